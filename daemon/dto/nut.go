@@ -110,27 +110,28 @@ type NUTResponse struct {
 	Timestamp time.Time   `json:"timestamp"`
 }
 
+// nutStatusTexts maps NUT status codes to human-readable text.
+var nutStatusTexts = map[string]string{
+	"OL":      "Online",
+	"OB":      "On Battery",
+	"LB":      "Low Battery",
+	"HB":      "High Battery",
+	"RB":      "Replace Battery",
+	"CHRG":    "Charging",
+	"DISCHRG": "Discharging",
+	"BYPASS":  "Bypass",
+	"CAL":     "Calibrating",
+	"OFF":     "Offline",
+	"OVER":    "Overloaded",
+	"TRIM":    "Trimming Voltage",
+	"BOOST":   "Boosting Voltage",
+	"FSD":     "Forced Shutdown",
+}
+
 // NUTStatusText converts NUT status codes to human-readable text
 func NUTStatusText(status string) string {
-	statusMap := map[string]string{
-		"OL":      "Online",
-		"OB":      "On Battery",
-		"LB":      "Low Battery",
-		"HB":      "High Battery",
-		"RB":      "Replace Battery",
-		"CHRG":    "Charging",
-		"DISCHRG": "Discharging",
-		"BYPASS":  "Bypass",
-		"CAL":     "Calibrating",
-		"OFF":     "Offline",
-		"OVER":    "Overloaded",
-		"TRIM":    "Trimming Voltage",
-		"BOOST":   "Boosting Voltage",
-		"FSD":     "Forced Shutdown",
-	}
-
 	// Handle multiple status codes (e.g., "OL CHRG")
-	if text, ok := statusMap[status]; ok {
+	if text, ok := nutStatusTexts[status]; ok {
 		return text
 	}
 	return status
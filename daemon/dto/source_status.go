@@ -50,6 +50,14 @@ type SourceStatus struct {
 	LastError   string    `json:"last_error,omitempty"`
 }
 
+// Stale reports whether an item carrying s is a retained last-known-good
+// copy published while its source was unreachable, so its state fields
+// describe the past rather than the present. A nil status (the normal,
+// healthy case) is never stale.
+func (s *SourceStatus) Stale() bool {
+	return s != nil && s.State == SourceUnavailable
+}
+
 // Capability is one probed OS capability (a binary or a path).
 type Capability struct {
 	Name      string `json:"name"`
@@ -8,15 +8,16 @@ import (
 )
 
 // sensitiveFields contains field names that should always be redacted (case-insensitive match).
-var sensitiveFields = []string{
+// Entries are matched as substrings, so variants that already contain an
+// earlier entry (e.g. "secret_key" contains "secret") are omitted. It is a
+// fixed-size array because the table never changes at runtime.
+var sensitiveFields = [...]string{
 	"password",
 	"token",
 	"secret",
 	"credential",
 	"api_key",
 	"apikey",
-	"secret_key",
-	"secretkey",
 	"auth_key",
 	"authkey",
 	"private_key",
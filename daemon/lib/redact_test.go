@@ -284,6 +284,9 @@ func TestIsSensitiveField(t *testing.T) {
 		{"secret", true},
 		{"api_key", true},
 		{"credential", true},
+		{"secret_key", true},
+		{"AWSSecretKey", true},
+		{"privateKey", true},
 		{"host", false},
 		{"port", false},
 		{"username", false},
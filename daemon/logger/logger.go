@@ -76,6 +76,13 @@ func GetLevel() LogLevel {
 	return currentLevel
 }
 
+// DebugEnabled reports whether debug messages are currently logged. Hot paths
+// use it to skip building Debug arguments (each boxed into an interface) when
+// the message would be discarded anyway.
+func DebugEnabled() bool {
+	return currentLevel <= LevelDebug
+}
+
 // Info logs informational messages in blue
 func Info(format string, v ...any) {
 	if currentLevel <= LevelInfo {
@@ -258,3 +258,17 @@ func TestSprintfFunction(t *testing.T) {
 		t.Errorf("Sprintf() = %q, want %q", result2, "no format args")
 	}
 }
+
+func TestDebugEnabled(t *testing.T) {
+	originalLevel := GetLevel()
+	defer SetLevel(originalLevel)
+
+	SetLevel(LevelDebug)
+	if !DebugEnabled() {
+		t.Error("DebugEnabled() = false at debug level")
+	}
+	SetLevel(LevelInfo)
+	if DebugEnabled() {
+		t.Error("DebugEnabled() = true at info level")
+	}
+}
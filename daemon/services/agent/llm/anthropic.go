@@ -145,16 +145,14 @@ func (a *AnthropicProvider) Chat(ctx context.Context, req ChatRequest) (*ChatRes
 	}
 	defer func() { _ = resp.Body.Close() }()
 
-	raw, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("read anthropic response body: %w", err)
-	}
 	if resp.StatusCode >= 300 {
+		raw, _ := io.ReadAll(io.LimitReader(resp.Body, maxErrorBodyBytes))
 		return nil, fmt.Errorf("anthropic API status %d: %s", resp.StatusCode, string(raw))
 	}
 
+	// Decode straight from the body instead of buffering it first.
 	var parsed anthropicResp
-	if err := json.Unmarshal(raw, &parsed); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&parsed); err != nil {
 		return nil, fmt.Errorf("decode anthropic response: %w", err)
 	}
 
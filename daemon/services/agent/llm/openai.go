@@ -167,20 +167,21 @@ func (o *OpenAIProvider) Chat(ctx context.Context, req ChatRequest) (*ChatRespon
 	}
 	defer func() { _ = resp.Body.Close() }()
 
-	raw, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("read openai response body: %w", err)
-	}
 	if resp.StatusCode >= 300 {
+		raw, _ := io.ReadAll(io.LimitReader(resp.Body, maxErrorBodyBytes))
 		return nil, fmt.Errorf("openai API status %d: %s", resp.StatusCode, string(raw))
 	}
 
+	// Decode straight from the body instead of buffering it first. The head
+	// of the body is kept for the error below: compatible servers often
+	// answer 200 with only an error object.
 	var parsed openAIResp
-	if err := json.Unmarshal(raw, &parsed); err != nil {
+	var head headBuffer
+	if err := json.NewDecoder(io.TeeReader(resp.Body, &head)).Decode(&parsed); err != nil {
 		return nil, fmt.Errorf("decode openai response: %w", err)
 	}
 	if len(parsed.Choices) == 0 {
-		return nil, fmt.Errorf("openai response contained no choices: %s", string(raw))
+		return nil, fmt.Errorf("openai response contained no choices: %s", head.String())
 	}
 
 	out := &ChatResponse{InputTokens: parsed.Usage.PromptTokens, OutputTokens: parsed.Usage.CompletionTokens}
@@ -193,3 +194,17 @@ func (o *OpenAIProvider) Chat(ctx context.Context, req ChatRequest) (*ChatRespon
 	}
 	return out, nil
 }
+
+// headBuffer keeps the first maxErrorBodyBytes written to it and discards
+// the rest, so a streamed body can be quoted in an error without buffering
+// all of it.
+type headBuffer struct {
+	bytes.Buffer
+}
+
+func (h *headBuffer) Write(p []byte) (int, error) {
+	if room := maxErrorBodyBytes - h.Len(); room > 0 {
+		h.Buffer.Write(p[:min(len(p), room)])
+	}
+	return len(p), nil
+}
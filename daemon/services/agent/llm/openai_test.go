@@ -90,3 +90,38 @@ func TestOpenAIEmptyChoicesErrors(t *testing.T) {
 		t.Fatal("expected error when choices is empty")
 	}
 }
+
+func TestOpenAIEmptyChoicesErrorQuotesBody(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"error":{"message":"model overloaded"},"padding":"` + strings.Repeat("x", 4*maxErrorBodyBytes) + `"}`))
+	}))
+	defer srv.Close()
+	p := NewOpenAIProvider("k", "m", srv.URL)
+	_, err := p.Chat(context.Background(), ChatRequest{})
+	if err == nil {
+		t.Fatal("expected error when choices is missing")
+	}
+	if !strings.Contains(err.Error(), "model overloaded") {
+		t.Errorf("error %q does not quote the response body", err)
+	}
+	if n := strings.Count(err.Error(), "x"); n > maxErrorBodyBytes {
+		t.Errorf("error carries %d body bytes, want at most %d", n, maxErrorBodyBytes)
+	}
+}
+
+func TestOpenAIErrorBodyIsTruncated(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		w.WriteHeader(http.StatusBadGateway)
+		_, _ = w.Write([]byte(strings.Repeat("x", 4*maxErrorBodyBytes)))
+	}))
+	defer srv.Close()
+	p := NewOpenAIProvider("k", "m", srv.URL)
+	_, err := p.Chat(context.Background(), ChatRequest{})
+	if err == nil {
+		t.Fatal("expected error on 502")
+	}
+	if n := strings.Count(err.Error(), "x"); n > maxErrorBodyBytes {
+		t.Errorf("error carries %d body bytes, want at most %d", n, maxErrorBodyBytes)
+	}
+}
@@ -3,6 +3,10 @@ package llm
 
 import "context"
 
+// maxErrorBodyBytes caps how much of a response body is quoted in an error
+// message. Successful responses are decoded straight from the body.
+const maxErrorBodyBytes = 4 << 10
+
 // EmptyObjectSchema is the default JSON Schema for a tool that takes no arguments.
 const EmptyObjectSchema = `{"type":"object","properties":{}}`
 
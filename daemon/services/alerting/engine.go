@@ -124,8 +124,9 @@ func (e *Engine) Start(ctx context.Context) {
 // evaluate runs one evaluation cycle for all enabled rules.
 func (e *Engine) evaluate() {
 	now := time.Now()
-	e.sampleHistory(now)
-	env := e.buildEnv()
+	snap := e.loadSnapshot()
+	e.sampleHistory(snap, now)
+	env := e.buildEnvFrom(snap)
 	e.overlayTrends(&env)
 	rules := e.store.GetEnabledRules()
 
@@ -268,18 +269,57 @@ func smartRawInt(raw string) int {
 	return v
 }
 
+// providerSnapshot is a single read of every provider cache an evaluation
+// tick uses. History sampling and env building both walk the same snapshot
+// instead of each reloading (and, for Docker, re-merging) it from the provider.
+type providerSnapshot struct {
+	system        *dto.SystemInfo
+	array         *dto.ArrayStatus
+	disks         []dto.DiskInfo
+	containers    []dto.ContainerInfo
+	vms           []dto.VMInfo
+	ups           *dto.UPSStatus
+	gpus          []*dto.GPUMetrics
+	zfsPools      []dto.ZFSPool
+	networks      []dto.NetworkInfo
+	nut           *dto.NUTResponse
+	notifications *dto.NotificationList
+	plugins       *dto.PluginList
+	degraded      int
+}
+
+// loadSnapshot reads every provider cache once.
+func (e *Engine) loadSnapshot() providerSnapshot {
+	return providerSnapshot{
+		system:        e.provider.GetSystemCache(),
+		array:         e.provider.GetArrayCache(),
+		disks:         e.provider.GetDisksCache(),
+		containers:    e.provider.GetDockerCache(),
+		vms:           e.provider.GetVMsCache(),
+		ups:           e.provider.GetUPSCache(),
+		gpus:          e.provider.GetGPUCache(),
+		zfsPools:      e.provider.GetZFSPoolsCache(),
+		networks:      e.provider.GetNetworkCache(),
+		nut:           e.provider.GetNUTCache(),
+		notifications: e.provider.GetNotificationsCache(),
+		plugins:       e.provider.GetPluginUpdatesCache(),
+		degraded:      e.provider.DegradedSubsystemCount(),
+	}
+}
+
 // sampleHistory records one tick of metrics into the trend history.
-func (e *Engine) sampleHistory(now time.Time) {
-	if sys := e.provider.GetSystemCache(); sys != nil {
+func (e *Engine) sampleHistory(snap providerSnapshot, now time.Time) {
+	if sys := snap.system; sys != nil {
 		e.history.Record("cpu_temp", "", sys.CPUTemp, now)
 	}
-	if arr := e.provider.GetArrayCache(); arr != nil {
+	if arr := snap.array; arr != nil {
 		e.history.Record("array_used_pct", "", arr.UsedPercent, now)
 	}
 
 	diskIDs := map[string]bool{}
-	if disks := e.provider.GetDisksCache(); disks != nil {
-		for _, d := range disks {
+	if disks := snap.disks; disks != nil {
+		for i := range disks {
+			d := &disks[i]
 			if d.ID == "" {
 				continue
 			}
@@ -289,16 +329,11 @@ func (e *Engine) sampleHistory(now time.Time) {
 			e.history.Record("disk_used_pct", id, d.UsagePercent, now)
 			e.history.Record("disk_errors", id, float64(d.SMARTErrors), now)
 
-			// Extract reallocated (ID 5) and pending (ID 197) from SMARTAttributes
-			var reallocated, pending float64
-			for _, attr := range d.SMARTAttributes {
-				switch attr.ID {
-				case 5:
-					reallocated = float64(smartRawInt(attr.RawValue))
-				case 197:
-					pending = float64(smartRawInt(attr.RawValue))
-				}
-			}
+			// Reallocated (ID 5) and pending (ID 197) sectors. SMARTAttributes is
+			// keyed by decimal attribute ID, so look them up directly instead of
+			// walking the whole table; a missing attribute reads as zero.
+			reallocated := float64(smartRawInt(d.SMARTAttributes["5"].RawValue))
+			pending := float64(smartRawInt(d.SMARTAttributes["197"].RawValue))
 			e.history.Record("reallocated", id, reallocated, now)
 			e.history.Record("pending", id, pending, now)
 		}
@@ -308,9 +343,10 @@ func (e *Engine) sampleHistory(now time.Time) {
 	}
 
 	containerIDs := map[string]bool{}
-	if containers := e.provider.GetDockerCache(); containers != nil {
-		for _, c := range containers {
-			if c.ID == "" {
+	if containers := snap.containers; containers != nil {
+		for i := range containers {
+			c := &containers[i]
+			if c.ID == "" || c.SourceStatus.Stale() {
 				continue
 			}
 			containerIDs[c.ID] = true
@@ -417,12 +453,16 @@ func (e *Engine) QueryHistory(metric, entity string) dto.MetricHistoryResult {
 	if len(s) == 0 {
 		return res
 	}
-	res.Slope = e.history.slope(s)
+	// Samples, min/max/avg and the slope fit are all gathered in one walk.
+	res.Samples = make([]dto.MetricSample, len(s))
 	res.Min = s[0].v
 	res.Max = s[0].v
 	var sum float64
-	for _, p := range s {
-		res.Samples = append(res.Samples, dto.MetricSample{TimeUnix: p.t.Unix(), Value: p.v})
+	var ls leastSquares
+	t0 := s[0].t
+	for i, p := range s {
+		res.Samples[i] = dto.MetricSample{TimeUnix: p.t.Unix(), Value: p.v}
+		ls.add(p.t.Sub(t0).Seconds(), p.v)
 		if p.v < res.Min {
 			res.Min = p.v
 		}
@@ -431,6 +471,7 @@ func (e *Engine) QueryHistory(metric, entity string) dto.MetricHistoryResult {
 		}
 		sum += p.v
 	}
+	res.Slope = ls.slope()
 	res.Avg = sum / float64(len(s))
 	res.Last = s[len(s)-1].v
 	return res
@@ -438,13 +479,18 @@ func (e *Engine) QueryHistory(metric, entity string) dto.MetricHistoryResult {
 
 // buildEnv constructs an AlertEnv from the current cached collector data.
 func (e *Engine) buildEnv() dto.AlertEnv {
+	return e.buildEnvFrom(e.loadSnapshot())
+}
+
+// buildEnvFrom constructs an AlertEnv from a provider snapshot.
+func (e *Engine) buildEnvFrom(snap providerSnapshot) dto.AlertEnv {
 	env := dto.AlertEnv{}
 
 	// OS-resilience: surface degraded data-source count for the subsystem_degraded rule.
-	env.DegradedSubsystemCount = e.provider.DegradedSubsystemCount()
+	env.DegradedSubsystemCount = snap.degraded
 
 	// System
-	if sys := e.provider.GetSystemCache(); sys != nil {
+	if sys := snap.system; sys != nil {
 		env.CPU = sys.CPUUsage
 		env.RAMUsedPct = sys.RAMUsage
 		env.RAMTotalBytes = sys.RAMTotal
@@ -460,7 +506,7 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// Array
-	if arr := e.provider.GetArrayCache(); arr != nil {
+	if arr := snap.array; arr != nil {
 		env.ArrayState = arr.State
 		env.ArrayUsedPct = arr.UsedPercent
 		env.ArrayFreeBytes = arr.FreeBytes
@@ -473,8 +519,9 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// Disks — aggregate max temp, max usage, total errors
-	if disks := e.provider.GetDisksCache(); disks != nil {
-		for _, d := range disks {
+	if disks := snap.disks; disks != nil {
+		for i := range disks {
+			d := &disks[i]
 			if d.Temperature > env.MaxDiskTemp {
 				env.MaxDiskTemp = d.Temperature
 			}
@@ -485,10 +532,15 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 		}
 	}
 
-	// Docker
-	if containers := e.provider.GetDockerCache(); containers != nil {
-		env.ContainerCount = len(containers)
+	// Docker. Stale last-known-good entries (Docker unreachable) have an
+	// unknown state and are left out of the counts, exactly as a missing
+	// cache is, so an outage neither hides nor fakes a stopped container.
+	if containers := snap.containers; containers != nil {
 		for _, c := range containers {
+			if c.SourceStatus.Stale() {
+				continue
+			}
+			env.ContainerCount++
 			if c.State == "running" {
 				env.RunningContainers++
 			} else {
@@ -501,9 +553,12 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// VMs
-	if vms := e.provider.GetVMsCache(); vms != nil {
-		env.VMCount = len(vms)
+	if vms := snap.vms; vms != nil {
 		for _, v := range vms {
+			if v.SourceStatus.Stale() {
+				continue
+			}
+			env.VMCount++
 			if v.State == "running" {
 				env.RunningVMs++
 			}
@@ -511,7 +566,7 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// UPS
-	if ups := e.provider.GetUPSCache(); ups != nil {
+	if ups := snap.ups; ups != nil {
 		env.UPSStatus = ups.Status
 		env.UPSBatteryCharge = ups.BatteryCharge
 		env.UPSLoadPercent = ups.LoadPercent
@@ -519,7 +574,7 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// GPU
-	if gpus := e.provider.GetGPUCache(); gpus != nil {
+	if gpus := snap.gpus; gpus != nil {
 		for _, g := range gpus {
 			if g == nil {
 				continue
@@ -536,7 +591,7 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// ZFS pools
-	if pools := e.provider.GetZFSPoolsCache(); pools != nil {
+	if pools := snap.zfsPools; pools != nil {
 		env.ZFSPoolCount = len(pools)
 		env.BootPoolHealthy = true // default: no boot pool present
 		for _, p := range pools {
@@ -558,7 +613,7 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// Network
-	if nets := e.provider.GetNetworkCache(); nets != nil {
+	if nets := snap.networks; nets != nil {
 		env.NetworkIFCount = len(nets)
 		for _, n := range nets {
 			env.NetworkErrors += n.ErrorsReceived + n.ErrorsSent
@@ -566,7 +621,7 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	}
 
 	// NUT
-	if nut := e.provider.GetNUTCache(); nut != nil && nut.Status != nil {
+	if nut := snap.nut; nut != nil && nut.Status != nil {
 		env.NUTStatus = nut.Status.Status
 		env.NUTBatteryCharge = nut.Status.BatteryCharge
 		env.NUTBatteryRuntime = nut.Status.BatteryRuntime
@@ -576,14 +631,14 @@ func (e *Engine) buildEnv() dto.AlertEnv {
 	// Notifications
 	// NotificationOverview and NotificationCounts are value types (not pointers),
 	// so the only nil-deref risk is notifs itself, which is guarded here.
-	if notifs := e.provider.GetNotificationsCache(); notifs != nil {
+	if notifs := snap.notifications; notifs != nil {
 		env.UnreadNotifications = notifs.Overview.Unread.Total
 		env.WarningNotifications = notifs.Overview.Unread.Warning
 		env.AlertNotifications = notifs.Overview.Unread.Alert
 	}
 
 	// Plugin updates
-	if plugins := e.provider.GetPluginUpdatesCache(); plugins != nil {
+	if plugins := snap.plugins; plugins != nil {
 		for _, p := range plugins.Plugins {
 			if p.UpdateAvailable {
 				env.PluginUpdatesAvailable++
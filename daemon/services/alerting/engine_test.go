@@ -201,6 +201,30 @@ func TestEngineBuildEnvNilCaches(t *testing.T) {
 	}
 }
 
+func TestEngineBuildEnvSkipsStaleContainersAndVMs(t *testing.T) {
+	dir := t.TempDir()
+	store := NewStore(dir)
+	stale := &dto.SourceStatus{State: dto.SourceUnavailable}
+	provider := &mockDataProvider{
+		containers: []dto.ContainerInfo{
+			{ID: "a", State: "running", SourceStatus: stale},
+			{ID: "b", State: "exited", SourceStatus: stale},
+		},
+		vms: []dto.VMInfo{{Name: "win", State: "running", SourceStatus: stale}},
+	}
+	engine := NewEngine(store, provider)
+
+	env := engine.buildEnv()
+
+	if env.ContainerCount != 0 || env.RunningContainers != 0 || env.StoppedContainers != 0 {
+		t.Errorf("stale containers counted: count=%d running=%d stopped=%d",
+			env.ContainerCount, env.RunningContainers, env.StoppedContainers)
+	}
+	if env.VMCount != 0 || env.RunningVMs != 0 {
+		t.Errorf("stale VMs counted: count=%d running=%d", env.VMCount, env.RunningVMs)
+	}
+}
+
 func TestEngineHistory(t *testing.T) {
 	dir := t.TempDir()
 	store := NewStore(dir)
@@ -335,6 +359,37 @@ func TestEngineTrendFields(t *testing.T) {
 	}
 }
 
+func TestSampleHistoryReadsSMARTSectorCounts(t *testing.T) {
+	e := NewEngine(NewStore(t.TempDir()), &mockDataProvider{})
+	now := time.Unix(1_700_000_000, 0)
+	snap := providerSnapshot{disks: []dto.DiskInfo{
+		{ID: "sda", SMARTAttributes: map[string]dto.SMARTAttribute{
+			"5":   {ID: 5, RawValue: "8"},
+			"9":   {ID: 9, RawValue: "25123"},
+			"197": {ID: 197, RawValue: "3 (0 0)"},
+		}},
+		{ID: "sdb"}, // no attribute table (e.g. NVMe)
+	}}
+
+	e.sampleHistory(snap, now)
+
+	tests := []struct {
+		metric, entity string
+		want           float64
+	}{
+		{"reallocated", "sda", 8},
+		{"pending", "sda", 3},
+		{"reallocated", "sdb", 0},
+		{"pending", "sdb", 0},
+	}
+	for _, tt := range tests {
+		series := e.history.SeriesSnapshot(tt.metric, tt.entity)
+		if len(series) != 1 || series[0].v != tt.want {
+			t.Errorf("%s[%s] = %v, want one sample of %v", tt.metric, tt.entity, series, tt.want)
+		}
+	}
+}
+
 func TestEngineEvaluateIntegration(t *testing.T) {
 	dir := t.TempDir()
 	store := NewStore(dir)
@@ -372,3 +427,33 @@ func TestEngineEvaluateIntegration(t *testing.T) {
 		t.Error("expected at least 1 history event")
 	}
 }
+
+// countingProvider counts reads of the per-item caches walked each tick.
+type countingProvider struct {
+	*mockDataProvider
+	diskReads, dockerReads int
+}
+
+func (c *countingProvider) GetDisksCache() []dto.DiskInfo {
+	c.diskReads++
+	return c.mockDataProvider.GetDisksCache()
+}
+
+func (c *countingProvider) GetDockerCache() []dto.ContainerInfo {
+	c.dockerReads++
+	return c.mockDataProvider.GetDockerCache()
+}
+
+func TestEngineEvaluateReadsProviderOncePerTick(t *testing.T) {
+	provider := &countingProvider{mockDataProvider: newMockProvider()}
+	e := NewEngine(NewStore(t.TempDir()), provider)
+
+	e.evaluate()
+
+	if provider.diskReads != 1 {
+		t.Errorf("GetDisksCache called %d times per tick, want 1", provider.diskReads)
+	}
+	if provider.dockerReads != 1 {
+		t.Errorf("GetDockerCache called %d times per tick, want 1", provider.dockerReads)
+	}
+}
@@ -41,10 +41,12 @@ func (h *MetricsHistory) recordAt(metric, entity string, v float64, t time.Time)
 		h.globalSeries[metric] = h.appendBounded(h.globalSeries[metric], sample{t, v})
 		return
 	}
-	if h.entitySeries[metric] == nil {
-		h.entitySeries[metric] = map[string][]sample{}
+	series := h.entitySeries[metric]
+	if series == nil {
+		series = map[string][]sample{}
+		h.entitySeries[metric] = series
 	}
-	h.entitySeries[metric][entity] = h.appendBounded(h.entitySeries[metric][entity], sample{t, v})
+	series[entity] = h.appendBounded(series[entity], sample{t, v})
 }
 
 // Record records a sample at the given time (caller passes now).
@@ -65,9 +67,12 @@ func (h *MetricsHistory) appendBounded(s []sample, x sample) []sample {
 	if start == 0 {
 		return s
 	}
-	trimmed := make([]sample, len(s)-start)
-	copy(trimmed, s[start:])
-	return trimmed
+	// Shift the kept samples to the front of the existing backing array
+	// rather than copying them into a fresh one: once a series is full every
+	// append trims, so that was an allocation per series per eval tick.
+	// Readers hold mu and SeriesSnapshot copies, so none observe the shift.
+	n := copy(s, s[start:])
+	return s[:n]
 }
 
 // pruneEntities drops per-entity series for a metric whose entity is not in keep.
@@ -87,22 +92,35 @@ func (h *MetricsHistory) slope(s []sample) float64 {
 	if len(s) < 2 {
 		return 0
 	}
+	var ls leastSquares
 	t0 := s[0].t
-	var n, sx, sy, sxx, sxy float64
 	for _, p := range s {
-		x := p.t.Sub(t0).Seconds()
-		y := p.v
-		n++
-		sx += x
-		sy += y
-		sxx += x * x
-		sxy += x * y
+		ls.add(p.t.Sub(t0).Seconds(), p.v)
 	}
-	den := n*sxx - sx*sx
+	return ls.slope()
+}
+
+// leastSquares accumulates the running sums of a least-squares line fit so
+// callers that walk a series for other statistics can fit it in the same pass.
+type leastSquares struct {
+	n, sx, sy, sxx, sxy float64
+}
+
+func (l *leastSquares) add(x, y float64) {
+	l.n++
+	l.sx += x
+	l.sy += y
+	l.sxx += x * x
+	l.sxy += x * y
+}
+
+// slope returns the fitted slope, or 0 when the points do not determine one.
+func (l *leastSquares) slope() float64 {
+	den := l.n*l.sxx - l.sx*l.sx
 	if den == 0 {
 		return 0
 	}
-	return (n*sxy - sx*sy) / den
+	return (l.n*l.sxy - l.sx*l.sy) / den
 }
 
 // etaToThreshold returns hours until the series, extrapolated linearly, reaches
@@ -29,3 +29,23 @@ func TestQueryHistory(t *testing.T) {
 		t.Error("empty series should have count 0")
 	}
 }
+
+func TestQueryHistoryMatchesSeriesSlope(t *testing.T) {
+	e := NewEngine(NewStore(t.TempDir()), &mockDataProvider{})
+	base := time.Unix(1_700_000_000, 0)
+	for i, v := range []float64{3, 9, 4, 12, 7, 15} {
+		e.history.Record("array_used_pct", "", v, base.Add(time.Duration(i*7)*time.Second))
+	}
+	r := e.QueryHistory("array_used_pct", "")
+	if want := e.history.slope(e.history.SeriesSnapshot("array_used_pct", "")); r.Slope != want {
+		t.Errorf("slope=%v want %v", r.Slope, want)
+	}
+	if len(r.Samples) != 6 || r.Samples[5].Value != 15 || r.Samples[5].TimeUnix != base.Unix()+35 {
+		t.Errorf("samples=%+v", r.Samples)
+	}
+
+	e.history.Record("cpu_temp", "", 50, base)
+	if r := e.QueryHistory("cpu_temp", ""); r.Slope != 0 || r.Avg != 50 {
+		t.Errorf("single sample slope/avg = %v/%v, want 0/50", r.Slope, r.Avg)
+	}
+}
@@ -38,6 +38,26 @@ func TestMetricsHistory_BoundedByCount(t *testing.T) {
 	}
 }
 
+func TestMetricsHistory_FullSeriesReusesBuffer(t *testing.T) {
+	h := NewMetricsHistory(5, time.Hour)
+	base := time.Unix(1_700_000_000, 0)
+	i := 0
+	for ; i < 10; i++ {
+		h.recordAt("cpu_temp", "", float64(i), ts(base, i))
+	}
+	allocs := testing.AllocsPerRun(100, func() {
+		h.recordAt("cpu_temp", "", float64(i), ts(base, i))
+		i++
+	})
+	if allocs != 0 {
+		t.Errorf("recording into a full series allocated %v times per sample, want 0", allocs)
+	}
+	s := h.globalSeries["cpu_temp"]
+	if len(s) != 5 || s[0].v != float64(i-5) || s[4].v != float64(i-1) {
+		t.Errorf("series = %v, want the last 5 samples in order", s)
+	}
+}
+
 func TestMetricsHistory_BoundedByAge(t *testing.T) {
 	h := NewMetricsHistory(1000, 10*time.Second)
 	base := time.Unix(1_700_000_000, 0)
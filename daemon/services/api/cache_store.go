@@ -1,6 +1,8 @@
 package api
 
 import (
+	"encoding/json"
+	"sync"
 	"sync/atomic"
 	"time"
 
@@ -53,6 +55,19 @@ type CacheStore struct {
 	moverCache           atomic.Pointer[dto.MoverStatus]
 	parityHistoryCache   atomic.Pointer[dto.ParityCheckHistory]
 
+	// dockerView memoizes the merged container+update-status view returned by
+	// GetDockerCache, keyed on the identity of both source snapshots.
+	dockerView atomic.Pointer[dockerView]
+	// vmView memoizes the ID/name index over the VM list used by GetVM,
+	// keyed on the identity of the source snapshot.
+	vmView atomic.Pointer[vmView]
+	// diskView memoizes the ID/device/name index over the disk list used by
+	// GetDisk, keyed on the identity of the source snapshot.
+	diskView atomic.Pointer[diskView]
+	// notificationView memoizes the unread/archive split served by the
+	// notification endpoints, keyed on the identity of the source snapshot.
+	notificationView atomic.Pointer[notificationView]
+
 	// registry is the OS-resilience status registry (may be nil in tests).
 	registry *platform.Registry
 }
@@ -99,6 +114,38 @@ func (c *CacheStore) GetNotificationsCache() *dto.NotificationList {
 	return c.notificationsCache.Load()
 }
 
+// notificationView splits one immutable notification list snapshot by type.
+type notificationView struct {
+	list     *dto.NotificationList
+	unread   []dto.Notification
+	archived []dto.Notification
+}
+
+// GetNotificationsByType returns the cached notifications split into unread
+// and archived. The split is computed once per published list rather than on
+// every request; both slices are non-nil and must be treated as read-only.
+// ok is false when no notifications have been collected yet.
+func (c *CacheStore) GetNotificationsByType() (unread, archived []dto.Notification, ok bool) {
+	v := c.notificationsCache.Load()
+	if v == nil {
+		return nil, nil, false
+	}
+	view := c.notificationView.Load()
+	if view == nil || view.list != v {
+		view = &notificationView{list: v, unread: []dto.Notification{}, archived: []dto.Notification{}}
+		for i := range v.Notifications {
+			switch n := &v.Notifications[i]; n.Type {
+			case "unread":
+				view.unread = append(view.unread, *n)
+			case "archive":
+				view.archived = append(view.archived, *n)
+			}
+		}
+		c.notificationView.Store(view)
+	}
+	return view.unread, view.archived, true
+}
+
 // GetZFSARCStatsCache returns cached ZFS ARC statistics.
 func (c *CacheStore) GetZFSARCStatsCache() *dto.ZFSARCStats {
 	return c.zfsARCStatsCache.Load()
@@ -134,6 +181,41 @@ func (c *CacheStore) GetDisksCache() []dto.DiskInfo {
 	return nil
 }
 
+// diskView is an ID/device/name index over one immutable disk list snapshot.
+type diskView struct {
+	disks *[]dto.DiskInfo
+	byKey map[string]int
+}
+
+// GetDisk returns the disk whose ID, device or name matches key. When a key is
+// shared, the first disk in list order wins, matching a linear scan. The index
+// is built once per published disk list.
+func (c *CacheStore) GetDisk(key string) (dto.DiskInfo, bool) {
+	v := c.disksCache.Load()
+	if v == nil {
+		return dto.DiskInfo{}, false
+	}
+	view := c.diskView.Load()
+	if view == nil || view.disks != v {
+		byKey := make(map[string]int, 3*len(*v))
+		for i := range *v {
+			d := &(*v)[i]
+			for _, k := range [...]string{d.ID, d.Device, d.Name} {
+				if _, seen := byKey[k]; !seen {
+					byKey[k] = i
+				}
+			}
+		}
+		view = &diskView{disks: v, byKey: byKey}
+		c.diskView.Store(view)
+	}
+	i, ok := view.byKey[key]
+	if !ok {
+		return dto.DiskInfo{}, false
+	}
+	return (*v)[i], true
+}
+
 // GetSharesCache returns cached share information.
 func (c *CacheStore) GetSharesCache() []dto.ShareInfo {
 	if v := c.sharesCache.Load(); v != nil {
@@ -142,18 +224,159 @@ func (c *CacheStore) GetSharesCache() []dto.ShareInfo {
 	return nil
 }
 
+// dockerView is an immutable merged container snapshot together with the two
+// source snapshots it was built from.
+type dockerView struct {
+	containers *[]dto.ContainerInfo
+	updates    *dto.ContainerUpdatesResult
+	merged     []dto.ContainerInfo
+	// byKey maps both container ID and name to an index in merged, so
+	// single-container lookups do not scan the list.
+	byKey map[string]int
+	// stats aggregates merged once so /docker/stats does not re-sum the
+	// list on every request. Its Timestamp is left for the caller to set.
+	stats dto.DockerAggregateStats
+
+	// body is the JSON response for merged (as written by respondJSON), encoded
+	// on first request. Home Assistant and dashboards poll /docker far more
+	// often than the collector publishes, so every poll in between reuses it.
+	encodeOnce sync.Once
+	body       []byte
+}
+
+// newDockerView merges the two source snapshots and indexes the result. When
+// an ID or name is shared, the first container in list order wins, matching a
+// linear scan.
+func newDockerView(containers *[]dto.ContainerInfo, updates *dto.ContainerUpdatesResult) *dockerView {
+	merged := mergeContainerUpdates(*containers, updates)
+	byKey := indexByIDAndName(merged, func(c *dto.ContainerInfo) (string, string) { return c.ID, c.Name })
+	return &dockerView{containers: containers, updates: updates, merged: merged, byKey: byKey, stats: aggregateDockerStats(merged)}
+}
+
+// aggregateDockerStats sums resource usage across the running containers.
+func aggregateDockerStats(containers []dto.ContainerInfo) dto.DockerAggregateStats {
+	var stats dto.DockerAggregateStats
+	for i := range containers {
+		c := &containers[i]
+		stats.TotalContainers++
+		if c.State == "running" {
+			stats.RunningContainers++
+			stats.TotalCPUPercent += c.CPUPercent
+			stats.TotalMemoryUsage += c.MemoryUsage
+			stats.TotalMemoryUsageMB += c.MemoryUsageMB
+			stats.TotalMemoryLimit += c.MemoryLimit
+		}
+	}
+	if stats.TotalMemoryLimit > 0 {
+		stats.MemoryUsagePercent = float64(stats.TotalMemoryUsage) / float64(stats.TotalMemoryLimit) * 100
+	}
+	return stats
+}
+
+// indexByIDAndName maps the ID and name of every item to its index. When a key
+// is shared, the first item in list order wins, matching a linear scan.
+func indexByIDAndName[T any](items []T, keys func(*T) (id, name string)) map[string]int {
+	byKey := make(map[string]int, 2*len(items))
+	for i := range items {
+		id, name := keys(&items[i])
+		for _, key := range [...]string{id, name} {
+			if _, seen := byKey[key]; !seen {
+				byKey[key] = i
+			}
+		}
+	}
+	return byKey
+}
+
 // GetDockerCache returns cached Docker container information with update status
 // merged in from the docker_update collector's cache. The raw stored slice is
-// never mutated — a shallow copy is returned with update fields overlaid.
+// never mutated — a shallow copy is built with update fields overlaid.
+//
+// Collectors publish a fresh slice on every cycle, so the merge only needs to
+// run when either source pointer changes; between changes every caller shares
+// the same merged snapshot. Like the other slice getters, the result must be
+// treated as read-only.
 func (c *CacheStore) GetDockerCache() []dto.ContainerInfo {
+	if view := c.loadDockerView(); view != nil {
+		return view.merged
+	}
+	return nil
+}
+
+// GetDockerContainer returns the container whose ID or name matches idOrName,
+// with update status merged in. The lookup uses the index built alongside the
+// merged snapshot, so it costs one map access instead of a list scan.
+func (c *CacheStore) GetDockerContainer(idOrName string) (dto.ContainerInfo, bool) {
+	view := c.loadDockerView()
+	if view == nil {
+		return dto.ContainerInfo{}, false
+	}
+	i, ok := view.byKey[idOrName]
+	if !ok {
+		return dto.ContainerInfo{}, false
+	}
+	return view.merged[i], true
+}
+
+// GetDockerCacheJSON returns GetDockerCache encoded as a JSON response body,
+// encoded once per merged snapshot. ok is false when no container list is
+// cached or the list could not be encoded. The returned bytes must not be
+// modified.
+func (c *CacheStore) GetDockerCacheJSON() (body []byte, ok bool) {
+	view := c.loadDockerView()
+	if view == nil {
+		return nil, false
+	}
+	view.encodeOnce.Do(func() {
+		data, err := json.Marshal(view.merged)
+		if err != nil {
+			logger.Error("Failed to encode Docker container list: %v", err)
+			return
+		}
+		// json.Encoder, used by respondJSON, terminates with a newline.
+		view.body = append(data, '\n')
+	})
+	return view.body, view.body != nil
+}
+
+// GetDockerStats returns aggregate resource usage across the cached
+// containers, computed once per merged snapshot. ok is false when no
+// container list is cached. The returned Timestamp is zero.
+func (c *CacheStore) GetDockerStats() (stats dto.DockerAggregateStats, ok bool) {
+	view := c.loadDockerView()
+	if view == nil {
+		return dto.DockerAggregateStats{}, false
+	}
+	return view.stats, true
+}
+
+// loadDockerView returns the memoized merged view, rebuilding it when either
+// source snapshot has changed. Returns nil when no container list is cached.
+func (c *CacheStore) loadDockerView() *dockerView {
 	v := c.dockerCache.Load()
 	if v == nil {
 		return nil
 	}
+	u := c.dockerUpdatesCache.Load()
+
+	if view := c.dockerView.Load(); view != nil && view.containers == v && view.updates == u {
+		return view
+	}
+
+	view := newDockerView(v, u)
+	c.dockerView.Store(view)
+	return view
+}
 
-	updates := map[string]dto.ContainerUpdateInfo{}
+// mergeContainerUpdates returns a copy of containers with the update fields
+// from u overlaid. u may be nil.
+func mergeContainerUpdates(containers []dto.ContainerInfo, u *dto.ContainerUpdatesResult) []dto.ContainerInfo {
+	// A nil map reads as empty, so without an update result nothing is
+	// allocated; otherwise the index is sized for every result up front.
+	var updates map[string]dto.ContainerUpdateInfo
 	var checkedAt *time.Time
-	if u := c.dockerUpdatesCache.Load(); u != nil {
+	if u != nil {
+		updates = make(map[string]dto.ContainerUpdateInfo, len(u.Containers))
 		for i := range u.Containers {
 			updates[u.Containers[i].ContainerID] = u.Containers[i]
 		}
@@ -164,8 +387,8 @@ func (c *CacheStore) GetDockerCache() []dto.ContainerInfo {
 		}
 	}
 
-	out := make([]dto.ContainerInfo, len(*v))
-	for i, ci := range *v {
+	out := make([]dto.ContainerInfo, len(containers))
+	for i, ci := range containers {
 		if info, ok := updates[ci.ID]; ok {
 			status := info.Status()
 			ci.UpdateStatus = status
@@ -219,6 +442,32 @@ func (c *CacheStore) GetVMsCache() []dto.VMInfo {
 	return nil
 }
 
+// vmView is an ID/name index over one immutable VM list snapshot.
+type vmView struct {
+	vms   *[]dto.VMInfo
+	byKey map[string]int
+}
+
+// GetVM returns the VM whose ID or name matches idOrName. The index is built
+// once per published VM list, so lookups cost one map access instead of a
+// list scan.
+func (c *CacheStore) GetVM(idOrName string) (dto.VMInfo, bool) {
+	v := c.vmsCache.Load()
+	if v == nil {
+		return dto.VMInfo{}, false
+	}
+	view := c.vmView.Load()
+	if view == nil || view.vms != v {
+		view = &vmView{vms: v, byKey: indexByIDAndName(*v, func(vm *dto.VMInfo) (string, string) { return vm.ID, vm.Name })}
+		c.vmView.Store(view)
+	}
+	i, ok := view.byKey[idOrName]
+	if !ok {
+		return dto.VMInfo{}, false
+	}
+	return (*v)[i], true
+}
+
 // GetGPUCache returns cached GPU metrics.
 func (c *CacheStore) GetGPUCache() []*dto.GPUMetrics {
 	if v := c.gpuCache.Load(); v != nil {
@@ -1,6 +1,8 @@
 package api
 
 import (
+	"encoding/json"
+	"strings"
 	"testing"
 	"time"
 
@@ -55,3 +57,204 @@ func TestGetDockerCacheMerge(t *testing.T) {
 		t.Error("sonarr UpdateChecked should be nil for unmatched container")
 	}
 }
+
+func TestGetDockerCacheReusesMergedSnapshot(t *testing.T) {
+	var cs CacheStore
+	containers := []dto.ContainerInfo{{ID: "abc123", Name: "plex"}}
+	cs.dockerCache.Store(&containers)
+
+	first := cs.GetDockerCache()
+	second := cs.GetDockerCache()
+	if &first[0] != &second[0] {
+		t.Error("unchanged sources should return the same merged snapshot")
+	}
+
+	cs.dockerUpdatesCache.Store(&dto.ContainerUpdatesResult{
+		Containers: []dto.ContainerUpdateInfo{
+			{ContainerID: "abc123", CurrentDigest: "sha256:a", LatestDigest: "sha256:b", UpdateAvailable: true},
+		},
+		Timestamp: time.Now(),
+	})
+	third := cs.GetDockerCache()
+	if &third[0] == &first[0] {
+		t.Fatal("a new updates snapshot should rebuild the merged view")
+	}
+	if third[0].UpdateStatus != dto.UpdateStatusAvailable {
+		t.Errorf("status = %q, want update_available", third[0].UpdateStatus)
+	}
+	if first[0].UpdateStatus != dto.UpdateStatusUnknown {
+		t.Error("previously returned snapshot was mutated")
+	}
+
+	replaced := []dto.ContainerInfo{{ID: "abc123", Name: "plex", State: "exited"}}
+	cs.dockerCache.Store(&replaced)
+	if got := cs.GetDockerCache(); got[0].State != "exited" {
+		t.Errorf("state = %q, want exited after a new container snapshot", got[0].State)
+	}
+}
+
+func TestGetDockerContainerLooksUpByIDOrName(t *testing.T) {
+	var cs CacheStore
+	if _, ok := cs.GetDockerContainer("plex"); ok {
+		t.Fatal("lookup on an empty cache should miss")
+	}
+
+	containers := []dto.ContainerInfo{
+		{ID: "abc123", Name: "plex"},
+		{ID: "def456", Name: "sonarr"},
+		{ID: "plex", Name: "shadowed"}, // ID collides with an earlier name
+	}
+	cs.dockerCache.Store(&containers)
+	cs.dockerUpdatesCache.Store(&dto.ContainerUpdatesResult{
+		Containers: []dto.ContainerUpdateInfo{
+			{ContainerID: "def456", CurrentDigest: "sha256:a", LatestDigest: "sha256:b", UpdateAvailable: true},
+		},
+	})
+
+	tests := []struct {
+		key    string
+		wantID string
+		wantOK bool
+	}{
+		{"abc123", "abc123", true},
+		{"sonarr", "def456", true},
+		{"plex", "abc123", true}, // first match in list order wins
+		{"missing", "", false},
+	}
+	for _, tt := range tests {
+		got, ok := cs.GetDockerContainer(tt.key)
+		if ok != tt.wantOK || got.ID != tt.wantID {
+			t.Errorf("GetDockerContainer(%q) = (%q, %v), want (%q, %v)", tt.key, got.ID, ok, tt.wantID, tt.wantOK)
+		}
+	}
+
+	if got, _ := cs.GetDockerContainer("sonarr"); got.UpdateStatus != dto.UpdateStatusAvailable {
+		t.Errorf("UpdateStatus = %q, want merged update status", got.UpdateStatus)
+	}
+}
+
+func TestGetVMLooksUpByIDOrName(t *testing.T) {
+	var cs CacheStore
+	if _, ok := cs.GetVM("win11"); ok {
+		t.Fatal("lookup on an empty cache should miss")
+	}
+
+	vms := []dto.VMInfo{{ID: "1", Name: "win11"}, {ID: "2", Name: "ubuntu"}}
+	cs.vmsCache.Store(&vms)
+	if got, ok := cs.GetVM("ubuntu"); !ok || got.ID != "2" {
+		t.Errorf("GetVM(ubuntu) = (%q, %v), want (2, true)", got.ID, ok)
+	}
+	if got, ok := cs.GetVM("1"); !ok || got.Name != "win11" {
+		t.Errorf("GetVM(1) = (%q, %v), want (win11, true)", got.Name, ok)
+	}
+
+	// A newly published list must invalidate the index.
+	next := []dto.VMInfo{{ID: "3", Name: "ubuntu"}}
+	cs.vmsCache.Store(&next)
+	if got, ok := cs.GetVM("ubuntu"); !ok || got.ID != "3" {
+		t.Errorf("GetVM(ubuntu) after republish = (%q, %v), want (3, true)", got.ID, ok)
+	}
+	if _, ok := cs.GetVM("win11"); ok {
+		t.Error("GetVM(win11) should miss after the VM list changed")
+	}
+}
+
+func TestGetDiskLooksUpByIDDeviceOrName(t *testing.T) {
+	var cs CacheStore
+	if _, ok := cs.GetDisk("disk1"); ok {
+		t.Fatal("lookup on an empty cache should miss")
+	}
+
+	disks := []dto.DiskInfo{
+		{ID: "WDC_1", Device: "sdb", Name: "disk1"},
+		{ID: "WDC_2", Device: "sdc", Name: "disk2"},
+		{ID: "WDC_3", Device: "sdb", Name: "disk3"}, // shares a device with disk1
+	}
+	cs.disksCache.Store(&disks)
+	for key, want := range map[string]string{"WDC_2": "disk2", "sdc": "disk2", "disk1": "disk1", "sdb": "disk1"} {
+		if got, ok := cs.GetDisk(key); !ok || got.Name != want {
+			t.Errorf("GetDisk(%s) = (%q, %v), want (%s, true)", key, got.Name, ok, want)
+		}
+	}
+
+	// A newly published list must invalidate the index.
+	next := []dto.DiskInfo{{ID: "WDC_4", Device: "sdd", Name: "disk1"}}
+	cs.disksCache.Store(&next)
+	if got, ok := cs.GetDisk("disk1"); !ok || got.ID != "WDC_4" {
+		t.Errorf("GetDisk(disk1) after republish = (%q, %v), want (WDC_4, true)", got.ID, ok)
+	}
+	if _, ok := cs.GetDisk("sdb"); ok {
+		t.Error("GetDisk(sdb) should miss after the disk list changed")
+	}
+}
+
+func TestGetNotificationsByTypeSplitsOncePerSnapshot(t *testing.T) {
+	var cs CacheStore
+	if _, _, ok := cs.GetNotificationsByType(); ok {
+		t.Fatal("split on an empty cache should report !ok")
+	}
+
+	list := &dto.NotificationList{Notifications: []dto.Notification{
+		{ID: "a", Type: "unread"},
+		{ID: "b", Type: "archive"},
+		{ID: "c", Type: "unread"},
+	}}
+	cs.notificationsCache.Store(list)
+	unread, archived, ok := cs.GetNotificationsByType()
+	if !ok || len(unread) != 2 || unread[1].ID != "c" || len(archived) != 1 || archived[0].ID != "b" {
+		t.Fatalf("split = (%v, %v, %v), want 2 unread and 1 archived", unread, archived, ok)
+	}
+	if again, _, _ := cs.GetNotificationsByType(); &again[0] != &unread[0] {
+		t.Error("split was rebuilt for an unchanged snapshot")
+	}
+
+	// A newly published list must invalidate the split.
+	cs.notificationsCache.Store(&dto.NotificationList{Notifications: []dto.Notification{{ID: "d", Type: "archive"}}})
+	unread, archived, _ = cs.GetNotificationsByType()
+	if unread == nil || len(unread) != 0 || len(archived) != 1 || archived[0].ID != "d" {
+		t.Errorf("split after republish = (%v, %v), want no unread and archived d", unread, archived)
+	}
+}
+
+func TestGetDockerStatsAggregatesRunningContainers(t *testing.T) {
+	var cs CacheStore
+	if _, ok := cs.GetDockerStats(); ok {
+		t.Fatal("stats on an empty cache should report !ok")
+	}
+
+	containers := []dto.ContainerInfo{
+		{ID: "a", State: "running", CPUPercent: 10, MemoryUsage: 256, MemoryLimit: 1024},
+		{ID: "b", State: "exited", CPUPercent: 99, MemoryUsage: 4096, MemoryLimit: 4096},
+		{ID: "c", State: "running", CPUPercent: 5, MemoryUsage: 256, MemoryLimit: 1024},
+	}
+	cs.dockerCache.Store(&containers)
+	stats, ok := cs.GetDockerStats()
+	if !ok || stats.TotalContainers != 3 || stats.RunningContainers != 2 ||
+		stats.TotalCPUPercent != 15 || stats.TotalMemoryUsage != 512 || stats.MemoryUsagePercent != 25 {
+		t.Errorf("GetDockerStats() = (%+v, %v), want 3 total, 2 running, 15%% CPU, 512 B at 25%%", stats, ok)
+	}
+}
+
+func TestGetDockerCacheJSONFollowsSnapshot(t *testing.T) {
+	var cs CacheStore
+	if _, ok := cs.GetDockerCacheJSON(); ok {
+		t.Fatal("JSON on an empty cache should report !ok")
+	}
+
+	containers := []dto.ContainerInfo{{ID: "a", Name: "plex"}}
+	cs.dockerCache.Store(&containers)
+	first, ok := cs.GetDockerCacheJSON()
+	want, _ := json.Marshal(cs.GetDockerCache())
+	if !ok || string(first) != string(want)+"\n" {
+		t.Fatalf("GetDockerCacheJSON() = %q, want %q plus newline", first, want)
+	}
+	if again, _ := cs.GetDockerCacheJSON(); &again[0] != &first[0] {
+		t.Error("unchanged snapshot was encoded again")
+	}
+
+	replaced := []dto.ContainerInfo{{ID: "b", Name: "sonarr"}}
+	cs.dockerCache.Store(&replaced)
+	if body, _ := cs.GetDockerCacheJSON(); !strings.Contains(string(body), "sonarr") {
+		t.Errorf("body after republish = %q, want the new snapshot", body)
+	}
+}
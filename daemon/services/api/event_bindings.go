@@ -126,31 +126,48 @@ func buildCacheDispatch(bindings []eventBinding) map[reflect.Type]func(*CacheSto
 	return m
 }
 
+// broadcastOnlyBindings lists topics that are broadcast to WebSocket clients
+// but not cached. They have no update function.
+func broadcastOnlyBindings() []eventBinding {
+	return []eventBinding{
+		broadcastOnly(constants.TopicCollectorStateChange),
+		broadcastOnly(constants.TopicSourceStatusChanged),
+	}
+}
+
+// broadcastOnly creates an eventBinding without a cache update function.
+func broadcastOnly[T any](topic domain.Topic[T]) eventBinding {
+	return eventBinding{topicName: topic.Name, msgType: reflect.TypeFor[T]()}
+}
+
+// broadcastBindings returns every binding whose topic is forwarded to
+// WebSocket clients: all cache bindings plus the broadcast-only topics.
+func broadcastBindings() []eventBinding {
+	return append(cacheBindings(), broadcastOnlyBindings()...)
+}
+
 // broadcastTopicNames derives the full list of topics forwarded to WebSocket
-// clients from cacheBindings() plus any non-cache topics that clients need.
+// clients from broadcastBindings().
 // This ensures adding a new cache binding automatically enables its broadcast.
 func broadcastTopicNames() []string {
-	bindings := cacheBindings()
-	names := make([]string, 0, len(bindings)+2)
-	for _, b := range bindings {
-		names = append(names, b.topicName)
+	bindings := broadcastBindings()
+	names := make([]string, len(bindings))
+	for i, b := range bindings {
+		names[i] = b.topicName
 	}
-	// CollectorStateChange is broadcast but not cached.
-	names = append(names, constants.TopicCollectorStateChange.Name)
-	// SourceStatusChanged is broadcast but not cached.
-	names = append(names, constants.TopicSourceStatusChanged.Name)
 	return names
 }
 
-// buildTypeToTopicMap returns a reflect.Type → topic name map
-// for resolving the topic name of a broadcast message.
+// buildTypeToTopicMap returns a reflect.Type → topic name map for resolving
+// the topic name of a broadcast message. It covers the same bindings as
+// broadcastTopicNames, so every forwarded message is sent under its own
+// event name and clients never have to infer the event from the payload's
+// keys.
 func buildTypeToTopicMap() map[reflect.Type]string {
-	bindings := cacheBindings()
-	m := make(map[reflect.Type]string, len(bindings)+1)
+	bindings := broadcastBindings()
+	m := make(map[reflect.Type]string, len(bindings))
 	for _, b := range bindings {
 		m[b.msgType] = b.topicName
 	}
-	// SourceStatus is broadcast but not cached.
-	m[reflect.TypeOf(dto.SourceStatus{})] = "source_status_changed"
 	return m
 }
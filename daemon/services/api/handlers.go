@@ -2,6 +2,7 @@
 package api
 
 import (
+	"context"
 	"encoding/json"
 	"fmt"
 	"net/http"
@@ -20,6 +21,10 @@ import (
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/services/controllers"
 )
 
+// healthBody is the constant /health response, encoded once. It matches what
+// respondJSON would write for map[string]string{"status": "ok"}.
+var healthBody = []byte(`{"status":"ok"}` + "\n")
+
 // handleHealth godoc
 //
 //	@Summary		Health check
@@ -29,7 +34,9 @@ import (
 //	@Success		200	{object}	map[string]string	"Server is healthy"
 //	@Router			/health [get]
 func (s *Server) handleHealth(w http.ResponseWriter, _ *http.Request) {
-	respondJSON(w, http.StatusOK, map[string]string{"status": "ok"})
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusOK)
+	_, _ = w.Write(healthBody)
 }
 
 // handleSystem godoc
@@ -175,14 +182,9 @@ func (s *Server) handleDisk(w http.ResponseWriter, r *http.Request) {
 	diskID := vars["id"]
 	logger.Debug("API: Getting disk info for %s", diskID)
 
-	disks := s.GetDisksCache()
-
-	// Find disk by ID
-	for _, disk := range disks {
-		if disk.ID == diskID || disk.Device == diskID || disk.Name == diskID {
-			respondJSON(w, http.StatusOK, disk)
-			return
-		}
+	if disk, ok := s.GetDisk(diskID); ok {
+		respondJSON(w, http.StatusOK, disk)
+		return
 	}
 
 	// Disk not found
@@ -221,6 +223,16 @@ func (s *Server) handleShares(w http.ResponseWriter, _ *http.Request) {
 //	@Success		200	{array}	dto.ContainerInfo	"List of containers"
 //	@Router			/docker [get]
 func (s *Server) handleDockerList(w http.ResponseWriter, _ *http.Request) {
+	// Serve the snapshot's pre-encoded body when there is one
+	if body, ok := s.GetDockerCacheJSON(); ok {
+		w.Header().Set("Content-Type", "application/json")
+		w.WriteHeader(http.StatusOK)
+		if _, err := w.Write(body); err != nil {
+			logger.Error("Failed to write JSON response: %v", err)
+		}
+		return
+	}
+
 	// Get latest container list from cache
 	containers := s.GetDockerCache()
 
@@ -246,14 +258,10 @@ func (s *Server) handleDockerInfo(w http.ResponseWriter, r *http.Request) {
 	containerID := vars["id"]
 	logger.Debug("API: Getting container info for %s", containerID)
 
-	containers := s.GetDockerCache()
-
 	// Find container by ID or name
-	for _, container := range containers {
-		if container.ID == containerID || container.Name == containerID {
-			respondJSON(w, http.StatusOK, container)
-			return
-		}
+	if container, ok := s.GetDockerContainer(containerID); ok {
+		respondJSON(w, http.StatusOK, container)
+		return
 	}
 
 	// Container not found
@@ -298,14 +306,10 @@ func (s *Server) handleVMInfo(w http.ResponseWriter, r *http.Request) {
 	vmID := vars["id"]
 	logger.Debug("API: Getting VM info for %s", vmID)
 
-	vms := s.GetVMsCache()
-
 	// Find VM by ID or name
-	for _, vm := range vms {
-		if vm.ID == vmID || vm.Name == vmID {
-			respondJSON(w, http.StatusOK, vm)
-			return
-		}
+	if vm, ok := s.GetVM(vmID); ok {
+		respondJSON(w, http.StatusOK, vm)
+		return
 	}
 
 	// VM not found
@@ -1821,13 +1825,16 @@ func (s *Server) handleNotifications(w http.ResponseWriter, r *http.Request) {
 	// Filter by importance if specified
 	importance := r.URL.Query().Get("importance")
 	if importance != "" {
-		filtered := []dto.Notification{}
-		for _, n := range notificationList.Notifications {
-			if n.Importance == importance {
-				filtered = append(filtered, n)
+		// Filter a shallow copy: the cached list is shared with every other
+		// reader, so it must never be modified in place.
+		filtered := *notificationList
+		filtered.Notifications = []dto.Notification{}
+		for i := range notificationList.Notifications {
+			if n := &notificationList.Notifications[i]; n.Importance == importance {
+				filtered.Notifications = append(filtered.Notifications, *n)
 			}
 		}
-		notificationList.Notifications = filtered
+		notificationList = &filtered
 	}
 
 	respondJSON(w, http.StatusOK, notificationList)
@@ -1842,9 +1849,9 @@ func (s *Server) handleNotifications(w http.ResponseWriter, r *http.Request) {
 //	@Success		200	{object}	map[string]interface{}	"Unread notifications with count"
 //	@Router			/notifications/unread [get]
 func (s *Server) handleNotificationsUnread(w http.ResponseWriter, _ *http.Request) {
-	notificationList := s.notificationsCache.Load()
+	unread, _, ok := s.GetNotificationsByType()
 
-	if notificationList == nil {
+	if !ok {
 		respondJSON(w, http.StatusOK, map[string]any{
 			"notifications": []dto.Notification{},
 			"count":         0,
@@ -1852,13 +1859,6 @@ func (s *Server) handleNotificationsUnread(w http.ResponseWriter, _ *http.Reques
 		return
 	}
 
-	unread := []dto.Notification{}
-	for _, n := range notificationList.Notifications {
-		if n.Type == "unread" {
-			unread = append(unread, n)
-		}
-	}
-
 	respondJSON(w, http.StatusOK, map[string]any{
 		"notifications": unread,
 		"count":         len(unread),
@@ -1874,9 +1874,9 @@ func (s *Server) handleNotificationsUnread(w http.ResponseWriter, _ *http.Reques
 //	@Success		200	{object}	map[string]interface{}	"Archived notifications with count"
 //	@Router			/notifications/archive [get]
 func (s *Server) handleNotificationsArchive(w http.ResponseWriter, _ *http.Request) {
-	notificationList := s.notificationsCache.Load()
+	_, archived, ok := s.GetNotificationsByType()
 
-	if notificationList == nil {
+	if !ok {
 		respondJSON(w, http.StatusOK, map[string]any{
 			"notifications": []dto.Notification{},
 			"count":         0,
@@ -1884,13 +1884,6 @@ func (s *Server) handleNotificationsArchive(w http.ResponseWriter, _ *http.Reque
 		return
 	}
 
-	archived := []dto.Notification{}
-	for _, n := range notificationList.Notifications {
-		if n.Type == "archive" {
-			archived = append(archived, n)
-		}
-	}
-
 	respondJSON(w, http.StatusOK, map[string]any{
 		"notifications": archived,
 		"count":         len(archived),
@@ -2993,6 +2986,18 @@ func (s *Server) handleDockerCheckUpdates(w http.ResponseWriter, _ *http.Request
 	respondJSON(w, http.StatusOK, dto.ContainerUpdatesResult{})
 }
 
+// updateRefreshCooldown is how long the result of a forced Docker or plugin
+// update re-check is reused. Each check queries remote registries, so a burst
+// of refresh requests (several dashboard buttons, a retrying client) waits for
+// and shares one check instead of each starting its own. Failed checks are not
+// cached.
+const updateRefreshCooldown = 5 * time.Second
+
+// updateRefreshTimeout bounds a shared update re-check. It runs detached from
+// the request that started it, so no single client can cancel it for the
+// others waiting on the result.
+const updateRefreshTimeout = 2 * time.Minute
+
 // handleDockerUpdatesRefresh godoc
 //
 //	@Summary		Force a container update re-check
@@ -3003,17 +3008,26 @@ func (s *Server) handleDockerCheckUpdates(w http.ResponseWriter, _ *http.Request
 //	@Failure		500	{object}	dto.Response				"Check failed"
 //	@Router			/docker/updates/refresh [post]
 func (s *Server) handleDockerUpdatesRefresh(w http.ResponseWriter, r *http.Request) {
-	dc := controllers.NewDockerController()
-	defer func() { _ = dc.Close() }()
-	result, err := dc.CheckAllContainerUpdates(r.Context())
+	result, err := s.dockerUpdatesRefresh.getContext(r.Context(), updateRefreshCooldown, updateRefreshTimeout, func(ctx context.Context) *dto.ContainerUpdatesResult {
+		dc := controllers.NewDockerController()
+		defer func() { _ = dc.Close() }()
+		result, err := dc.CheckAllContainerUpdates(ctx)
+		if err != nil {
+			logger.Error("API: container update refresh failed: %v", err)
+			return nil
+		}
+		domain.Publish(s.ctx.Hub, constants.TopicDockerUpdatesUpdate, result)
+		return result
+	})
 	if err != nil {
-		logger.Error("API: container update refresh failed: %v", err)
+		return // the client went away; the shared check carries on without it
+	}
+	if result == nil {
 		respondJSON(w, http.StatusInternalServerError, dto.Response{
 			Success: false, Message: "update check failed", Timestamp: time.Now(),
 		})
 		return
 	}
-	domain.Publish(s.ctx.Hub, constants.TopicDockerUpdatesUpdate, result)
 	respondJSON(w, http.StatusOK, result)
 }
 
@@ -3220,22 +3234,31 @@ func (s *Server) handlePluginCheckUpdates(w http.ResponseWriter, _ *http.Request
 //	@Failure		500	{object}	dto.Response	"Check failed"
 //	@Router			/plugins/updates/refresh [post]
 func (s *Server) handlePluginUpdatesRefresh(w http.ResponseWriter, r *http.Request) {
-	controller := controllers.NewPluginController()
-	updates, err := controller.CheckPluginUpdates(r.Context())
+	result, err := s.pluginUpdatesRefresh.getContext(r.Context(), updateRefreshCooldown, updateRefreshTimeout, func(ctx context.Context) *dto.PluginList {
+		controller := controllers.NewPluginController()
+		updates, err := controller.CheckPluginUpdates(ctx)
+		if err != nil {
+			logger.Error("API: plugin update refresh failed: %v", err)
+			return nil
+		}
+		result := &dto.PluginList{
+			Plugins:          updates,
+			TotalCount:       len(updates),
+			UpdatesAvailable: len(updates),
+			Timestamp:        time.Now(),
+		}
+		domain.Publish(s.ctx.Hub, constants.TopicPluginUpdatesUpdate, result)
+		return result
+	})
 	if err != nil {
-		logger.Error("API: plugin update refresh failed: %v", err)
+		return // the client went away; the shared check carries on without it
+	}
+	if result == nil {
 		respondJSON(w, http.StatusInternalServerError, dto.Response{
 			Success: false, Message: "plugin update check failed", Timestamp: time.Now(),
 		})
 		return
 	}
-	result := &dto.PluginList{
-		Plugins:          updates,
-		TotalCount:       len(updates),
-		UpdatesAvailable: len(updates),
-		Timestamp:        time.Now(),
-	}
-	domain.Publish(s.ctx.Hub, constants.TopicPluginUpdatesUpdate, result)
 	respondJSON(w, http.StatusOK, result)
 }
 
@@ -4747,27 +4770,8 @@ func (s *Server) handleSetCPUGovernor(w http.ResponseWriter, r *http.Request) {
 //	@Failure		500	{object}	dto.Response				"Internal error"
 //	@Router			/docker/stats [get]
 func (s *Server) handleDockerStats(w http.ResponseWriter, _ *http.Request) {
-	containers := s.GetDockerCache()
-	if containers == nil {
-		respondJSON(w, http.StatusOK, dto.DockerAggregateStats{Timestamp: time.Now()})
-		return
-	}
-
-	var stats dto.DockerAggregateStats
-	for i := range containers {
-		c := &containers[i]
-		stats.TotalContainers++
-		if c.State == "running" {
-			stats.RunningContainers++
-			stats.TotalCPUPercent += c.CPUPercent
-			stats.TotalMemoryUsage += c.MemoryUsage
-			stats.TotalMemoryUsageMB += c.MemoryUsageMB
-			stats.TotalMemoryLimit += c.MemoryLimit
-		}
-	}
-	if stats.TotalMemoryLimit > 0 {
-		stats.MemoryUsagePercent = float64(stats.TotalMemoryUsage) / float64(stats.TotalMemoryLimit) * 100
-	}
+	// Without a cached list this is the zero aggregate, as before.
+	stats, _ := s.GetDockerStats()
 	stats.Timestamp = time.Now()
 
 	respondJSON(w, http.StatusOK, stats)
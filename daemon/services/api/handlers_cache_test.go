@@ -709,6 +709,16 @@ func TestHandleNotifications_WithImportanceFilter(t *testing.T) {
 	if rr.Code != http.StatusOK {
 		t.Fatalf("expected 200, got %d", rr.Code)
 	}
+	var got dto.NotificationList
+	if err := json.Unmarshal(rr.Body.Bytes(), &got); err != nil {
+		t.Fatalf("decode response: %v", err)
+	}
+	if len(got.Notifications) != 1 || got.Notifications[0].ID != "n2" {
+		t.Errorf("filtered notifications = %+v, want only n2", got.Notifications)
+	}
+	if cached := server.notificationsCache.Load(); len(cached.Notifications) != 4 {
+		t.Errorf("cached list has %d notifications after filtering, want 4 (cache must not be modified)", len(cached.Notifications))
+	}
 }
 
 func TestHandleNotifications_NilCache(t *testing.T) {
@@ -47,6 +47,14 @@ func TestHealthEndpoint(t *testing.T) {
 	}
 }
 
+func TestHealthBodyMatchesEncodedResponse(t *testing.T) {
+	rr := httptest.NewRecorder()
+	respondJSON(rr, http.StatusOK, map[string]string{"status": "ok"})
+	if got := rr.Body.String(); got != string(healthBody) {
+		t.Errorf("healthBody = %q, respondJSON writes %q", healthBody, got)
+	}
+}
+
 func TestSystemEndpoint(t *testing.T) {
 	server, _ := setupTestServer()
 
@@ -3,7 +3,6 @@ package api
 import (
 	"fmt"
 	"net/http"
-	"sort"
 	"time"
 
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/dto"
@@ -12,6 +11,13 @@ import (
 // diskTempWarning is the temperature threshold (°C) above which a disk finding is emitted as a warning.
 const diskTempWarning = 55.0
 
+// Finding severities, in report order.
+const (
+	severityCritical = "critical"
+	severityWarning  = "warning"
+	severityInfo     = "info"
+)
+
 // BuildHealthReport aggregates health signals from plain data and returns a
 // prioritised, ranked HealthReport. Keeping inputs as plain values makes the
 // function unit-testable without a running Server.
@@ -27,7 +33,7 @@ func BuildHealthReport(
 
 	if array != nil && array.State != "Started" {
 		findings = append(findings, dto.HealthFinding{
-			Severity: "critical",
+			Severity: severityCritical,
 			Title:    "Array not started",
 			Detail:   fmt.Sprintf("Array is in state %q — data is inaccessible until the array is started.", array.State),
 		})
@@ -35,34 +41,44 @@ func BuildHealthReport(
 
 	// ── Disk health ───────────────────────────────────────────────────────────
 
-	for _, d := range disks {
-		if d.SMARTStatus != "" && d.SMARTStatus != "PASSED" {
+	// Index into the slice rather than ranging by value: DiskInfo is a large
+	// struct and most disks produce no finding, so copying each one is waste.
+	for i := range disks {
+		d := &disks[i]
+		smartFailed := d.SMARTStatus != "" && d.SMARTStatus != "PASSED"
+		hot := d.Temperature > diskTempWarning
+		if !smartFailed && !hot {
+			continue
+		}
+		label := diskLabel(d)
+		if smartFailed {
 			findings = append(findings, dto.HealthFinding{
-				Severity: "critical",
-				Title:    fmt.Sprintf("Disk %s SMART failure", diskLabel(d)),
-				Detail:   fmt.Sprintf("Disk %s reported SMART status %q. Backup data and replace the disk.", diskLabel(d), d.SMARTStatus),
+				Severity: severityCritical,
+				Title:    fmt.Sprintf("Disk %s SMART failure", label),
+				Detail:   fmt.Sprintf("Disk %s reported SMART status %q. Backup data and replace the disk.", label, d.SMARTStatus),
 			})
 		}
-		if d.Temperature > diskTempWarning {
+		if hot {
 			findings = append(findings, dto.HealthFinding{
-				Severity: "warning",
-				Title:    fmt.Sprintf("Disk %s high temperature", diskLabel(d)),
-				Detail:   fmt.Sprintf("Disk %s temperature is %.0f °C (threshold: %.0f °C). Improve airflow or reduce load.", diskLabel(d), d.Temperature, diskTempWarning),
+				Severity: severityWarning,
+				Title:    fmt.Sprintf("Disk %s high temperature", label),
+				Detail:   fmt.Sprintf("Disk %s temperature is %.0f °C (threshold: %.0f °C). Improve airflow or reduce load.", label, d.Temperature, diskTempWarning),
 			})
 		}
 	}
 
 	// ── Container health ──────────────────────────────────────────────────────
 
-	for _, c := range containers {
+	for i := range containers {
+		c := &containers[i]
 		if c.State != "running" {
-			sev := "info"
+			sev := severityInfo
 			title := fmt.Sprintf("Container %q is not running", c.Name)
 			detail := fmt.Sprintf("Container %q is in state %q.", c.Name, c.State)
 
 			// Elevate to warning when restart count indicates repeated failures.
 			if c.RestartCount > 3 {
-				sev = "warning"
+				sev = severityWarning
 				title = fmt.Sprintf("Container %q is not running (restarted %d times)", c.Name, c.RestartCount)
 				detail = fmt.Sprintf("Container %q is in state %q and has restarted %d times — it may be crash-looping.", c.Name, c.State, c.RestartCount)
 			}
@@ -85,7 +101,7 @@ func BuildHealthReport(
 		// Running but update available — informational only (no executor action for updates).
 		if c.UpdateAvailable != nil && *c.UpdateAvailable {
 			findings = append(findings, dto.HealthFinding{
-				Severity: "info",
+				Severity: severityInfo,
 				Title:    fmt.Sprintf("Container %q has an update available", c.Name),
 				Detail:   fmt.Sprintf("A newer image is available for container %q. Update via the Docker UI or docker pull.", c.Name),
 			})
@@ -97,7 +113,7 @@ func BuildHealthReport(
 	for _, a := range firing {
 		sev := a.Severity
 		if sev == "" {
-			sev = "warning"
+			sev = severityWarning
 		}
 		msg := a.Message
 		if msg == "" {
@@ -105,39 +121,31 @@ func BuildHealthReport(
 		}
 		findings = append(findings, dto.HealthFinding{
 			Severity: normalizeSeverity(sev),
-			Title:    fmt.Sprintf("Firing alert: %s", a.RuleName),
+			Title:    "Firing alert: " + a.RuleName,
 			Detail:   msg,
 		})
 	}
 
-	// ── Sort by severity (critical → warning → info) ──────────────────────────
+	// ── Order by severity (critical → warning → info) ──────────────────────────
 
-	severityOrder := map[string]int{"critical": 0, "warning": 1, "info": 2}
-	sort.SliceStable(findings, func(i, j int) bool {
-		oi, ok := severityOrder[findings[i].Severity]
-		if !ok {
-			oi = severityOrder["info"]
-		}
-		oj, ok := severityOrder[findings[j].Severity]
-		if !ok {
-			oj = severityOrder["info"]
-		}
-		return oi < oj
-	})
-
-	// ── Count by severity ─────────────────────────────────────────────────────
-
-	var critical, warning, info int
-	for _, f := range findings {
-		switch f.Severity {
-		case "critical":
-			critical++
-		case "warning":
-			warning++
-		default:
-			info++
+	// Count first, then place each finding into its severity's region of a new
+	// slice. This is a stable three-way partition: O(n), with no comparator or
+	// map lookups, and the counts come out of the same pass.
+	var counts [3]int
+	for i := range findings {
+		counts[severityRank(findings[i].Severity)]++
+	}
+	if len(findings) > 0 {
+		ordered := make([]dto.HealthFinding, len(findings))
+		next := [3]int{0, counts[0], counts[0] + counts[1]}
+		for i := range findings {
+			r := severityRank(findings[i].Severity)
+			ordered[next[r]] = findings[i]
+			next[r]++
 		}
+		findings = ordered
 	}
+	critical, warning, info := counts[0], counts[1], counts[2]
 
 	if findings == nil {
 		findings = []dto.HealthFinding{}
@@ -157,15 +165,28 @@ func BuildHealthReport(
 // and count consistently.
 func normalizeSeverity(s string) string {
 	switch s {
-	case "critical", "warning", "info":
+	case severityCritical, severityWarning, severityInfo:
 		return s
 	default:
-		return "info"
+		return severityInfo
+	}
+}
+
+// severityRank orders severities for the report: critical, warning, then
+// everything else as info (matching normalizeSeverity).
+func severityRank(s string) int {
+	switch s {
+	case severityCritical:
+		return 0
+	case severityWarning:
+		return 1
+	default:
+		return 2
 	}
 }
 
 // diskLabel returns a human-readable label for a disk.
-func diskLabel(d dto.DiskInfo) string {
+func diskLabel(d *dto.DiskInfo) string {
 	if d.Name != "" {
 		return d.Name
 	}
@@ -184,15 +205,9 @@ func diskLabel(d dto.DiskInfo) string {
 //	@Success		200	{object}	dto.HealthReport	"Health report"
 //	@Router			/health/report [get]
 func (s *Server) handleHealthReport(w http.ResponseWriter, _ *http.Request) {
+	// BuildHealthReport treats nil slices as empty; no defaults are needed.
 	containers := s.GetDockerCache()
-	if containers == nil {
-		containers = []dto.ContainerInfo{}
-	}
-
 	disks := s.GetDisksCache()
-	if disks == nil {
-		disks = []dto.DiskInfo{}
-	}
 
 	var firing []dto.AlertStatus
 	if s.alertEngine != nil {
@@ -353,3 +353,39 @@ func TestHandleHealthReport_WithStoppedContainerInCache(t *testing.T) {
 		t.Error("expected start_container ActionRef for deadbeef1234 in report findings")
 	}
 }
+
+// TestBuildHealthReport_OrdersBySeverityStably verifies findings are grouped
+// critical → warning → info while keeping their original order within a group.
+func TestBuildHealthReport_OrdersBySeverityStably(t *testing.T) {
+	containers := []dto.ContainerInfo{
+		{ID: "c1", Name: "first", State: "exited"},
+		{ID: "c2", Name: "second", State: "exited"},
+	}
+	disks := []dto.DiskInfo{
+		{ID: "disk1", Name: "Disk 1", SMARTStatus: "FAILED", Temperature: 60},
+		{ID: "disk2", Name: "Disk 2", SMARTStatus: "FAILED"},
+	}
+	firing := []dto.AlertStatus{{RuleName: "odd", Severity: "bogus"}}
+
+	report := BuildHealthReport(containers, nil, disks, firing)
+
+	want := []string{
+		"Disk Disk 1 SMART failure",
+		"Disk Disk 2 SMART failure",
+		"Disk Disk 1 high temperature",
+		`Container "first" is not running`,
+		`Container "second" is not running`,
+		"Firing alert: odd",
+	}
+	if len(report.Findings) != len(want) {
+		t.Fatalf("got %d findings, want %d: %+v", len(report.Findings), len(want), report.Findings)
+	}
+	for i, f := range report.Findings {
+		if f.Title != want[i] {
+			t.Errorf("finding %d = %q, want %q", i, f.Title, want[i])
+		}
+	}
+	if report.Critical != 2 || report.Warning != 1 || report.Info != 3 {
+		t.Errorf("counts = %d/%d/%d, want 2/1/3", report.Critical, report.Warning, report.Info)
+	}
+}
@@ -0,0 +1,98 @@
+package api
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/logger"
+)
+
+// memo caches one computed value for a short time. Concurrent callers that
+// miss the cache wait for the single in-progress computation instead of
+// starting their own, so a burst of requests for an expensive on-demand value
+// (e.g. one that calls external services) costs one computation.
+//
+// The zero value is ready to use. The cached value is shared between callers
+// and must be treated as read-only.
+type memo[T any] struct {
+	mu      sync.Mutex
+	value   *T
+	expires time.Time
+	call    *memoCall[T] // computation started by getContext, nil when idle
+}
+
+// memoCall is one in-progress getContext computation; value is set before
+// done is closed.
+type memoCall[T any] struct {
+	done  chan struct{}
+	value *T
+}
+
+// get returns the cached value if it is younger than ttl, and otherwise calls
+// compute and caches its result.
+func (m *memo[T]) get(ttl time.Duration, compute func() *T) *T {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+
+	if m.value != nil && time.Now().Before(m.expires) {
+		return m.value
+	}
+	m.value = compute()
+	m.expires = time.Now().Add(ttl)
+	return m.value
+}
+
+// getContext is get for computations that take a context, such as checks
+// against external registries. The computation runs on a context detached
+// from ctx and bounded by timeout, so a caller that goes away does not fail
+// the others sharing it, and each caller stops waiting as soon as its own
+// ctx is done, returning ctx.Err(). A nil result marks a failed
+// computation: every caller that shared it receives nil, but it is not
+// cached, so the next caller starts a fresh computation.
+func (m *memo[T]) getContext(ctx context.Context, ttl, timeout time.Duration, compute func(context.Context) *T) (*T, error) {
+	m.mu.Lock()
+	if m.value != nil && time.Now().Before(m.expires) {
+		v := m.value
+		m.mu.Unlock()
+		return v, nil
+	}
+	call := m.call
+	if call == nil {
+		call = &memoCall[T]{done: make(chan struct{})}
+		m.call = call
+		go m.run(context.WithoutCancel(ctx), call, ttl, timeout, compute)
+	}
+	m.mu.Unlock()
+
+	select {
+	case <-call.done:
+		return call.value, nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
+
+// run performs call's computation and publishes its result.
+func (m *memo[T]) run(ctx context.Context, call *memoCall[T], ttl, timeout time.Duration, compute func(context.Context) *T) {
+	var v *T
+	defer func() {
+		if r := recover(); r != nil {
+			logger.LogPanicWithStack("memo computation", r)
+			v = nil
+		}
+		m.mu.Lock()
+		if v != nil {
+			m.value = v
+			m.expires = time.Now().Add(ttl)
+		}
+		m.call = nil
+		m.mu.Unlock()
+		call.value = v
+		close(call.done)
+	}()
+
+	ctx, cancel := context.WithTimeout(ctx, timeout)
+	defer cancel()
+	v = compute(ctx)
+}
@@ -0,0 +1,125 @@
+package api
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestMemoSharesOneComputation(t *testing.T) {
+	var m memo[int]
+	var calls atomic.Int32
+	compute := func() *int {
+		calls.Add(1)
+		time.Sleep(10 * time.Millisecond)
+		v := 42
+		return &v
+	}
+
+	var wg sync.WaitGroup
+	for range 8 {
+		wg.Go(func() {
+			if got := m.get(time.Minute, compute); *got != 42 {
+				t.Errorf("get() = %d, want 42", *got)
+			}
+		})
+	}
+	wg.Wait()
+
+	if got := calls.Load(); got != 1 {
+		t.Errorf("compute called %d times, want 1", got)
+	}
+}
+
+func TestMemoRecomputesAfterTTL(t *testing.T) {
+	var m memo[int]
+	n := 0
+	compute := func() *int {
+		n++
+		v := n
+		return &v
+	}
+
+	if got := *m.get(time.Millisecond, compute); got != 1 {
+		t.Fatalf("first get() = %d, want 1", got)
+	}
+	time.Sleep(5 * time.Millisecond)
+	if got := *m.get(time.Millisecond, compute); got != 2 {
+		t.Errorf("get() after ttl = %d, want 2", got)
+	}
+}
+
+func TestMemoGetContextSharesFailureWithoutCaching(t *testing.T) {
+	var m memo[int]
+	var calls atomic.Int32
+	release := make(chan struct{})
+	failing := func(context.Context) *int {
+		calls.Add(1)
+		<-release
+		return nil
+	}
+
+	var wg sync.WaitGroup
+	for range 4 {
+		wg.Go(func() {
+			if v, err := m.getContext(context.Background(), time.Minute, time.Minute, failing); v != nil || err != nil {
+				t.Errorf("getContext() = %v, %v; want nil, nil", v, err)
+			}
+		})
+	}
+	time.Sleep(10 * time.Millisecond)
+	close(release)
+	wg.Wait()
+	if got := calls.Load(); got != 1 {
+		t.Errorf("compute called %d times for one burst, want 1", got)
+	}
+
+	v, _ := m.getContext(context.Background(), time.Minute, time.Minute, func(context.Context) *int {
+		n := 7
+		return &n
+	})
+	if v == nil || *v != 7 {
+		t.Errorf("getContext() after a failure = %v, want a fresh computation", v)
+	}
+}
+
+func TestMemoGetContextDetachesFromCallers(t *testing.T) {
+	var m memo[int]
+	release := make(chan struct{})
+	var computeErr atomic.Value
+	compute := func(ctx context.Context) *int {
+		<-release
+		computeErr.Store(fmt.Sprint(ctx.Err()))
+		n := 42
+		return &n
+	}
+
+	first, cancel := context.WithCancel(context.Background())
+	firstDone := make(chan error, 1)
+	go func() {
+		_, err := m.getContext(first, time.Minute, time.Minute, compute)
+		firstDone <- err
+	}()
+	time.Sleep(10 * time.Millisecond)
+	cancel()
+	if err := <-firstDone; !errors.Is(err, context.Canceled) {
+		t.Errorf("cancelled caller got %v, want context.Canceled", err)
+	}
+
+	second := make(chan *int, 1)
+	go func() {
+		v, _ := m.getContext(context.Background(), time.Minute, time.Minute, compute)
+		second <- v
+	}()
+	close(release)
+	if v := <-second; v == nil || *v != 42 {
+		t.Errorf("waiter got %v, want the shared result", v)
+	}
+	if got := computeErr.Load(); got != "<nil>" {
+		t.Errorf("computation context err = %v, want <nil> after the first caller left", got)
+	}
+}
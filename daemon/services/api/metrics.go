@@ -1,12 +1,15 @@
 package api
 
 import (
-	"fmt"
 	"net/http"
+	"strconv"
+	"sync"
 
 	"github.com/prometheus/client_golang/prometheus"
 	"github.com/prometheus/client_golang/prometheus/collectors"
 	"github.com/prometheus/client_golang/prometheus/promhttp"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/dto"
 )
 
 // Prometheus metric definitions
@@ -299,6 +302,12 @@ var (
 // metricsRegistry is a custom registry for Unraid metrics
 var metricsRegistry = prometheus.NewRegistry()
 
+// metricsHandler serves metricsRegistry. It is built once rather than per
+// scrape; the handler is safe for concurrent use.
+var metricsHandler = promhttp.HandlerFor(metricsRegistry, promhttp.HandlerOpts{
+	EnableOpenMetrics: true,
+})
+
 func init() {
 	// Register all metrics with our custom registry
 	metricsRegistry.MustRegister(
@@ -372,8 +381,43 @@ func init() {
 	)
 }
 
+// metricsSources records the cache snapshots the per-item metric vectors were
+// last rebuilt from. Collectors publish a fresh snapshot on every update, so
+// an unchanged pointer means the vectors already hold its values and the
+// Reset-and-repopulate pass can be skipped. Like the vectors themselves, it
+// is package-level and guarded by its mutex, which also keeps concurrent
+// scrapes from interleaving a Reset with another scrape's repopulation.
+var metricsSources struct {
+	mu     sync.Mutex
+	disks  *[]dto.DiskInfo
+	docker *dockerView
+	vms    *[]dto.VMInfo
+	shares *[]dto.ShareInfo
+	gpus   *[]*dto.GPUMetrics
+	fans   *dto.FanControlStatus
+
+	// systemInfoLabels holds the label values of the current unraid_system_info
+	// series (hostname, version, agent_version). They change only on rename or
+	// upgrade, so the series is replaced only when they differ.
+	systemInfoLabels *[3]string
+}
+
+// sourceChanged reports whether cur differs from the snapshot *last was built
+// from, recording cur when it does. A nil cur never counts as a change, so the
+// previous values are kept while a source has nothing cached.
+func sourceChanged[T any](last **T, cur *T) bool {
+	if cur == nil || *last == cur {
+		return false
+	}
+	*last = cur
+	return true
+}
+
 // updateMetrics updates all Prometheus metrics from the server's cache
 func (s *Server) updateMetrics() {
+	metricsSources.mu.Lock()
+	defer metricsSources.mu.Unlock()
+
 	// OS-resilience: per-subsystem data-source health.
 	if s.ctx.Platform != nil {
 		subsystemStatus.Reset()
@@ -386,21 +430,21 @@ func (s *Server) updateMetrics() {
 	// Load all cache values atomically (lock-free reads)
 	sysCache := s.systemCache.Load()
 	arrCache := s.arrayCache.Load()
-	disksSlice := s.GetDisksCache()
-	dockerSlice := s.GetDockerCache()
-	vmsSlice := s.GetVMsCache()
+	disksPtr := s.disksCache.Load()
+	dockerPtr := s.loadDockerView()
+	vmsPtr := s.vmsCache.Load()
 	upsVal := s.upsCache.Load()
-	sharesSlice := s.GetSharesCache()
-	gpuSlice := s.GetGPUCache()
+	sharesPtr := s.sharesCache.Load()
+	gpuPtr := s.gpuCache.Load()
 
 	// Update system metrics
 	if sysCache != nil {
-		systemInfo.Reset()
-		systemInfo.WithLabelValues(
-			sysCache.Hostname,
-			sysCache.Version,
-			sysCache.AgentVersion,
-		).Set(1)
+		labels := [3]string{sysCache.Hostname, sysCache.Version, sysCache.AgentVersion}
+		if last := metricsSources.systemInfoLabels; last == nil || *last != labels {
+			systemInfo.Reset()
+			systemInfo.WithLabelValues(labels[:]...).Set(1)
+			metricsSources.systemInfoLabels = &labels
+		}
 
 		systemUptime.Set(float64(sysCache.Uptime))
 		cpuUsage.Set(sysCache.CPUUsage)
@@ -451,7 +495,8 @@ func (s *Server) updateMetrics() {
 	}
 
 	// Update disk metrics
-	if disksSlice != nil {
+	if sourceChanged(&metricsSources.disks, disksPtr) {
+		disksSlice := *disksPtr
 		// Reset disk metrics to clear stale entries
 		diskTemperature.Reset()
 		diskSizeBytes.Reset()
@@ -461,20 +506,24 @@ func (s *Server) updateMetrics() {
 		diskStandby.Reset()
 		diskSmartStatus.Reset()
 
-		for _, disk := range disksSlice {
+		for i := range disksSlice {
+			disk := &disksSlice[i]
 			// Determine disk type based on role (cache/pool disks are often SSDs)
 			diskType := "HDD"
 			if disk.Role == "cache" || disk.Role == "pool" {
 				diskType = "SSD"
 			}
 
+			// Most disk gauges share the same label values; build them once.
+			labels := []string{disk.Name, disk.Device}
+
 			if disk.Temperature > 0 {
 				diskTemperature.WithLabelValues(disk.Name, disk.Device, diskType).Set(disk.Temperature)
 			}
 
-			diskSizeBytes.WithLabelValues(disk.Name, disk.Device).Set(float64(disk.Size))
-			diskUsedBytes.WithLabelValues(disk.Name, disk.Device).Set(float64(disk.Used))
-			diskFreeBytes.WithLabelValues(disk.Name, disk.Device).Set(float64(disk.Free))
+			diskSizeBytes.WithLabelValues(labels...).Set(float64(disk.Size))
+			diskUsedBytes.WithLabelValues(labels...).Set(float64(disk.Used))
+			diskFreeBytes.WithLabelValues(labels...).Set(float64(disk.Free))
 
 			// Status: 1 = healthy, 0 = problem
 			statusValue := 1.0
@@ -488,19 +537,20 @@ func (s *Server) updateMetrics() {
 			if disk.SpinState == "standby" {
 				standbyValue = 1.0
 			}
-			diskStandby.WithLabelValues(disk.Name, disk.Device).Set(standbyValue)
+			diskStandby.WithLabelValues(labels...).Set(standbyValue)
 
 			// SMART status: 1 = passed, 0 = failed
 			smartValue := 1.0
 			if disk.SMARTStatus == "FAILED" {
 				smartValue = 0.0
 			}
-			diskSmartStatus.WithLabelValues(disk.Name, disk.Device).Set(smartValue)
+			diskSmartStatus.WithLabelValues(labels...).Set(smartValue)
 		}
 	}
 
 	// Update Docker metrics
-	if dockerSlice != nil {
+	if sourceChanged(&metricsSources.docker, dockerPtr) {
+		dockerSlice := dockerPtr.merged
 		containerState.Reset()
 		running := 0
 		for _, container := range dockerSlice {
@@ -516,7 +566,8 @@ func (s *Server) updateMetrics() {
 	}
 
 	// Update VM metrics
-	if vmsSlice != nil {
+	if sourceChanged(&metricsSources.vms, vmsPtr) {
+		vmsSlice := *vmsPtr
 		vmState.Reset()
 		running := 0
 		for _, vm := range vmsSlice {
@@ -550,7 +601,8 @@ func (s *Server) updateMetrics() {
 	}
 
 	// Update share metrics
-	if sharesSlice != nil {
+	if sourceChanged(&metricsSources.shares, sharesPtr) {
+		sharesSlice := *sharesPtr
 		shareUsedBytes.Reset()
 		for _, share := range sharesSlice {
 			shareUsedBytes.WithLabelValues(share.Name).Set(float64(share.Used))
@@ -559,7 +611,8 @@ func (s *Server) updateMetrics() {
 	}
 
 	// Update GPU metrics
-	if gpuSlice != nil {
+	if sourceChanged(&metricsSources.gpus, gpuPtr) {
+		gpuSlice := *gpuPtr
 		gpuTemperature.Reset()
 		gpuUtilization.Reset()
 		gpuMemoryUsed.Reset()
@@ -570,23 +623,24 @@ func (s *Server) updateMetrics() {
 			if gpu == nil {
 				continue
 			}
-			idx := fmt.Sprintf("%d", i)
-			gpuTemperature.WithLabelValues(idx, gpu.Name).Set(gpu.Temperature)
-			gpuUtilization.WithLabelValues(idx, gpu.Name).Set(gpu.UtilizationGPU)
-			gpuMemoryUsed.WithLabelValues(idx, gpu.Name).Set(float64(gpu.MemoryUsed))
-			gpuMemoryTotal.WithLabelValues(idx, gpu.Name).Set(float64(gpu.MemoryTotal))
-			gpuPowerWatts.WithLabelValues(idx, gpu.Name).Set(gpu.PowerDraw)
+			labels := []string{strconv.Itoa(i), gpu.Name}
+			gpuTemperature.WithLabelValues(labels...).Set(gpu.Temperature)
+			gpuUtilization.WithLabelValues(labels...).Set(gpu.UtilizationGPU)
+			gpuMemoryUsed.WithLabelValues(labels...).Set(float64(gpu.MemoryUsed))
+			gpuMemoryTotal.WithLabelValues(labels...).Set(float64(gpu.MemoryTotal))
+			gpuPowerWatts.WithLabelValues(labels...).Set(gpu.PowerDraw)
 		}
 	}
 
 	// Update fan metrics
-	if fanCache := s.fanControlCache.Load(); fanCache != nil {
+	if fanCache := s.fanControlCache.Load(); sourceChanged(&metricsSources.fans, fanCache) {
 		fanRPM.Reset()
 		fanPWMPercent.Reset()
 
 		for _, fan := range fanCache.Fans {
-			fanRPM.WithLabelValues(fan.ID, fan.Name).Set(float64(fan.RPM))
-			fanPWMPercent.WithLabelValues(fan.ID, fan.Name).Set(float64(fan.PWMPercent))
+			labels := []string{fan.ID, fan.Name}
+			fanRPM.WithLabelValues(labels...).Set(float64(fan.RPM))
+			fanPWMPercent.WithLabelValues(labels...).Set(float64(fan.PWMPercent))
 		}
 	}
 }
@@ -606,9 +660,7 @@ func (s *Server) handleMetrics(w http.ResponseWriter, r *http.Request) {
 	s.updateNetworkServiceMetrics()
 
 	// Serve metrics using Prometheus HTTP handler
-	promhttp.HandlerFor(metricsRegistry, promhttp.HandlerOpts{
-		EnableOpenMetrics: true,
-	}).ServeHTTP(w, r)
+	metricsHandler.ServeHTTP(w, r)
 }
 
 // updateNetworkServiceMetrics reads network service status from the cache
@@ -618,8 +670,9 @@ func (s *Server) updateNetworkServiceMetrics() {
 		return
 	}
 
-	serviceEnabled.Reset()
-	serviceRunning.Reset()
+	// The service label set is fixed, so the child gauges are created on the
+	// first scrape and only their values are overwritten afterwards. Resetting
+	// the vectors here would drop and reallocate all 26 children per scrape.
 
 	// Helper to set service metrics
 	setServiceMetrics := func(name string, enabled, running bool) {
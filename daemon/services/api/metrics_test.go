@@ -276,3 +276,52 @@ func TestRuntimeMetricsExposed(t *testing.T) {
 		}
 	}
 }
+
+func TestSourceChanged(t *testing.T) {
+	var last *dto.UPSStatus
+	a, b := &dto.UPSStatus{}, &dto.UPSStatus{}
+
+	if sourceChanged(&last, nil) || last != nil {
+		t.Fatal("a nil snapshot must not count as a change")
+	}
+	if !sourceChanged(&last, a) || last != a {
+		t.Fatal("first snapshot should count as a change and be recorded")
+	}
+	if sourceChanged(&last, a) {
+		t.Error("the same snapshot should not count as a change")
+	}
+	if sourceChanged(&last, nil) || last != a {
+		t.Error("a nil snapshot must keep the previous one recorded")
+	}
+	if !sourceChanged(&last, b) || last != b {
+		t.Error("a newly published snapshot should count as a change")
+	}
+}
+
+func TestSystemInfoMetricFollowsLabelChanges(t *testing.T) {
+	ctx := &domain.Context{Config: domain.Config{Port: 8043}}
+	server := NewServer(ctx)
+
+	scrape := func() string {
+		req := httptest.NewRequest(http.MethodGet, "/metrics", nil)
+		w := httptest.NewRecorder()
+		server.handleMetrics(w, req)
+		return w.Body.String()
+	}
+
+	server.systemCache.Store(&dto.SystemInfo{Hostname: "label-tower", Version: "7.2.3", AgentVersion: "1"})
+	scrape()
+	body := scrape()
+	if got := strings.Count(body, `unraid_system_info{agent_version="1",hostname="label-tower",version="7.2.3"} 1`); got != 1 {
+		t.Fatalf("expected one system info series after repeated scrapes, found %d", got)
+	}
+
+	server.systemCache.Store(&dto.SystemInfo{Hostname: "label-tower", Version: "7.3.0", AgentVersion: "1"})
+	body = scrape()
+	if !strings.Contains(body, `version="7.3.0"`) {
+		t.Error("system info series not updated after a version change")
+	}
+	if strings.Contains(body, `version="7.2.3"`) {
+		t.Error("stale system info series kept after a version change")
+	}
+}
@@ -2,10 +2,13 @@ package api
 
 import (
 	"bufio"
+	"compress/gzip"
 	"fmt"
+	"io"
 	"net"
 	"net/http"
 	"net/url"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -61,6 +64,12 @@ func (sr *statusRecorder) Hijack() (net.Conn, *bufio.ReadWriter, error) {
 
 func loggingMiddleware(next http.Handler) http.Handler {
 	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		// The access line is debug-only; outside debug mode skip the
+		// recorder, the clock reads and the boxed log arguments entirely.
+		if !logger.DebugEnabled() {
+			next.ServeHTTP(w, r)
+			return
+		}
 		start := time.Now()
 		rec := &statusRecorder{ResponseWriter: w, status: http.StatusOK}
 		next.ServeHTTP(rec, r)
@@ -113,6 +122,150 @@ func bodySizeLimitMiddleware(next http.Handler) http.Handler {
 	})
 }
 
+// gzipWriterPool recycles gzip writers across responses; a gzip.Writer carries
+// roughly 800 KB of compressor state, so allocating one per request would
+// outweigh the bandwidth saved on small payloads. BestSpeed is used because
+// clients are on the LAN, where CPU rather than bandwidth is the bottleneck.
+var gzipWriterPool = sync.Pool{
+	New: func() any {
+		zw, _ := gzip.NewWriterLevel(io.Discard, gzip.BestSpeed)
+		return zw
+	},
+}
+
+// gzipMinSize is the smallest body worth compressing. Below about one packet
+// gzip only adds its own framing and a deflate pass, and many endpoints
+// (/ups, /registration, action results) answer with a few hundred bytes.
+const gzipMinSize = 1024
+
+// gzipResponseWriter compresses the response body when the handler answers
+// with JSON. The decision is deferred to the first WriteHeader/Write so that
+// responses that set their own Content-Encoding (promhttp), stream events
+// (MCP), or carry no body are passed through untouched. For JSON the header is
+// held back once more, until the first Write shows whether the body reaches
+// gzipMinSize; handlers write their encoded body in one call, so that write is
+// representative.
+type gzipResponseWriter struct {
+	http.ResponseWriter
+	zw      *gzip.Writer
+	decided bool
+	// status is the held-back status code of a JSON response, or 0.
+	status int
+}
+
+func (g *gzipResponseWriter) WriteHeader(code int) {
+	if !g.decided {
+		g.decided = true
+		h := g.Header()
+		if code != http.StatusNoContent && code != http.StatusNotModified &&
+			h.Get("Content-Encoding") == "" &&
+			strings.HasPrefix(h.Get("Content-Type"), "application/json") {
+			g.status = code
+			return
+		}
+	} else if g.status != 0 {
+		return // header still held back; like net/http, drop the repeat call
+	}
+	g.ResponseWriter.WriteHeader(code)
+}
+
+// commit sends the held-back header, switching the body to gzip first when
+// compress is set.
+func (g *gzipResponseWriter) commit(compress bool) {
+	code := g.status
+	g.status = 0
+	if compress {
+		h := g.Header()
+		h.Set("Content-Encoding", "gzip")
+		h.Del("Content-Length")
+		zw, _ := gzipWriterPool.Get().(*gzip.Writer)
+		zw.Reset(g.ResponseWriter)
+		g.zw = zw
+	}
+	g.ResponseWriter.WriteHeader(code)
+}
+
+func (g *gzipResponseWriter) Write(b []byte) (int, error) {
+	if !g.decided {
+		g.WriteHeader(http.StatusOK)
+	}
+	if g.status != 0 {
+		g.commit(len(b) >= gzipMinSize)
+	}
+	if g.zw != nil {
+		return g.zw.Write(b)
+	}
+	return g.ResponseWriter.Write(b)
+}
+
+// Flush pushes buffered compressed bytes to the client so streaming handlers
+// keep working behind the middleware. A JSON response flushed before its
+// first write is assumed to be streaming and is compressed.
+func (g *gzipResponseWriter) Flush() {
+	if g.status != 0 {
+		g.commit(true)
+	}
+	if g.zw != nil {
+		_ = g.zw.Flush()
+	}
+	if f, ok := g.ResponseWriter.(http.Flusher); ok {
+		f.Flush()
+	}
+}
+
+// close finishes the gzip stream and returns the writer to the pool.
+func (g *gzipResponseWriter) close() {
+	if g.status != 0 {
+		g.commit(false) // JSON status without a body
+	}
+	if g.zw == nil {
+		return
+	}
+	if err := g.zw.Close(); err != nil {
+		logger.Debug("gzip: failed to finish response: %v", err)
+	}
+	g.zw.Reset(io.Discard)
+	gzipWriterPool.Put(g.zw)
+	g.zw = nil
+}
+
+// acceptsGzip reports whether the request's Accept-Encoding allows gzip.
+func acceptsGzip(r *http.Request) bool {
+	for part := range strings.SplitSeq(r.Header.Get("Accept-Encoding"), ",") {
+		coding, params, _ := strings.Cut(strings.TrimSpace(part), ";")
+		if !strings.EqualFold(strings.TrimSpace(coding), "gzip") {
+			continue
+		}
+		if q, ok := strings.CutPrefix(strings.TrimSpace(params), "q="); ok {
+			v, err := strconv.ParseFloat(q, 64)
+			return err == nil && v > 0
+		}
+		return true
+	}
+	return false
+}
+
+// gzipMiddleware compresses JSON responses for clients that advertise gzip
+// support. List endpoints such as /disks and /docker shrink several-fold,
+// which cuts both transfer time and the bytes a client has to read before it
+// can start decoding. WebSocket upgrades and HEAD requests are left alone.
+func gzipMiddleware(next http.Handler) http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == http.MethodHead || r.Header.Get("Upgrade") != "" {
+			next.ServeHTTP(w, r)
+			return
+		}
+		w.Header().Add("Vary", "Accept-Encoding")
+		if !acceptsGzip(r) {
+			next.ServeHTTP(w, r)
+			return
+		}
+		gw := &gzipResponseWriter{ResponseWriter: w}
+		defer gw.close()
+		next.ServeHTTP(gw, r)
+	})
+}
+
 // Rate limiting is per-client (keyed by source IP) rather than a single global
 // bucket. The agent is a LAN-only appliance whose clients legitimately burst:
 // the Home Assistant integration fetches 20-30 endpoints in parallel on every
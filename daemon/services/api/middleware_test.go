@@ -1,12 +1,17 @@
 package api
 
 import (
+	"compress/gzip"
+	"io"
 	"net/http"
 	"net/http/httptest"
+	"strings"
 	"testing"
 	"time"
 
 	"golang.org/x/time/rate"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/logger"
 )
 
 func TestCorsMiddleware(t *testing.T) {
@@ -348,3 +353,112 @@ func TestMiddlewareChainWithPanic(t *testing.T) {
 		t.Errorf("Access-Control-Allow-Origin = %q, want %q", got, "*")
 	}
 }
+
+func TestGzipMiddleware(t *testing.T) {
+	body := `{"disks":[` + strings.Repeat(`{"id":"disk1","status":"DISK_OK"},`, 40) + `{"id":"disk2"}]}`
+	const small = `{"success":true}`
+
+	tests := []struct {
+		name           string
+		acceptEncoding string
+		contentType    string
+		body           string
+		wantGzip       bool
+	}{
+		{"json with gzip", "gzip, deflate", "application/json", body, true},
+		{"json without gzip", "", "application/json", body, false},
+		{"gzip refused with q=0", "gzip;q=0", "application/json", body, false},
+		{"event stream is not compressed", "gzip", "text/event-stream", body, false},
+		{"small json is not compressed", "gzip", "application/json", small, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			handler := gzipMiddleware(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+				w.Header().Set("Content-Type", tt.contentType)
+				_, _ = w.Write([]byte(tt.body))
+			}))
+
+			req := httptest.NewRequest("GET", "/api/v1/disks", nil)
+			if tt.acceptEncoding != "" {
+				req.Header.Set("Accept-Encoding", tt.acceptEncoding)
+			}
+			rr := httptest.NewRecorder()
+			handler.ServeHTTP(rr, req)
+
+			if got := rr.Header().Get("Vary"); got != "Accept-Encoding" {
+				t.Errorf("Vary = %q, want Accept-Encoding", got)
+			}
+			gotGzip := rr.Header().Get("Content-Encoding") == "gzip"
+			if gotGzip != tt.wantGzip {
+				t.Fatalf("Content-Encoding gzip = %v, want %v", gotGzip, tt.wantGzip)
+			}
+
+			payload := rr.Body.Bytes()
+			if gotGzip {
+				zr, err := gzip.NewReader(rr.Body)
+				if err != nil {
+					t.Fatalf("gzip.NewReader: %v", err)
+				}
+				if payload, err = io.ReadAll(zr); err != nil {
+					t.Fatalf("reading gzip body: %v", err)
+				}
+			}
+			if string(payload) != tt.body {
+				t.Errorf("body = %q, want %q", payload, tt.body)
+			}
+		})
+	}
+}
+
+func TestGzipMiddlewareHoldsJSONStatusUntilBody(t *testing.T) {
+	large := `[` + strings.Repeat(`"container",`, 200) + `"last"]`
+	for _, tt := range []struct {
+		name     string
+		body     string
+		wantGzip bool
+	}{
+		{"large body", large, true},
+		{"small body", `{"success":true}`, false},
+		{"no body", "", false},
+	} {
+		t.Run(tt.name, func(t *testing.T) {
+			handler := gzipMiddleware(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+				w.Header().Set("Content-Type", "application/json")
+				w.WriteHeader(http.StatusCreated)
+				if tt.body != "" {
+					_, _ = w.Write([]byte(tt.body))
+				}
+			}))
+			req := httptest.NewRequest("POST", "/api/v1/docker/plex/start", nil)
+			req.Header.Set("Accept-Encoding", "gzip")
+			rr := httptest.NewRecorder()
+			handler.ServeHTTP(rr, req)
+
+			if rr.Code != http.StatusCreated {
+				t.Errorf("status = %d, want %d", rr.Code, http.StatusCreated)
+			}
+			if gotGzip := rr.Header().Get("Content-Encoding") == "gzip"; gotGzip != tt.wantGzip {
+				t.Errorf("Content-Encoding gzip = %v, want %v", gotGzip, tt.wantGzip)
+			}
+		})
+	}
+}
+
+func TestLoggingMiddlewareAtDebugLevel(t *testing.T) {
+	prev := logger.GetLevel()
+	logger.SetLevel(logger.LevelDebug)
+	t.Cleanup(func() { logger.SetLevel(prev) })
+
+	handler := loggingMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if _, ok := w.(*statusRecorder); !ok {
+			t.Errorf("debug logging should record the status, got writer %T", w)
+		}
+		w.WriteHeader(http.StatusTeapot)
+	}))
+	rr := httptest.NewRecorder()
+	handler.ServeHTTP(rr, httptest.NewRequest("GET", "/test", nil))
+	if rr.Code != http.StatusTeapot {
+		t.Errorf("Status code = %d, want %d", rr.Code, http.StatusTeapot)
+	}
+}
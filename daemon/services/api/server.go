@@ -63,6 +63,13 @@ type Server struct {
 	tuningController *controllers.TuningController
 	agentSvc         *agent.Service
 
+	// accessURLs briefly caches GetNetworkAccessURLs.
+	accessURLs memo[dto.NetworkAccessURLs]
+	// dockerUpdatesRefresh and pluginUpdatesRefresh coalesce bursts of forced
+	// update re-checks (see updateRefreshCooldown).
+	dockerUpdatesRefresh memo[dto.ContainerUpdatesResult]
+	pluginUpdatesRefresh memo[dto.PluginList]
+
 	// Embedded cache store for lock-free atomic access to collector data
 	*CacheStore
 }
@@ -100,6 +107,7 @@ func (s *Server) setupRoutes() {
 	s.router.Use(bodySizeLimitMiddleware)
 	s.router.Use(rateLimitMiddleware(newPerClientRateLimiter(rate.Limit(rateLimitPerSecond), rateLimitBurst)))
 	s.router.Use(loggingMiddleware)
+	s.router.Use(gzipMiddleware)
 
 	// Prometheus metrics endpoint (at root level, no /api/v1 prefix)
 	s.router.HandleFunc("/metrics", s.handleMetrics).Methods("GET")
@@ -475,7 +483,9 @@ func (s *Server) subscribeToEvents(ctx context.Context, readyWg *sync.WaitGroup)
 		case msg := <-ch:
 			if handler, ok := dispatch[reflect.TypeOf(msg)]; ok {
 				handler(s.CacheStore, msg)
-				logger.Debug("Cache: Updated %T", msg)
+				if logger.DebugEnabled() {
+					logger.Debug("Cache: Updated %T", msg)
+				}
 			} else {
 				logger.Warning("Cache: Received unknown event type: %T", msg)
 			}
@@ -619,15 +629,24 @@ func (s *Server) GetShareConfig(name string) *dto.ShareConfig {
 	return config
 }
 
+// accessURLsTTL is how long a computed set of network access URLs is reused.
+// Discovery probes up to three external IP services for the WAN address, so
+// dashboards, MCP tools and REST clients asking at the same time share one
+// result instead of each paying those round trips.
+const accessURLsTTL = 10 * time.Second
+
 // GetNetworkAccessURLs returns all network access URLs for the server. When the
 // agent serves HTTPS the URLs are rewritten to https:// with the configured
 // port, so clients are pointed at the scheme the server actually listens on.
+// The result is briefly cached (see accessURLsTTL) and must not be modified.
 func (s *Server) GetNetworkAccessURLs() *dto.NetworkAccessURLs {
-	accessURLs := collectors.CollectNetworkAccessURLs()
-	if s.ctx.TLSEnabled() {
-		accessURLs.URLs = collectors.GetHTTPSURLs(accessURLs.URLs, s.ctx.Port)
-	}
-	return accessURLs
+	return s.accessURLs.get(accessURLsTTL, func() *dto.NetworkAccessURLs {
+		accessURLs := collectors.CollectNetworkAccessURLs()
+		if s.ctx.TLSEnabled() {
+			accessURLs.URLs = collectors.GetHTTPSURLs(accessURLs.URLs, s.ctx.Port)
+		}
+		return accessURLs
+	})
 }
 
 // GetHealthStatus returns a map with system health metrics.
@@ -663,16 +682,10 @@ func (s *Server) GetHealthStatus() map[string]any {
 	health["healthy_disks"] = healthyDisks
 	health["warning_disks"] = warningDisks
 
-	// Container health
-	containers := s.GetDockerCache()
-	runningContainers := 0
-	for _, c := range containers {
-		if c.State == "running" {
-			runningContainers++
-		}
-	}
-	health["running_containers"] = runningContainers
-	health["total_containers"] = len(containers)
+	// Container health, from the counts kept with the merged Docker snapshot
+	dockerStats, _ := s.GetDockerStats()
+	health["running_containers"] = dockerStats.RunningContainers
+	health["total_containers"] = dockerStats.TotalContainers
 
 	// VM health
 	vms := s.GetVMsCache()
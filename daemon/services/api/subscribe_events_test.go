@@ -3,6 +3,7 @@ package api
 import (
 	"context"
 	"net/http/httptest"
+	"reflect"
 	"strings"
 	"sync"
 	"testing"
@@ -518,3 +519,20 @@ func TestBroadcastEvents_ForwardsToWSHub(t *testing.T) {
 		t.Fatalf("WebSocket client did not receive broadcast: %v", err)
 	}
 }
+
+func TestBuildTypeToTopicMapCoversBroadcastTopics(t *testing.T) {
+	typeToTopic := buildTypeToTopicMap()
+	names := make(map[string]bool, len(typeToTopic))
+	for _, name := range typeToTopic {
+		names[name] = true
+	}
+	for _, name := range broadcastTopicNames() {
+		if !names[name] {
+			t.Errorf("broadcast topic %q has no type mapping and would be sent as \"update\"", name)
+		}
+	}
+
+	if got := typeToTopic[reflect.TypeFor[dto.CollectorStateEvent]()]; got != "collector_state_change" {
+		t.Errorf("CollectorStateEvent maps to %q, want collector_state_change", got)
+	}
+}
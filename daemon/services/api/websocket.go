@@ -1,6 +1,7 @@
 package api
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"net"
@@ -8,6 +9,7 @@ import (
 	"net/url"
 	"sync"
 	"time"
+	"unicode/utf8"
 
 	"github.com/gorilla/websocket"
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/constants"
@@ -22,6 +24,9 @@ const maxWSMessageSize = 64 * 1024 // 64 KB
 type broadcastMessage struct {
 	Topic string
 	Data  any
+	// payload is Data already encoded by Broadcast, or nil if the hub must
+	// encode it itself.
+	payload json.RawMessage
 }
 
 // WSHub manages WebSocket client connections and broadcasts messages to all connected clients.
@@ -58,6 +63,8 @@ func NewWSHub() *WSHub {
 // Run starts the WebSocket hub's main event loop.
 // It handles client registration, unregistration, and message broadcasting until the context is cancelled.
 func (h *WSHub) Run(ctx context.Context) {
+	// targets is reused across broadcasts; only this goroutine touches it.
+	var targets []*WSClient
 	for {
 		select {
 		case <-ctx.Done():
@@ -87,14 +94,11 @@ func (h *WSHub) Run(ctx context.Context) {
 			h.mu.Unlock()
 
 		case msg := <-h.broadcast:
-			event := dto.WSEvent{
-				Event:     msg.Topic,
-				Timestamp: time.Now(),
-				Data:      msg.Data,
-			}
-
 			h.mu.RLock()
-			targets := make([]*WSClient, 0, len(h.clients))
+			// Drop the previous broadcast's pointers so disconnected
+			// clients are not kept reachable by the reused buffer.
+			clear(targets)
+			targets = targets[:0]
 			for client := range h.clients {
 				if !client.wantsTopic(msg.Topic) {
 					continue
@@ -103,6 +107,29 @@ func (h *WSHub) Run(ctx context.Context) {
 			}
 			h.mu.RUnlock()
 
+			if len(targets) == 0 {
+				continue
+			}
+
+			// Encode the payload once per broadcast rather than once per
+			// client: every writePump marshals the event, and a pre-encoded
+			// json.RawMessage is only copied instead of reflected over again.
+			// Broadcast normally encoded it already; a client that subscribed
+			// in the meantime can leave it to this loop.
+			data := msg.payload
+			if data == nil {
+				var err error
+				if data, err = json.Marshal(msg.Data); err != nil {
+					logger.Warning("WebSocket: dropping %q broadcast, payload is not JSON-encodable: %v", msg.Topic, err)
+					continue
+				}
+			}
+			event := dto.WSEvent{
+				Event:     msg.Topic,
+				Timestamp: time.Now(),
+				Data:      data,
+			}
+
 			staleClients := make([]*WSClient, 0)
 			for _, client := range targets {
 				select {
@@ -175,8 +202,30 @@ func (c *WSClient) setTopics(topics []string) {
 }
 
 // Broadcast sends a message to all connected WebSocket clients matching the topic filter.
+// The payload is encoded here, on the publishing goroutine, so the hub loop
+// only fans frames out and stays free to register and unregister clients
+// while the next event is being encoded. Nothing is encoded when no client
+// wants the topic.
 func (h *WSHub) Broadcast(topic string, data any) {
-	h.broadcast <- broadcastMessage{Topic: topic, Data: data}
+	msg := broadcastMessage{Topic: topic, Data: data}
+	if h.hasSubscriber(topic) {
+		if payload, err := json.Marshal(data); err == nil {
+			msg.payload = payload
+		}
+	}
+	h.broadcast <- msg
+}
+
+// hasSubscriber reports whether any connected client wants topic.
+func (h *WSHub) hasSubscriber(topic string) bool {
+	h.mu.RLock()
+	defer h.mu.RUnlock()
+	for client := range h.clients {
+		if client.wantsTopic(topic) {
+			return true
+		}
+	}
+	return false
 }
 
 // handleWebSocket godoc
@@ -211,6 +260,7 @@ func (h *WSHub) Broadcast(topic string, data any) {
 //	@Router			/ws [get]
 func (s *Server) handleWebSocket(w http.ResponseWriter, r *http.Request) {
 	u := websocket.Upgrader{
+		WriteBufferPool: wsWriteBufferPool,
 		CheckOrigin: func(req *http.Request) bool {
 			origin := req.Header.Get("Origin")
 			if origin == "" {
@@ -319,7 +369,21 @@ func (c *WSClient) writePump() {
 				return
 			}
 
-			if err := c.conn.WriteJSON(event); err != nil {
+			buf := wsFramePool.Get().(*[]byte)
+			frame, err := appendWSEvent((*buf)[:0], event)
+			if err != nil {
+				logger.Debug("WebSocket: dropping %q event, payload is not JSON-encodable: %v", event.Event, err)
+				wsFramePool.Put(buf)
+				continue
+			}
+			err = c.conn.WriteMessage(websocket.TextMessage, frame)
+			// Return the buffer for the next event unless one outsized payload
+			// grew it well beyond what regular broadcasts need.
+			if cap(frame) <= maxRetainedWSFrame {
+				*buf = frame
+				wsFramePool.Put(buf)
+			}
+			if err != nil {
 				return
 			}
 
@@ -331,6 +395,88 @@ func (c *WSClient) writePump() {
 	}
 }
 
+// maxRetainedWSFrame caps the encode buffers returned to wsFramePool.
+const maxRetainedWSFrame = 256 * 1024
+
+// wsFramePool shares frame encode buffers between all writePumps. A
+// connection only needs one while it is writing, so idle clients no longer
+// each pin a buffer sized by the largest event they ever received.
+var wsFramePool = sync.Pool{New: func() any { return new([]byte) }}
+
+// wsWriteBufferPool lends gorilla's per-connection write buffers out only for
+// the duration of a write instead of allocating one per connection for its
+// lifetime.
+var wsWriteBufferPool = &sync.Pool{}
+
+// appendWSEvent appends event to dst exactly as json.Encoder would write it,
+// trailing newline included. The hub hands every client a payload that is
+// already encoded as a json.RawMessage, so it is copied verbatim: encoding the
+// envelope with json.Marshal would reflect over it and re-validate and compact
+// the payload once per client for every broadcast.
+func appendWSEvent(dst []byte, event dto.WSEvent) ([]byte, error) {
+	dst = append(dst, `{"event":`...)
+	dst = appendJSONString(dst, event.Event)
+	dst = append(dst, `,"timestamp":"`...)
+	dst = event.Timestamp.AppendFormat(dst, time.RFC3339Nano)
+	dst = append(dst, `","data":`...)
+	raw, ok := event.Data.(json.RawMessage)
+	if !ok {
+		var err error
+		if raw, err = json.Marshal(event.Data); err != nil {
+			return dst, err
+		}
+	}
+	if len(raw) == 0 {
+		raw = json.RawMessage("null")
+	}
+	dst = append(dst, raw...)
+	return append(dst, "}\n"...), nil
+}
+
+// appendJSONString appends s as a JSON string. Topic names are plain ASCII
+// and are quoted directly; anything json.Marshal would escape takes the
+// encoder instead.
+func appendJSONString(dst []byte, s string) []byte {
+	for i := 0; i < len(s); i++ {
+		if b := s[i]; b < 0x20 || b >= utf8.RuneSelf || b == '"' || b == '\\' || b == '<' || b == '>' || b == '&' {
+			quoted, _ := json.Marshal(s) // cannot fail for a string
+			return append(dst, quoted...)
+		}
+	}
+	dst = append(dst, '"')
+	dst = append(dst, s...)
+	return append(dst, '"')
+}
+
+// wsClientMessage is a message sent by a WebSocket client. encoding/json
+// matches the field name case-insensitively, so readPump only decodes frames
+// that hasSubscribeKey accepts.
+type wsClientMessage struct {
+	Subscribe json.RawMessage `json:"subscribe"`
+}
+
+var subscribeKey = []byte(`"subscribe"`)
+
+// hasSubscribeKey reports whether raw contains the literal key "subscribe",
+// followed by optional whitespace and a colon. Clients have always had to
+// spell the key exactly; checking the bytes here keeps the struct decode
+// from also accepting "Subscribe" or "SUBSCRIBE", and drops frames without
+// the key (keepalives, chatter from clients that never filter) without
+// running the decoder. Escaped spellings such as "\u0073ubscribe" are not
+// recognised.
+func hasSubscribeKey(raw []byte) bool {
+	for {
+		i := bytes.Index(raw, subscribeKey)
+		if i < 0 {
+			return false
+		}
+		raw = raw[i+len(subscribeKey):]
+		if rest := bytes.TrimLeft(raw, " \t\r\n"); len(rest) > 0 && rest[0] == ':' {
+			return true
+		}
+	}
+}
+
 func (c *WSClient) readPump() {
 	defer func() {
 		c.hub.unregister <- c
@@ -350,25 +496,40 @@ func (c *WSClient) readPump() {
 		return nil
 	})
 
+	var buf bytes.Buffer
 	for {
-		_, raw, err := c.conn.ReadMessage()
+		msgType, r, err := c.conn.NextReader()
 		if err != nil {
 			break
 		}
-		// Try to parse subscribe message. Use a raw map to distinguish between
-		// "subscribe" key absent vs. explicitly set to null (both unmarshal to
-		// nil []string, but only the latter should reset topics to "all").
-		var envelope map[string]json.RawMessage
-		if json.Unmarshal(raw, &envelope) != nil {
+		// Client messages are JSON text frames. Any other frame is left
+		// unread; the next NextReader call discards it without buffering it.
+		if msgType != websocket.TextMessage {
+			continue
+		}
+		// Frames are read into one buffer reused for the life of the
+		// connection; SetReadLimit bounds it to maxWSMessageSize. Nothing
+		// below keeps a reference to raw: the decode copies what it keeps.
+		buf.Reset()
+		if _, err := buf.ReadFrom(r); err != nil {
+			break
+		}
+		raw := buf.Bytes()
+		// Try to parse subscribe message. A json.RawMessage field distinguishes
+		// between "subscribe" key absent (left nil) vs. explicitly set to null
+		// (holds "null"): both unmarshal to nil []string, but only the latter
+		// should reset topics to "all". Decoding into a struct skips building
+		// a map entry for every other key in the message.
+		if !hasSubscribeKey(raw) {
 			continue
 		}
-		rawSub, hasKey := envelope["subscribe"]
-		if !hasKey {
+		var envelope wsClientMessage
+		if json.Unmarshal(raw, &envelope) != nil || envelope.Subscribe == nil {
 			continue
 		}
 		var topics []string
 		// json.Unmarshal handles both null → nil and ["a","b"] → slice.
-		if err := json.Unmarshal(rawSub, &topics); err != nil {
+		if err := json.Unmarshal(envelope.Subscribe, &topics); err != nil {
 			continue
 		}
 		c.setTopics(topics) // nil means "all topics"
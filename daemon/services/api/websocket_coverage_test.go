@@ -292,6 +292,41 @@ func TestWebSocketReadPumpMessage(t *testing.T) {
 	time.Sleep(50 * time.Millisecond)
 }
 
+func TestWebSocketReadPumpIgnoresBinaryFrames(t *testing.T) {
+	server, cancel := newTestServerWithHub(t)
+	defer cancel()
+
+	ts := httptest.NewServer(server.router)
+	defer ts.Close()
+
+	ws := dialWS(t, ts)
+	defer ws.Close()
+
+	if err := ws.WriteMessage(websocket.TextMessage, []byte(`{"subscribe":["system_update"]}`)); err != nil {
+		t.Fatalf("Failed to write subscribe message: %v", err)
+	}
+	// A binary frame is not a client message and must not replace the filter.
+	if err := ws.WriteMessage(websocket.BinaryMessage, []byte(`{"subscribe":["array_status_update"]}`)); err != nil {
+		t.Fatalf("Failed to write binary message: %v", err)
+	}
+	time.Sleep(50 * time.Millisecond)
+
+	server.wsHub.Broadcast("system_update", map[string]string{"hostname": "tower"})
+
+	ws.SetReadDeadline(time.Now().Add(2 * time.Second))
+	_, msg, err := ws.ReadMessage()
+	if err != nil {
+		t.Fatalf("Failed to read broadcast message: %v", err)
+	}
+	var event dto.WSEvent
+	if err := json.Unmarshal(msg, &event); err != nil {
+		t.Fatalf("Failed to unmarshal WSEvent: %v", err)
+	}
+	if event.Event != "system_update" {
+		t.Errorf("Expected event type 'system_update', got %q", event.Event)
+	}
+}
+
 func TestWebSocketPongHandler(t *testing.T) {
 	server, cancel := newTestServerWithHub(t)
 	defer cancel()
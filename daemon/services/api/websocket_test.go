@@ -1,7 +1,9 @@
 package api
 
 import (
+	"bytes"
 	"context"
+	"encoding/json"
 	"testing"
 	"time"
 
@@ -344,3 +346,125 @@ func BenchmarkWSHubBroadcast(b *testing.B) {
 		hub.Broadcast("update", map[string]int{"count": i})
 	}
 }
+
+func TestWSHubBroadcastEncodesPayloadOnce(t *testing.T) {
+	hub := NewWSHub()
+	go hub.Run(t.Context())
+
+	sends := []chan dto.WSEvent{make(chan dto.WSEvent, 1), make(chan dto.WSEvent, 1)}
+	for _, send := range sends {
+		hub.register <- &WSClient{hub: hub, send: send}
+	}
+
+	hub.Broadcast("update", map[string]int{"cpu": 42})
+
+	var payloads []json.RawMessage
+	for i, send := range sends {
+		select {
+		case msg := <-send:
+			raw, ok := msg.Data.(json.RawMessage)
+			if !ok {
+				t.Fatalf("client %d: Data is %T, want pre-encoded json.RawMessage", i, msg.Data)
+			}
+			if string(raw) != `{"cpu":42}` {
+				t.Errorf("client %d: Data = %s, want {\"cpu\":42}", i, raw)
+			}
+			payloads = append(payloads, raw)
+		case <-time.After(500 * time.Millisecond):
+			t.Fatalf("client %d did not receive broadcast", i)
+		}
+	}
+	if &payloads[0][0] != &payloads[1][0] {
+		t.Error("clients should share one encoded payload")
+	}
+}
+
+func TestWSClientMessageDistinguishesAbsentAndNullSubscribe(t *testing.T) {
+	tests := []struct {
+		raw       string
+		wantIsSet bool
+	}{
+		{`{"other":1}`, false},
+		{`{"subscribe":null}`, true},
+		{`{"subscribe":["system_update"]}`, true},
+	}
+	for _, tt := range tests {
+		var msg wsClientMessage
+		if err := json.Unmarshal([]byte(tt.raw), &msg); err != nil {
+			t.Fatalf("Unmarshal(%s): %v", tt.raw, err)
+		}
+		if got := msg.Subscribe != nil; got != tt.wantIsSet {
+			t.Errorf("Unmarshal(%s): subscribe set = %v, want %v", tt.raw, got, tt.wantIsSet)
+		}
+	}
+}
+
+func TestHasSubscribeKeyMatchesExactKey(t *testing.T) {
+	tests := []struct {
+		raw  string
+		want bool
+	}{
+		{`{"subscribe":null}`, true},
+		{`{"subscribe":[]}`, true},
+		{`{"type":"ping", "subscribe" : ["system_update"]}`, true},
+		{`{"note":"subscribe","subscribe":[]}`, true},
+		{`{"other":1}`, false},
+		{`{"type":"ping"}`, false},
+		{`{"Subscribe":["system_update"]}`, false},
+		{`{"SUBSCRIBE":[]}`, false},
+		{`{"ſubscribe":[]}`, false},
+		{`{"note":"subscribe"}`, false},
+		{`not json`, false},
+	}
+	for _, tt := range tests {
+		if got := hasSubscribeKey([]byte(tt.raw)); got != tt.want {
+			t.Errorf("hasSubscribeKey(%s) = %v, want %v", tt.raw, got, tt.want)
+		}
+	}
+}
+
+func TestAppendWSEventMatchesEncoder(t *testing.T) {
+	ts := time.Date(2026, 3, 14, 15, 9, 26, 535897000, time.UTC)
+	events := []dto.WSEvent{
+		{Event: "system_update", Timestamp: ts, Data: json.RawMessage(`{"hostname":"tower","cpu":12.5}`)},
+		{Event: "agent_step", Timestamp: ts.In(time.FixedZone("SAST", 2*3600)), Data: map[string]any{"note": "<b>&</b>"}},
+		{Event: `odd "topic"`, Timestamp: ts, Data: nil},
+		{Event: "raw_empty", Timestamp: ts, Data: json.RawMessage(nil)},
+	}
+	var frame []byte
+	for _, event := range events {
+		var want bytes.Buffer
+		if err := json.NewEncoder(&want).Encode(event); err != nil {
+			t.Fatalf("Encode(%q): %v", event.Event, err)
+		}
+		var err error
+		if frame, err = appendWSEvent(frame[:0], event); err != nil {
+			t.Fatalf("appendWSEvent(%q): %v", event.Event, err)
+		}
+		if string(frame) != want.String() {
+			t.Errorf("appendWSEvent(%q) = %s, want %s", event.Event, frame, want.String())
+		}
+	}
+}
+
+func TestWSHubBroadcastEncodesOnlyForSubscribers(t *testing.T) {
+	hub := NewWSHub()
+
+	hub.Broadcast("update", map[string]int{"cpu": 1})
+	if msg := <-hub.broadcast; msg.payload != nil {
+		t.Errorf("payload = %s with no clients, want nothing encoded", msg.payload)
+	}
+
+	client := &WSClient{hub: hub, send: make(chan dto.WSEvent, 1)}
+	client.setTopics([]string{"system_update"})
+	hub.clients[client] = true
+
+	hub.Broadcast("update", map[string]int{"cpu": 2})
+	if msg := <-hub.broadcast; msg.payload != nil {
+		t.Errorf("payload = %s for an unsubscribed topic, want nothing encoded", msg.payload)
+	}
+	hub.Broadcast("system_update", map[string]int{"cpu": 3})
+	if msg := <-hub.broadcast; string(msg.payload) != `{"cpu":3}` {
+		t.Errorf("payload = %s, want the pre-encoded event", msg.payload)
+	}
+}
@@ -39,15 +39,8 @@ func NewArrayCollector(ctx *domain.Context) *ArrayCollector {
 func (c *ArrayCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting array collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Array collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Array", interval, c.Collect)
-	}()
+	collect := func() { collectWithWatchdog(ctx, "Array", interval, c.Collect) }
+	collectSafely("Array", collect)
 
 	// Set up fsnotify watcher for instant state updates on INI file changes
 	fw, err := NewFileWatcher(500 * time.Millisecond)
@@ -78,25 +71,7 @@ func (c *ArrayCollector) Start(ctx context.Context, interval time.Duration) {
 		logger.Info("Array collector: fsnotify watching %v for instant updates", watchedArrayFiles)
 	}
 
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Array collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Array collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Array", interval, c.Collect)
-			}()
-		}
-	}
+	tickCollect(ctx, "Array", interval, collect)
 }
 
 // Collect gathers current array status information and publishes it to the event bus.
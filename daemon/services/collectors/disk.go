@@ -4,6 +4,7 @@ import (
 	"bufio"
 	"context"
 	"os"
+	"path/filepath"
 	"strconv"
 	"strings"
 	"sync"
@@ -46,15 +47,8 @@ func NewDiskCollector(ctx *domain.Context) *DiskCollector {
 func (c *DiskCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting disk collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Disk collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Disk", interval, c.Collect)
-	}()
+	collect := func() { collectWithWatchdog(ctx, "Disk", interval, c.Collect) }
+	collectSafely("Disk", collect)
 
 	// Set up fsnotify watcher for instant state updates on disks.ini changes
 	watchedFiles := []string{constants.DisksIni}
@@ -85,25 +79,7 @@ func (c *DiskCollector) Start(ctx context.Context, interval time.Duration) {
 		logger.Info("Disk collector: fsnotify watching %v for instant updates", watchedFiles)
 	}
 
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Disk collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Disk collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Disk", interval, c.Collect)
-			}()
-		}
-	}
+	tickCollect(ctx, "Disk", interval, collect)
 }
 
 // Collect gathers detailed disk information and publishes it to the event bus.
@@ -203,6 +179,7 @@ func (c *DiskCollector) parseDisksINI() ([]dto.DiskInfo, error) {
 	var disks []dto.DiskInfo
 	scanner := bufio.NewScanner(file)
 	var currentDisk *dto.DiskInfo
+	now := time.Now()
 
 	for scanner.Scan() {
 		line := strings.TrimSpace(scanner.Text())
@@ -216,13 +193,13 @@ func (c *DiskCollector) parseDisksINI() ([]dto.DiskInfo, error) {
 
 			// Start new disk
 			currentDisk = &dto.DiskInfo{
-				Timestamp: time.Now(),
+				Timestamp: now,
 			}
 			continue
 		}
 
 		// Parse key=value pairs
-		if currentDisk != nil && strings.Contains(line, "=") {
+		if currentDisk != nil {
 			c.parseDiskKeyValue(currentDisk, line)
 		}
 	}
@@ -242,13 +219,13 @@ func (c *DiskCollector) parseDisksINI() ([]dto.DiskInfo, error) {
 
 // parseDiskKeyValue parses a single key=value line from disks.ini
 func (c *DiskCollector) parseDiskKeyValue(disk *dto.DiskInfo, line string) {
-	parts := strings.SplitN(line, "=", 2)
-	if len(parts) != 2 {
+	rawKey, rawValue, ok := strings.Cut(line, "=")
+	if !ok {
 		return
 	}
 
-	key := strings.TrimSpace(parts[0])
-	value := strings.Trim(strings.TrimSpace(parts[1]), `"`)
+	key := strings.TrimSpace(rawKey)
+	value := strings.Trim(strings.TrimSpace(rawValue), `"`)
 
 	switch key {
 	case "name":
@@ -307,6 +284,14 @@ func (c *DiskCollector) parseDiskKeyValue(disk *dto.DiskInfo, line string) {
 func (c *DiskCollector) enrichDisks(disks []dto.DiskInfo) {
 	zfsPoolUsages := c.getZFSPoolUsages()
 
+	// Read /proc/mounts once for the whole pass rather than once per disk.
+	// On failure no mount point is found, as before.
+	data, err := os.ReadFile("/proc/mounts")
+	if err != nil {
+		logger.Debug("Disk: Failed to read /proc/mounts: %v", err)
+	}
+	mounts := string(data)
+
 	for i := range disks {
 		// Get model and serial number
 		c.enrichWithModelAndSerial(&disks[i])
@@ -320,7 +305,7 @@ func (c *DiskCollector) enrichDisks(disks []dto.DiskInfo) {
 		}
 
 		// Get mount information
-		c.enrichWithMountInfo(&disks[i])
+		c.enrichWithMountInfo(&disks[i], mounts)
 
 		// Get disk role
 		c.enrichWithRole(&disks[i])
@@ -486,16 +471,17 @@ func (c *DiskCollector) isUSBDevice(device string) bool {
 	}
 
 	// Resolve the relative path to an absolute path
-	// The symlink is relative (e.g., ../../../6:0:0:0), so we need to resolve it
-	fullPath, err := lib.ExecCommand("readlink", "-f", sysfsPath)
-	if err != nil || len(fullPath) == 0 {
+	// The symlink is relative (e.g., ../../../6:0:0:0), so we need to resolve it.
+	// EvalSymlinks does this in-process instead of spawning readlink -f for
+	// every disk on every collection.
+	fullPathStr, err := filepath.EvalSymlinks(sysfsPath)
+	if err != nil || fullPathStr == "" {
 		// If we can't resolve the path, fall back to checking the relative path
-		fullPath = []string{devicePath}
+		fullPathStr = devicePath
 	}
 
 	// USB devices have "usb" in their full device path
 	// Example: /sys/devices/pci0000:00/0000:00:14.0/usb1/1-10/1-10:1.0/host6/target6:0:0/6:0:0:0
-	fullPathStr := strings.Join(fullPath, "")
 	isUSB := strings.Contains(fullPathStr, "/usb")
 
 	if isUSB {
@@ -609,33 +595,25 @@ func (c *DiskCollector) enrichWithSMARTData(disk *dto.DiskInfo) {
 
 	logger.Debug("Disk: Successfully retrieved SMART health for %s", disk.Device)
 	for _, line := range lines {
-		line = strings.TrimSpace(line)
-
 		// Parse SMART health status (SATA/SAS drives)
 		// Example: "SMART overall-health self-assessment test result: PASSED"
-		if strings.Contains(line, "SMART overall-health self-assessment test result:") {
-			parts := strings.SplitN(line, ":", 2)
-			if len(parts) == 2 {
-				status := strings.TrimSpace(parts[1])
-				disk.SMARTStatus = strings.ToUpper(status)
-				logger.Debug("Disk: Parsed SATA/SAS SMART status for %s: %s", disk.Device, disk.SMARTStatus)
-			}
+		// strings.Cut finds the marker and yields the status in one scan.
+		if _, status, ok := strings.Cut(line, "SMART overall-health self-assessment test result:"); ok {
+			disk.SMARTStatus = strings.ToUpper(strings.TrimSpace(status))
+			logger.Debug("Disk: Parsed SATA/SAS SMART status for %s: %s", disk.Device, disk.SMARTStatus)
+			continue
 		}
 
 		// Parse SMART health status (NVMe drives)
 		// Example: "SMART Health Status: OK"
-		if strings.Contains(line, "SMART Health Status:") {
-			parts := strings.SplitN(line, ":", 2)
-			if len(parts) == 2 {
-				status := strings.TrimSpace(parts[1])
-				// Normalize NVMe "OK" to "PASSED" for consistency
-				if strings.ToUpper(status) == "OK" {
-					disk.SMARTStatus = "PASSED"
-				} else {
-					disk.SMARTStatus = strings.ToUpper(status)
-				}
-				logger.Debug("Disk: Parsed NVMe SMART status for %s: %s (original: %s)", disk.Device, disk.SMARTStatus, status)
+		if _, status, ok := strings.Cut(line, "SMART Health Status:"); ok {
+			status = strings.TrimSpace(status)
+			// Normalize NVMe "OK" to "PASSED" for consistency
+			disk.SMARTStatus = strings.ToUpper(status)
+			if disk.SMARTStatus == "OK" {
+				disk.SMARTStatus = "PASSED"
 			}
+			logger.Debug("Disk: Parsed NVMe SMART status for %s: %s (original: %s)", disk.Device, disk.SMARTStatus, status)
 		}
 	}
 
@@ -645,15 +623,11 @@ func (c *DiskCollector) enrichWithSMARTData(disk *dto.DiskInfo) {
 		if len(attrs) > 0 {
 			disk.SMARTAttributes = attrs
 			// Populate convenience fields from well-known attribute IDs.
-			if a, ok := attrs["9"]; ok {
-				if v, parseErr := strconv.ParseUint(strings.Fields(a.RawValue)[0], 10, 64); parseErr == nil {
-					disk.PowerOnHours = v
-				}
+			if v, ok := rawValueUint(attrs["9"].RawValue); ok {
+				disk.PowerOnHours = v
 			}
-			if a, ok := attrs["12"]; ok {
-				if v, parseErr := strconv.ParseUint(strings.Fields(a.RawValue)[0], 10, 64); parseErr == nil {
-					disk.PowerCycleCount = v
-				}
+			if v, ok := rawValueUint(attrs["12"].RawValue); ok {
+				disk.PowerCycleCount = v
 			}
 		}
 	}
@@ -729,15 +703,20 @@ func parseSMARTAttributes(lines []string) map[string]dto.SMARTAttribute {
 	return attrs
 }
 
-// enrichWithMountInfo adds mount point and usage information
-func (c *DiskCollector) enrichWithMountInfo(disk *dto.DiskInfo) {
-	if disk.Name == "" {
-		return
-	}
+// rawValueUint parses the leading integer of a SMART RAW_VALUE such as
+// "25123" or "0 (0 200 0 0 0)". parseSMARTAttributes joins the raw fields with
+// single spaces, so cutting at the first space isolates the number without
+// splitting the whole string.
+func rawValueUint(raw string) (uint64, bool) {
+	head, _, _ := strings.Cut(raw, " ")
+	v, err := strconv.ParseUint(head, 10, 64)
+	return v, err == nil
+}
 
-	// Read /proc/mounts to find mount point
-	data, err := os.ReadFile("/proc/mounts")
-	if err != nil {
+// enrichWithMountInfo adds mount point and usage information. mounts is the
+// content of /proc/mounts, read once per collection by the caller.
+func (c *DiskCollector) enrichWithMountInfo(disk *dto.DiskInfo, mounts string) {
+	if disk.Name == "" {
 		return
 	}
 
@@ -746,16 +725,16 @@ func (c *DiskCollector) enrichWithMountInfo(disk *dto.DiskInfo) {
 	// For cache/flash, it's the actual device (e.g., /dev/nvme0n1p1, /dev/sda1)
 
 	var mountPoint string
-	lines := strings.SplitSeq(string(data), "\n")
+	expectedMountPoint := "/mnt/" + disk.Name
+	devicePath := "/dev/" + disk.Device
 
-	for line := range lines {
+	for line := range strings.SplitSeq(mounts, "\n") {
 		fields := strings.Fields(line)
 		if len(fields) < 2 {
 			continue
 		}
 
 		// Check if mount point matches /mnt/{diskname}
-		expectedMountPoint := "/mnt/" + disk.Name
 		if fields[1] == expectedMountPoint {
 			mountPoint = fields[1]
 			break
@@ -763,8 +742,7 @@ func (c *DiskCollector) enrichWithMountInfo(disk *dto.DiskInfo) {
 
 		// Also check for direct device match (for cache, flash, etc.)
 		if disk.Device != "" {
-			devicePath := "/dev/" + disk.Device
-			if fields[0] == devicePath || strings.HasPrefix(fields[0], devicePath) {
+			if strings.HasPrefix(fields[0], devicePath) {
 				mountPoint = fields[1]
 				break
 			}
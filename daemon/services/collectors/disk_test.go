@@ -909,6 +909,26 @@ func TestParseSMARTAttributes(t *testing.T) {
 	}
 }
 
+func TestRawValueUint(t *testing.T) {
+	tests := []struct {
+		raw    string
+		want   uint64
+		wantOK bool
+	}{
+		{"25123", 25123, true},
+		{"0 (0 200 0 0 0)", 0, true},
+		{"42 (Min/Max 18/45)", 42, true},
+		{"", 0, false},
+		{"-", 0, false},
+	}
+	for _, tt := range tests {
+		got, ok := rawValueUint(tt.raw)
+		if got != tt.want || ok != tt.wantOK {
+			t.Errorf("rawValueUint(%q) = %d, %v; want %d, %v", tt.raw, got, ok, tt.want, tt.wantOK)
+		}
+	}
+}
+
 // TestEnrichWithModelAndSerialEmptyID tests enrichment when ID is empty
 func TestEnrichWithModelAndSerialEmptyID(t *testing.T) {
 	hub := domain.NewEventBus(10)
@@ -21,6 +21,19 @@ import (
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/logger"
 )
 
+// Docker Engine API bounds for one collection cycle. A wedged dockerd accepts
+// the socket connection but never answers, and an unbounded SDK call would
+// freeze the collector until the agent restarts. The list bound covers the
+// single ContainerList call; each running container's inspect gets its own
+// shorter bound so one stuck container cannot starve the rest.
+const (
+	dockerListTimeout    = 10 * time.Second
+	dockerInspectTimeout = 5 * time.Second
+	// dockerInspectConcurrency bounds how many ContainerInspect calls a
+	// collection has in flight at once.
+	dockerInspectConcurrency = 4
+)
+
 // cpuSnapshot holds a point-in-time cgroup CPU usage reading for delta calculation.
 type cpuSnapshot struct {
 	usageUsec int64
@@ -34,6 +47,14 @@ type netSnapshot struct {
 	readAt time.Time
 }
 
+// runningContainer pairs a running container's ContainerList entry with the
+// DTO built for it, so the inspect pass needs neither a copy of the (large)
+// list entry nor an ID-to-DTO lookup map.
+type runningContainer struct {
+	summary *container.Summary
+	info    *dto.ContainerInfo
+}
+
 // DockerCollector collects Docker container information using the Docker SDK.
 // This is significantly faster than CLI commands as it avoids process spawning.
 type DockerCollector struct {
@@ -43,6 +64,7 @@ type DockerCollector struct {
 	mu           sync.Mutex             // protects prevCPU and prevNet
 	prevCPU      map[string]cpuSnapshot // keyed by full container ID
 	prevNet      map[string]netSnapshot // keyed by full container ID
+	lastGood     lastKnownGood[dto.ContainerInfo]
 }
 
 // NewDockerCollector creates a new Docker SDK-based collector
@@ -86,22 +108,31 @@ func (c *DockerCollector) reportDockerSourceFailure(reason string, err error) {
 	c.appCtx.Platform.Report("docker", dto.SourceUnavailable, reason, err)
 }
 
+// publishLastKnownGood publishes the container list after a failed collection.
+// A transient failure republishes the last successful list flagged with the
+// current source status, so containers don't flap to unavailable between
+// polls. An intentionally disabled Docker service publishes an empty list.
+func (c *DockerCollector) publishLastKnownGood() {
+	if dockerServiceDisabled() {
+		c.lastGood.clear()
+		domain.Publish(c.appCtx.Hub, constants.TopicContainerListUpdate, []*dto.ContainerInfo{})
+		return
+	}
+	var st *dto.SourceStatus
+	if c.appCtx.Platform != nil {
+		st = c.appCtx.Platform.StatusFor("docker")
+	}
+	containers := c.lastGood.stale(func(ci *dto.ContainerInfo) { ci.SourceStatus = st })
+	domain.Publish(c.appCtx.Hub, constants.TopicContainerListUpdate, containers)
+}
+
 // Start begins the Docker collector's periodic data collection
 func (c *DockerCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting docker collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Docker collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Docker", interval, c.Collect)
-	}()
+	collect := func() { collectWithWatchdog(ctx, "Docker", interval, c.Collect) }
+	collectSafely("Docker", collect)
 
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
 	defer func() {
 		if c.dockerClient != nil {
 			if err := c.dockerClient.Close(); err != nil {
@@ -110,22 +141,7 @@ func (c *DockerCollector) Start(ctx context.Context, interval time.Duration) {
 		}
 	}()
 
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Docker collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Docker collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Docker", interval, c.Collect)
-			}()
-		}
-	}
+	tickCollect(ctx, "Docker", interval, collect)
 }
 
 // Collect gathers Docker container information using the SDK and publishes to event bus
@@ -137,30 +153,32 @@ func (c *DockerCollector) Collect() {
 	if err := c.initClient(); err != nil {
 		logger.Debug("Failed to initialize Docker client: %v (Docker may not be running)", err)
 		c.reportDockerSourceFailure("Docker client initialization failed", err)
-		// Publish empty list
-		domain.Publish(c.appCtx.Hub, constants.TopicContainerListUpdate, []*dto.ContainerInfo{})
+		c.publishLastKnownGood()
 		return
 	}
 
-	ctx := context.Background()
-
 	// List all containers (including stopped) - SDK is much faster than CLI
 	startList := time.Now()
-	result, err := c.dockerClient.ContainerList(ctx, client.ContainerListOptions{All: true})
+	listCtx, cancelList := context.WithTimeout(context.Background(), dockerListTimeout)
+	result, err := c.dockerClient.ContainerList(listCtx, client.ContainerListOptions{All: true})
+	cancelList()
 	if err != nil {
 		logger.Debug("Failed to list containers via SDK: %v", err)
 		c.reportDockerSourceFailure("Docker daemon unreachable (ContainerList failed)", err)
-		domain.Publish(c.appCtx.Hub, constants.TopicContainerListUpdate, []*dto.ContainerInfo{})
+		c.publishLastKnownGood()
 		return
 	}
 	apiContainers := result.Items
 	logger.Debug("Docker SDK: ContainerList took %v for %d containers", time.Since(startList), len(apiContainers))
 
 	containers := make([]*dto.ContainerInfo, 0, len(apiContainers))
-	var runningContainers []container.Summary
+	var running []runningContainer
 
-	// First pass: create basic container info
-	for _, apiContainer := range apiContainers {
+	// First pass: create basic container info. Every container in the
+	// snapshot carries the same collection time.
+	now := time.Now()
+	for i := range apiContainers {
+		apiContainer := &apiContainers[i]
 		shortID := apiContainer.ID[:12]
 		state := strings.ToLower(string(apiContainer.State))
 
@@ -171,7 +189,7 @@ func (c *DockerCollector) Collect() {
 			State:     state,
 			Status:    apiContainer.Status,
 			Ports:     c.convertPorts(apiContainer.Ports),
-			Timestamp: time.Now(),
+			Timestamp: now,
 		}
 
 		// Extract version from image tag
@@ -185,114 +203,32 @@ func (c *DockerCollector) Collect() {
 		containers = append(containers, cont)
 
 		if state == "running" {
-			runningContainers = append(runningContainers, apiContainer)
+			running = append(running, runningContainer{summary: apiContainer, info: cont})
 		}
 	}
 
 	// Batch inspect running containers for detailed info
-	if len(runningContainers) > 0 {
+	if len(running) > 0 {
 		startInspect := time.Now()
-		containerMap := make(map[string]*dto.ContainerInfo)
-		for _, cont := range containers {
-			containerMap[cont.ID] = cont
-		}
-
-		for _, apiContainer := range runningContainers {
-			shortID := apiContainer.ID[:12]
-			inspectResult, err := c.dockerClient.ContainerInspect(ctx, apiContainer.ID, client.ContainerInspectOptions{})
-			if err != nil {
-				logger.Debug("Docker SDK: Failed to inspect container %s: %v", shortID, err)
-				continue
-			}
-
-			inspectData := inspectResult.Container
-
-			if cont, ok := containerMap[shortID]; ok {
-				// Network mode
-				if inspectData.HostConfig != nil {
-					cont.NetworkMode = string(inspectData.HostConfig.NetworkMode)
-				}
-
-				// IP Address and MAC (get first available)
-				if inspectData.NetworkSettings != nil {
-					for _, network := range inspectData.NetworkSettings.Networks {
-						if network.IPAddress.IsValid() {
-							cont.IPAddress = network.IPAddress.String()
-							if mac := network.MacAddress.String(); mac != "" {
-								cont.MACAddress = mac
-							}
-							break
-						}
-					}
-					// Fall back to any network that exposes a MAC even without a valid IP.
-					if cont.MACAddress == "" {
-						for _, network := range inspectData.NetworkSettings.Networks {
-							if mac := network.MacAddress.String(); mac != "" {
-								cont.MACAddress = mac
-								break
-							}
-						}
-					}
-				}
 
-				// Port mappings
-				if inspectData.HostConfig != nil {
-					portMappings := []string{}
-					for containerPort, bindings := range inspectData.HostConfig.PortBindings {
-						for _, binding := range bindings {
-							if binding.HostPort != "" {
-								portMappings = append(portMappings, fmt.Sprintf("%s:%s", binding.HostPort, containerPort))
-							}
-						}
-					}
-					cont.PortMappings = portMappings
-
-					// Restart policy
-					cont.RestartPolicy = string(inspectData.HostConfig.RestartPolicy.Name)
-					if cont.RestartPolicy == "" {
-						cont.RestartPolicy = "no"
-					}
-				}
-
-				// Volume mappings
-				volumeMappings := []dto.VolumeMapping{}
-				for _, mount := range inspectData.Mounts {
-					volumeMappings = append(volumeMappings, dto.VolumeMapping{
-						HostPath:      mount.Source,
-						ContainerPath: mount.Destination,
-						Mode:          mount.Mode,
-					})
-				}
-				cont.VolumeMappings = volumeMappings
-
-				// Uptime
-				if inspectData.State != nil && inspectData.State.StartedAt != "" {
-					startTime, err := time.Parse(time.RFC3339Nano, inspectData.State.StartedAt)
-					if err == nil {
-						cont.Uptime = dockerFormatUptime(time.Since(startTime))
-					}
-				}
-
-				// RestartCount
-				cont.RestartCount = inspectData.RestartCount
-
-				// Memory stats from cgroups (much faster than ContainerStats API)
-				c.getMemoryFromCgroups(apiContainer.ID, cont)
-
-				// CPU stats from cgroups (delta between collections)
-				c.getCPUFromCgroups(apiContainer.ID, cont)
-
-				// Network I/O from /proc/<pid>/net/dev
-				if inspectData.State != nil {
-					c.getNetworkFromProc(inspectData.State.Pid, apiContainer.ID, cont)
-				}
-			}
+		// Inspect calls are round trips to the Docker daemon; overlapping a
+		// few of them keeps collection time from growing linearly with the
+		// number of running containers, without flooding the daemon.
+		sem := make(chan struct{}, dockerInspectConcurrency)
+		var wg sync.WaitGroup
+		for _, rc := range running {
+			sem <- struct{}{}
+			wg.Go(func() {
+				defer func() { <-sem }()
+				c.inspectContainer(rc.summary, rc.info)
+			})
 		}
-		logger.Debug("Docker SDK: Inspect + cgroup stats took %v for %d containers", time.Since(startInspect), len(runningContainers))
+		wg.Wait()
+		logger.Debug("Docker SDK: Inspect + cgroup stats took %v for %d containers", time.Since(startInspect), len(running))
 	}
 
 	// Prune stale CPU snapshots for containers that no longer exist
-	c.pruneStaleSnapshots(runningContainers)
+	c.pruneStaleSnapshots(running)
 
 	// Source healthy (zero containers is normal, not degraded). Attach the
 	// inline status flag only when not healthy.
@@ -306,10 +242,106 @@ func (c *DockerCollector) Collect() {
 	}
 
 	// Publish event
+	c.lastGood.store(containers)
 	domain.Publish(c.appCtx.Hub, constants.TopicContainerListUpdate, containers)
 	logger.Debug("Docker SDK: Total collection took %v, published %d containers", time.Since(startTotal), len(containers))
 }
 
+// inspectContainer fills in the inspect-derived and cgroup/proc fields of a
+// running container's DTO. It is safe to call concurrently for different
+// containers: it only writes cont, and prevCPU/prevNet are guarded by c.mu.
+func (c *DockerCollector) inspectContainer(apiContainer *container.Summary, cont *dto.ContainerInfo) {
+	shortID := apiContainer.ID[:12]
+	inspectCtx, cancelInspect := context.WithTimeout(context.Background(), dockerInspectTimeout)
+	inspectResult, err := c.dockerClient.ContainerInspect(inspectCtx, apiContainer.ID, client.ContainerInspectOptions{})
+	cancelInspect()
+	if err != nil {
+		logger.Debug("Docker SDK: Failed to inspect container %s: %v", shortID, err)
+		return
+	}
+
+	inspectData := inspectResult.Container
+
+	// Network mode
+	if inspectData.HostConfig != nil {
+		cont.NetworkMode = string(inspectData.HostConfig.NetworkMode)
+	}
+
+	// IP Address and MAC (get first available)
+	if inspectData.NetworkSettings != nil {
+		for _, network := range inspectData.NetworkSettings.Networks {
+			if network.IPAddress.IsValid() {
+				cont.IPAddress = network.IPAddress.String()
+				if mac := network.MacAddress.String(); mac != "" {
+					cont.MACAddress = mac
+				}
+				break
+			}
+		}
+		// Fall back to any network that exposes a MAC even without a valid IP.
+		if cont.MACAddress == "" {
+			for _, network := range inspectData.NetworkSettings.Networks {
+				if mac := network.MacAddress.String(); mac != "" {
+					cont.MACAddress = mac
+					break
+				}
+			}
+		}
+	}
+
+	// Port mappings
+	if inspectData.HostConfig != nil {
+		portMappings := []string{}
+		for containerPort, bindings := range inspectData.HostConfig.PortBindings {
+			for _, binding := range bindings {
+				if binding.HostPort != "" {
+					portMappings = append(portMappings, fmt.Sprintf("%s:%s", binding.HostPort, containerPort))
+				}
+			}
+		}
+		cont.PortMappings = portMappings
+
+		// Restart policy
+		cont.RestartPolicy = string(inspectData.HostConfig.RestartPolicy.Name)
+		if cont.RestartPolicy == "" {
+			cont.RestartPolicy = "no"
+		}
+	}
+
+	// Volume mappings
+	volumeMappings := []dto.VolumeMapping{}
+	for _, mount := range inspectData.Mounts {
+		volumeMappings = append(volumeMappings, dto.VolumeMapping{
+			HostPath:      mount.Source,
+			ContainerPath: mount.Destination,
+			Mode:          mount.Mode,
+		})
+	}
+	cont.VolumeMappings = volumeMappings
+
+	// Uptime
+	if inspectData.State != nil && inspectData.State.StartedAt != "" {
+		startTime, err := time.Parse(time.RFC3339Nano, inspectData.State.StartedAt)
+		if err == nil {
+			cont.Uptime = dockerFormatUptime(time.Since(startTime))
+		}
+	}
+
+	// RestartCount
+	cont.RestartCount = inspectData.RestartCount
+
+	// Memory stats from cgroups (much faster than ContainerStats API)
+	c.getMemoryFromCgroups(apiContainer.ID, cont)
+
+	// CPU stats from cgroups (delta between collections)
+	c.getCPUFromCgroups(apiContainer.ID, cont)
+
+	// Network I/O from /proc/<pid>/net/dev
+	if inspectData.State != nil {
+		c.getNetworkFromProc(inspectData.State.Pid, apiContainer.ID, cont)
+	}
+}
+
 // getMemoryFromCgroups reads memory stats directly from cgroup v2 filesystem
 // This is much faster than using Docker's ContainerStats API
 func (c *DockerCollector) getMemoryFromCgroups(fullID string, cont *dto.ContainerInfo) {
@@ -381,16 +413,26 @@ func dockerFormatMemoryDisplay(used, limit uint64) string {
 		return "0 / 0"
 	}
 
-	usedMB := float64(used) / (1024 * 1024)
-	limitMB := float64(limit) / (1024 * 1024)
-
-	if limitMB >= 1024 {
-		usedGB := usedMB / 1024
-		limitGB := limitMB / 1024
-		return fmt.Sprintf("%.2f GB / %.2f GB", usedGB, limitGB)
-	}
+	return formatMemoryUsage(used, limit)
+}
 
-	return fmt.Sprintf("%.2f MB / %.2f MB", usedMB, limitMB)
+// formatMemoryUsage renders used/total as "X.XX GB / Y.YY GB", or in MB when
+// total is under 1 GiB. It runs for every container and VM on each poll, so
+// it appends straight into a stack buffer instead of going through
+// fmt.Sprintf; the output is identical to the "%.2f" verb.
+func formatMemoryUsage(used, total uint64) string {
+	unit, scale := " MB", 1.0/(1<<20)
+	if total >= 1<<30 {
+		unit, scale = " GB", 1.0/(1<<30)
+	}
+
+	var buf [48]byte
+	b := strconv.AppendFloat(buf[:0], float64(used)*scale, 'f', 2, 64)
+	b = append(b, unit...)
+	b = append(b, " / "...)
+	b = strconv.AppendFloat(b, float64(total)*scale, 'f', 2, 64)
+	b = append(b, unit...)
+	return string(b)
 }
 
 // dockerGetSystemMemoryTotal reads total system memory from /proc/meminfo
@@ -467,10 +509,10 @@ func (c *DockerCollector) getCPUFromCgroups(fullID string, cont *dto.ContainerIn
 }
 
 // pruneStaleSnapshots removes CPU and network snapshots for containers that are no longer running.
-func (c *DockerCollector) pruneStaleSnapshots(running []container.Summary) {
+func (c *DockerCollector) pruneStaleSnapshots(running []runningContainer) {
 	active := make(map[string]struct{}, len(running))
 	for _, rc := range running {
-		active[rc.ID] = struct{}{}
+		active[rc.summary.ID] = struct{}{}
 	}
 	c.mu.Lock()
 	for id := range c.prevCPU {
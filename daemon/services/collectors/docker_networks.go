@@ -47,34 +47,8 @@ func (c *DockerNetworksCollector) Start(ctx context.Context, interval time.Durat
 	case <-time.After(dockerNetworksStartupStagger):
 	}
 
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("DockerNetworks collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("DockerNetworks collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("DockerNetworks collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("DockerNetworks", c.Collect)
+	tickCollect(ctx, "DockerNetworks", interval, c.Collect)
 }
 
 // Collect fetches the current network list and publishes only when it changed
@@ -63,34 +63,9 @@ func (c *DockerUpdateCollector) Start(ctx context.Context, interval time.Duratio
 	case <-time.After(dockerUpdateStartupStagger):
 	}
 
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("DockerUpdate collector", r)
-			}
-		}()
-		c.Collect(ctx)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("DockerUpdate collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("DockerUpdate collector", r)
-					}
-				}()
-				c.Collect(ctx)
-			}()
-		}
-	}
+	collect := func() { c.Collect(ctx) }
+	collectSafely("DockerUpdate", collect)
+	tickCollect(ctx, "DockerUpdate", interval, collect)
 }
 
 // Collect runs an update check and publishes the result only if it changed
@@ -24,33 +24,8 @@ func NewFanControlCollector(ctx *domain.Context) *FanControlCollector {
 
 // Start begins the periodic fan status collection loop with panic recovery.
 func (c *FanControlCollector) Start(ctx context.Context, interval time.Duration) {
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Fan control collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Fan control collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("Fan control", c.Collect)
+	tickCollect(ctx, "Fan control", interval, c.Collect)
 }
 
 // Collect reads the current fan status and publishes it to the event bus.
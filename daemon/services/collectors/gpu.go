@@ -9,6 +9,7 @@ import (
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/constants"
@@ -22,8 +23,34 @@ import (
 // It gathers temperature, utilization, memory usage, and power consumption data.
 type GPUCollector struct {
 	ctx *domain.Context
+
+	// PCI inventory shared by the Intel and AMD probes; see pciDevices.
+	pciMu      sync.Mutex
+	pciListing string
+	pciExpires time.Time
 }
 
+// pciListingTTL bounds how long the lspci inventory is reused. GPUs are not
+// hot-plugged, so re-listing the PCI bus on every poll only costs a fork/exec
+// per vendor; a stale listing at worst delays detecting a newly bound card.
+const pciListingTTL = 10 * time.Minute
+
+// Regexes for parsing lspci and radeontop output. They are compiled on first
+// use rather than at package init: most servers only run the NVIDIA path or
+// have no GPU at all, so the agent should not pay for them at startup, and
+// once compiled they are reused instead of recompiled per line and per poll.
+var (
+	lspciQuotedRe = sync.OnceValue(func() *regexp.Regexp {
+		return regexp.MustCompile(`"([^"]*)"`)
+	})
+	radeontopGPURe = sync.OnceValue(func() *regexp.Regexp {
+		return regexp.MustCompile(`gpu\s+([\d.]+)%`)
+	})
+	radeontopVRAMRe = sync.OnceValue(func() *regexp.Regexp {
+		return regexp.MustCompile(`vram\s+([\d.]+)%\s+([\d]+)mb`)
+	})
+)
+
 // NewGPUCollector creates a new GPU metrics collector with the given context.
 func NewGPUCollector(ctx *domain.Context) *GPUCollector {
 	return &GPUCollector{ctx: ctx}
@@ -34,35 +61,9 @@ func NewGPUCollector(ctx *domain.Context) *GPUCollector {
 func (c *GPUCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting gpu collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("GPU collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "GPU", interval, c.Collect)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("GPU collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("GPU collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "GPU", interval, c.Collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "GPU", interval, c.Collect) }
+	collectSafely("GPU", collect)
+	tickCollect(ctx, "GPU", interval, collect)
 }
 
 // Collect gathers GPU metrics from all available GPUs and publishes them to the event bus.
@@ -114,6 +115,25 @@ func (c *GPUCollector) Collect() {
 	logger.Debug("Published %s event for %d total GPU(s)", constants.TopicGPUMetricsUpdate.Name, len(gpuMetrics))
 }
 
+// pciDevices returns the `lspci -Dmm` listing, running lspci at most once per
+// pciListingTTL and sharing the result between the Intel and AMD probes.
+// Failures are not cached so the next poll retries.
+func (c *GPUCollector) pciDevices() (string, error) {
+	c.pciMu.Lock()
+	defer c.pciMu.Unlock()
+
+	if c.pciListing != "" && time.Now().Before(c.pciExpires) {
+		return c.pciListing, nil
+	}
+	output, err := lib.ExecCommandOutput("lspci", "-Dmm")
+	if err != nil {
+		return "", err
+	}
+	c.pciListing = output
+	c.pciExpires = time.Now().Add(pciListingTTL)
+	return output, nil
+}
+
 // assignGlobalGPUIndices reassigns GPU indices sequentially (0, 1, 2, ...)
 // to ensure global uniqueness across all vendors.
 func assignGlobalGPUIndices(gpus []*dto.GPUMetrics) {
@@ -127,7 +147,7 @@ func (c *GPUCollector) collectIntelGPU() ([]*dto.GPUMetrics, error) {
 	logger.Debug("Intel GPU: Starting Intel GPU detection")
 
 	// First check if Intel GPU exists using lspci
-	output, err := lib.ExecCommandOutput("lspci", "-Dmm")
+	output, err := c.pciDevices()
 	if err != nil {
 		logger.Debug("Intel GPU: lspci query failed: %v", err)
 		return nil, fmt.Errorf("lspci query failed: %w", err)
@@ -159,8 +179,7 @@ func (c *GPUCollector) collectIntelGPU() ([]*dto.GPUMetrics, error) {
 			// Extract all quoted strings using regex
 			// Format: "VGA compatible controller" "Intel Corporation" "CoffeeLake-S GT2 [UHD Graphics 630]" -p00 "ASRock Incorporation" "Device 3e92"
 			// Indices: [0]=class, [1]=vendor, [2]=device_name, [3]=subsys_vendor, [4]=subsys_device
-			re := regexp.MustCompile(`"([^"]*)"`)
-			matches := re.FindAllStringSubmatch(line, -1)
+			matches := lspciQuotedRe().FindAllStringSubmatch(line, -1)
 
 			// The 3rd quoted string (index 2) is the device name
 			if len(matches) >= 3 {
@@ -437,6 +456,7 @@ func (c *GPUCollector) collectNvidiaGPU() ([]*dto.GPUMetrics, error) {
 
 	gpus := make([]*dto.GPUMetrics, 0, len(records))
 
+	now := time.Now()
 	for _, record := range records {
 		if len(record) < 10 {
 			continue
@@ -445,7 +465,7 @@ func (c *GPUCollector) collectNvidiaGPU() ([]*dto.GPUMetrics, error) {
 		gpu := &dto.GPUMetrics{
 			Available: true,
 			Vendor:    "nvidia",
-			Timestamp: time.Now(),
+			Timestamp: now,
 		}
 
 		// Index
@@ -537,7 +557,7 @@ func (c *GPUCollector) collectAMDGPU() ([]*dto.GPUMetrics, error) {
 // collectAMDGPUWithRadeontop uses radeontop for consumer AMD GPUs
 func (c *GPUCollector) collectAMDGPUWithRadeontop() ([]*dto.GPUMetrics, error) {
 	// First, detect AMD GPUs using lspci
-	output, err := lib.ExecCommandOutput("lspci", "-Dmm")
+	output, err := c.pciDevices()
 	if err != nil {
 		return nil, fmt.Errorf("lspci query failed: %w", err)
 	}
@@ -561,8 +581,7 @@ func (c *GPUCollector) collectAMDGPUWithRadeontop() ([]*dto.GPUMetrics, error) {
 			}
 
 			// Extract model name
-			re := regexp.MustCompile(`"([^"]*)"`)
-			matches := re.FindAllStringSubmatch(line, -1)
+			matches := lspciQuotedRe().FindAllStringSubmatch(line, -1)
 			if len(matches) >= 3 {
 				fullModel := matches[2][1]
 				// Extract marketing name from brackets if present
@@ -627,14 +646,14 @@ func (c *GPUCollector) collectSingleAMDGPU(pciID, model string, index int) *dto.
 	output := strings.TrimSpace(cmdOutput)
 	if output != "" {
 		// Extract GPU utilization
-		if matches := regexp.MustCompile(`gpu\s+([\d.]+)%`).FindStringSubmatch(output); len(matches) > 1 {
+		if matches := radeontopGPURe().FindStringSubmatch(output); len(matches) > 1 {
 			if util, err := strconv.ParseFloat(matches[1], 64); err == nil {
 				gpu.UtilizationGPU = util
 			}
 		}
 
 		// Extract VRAM usage: "vram 15.00% 1234mb"
-		if matches := regexp.MustCompile(`vram\s+([\d.]+)%\s+([\d]+)mb`).FindStringSubmatch(output); len(matches) > 2 {
+		if matches := radeontopVRAMRe().FindStringSubmatch(output); len(matches) > 2 {
 			if vramPercent, err := strconv.ParseFloat(matches[1], 64); err == nil {
 				gpu.UtilizationMemory = vramPercent
 			}
@@ -761,6 +780,7 @@ func (c *GPUCollector) collectAMDGPUWithROCm() ([]*dto.GPUMetrics, error) {
 	})
 
 	// Parse each GPU in deterministic card order
+	now := time.Now()
 	for _, gpuID := range cardIDs {
 		gpuDataInterface := rocmData[gpuID]
 
@@ -773,7 +793,7 @@ func (c *GPUCollector) collectAMDGPUWithROCm() ([]*dto.GPUMetrics, error) {
 			Available: true,
 			Index:     index,
 			Vendor:    "amd",
-			Timestamp: time.Now(),
+			Timestamp: now,
 		}
 
 		// Get GPU name/model
@@ -27,35 +27,9 @@ func NewHardwareCollector(ctx *domain.Context) *HardwareCollector {
 func (c *HardwareCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting hardware collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Hardware collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Hardware", interval, c.Collect)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Hardware collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Hardware collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Hardware", interval, c.Collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "Hardware", interval, c.Collect) }
+	collectSafely("Hardware", collect)
+	tickCollect(ctx, "Hardware", interval, collect)
 }
 
 // Collect gathers hardware information from DMI tables and publishes it to the event bus.
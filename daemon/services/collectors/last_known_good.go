@@ -0,0 +1,58 @@
+package collectors
+
+import "sync/atomic"
+
+// lastKnownGood retains the most recent successful list collection so that a
+// transient source failure (daemon restart, socket hiccup) can republish the
+// previous snapshot instead of an empty list. Publishing an empty list makes
+// every downstream consumer (REST cache, WebSocket clients, MQTT entities)
+// drop all items until the next successful poll.
+type lastKnownGood[T any] struct {
+	snap   atomic.Pointer[[]*T]
+	misses atomic.Int32 // consecutive stale() calls since the last store
+}
+
+// maxStaleCollections caps how many consecutive failed collections may
+// republish the retained snapshot. Past that the outage is no longer
+// transient, and states such as "running" would keep reporting a world that
+// may no longer exist, so stale() drops the snapshot and returns an empty
+// list instead.
+const maxStaleCollections = 5
+
+// store records a successful collection.
+func (l *lastKnownGood[T]) store(items []*T) {
+	l.misses.Store(0)
+	l.snap.Store(&items)
+}
+
+// clear forgets the retained snapshot, e.g. when the source was intentionally
+// disabled and an empty list is the correct answer.
+func (l *lastKnownGood[T]) clear() {
+	l.snap.Store(nil)
+	l.misses.Store(0)
+}
+
+// stale returns shallow copies of the retained snapshot, passing each copy to
+// mark (typically to attach the current SourceStatus). The published originals
+// are never mutated because subscribers may still be reading them. Returns an
+// empty, non-nil slice when nothing has been collected yet, or once more than
+// maxStaleCollections consecutive calls have passed without a store.
+func (l *lastKnownGood[T]) stale(mark func(*T)) []*T {
+	if l.misses.Add(1) > maxStaleCollections {
+		l.snap.Store(nil)
+		return []*T{}
+	}
+	p := l.snap.Load()
+	if p == nil {
+		return []*T{}
+	}
+	out := make([]*T, len(*p))
+	for i, item := range *p {
+		cp := *item
+		if mark != nil {
+			mark(&cp)
+		}
+		out[i] = &cp
+	}
+	return out
+}
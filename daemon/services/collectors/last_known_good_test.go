@@ -0,0 +1,55 @@
+package collectors
+
+import (
+	"testing"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/dto"
+)
+
+func TestLastKnownGood(t *testing.T) {
+	var lkg lastKnownGood[dto.ContainerInfo]
+
+	if got := lkg.stale(nil); got == nil || len(got) != 0 {
+		t.Fatalf("stale() before store = %v, want empty non-nil slice", got)
+	}
+
+	original := []*dto.ContainerInfo{{ID: "abc", State: "running"}}
+	lkg.store(original)
+
+	status := &dto.SourceStatus{State: dto.SourceUnavailable}
+	got := lkg.stale(func(ci *dto.ContainerInfo) { ci.SourceStatus = status })
+	if len(got) != 1 || got[0].ID != "abc" || got[0].SourceStatus != status {
+		t.Fatalf("stale() = %+v, want copy of abc flagged with status", got)
+	}
+	if original[0].SourceStatus != nil {
+		t.Error("stale() mutated the published snapshot")
+	}
+	if got[0] == original[0] {
+		t.Error("stale() returned the original pointer instead of a copy")
+	}
+
+	lkg.clear()
+	if got := lkg.stale(nil); len(got) != 0 {
+		t.Errorf("stale() after clear = %v, want empty", got)
+	}
+}
+
+func TestLastKnownGood_ExpiresAfterMaxStaleCollections(t *testing.T) {
+	var lkg lastKnownGood[dto.ContainerInfo]
+	lkg.store([]*dto.ContainerInfo{{ID: "abc", State: "running"}})
+
+	for i := range maxStaleCollections {
+		if got := lkg.stale(nil); len(got) != 1 {
+			t.Fatalf("stale() call %d = %v, want retained snapshot", i+1, got)
+		}
+	}
+	if got := lkg.stale(nil); got == nil || len(got) != 0 {
+		t.Fatalf("stale() past the cap = %v, want empty non-nil slice", got)
+	}
+
+	// A successful collection restarts the allowance.
+	lkg.store([]*dto.ContainerInfo{{ID: "def", State: "running"}})
+	if got := lkg.stale(nil); len(got) != 1 || got[0].ID != "def" {
+		t.Errorf("stale() after store = %v, want new snapshot", got)
+	}
+}
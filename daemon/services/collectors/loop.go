@@ -0,0 +1,38 @@
+package collectors
+
+import (
+	"context"
+	"time"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/logger"
+)
+
+// collectSafely runs one collector cycle, recovering a panic so that a single
+// bad cycle cannot take the collector down. name is the collector's log name
+// (e.g. "Docker"); the panic is reported as "<name> collector".
+func collectSafely(name string, collect func()) {
+	defer func() {
+		if r := recover(); r != nil {
+			logger.LogPanicWithStack(name+" collector", r)
+		}
+	}()
+	collect()
+}
+
+// tickCollect runs collect on every interval tick until ctx is cancelled. It is
+// the periodic half shared by every collector's Start; the initial cycle and
+// any setup (startup stagger, file watchers) happen in Start before the call.
+func tickCollect(ctx context.Context, name string, interval time.Duration, collect func()) {
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-ctx.Done():
+			logger.Info("%s collector stopping due to context cancellation", name)
+			return
+		case <-ticker.C:
+			collectSafely(name, collect)
+		}
+	}
+}
@@ -0,0 +1,39 @@
+package collectors
+
+import (
+	"context"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestTickCollect_RecoversPanicsAndStopsOnCancel(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	var cycles atomic.Int32
+
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		tickCollect(ctx, "Test", 5*time.Millisecond, func() {
+			if cycles.Add(1) == 1 {
+				panic("boom")
+			}
+		})
+	}()
+
+	deadline := time.After(2 * time.Second)
+	for cycles.Load() < 3 {
+		select {
+		case <-deadline:
+			t.Fatalf("only %d cycles ran; a panicking cycle must not stop the loop", cycles.Load())
+		case <-time.After(time.Millisecond):
+		}
+	}
+
+	cancel()
+	select {
+	case <-done:
+	case <-time.After(time.Second):
+		t.Fatal("tickCollect did not return after context cancellation")
+	}
+}
@@ -52,34 +52,9 @@ func (c *MoverCollector) Start(ctx context.Context, interval time.Duration) {
 	case <-time.After(moverStartupStagger):
 	}
 
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Mover collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Mover", interval, c.Collect)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Mover collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Mover collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Mover", interval, c.Collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "Mover", interval, c.Collect) }
+	collectSafely("Mover", collect)
+	tickCollect(ctx, "Mover", interval, collect)
 }
 
 // Collect runs a mover status check and publishes the result only when the
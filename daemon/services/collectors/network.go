@@ -43,35 +43,9 @@ func NewNetworkCollector(ctx *domain.Context) *NetworkCollector {
 func (c *NetworkCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting network collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Network collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Network", interval, c.Collect)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Network collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Network collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Network", interval, c.Collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "Network", interval, c.Collect) }
+	collectSafely("Network", collect)
+	tickCollect(ctx, "Network", interval, collect)
 }
 
 // Collect gathers network interface information and publishes it to the event bus.
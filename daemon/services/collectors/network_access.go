@@ -186,45 +186,30 @@ func getWireGuardAccessURLs() []dto.AccessURL {
 	return urls
 }
 
-// getWANAccessURL returns the public WAN IP if accessible
-func getWANAccessURL() *dto.AccessURL {
-	// Try multiple services to get public IP
-	services := []string{
-		"https://api.ipify.org",
-		"https://ifconfig.me/ip",
-		"https://icanhazip.com",
-	}
-
-	// 2s per service keeps worst-case discovery under ~6s on networks without
-	// outbound internet access (issue #123); a reachable IP service answers in
-	// well under a second. The first successful response wins.
-	client := &http.Client{
-		Timeout: 2 * time.Second,
-	}
-
-	for _, service := range services {
-		//nolint:gosec // G107: URL is from a trusted constant list of IP services
-		resp, err := client.Get(service)
-		if err != nil {
-			continue
-		}
-		defer func() {
-			if err := resp.Body.Close(); err != nil {
-				logger.Debug("Error closing response body: %v", err)
-			}
-		}()
+// publicIPServices are tried in order to discover the public WAN IP.
+var publicIPServices = []string{
+	"https://api.ipify.org",
+	"https://ifconfig.me/ip",
+	"https://icanhazip.com",
+}
 
-		if resp.StatusCode != http.StatusOK {
-			continue
-		}
+// publicIPClient is shared across lookups so repeated discoveries reuse the
+// pooled TLS connection to a service instead of handshaking each time.
+//
+// 2s per service keeps worst-case discovery under ~6s on networks without
+// outbound internet access (issue #123); a reachable IP service answers in
+// well under a second.
+var publicIPClient = &http.Client{Timeout: 2 * time.Second}
 
-		body, err := io.ReadAll(io.LimitReader(resp.Body, 64))
-		if err != nil {
-			continue
-		}
+// maxPublicIPBytes caps how much of an IP service response is read; an IPv6
+// address plus a trailing newline fits comfortably.
+const maxPublicIPBytes = 64
 
-		ip := strings.TrimSpace(string(body))
-		if net.ParseIP(ip) != nil {
+// getWANAccessURL returns the public WAN IP if accessible
+func getWANAccessURL() *dto.AccessURL {
+	// The first successful response wins.
+	for _, service := range publicIPServices {
+		if ip := fetchPublicIP(service); ip != "" {
 			return &dto.AccessURL{
 				Type: dto.URLTypeWAN,
 				Name: "Remote Access (WAN)",
@@ -245,6 +230,40 @@ func getWANAccessURL() *dto.AccessURL {
 	return nil
 }
 
+// fetchPublicIP asks one IP echo service for the public address and returns it,
+// or "" when the service fails or answers with something that is not an IP.
+// The response is closed before returning, so a failing service does not hold
+// its connection while the next one is tried.
+func fetchPublicIP(service string) string {
+	//nolint:gosec // G107: URL is from a trusted constant list of IP services
+	resp, err := publicIPClient.Get(service)
+	if err != nil {
+		return ""
+	}
+	defer func() {
+		// Drain what is left of the small body so the connection is reusable.
+		_, _ = io.Copy(io.Discard, io.LimitReader(resp.Body, maxPublicIPBytes))
+		if err := resp.Body.Close(); err != nil {
+			logger.Debug("Error closing response body: %v", err)
+		}
+	}()
+
+	if resp.StatusCode != http.StatusOK {
+		return ""
+	}
+
+	body, err := io.ReadAll(io.LimitReader(resp.Body, maxPublicIPBytes))
+	if err != nil {
+		return ""
+	}
+
+	ip := strings.TrimSpace(string(body))
+	if net.ParseIP(ip) == nil {
+		return ""
+	}
+	return ip
+}
+
 // getWANIPFromUnraid tries to get the WAN IP from Unraid's network configuration
 func getWANIPFromUnraid() string {
 	// Check if there's a WAN IP stored in Unraid config
@@ -341,25 +360,11 @@ func getIPv6AccessURLs() []dto.AccessURL {
 	return urls
 }
 
-// isPrivateIP checks if an IP address is in a private range
+// isPrivateIP checks if an IPv4 address is in an RFC 1918 private range
+// (10/8, 172.16/12, 192.168/16). IPv6 addresses are never reported private.
 func isPrivateIP(ip net.IP) bool {
-	privateRanges := []string{
-		"10.0.0.0/8",
-		"172.16.0.0/12",
-		"192.168.0.0/16",
-	}
-
-	for _, cidr := range privateRanges {
-		_, network, err := net.ParseCIDR(cidr)
-		if err != nil {
-			continue
-		}
-		if network.Contains(ip) {
-			return true
-		}
-	}
-
-	return false
+	ip4 := ip.To4()
+	return ip4 != nil && ip4.IsPrivate()
 }
 
 // GetPrimaryLANIP returns the primary LAN IP address
@@ -2,6 +2,8 @@ package collectors
 
 import (
 	"net"
+	"net/http"
+	"net/http/httptest"
 	"strings"
 	"testing"
 
@@ -252,3 +254,30 @@ func TestAccessURLStructure(t *testing.T) {
 		t.Errorf("IPv6 mismatch")
 	}
 }
+
+func TestFetchPublicIP(t *testing.T) {
+	tests := []struct {
+		name   string
+		status int
+		body   string
+		want   string
+	}{
+		{"valid IPv4", http.StatusOK, "203.0.113.7\n", "203.0.113.7"},
+		{"server error", http.StatusInternalServerError, "203.0.113.7", ""},
+		{"not an IP", http.StatusOK, "<html>rate limited</html>", ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+				w.WriteHeader(tt.status)
+				_, _ = w.Write([]byte(tt.body))
+			}))
+			defer srv.Close()
+
+			if got := fetchPublicIP(srv.URL); got != tt.want {
+				t.Errorf("fetchPublicIP() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
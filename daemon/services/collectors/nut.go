@@ -31,35 +31,9 @@ func NewNUTCollector(ctx *domain.Context) *NUTCollector {
 func (c *NUTCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting NUT collector (interval: %v)", interval)
 
-	// Run once immediately
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("NUT collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "NUT", interval, c.Collect)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("NUT collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("NUT collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "NUT", interval, c.Collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "NUT", interval, c.Collect) }
+	collectSafely("NUT", collect)
+	tickCollect(ctx, "NUT", interval, collect)
 }
 
 // Collect gathers NUT status information and publishes it to the event bus.
@@ -74,34 +74,8 @@ func (c *OSUpdateCollector) Start(ctx context.Context, interval time.Duration) {
 	case <-time.After(osUpdateStartupStagger):
 	}
 
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("OSUpdate collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("OSUpdate collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("OSUpdate collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("OSUpdate", c.Collect)
+	tickCollect(ctx, "OSUpdate", interval, c.Collect)
 }
 
 // Collect runs an OS update check and publishes the result only if it changed
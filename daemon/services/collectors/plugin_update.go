@@ -63,34 +63,9 @@ func (c *PluginUpdateCollector) Start(ctx context.Context, interval time.Duratio
 	case <-time.After(pluginUpdateStartupStagger):
 	}
 
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("PluginUpdate collector", r)
-			}
-		}()
-		c.Collect(ctx)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("PluginUpdate collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("PluginUpdate collector", r)
-					}
-				}()
-				c.Collect(ctx)
-			}()
-		}
-	}
+	collect := func() { c.Collect(ctx) }
+	collectSafely("PluginUpdate", collect)
+	tickCollect(ctx, "PluginUpdate", interval, collect)
 }
 
 // Collect runs a plugin update check and publishes the result only if it
@@ -27,35 +27,8 @@ func NewRegistrationCollector(ctx *domain.Context) *RegistrationCollector {
 func (c *RegistrationCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting registration collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Registration collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Registration collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Registration collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("Registration", c.Collect)
+	tickCollect(ctx, "Registration", interval, c.Collect)
 }
 
 // Collect gathers registration information
@@ -31,15 +31,8 @@ func NewShareCollector(ctx *domain.Context) *ShareCollector {
 func (c *ShareCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting share collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Share collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Share", interval, func() { c.Collect(ctx) })
-	}()
+	collect := func() { collectWithWatchdog(ctx, "Share", interval, func() { c.Collect(ctx) }) }
+	collectSafely("Share", collect)
 
 	// Set up fsnotify watcher for instant state updates on shares.ini changes
 	watchedFiles := []string{constants.SharesIni}
@@ -70,25 +63,7 @@ func (c *ShareCollector) Start(ctx context.Context, interval time.Duration) {
 		logger.Info("Share collector: fsnotify watching %v for instant updates", watchedFiles)
 	}
 
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Share collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Share collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Share", interval, func() { c.Collect(ctx) })
-			}()
-		}
-	}
+	tickCollect(ctx, "Share", interval, collect)
 }
 
 // Collect gathers user share information and publishes it to the event bus.
@@ -261,6 +236,7 @@ func (c *ShareCollector) collectShares(ctx context.Context) ([]dto.ShareInfo, er
 	}
 
 	// Calculate total and usage percentage for each share
+	now := time.Now()
 	for i := range shares {
 		// If total is 0, calculate it from used + free
 		if shares[i].Total == 0 && (shares[i].Used > 0 || shares[i].Free > 0) {
@@ -273,7 +249,7 @@ func (c *ShareCollector) collectShares(ctx context.Context) ([]dto.ShareInfo, er
 		}
 
 		// Set timestamp
-		shares[i].Timestamp = time.Now()
+		shares[i].Timestamp = now
 	}
 
 	// Enrich shares with configuration data
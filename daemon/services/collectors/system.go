@@ -23,6 +23,10 @@ import (
 type SystemCollector struct {
 	ctx      *domain.Context
 	prevRAPL *lib.RAPLReading // Previous RAPL reading for power delta calculation
+
+	// unraidVersion caches the OS version once read; it only changes across
+	// an upgrade, which reboots the server and restarts the agent.
+	unraidVersion string
 }
 
 // NewSystemCollector creates a new system information collector with the given context.
@@ -35,35 +39,8 @@ func NewSystemCollector(ctx *domain.Context) *SystemCollector {
 func (c *SystemCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting system collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("System collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("System collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("System collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("System", c.Collect)
+	tickCollect(ctx, "System", interval, c.Collect)
 }
 
 // Collect gathers system information and publishes it to the event bus.
@@ -112,7 +89,10 @@ func (c *SystemCollector) collectSystemInfo() (*dto.SystemInfo, error) {
 	}
 
 	// Get Unraid version
-	info.Version = c.getUnraidVersion()
+	if c.unraidVersion == "" {
+		c.unraidVersion = c.getUnraidVersion()
+	}
+	info.Version = c.unraidVersion
 
 	// Get Management Agent version
 	info.AgentVersion = c.ctx.Version
@@ -309,28 +289,14 @@ func (c *SystemCollector) calculateCPUPercent() (float64, error) {
 		return 0, err
 	}
 
-	// Calculate usage
-	total1 := stat1["user"] + stat1["nice"] + stat1["system"] + stat1["idle"] + stat1["iowait"] + stat1["irq"] + stat1["softirq"] + stat1["steal"]
-	total2 := stat2["user"] + stat2["nice"] + stat2["system"] + stat2["idle"] + stat2["iowait"] + stat2["irq"] + stat2["softirq"] + stat2["steal"]
-
-	idle1 := stat1["idle"] + stat1["iowait"]
-	idle2 := stat2["idle"] + stat2["iowait"]
-
-	totalDelta := total2 - total1
-	idleDelta := idle2 - idle1
-
-	if totalDelta == 0 {
-		return 0, nil
-	}
-
-	usage := (float64(totalDelta-idleDelta) / float64(totalDelta)) * 100
+	usage, _ := cpuUsagePercent(stat1, stat2)
 	return usage, nil
 }
 
-func (c *SystemCollector) readCPUStat() (map[string]uint64, error) {
+func (c *SystemCollector) readCPUStat() (cpuTimes, error) {
 	file, err := os.Open("/proc/stat")
 	if err != nil {
-		return nil, err
+		return cpuTimes{}, err
 	}
 	defer func() {
 		if err := file.Close(); err != nil {
@@ -344,41 +310,65 @@ func (c *SystemCollector) readCPUStat() (map[string]uint64, error) {
 		if strings.HasPrefix(line, "cpu ") {
 			fields := strings.Fields(line)
 			if len(fields) < 9 {
-				return nil, fmt.Errorf("invalid cpu stat format")
+				return cpuTimes{}, fmt.Errorf("invalid cpu stat format")
 			}
 
-			stat := make(map[string]uint64)
-			var err error
-			if stat["user"], err = strconv.ParseUint(fields[1], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU user stat: %v", err)
-			}
-			if stat["nice"], err = strconv.ParseUint(fields[2], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU nice stat: %v", err)
-			}
-			if stat["system"], err = strconv.ParseUint(fields[3], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU system stat: %v", err)
-			}
-			if stat["idle"], err = strconv.ParseUint(fields[4], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU idle stat: %v", err)
-			}
-			if stat["iowait"], err = strconv.ParseUint(fields[5], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU iowait stat: %v", err)
-			}
-			if stat["irq"], err = strconv.ParseUint(fields[6], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU irq stat: %v", err)
-			}
-			if stat["softirq"], err = strconv.ParseUint(fields[7], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU softirq stat: %v", err)
-			}
-			if stat["steal"], err = strconv.ParseUint(fields[8], 10, 64); err != nil {
-				logger.Warning("Failed to parse CPU steal stat: %v", err)
-			}
+			return parseCPUTimes(fields, func(name string, err error) {
+				logger.Warning("Failed to parse CPU %s stat: %v", name, err)
+			}), nil
+		}
+	}
+
+	return cpuTimes{}, fmt.Errorf("cpu line not found in /proc/stat")
+}
 
-			return stat, nil
+// cpuTimes holds the jiffy counters of one /proc/stat cpu line, indexed by
+// the cpuUser..cpuSteal constants in the kernel's field order.
+type cpuTimes [cpuTimeFields]uint64
+
+const (
+	cpuUser = iota
+	cpuNice
+	cpuSystem
+	cpuIdle
+	cpuIOWait
+	cpuIRQ
+	cpuSoftIRQ
+	cpuSteal
+	cpuTimeFields
+)
+
+// cpuTimeNames names each cpuTimes slot for parse-failure logging.
+var cpuTimeNames = [cpuTimeFields]string{"user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal"}
+
+// parseCPUTimes reads the counters from a split cpu line (fields[0] is the
+// cpu label). A counter that fails to parse is reported to onErr and left 0.
+func parseCPUTimes(fields []string, onErr func(name string, err error)) cpuTimes {
+	var t cpuTimes
+	for i := range t {
+		v, err := strconv.ParseUint(fields[i+1], 10, 64)
+		if err != nil {
+			onErr(cpuTimeNames[i], err)
 		}
+		t[i] = v
 	}
+	return t
+}
 
-	return nil, fmt.Errorf("cpu line not found in /proc/stat")
+// cpuUsagePercent returns the busy share of the time elapsed between two
+// samples. ok is false when no time elapsed.
+func cpuUsagePercent(prev, cur cpuTimes) (usage float64, ok bool) {
+	var total1, total2 uint64
+	for i := range cur {
+		total1 += prev[i]
+		total2 += cur[i]
+	}
+	totalDelta := total2 - total1
+	idleDelta := (cur[cpuIdle] + cur[cpuIOWait]) - (prev[cpuIdle] + prev[cpuIOWait])
+	if totalDelta == 0 {
+		return 0, false
+	}
+	return (float64(totalDelta-idleDelta) / float64(totalDelta)) * 100, true
 }
 
 func (c *SystemCollector) getMemoryInfo() (uint64, uint64, uint64, uint64, uint64, error) {
@@ -816,17 +806,7 @@ func (c *SystemCollector) getPerCoreCPUUsage() (map[string]float64, error) {
 	perCoreUsage := make(map[string]float64)
 	for core, values1 := range stat1 {
 		if values2, exists := stat2[core]; exists {
-			total1 := values1["user"] + values1["nice"] + values1["system"] + values1["idle"] + values1["iowait"] + values1["irq"] + values1["softirq"] + values1["steal"]
-			total2 := values2["user"] + values2["nice"] + values2["system"] + values2["idle"] + values2["iowait"] + values2["irq"] + values2["softirq"] + values2["steal"]
-
-			idle1 := values1["idle"] + values1["iowait"]
-			idle2 := values2["idle"] + values2["iowait"]
-
-			totalDelta := total2 - total1
-			idleDelta := idle2 - idle1
-
-			if totalDelta > 0 {
-				usage := (float64(totalDelta-idleDelta) / float64(totalDelta)) * 100
+			if usage, ok := cpuUsagePercent(values1, values2); ok {
 				perCoreUsage[core] = usage
 			}
 		}
@@ -836,7 +816,7 @@ func (c *SystemCollector) getPerCoreCPUUsage() (map[string]float64, error) {
 }
 
 // readPerCoreCPUStat reads CPU statistics for each core from /proc/stat
-func (c *SystemCollector) readPerCoreCPUStat() (map[string]map[string]uint64, error) {
+func (c *SystemCollector) readPerCoreCPUStat() (map[string]cpuTimes, error) {
 	file, err := os.Open("/proc/stat")
 	if err != nil {
 		return nil, err
@@ -847,7 +827,7 @@ func (c *SystemCollector) readPerCoreCPUStat() (map[string]map[string]uint64, er
 		}
 	}()
 
-	coreStats := make(map[string]map[string]uint64)
+	coreStats := make(map[string]cpuTimes)
 	scanner := bufio.NewScanner(file)
 
 	for scanner.Scan() {
@@ -865,34 +845,9 @@ func (c *SystemCollector) readPerCoreCPUStat() (map[string]map[string]uint64, er
 				continue
 			}
 
-			stat := make(map[string]uint64)
-			var parseErr error
-			if stat["user"], parseErr = strconv.ParseUint(fields[1], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU user stat for %s: %v", coreName, parseErr)
-			}
-			if stat["nice"], parseErr = strconv.ParseUint(fields[2], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU nice stat for %s: %v", coreName, parseErr)
-			}
-			if stat["system"], parseErr = strconv.ParseUint(fields[3], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU system stat for %s: %v", coreName, parseErr)
-			}
-			if stat["idle"], parseErr = strconv.ParseUint(fields[4], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU idle stat for %s: %v", coreName, parseErr)
-			}
-			if stat["iowait"], parseErr = strconv.ParseUint(fields[5], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU iowait stat for %s: %v", coreName, parseErr)
-			}
-			if stat["irq"], parseErr = strconv.ParseUint(fields[6], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU irq stat for %s: %v", coreName, parseErr)
-			}
-			if stat["softirq"], parseErr = strconv.ParseUint(fields[7], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU softirq stat for %s: %v", coreName, parseErr)
-			}
-			if stat["steal"], parseErr = strconv.ParseUint(fields[8], 10, 64); parseErr != nil {
-				logger.Debug("Failed to parse per-core CPU steal stat for %s: %v", coreName, parseErr)
-			}
-
-			coreStats[coreName] = stat
+			coreStats[coreName] = parseCPUTimes(fields, func(name string, err error) {
+				logger.Debug("Failed to parse per-core CPU %s stat for %s: %v", name, coreName, err)
+			})
 		}
 	}
 
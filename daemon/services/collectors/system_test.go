@@ -309,6 +309,32 @@ cpu1 1291881 36252 385618 5764888 2500 0 3146 0 0 0
 	}
 }
 
+func TestParseCPUTimes(t *testing.T) {
+	var failed []string
+	got := parseCPUTimes(strings.Fields("cpu0 100 2 30 400 50 6 7 x 0 0"), func(name string, _ error) {
+		failed = append(failed, name)
+	})
+	want := cpuTimes{cpuUser: 100, cpuNice: 2, cpuSystem: 30, cpuIdle: 400, cpuIOWait: 50, cpuIRQ: 6, cpuSoftIRQ: 7, cpuSteal: 0}
+	if got != want {
+		t.Errorf("parseCPUTimes = %v, want %v", got, want)
+	}
+	if len(failed) != 1 || failed[0] != "steal" {
+		t.Errorf("parse failures = %v, want [steal]", failed)
+	}
+}
+
+func TestCPUUsagePercent(t *testing.T) {
+	prev := cpuTimes{cpuUser: 100, cpuIdle: 800, cpuIOWait: 100}
+	cur := cpuTimes{cpuUser: 160, cpuSystem: 15, cpuIdle: 820, cpuIOWait: 105}
+	usage, ok := cpuUsagePercent(prev, cur)
+	if !ok || usage != 75 {
+		t.Errorf("cpuUsagePercent = %v, %v; want 75, true", usage, ok)
+	}
+	if _, ok := cpuUsagePercent(cur, cur); ok {
+		t.Error("cpuUsagePercent with no elapsed time reported ok")
+	}
+}
+
 func TestSystemUptimeFormatting(t *testing.T) {
 	tests := []struct {
 		seconds  int64
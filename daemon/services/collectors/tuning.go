@@ -27,33 +27,8 @@ func NewTuningCollector(ctx *domain.Context) *TuningCollector {
 func (c *TuningCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting tuning collector (interval: %v)", interval)
 
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Tuning collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Tuning collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("Tuning", c.Collect)
+	tickCollect(ctx, "Tuning", interval, c.Collect)
 }
 
 // Collect gathers all tuning parameters and publishes to the event bus.
@@ -38,35 +38,9 @@ func (c *UnassignedCollector) Start(ctx context.Context, interval time.Duration)
 
 	logger.Info("Starting unassigned devices collector (interval: %v)", interval)
 
-	// Initial collection with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("Unassigned collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "Unassigned", interval, c.collect)
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("Stopping unassigned devices collector")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("Unassigned collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "Unassigned", interval, c.collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "Unassigned", interval, c.collect) }
+	collectSafely("Unassigned", collect)
+	tickCollect(ctx, "Unassigned", interval, collect)
 }
 
 // collect gathers unassigned device information
@@ -30,29 +30,9 @@ func NewUPSCollector(ctx *domain.Context) *UPSCollector {
 func (c *UPSCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting ups collector (interval: %v)", interval)
 
-	runCollectSafely := func(phase string) {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("UPS collector ("+phase+")", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "UPS", interval, c.Collect)
-	}
-
-	runCollectSafely("startup")
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("UPS collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			runCollectSafely("periodic collection")
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "UPS", interval, c.Collect) }
+	collectSafely("UPS", collect)
+	tickCollect(ctx, "UPS", interval, collect)
 }
 
 // Collect gathers UPS status information and publishes it to the event bus.
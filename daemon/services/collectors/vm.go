@@ -29,6 +29,7 @@ type VMCollector struct {
 	appCtx        *domain.Context
 	cpuStatsMutex sync.RWMutex
 	previousStats map[string]*vmCPUStats // vmName -> previous CPU stats
+	lastGood      lastKnownGood[dto.VMInfo]
 }
 
 // NewVMCollector creates a new libvirt-based VM collector
@@ -43,35 +44,8 @@ func NewVMCollector(ctx *domain.Context) *VMCollector {
 func (c *VMCollector) Start(ctx context.Context, interval time.Duration) {
 	logger.Info("Starting VM collector (interval: %v)", interval)
 
-	// Run once immediately with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("VM collector", r)
-			}
-		}()
-		c.Collect()
-	}()
-
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("VM collector stopping due to context cancellation")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("VM collector", r)
-					}
-				}()
-				c.Collect()
-			}()
-		}
-	}
+	collectSafely("VM", c.Collect)
+	tickCollect(ctx, "VM", interval, c.Collect)
 }
 
 // reportVMSourceFailure records a VM data-source failure, distinguishing an
@@ -89,6 +63,23 @@ func (c *VMCollector) reportVMSourceFailure(reason string, err error) {
 	c.appCtx.Platform.Report("vm", dto.SourceUnavailable, reason, err)
 }
 
+// publishLastKnownGood publishes the VM list after a failed collection.
+// A transient libvirt failure republishes the last successful list flagged with
+// the current source status; a disabled VM manager publishes an empty list.
+func (c *VMCollector) publishLastKnownGood() {
+	if vmServiceDisabled() {
+		c.lastGood.clear()
+		domain.Publish(c.appCtx.Hub, constants.TopicVMListUpdate, []*dto.VMInfo{})
+		return
+	}
+	var st *dto.SourceStatus
+	if c.appCtx.Platform != nil {
+		st = c.appCtx.Platform.StatusFor("vm")
+	}
+	vms := c.lastGood.stale(func(vm *dto.VMInfo) { vm.SourceStatus = st })
+	domain.Publish(c.appCtx.Hub, constants.TopicVMListUpdate, vms)
+}
+
 // Collect gathers VM information using libvirt API and publishes to event bus
 func (c *VMCollector) Collect() {
 	startTotal := time.Now()
@@ -100,8 +91,7 @@ func (c *VMCollector) Collect() {
 	if err != nil {
 		logger.Debug("Failed to connect to libvirt: %v (libvirt may not be running)", err)
 		c.reportVMSourceFailure("libvirt connection failed", err)
-		// Publish empty list
-		domain.Publish(c.appCtx.Hub, constants.TopicVMListUpdate, []*dto.VMInfo{})
+		c.publishLastKnownGood()
 		return
 	}
 	defer l.Disconnect() //nolint:errcheck
@@ -117,11 +107,12 @@ func (c *VMCollector) Collect() {
 
 	vms := make([]*dto.VMInfo, 0, len(domains))
 
+	now := time.Now()
 	for _, domain := range domains {
 		vm := &dto.VMInfo{
 			ID:        fmt.Sprintf("%x", domain.UUID),
 			Name:      domain.Name,
-			Timestamp: time.Now(),
+			Timestamp: now,
 		}
 
 		// Get domain state
@@ -187,6 +178,7 @@ func (c *VMCollector) Collect() {
 	}
 
 	// Publish event
+	c.lastGood.store(vms)
 	domain.Publish(c.appCtx.Hub, constants.TopicVMListUpdate, vms)
 	logger.Debug("VM libvirt: Total collection took %v, published %d VMs", time.Since(startTotal), len(vms))
 }
@@ -330,16 +322,7 @@ func (c *VMCollector) formatMemoryDisplay(used, allocated uint64) string {
 		return "0 B / 0 B"
 	}
 
-	usedMB := float64(used) / (1024 * 1024)
-	allocMB := float64(allocated) / (1024 * 1024)
-
-	if allocMB >= 1024 {
-		usedGB := usedMB / 1024
-		allocGB := allocMB / 1024
-		return fmt.Sprintf("%.2f GB / %.2f GB", usedGB, allocGB)
-	}
-
-	return fmt.Sprintf("%.2f MB / %.2f MB", usedMB, allocMB)
+	return formatMemoryUsage(used, allocated)
 }
 
 // extractDiskTargets parses XML to find disk device targets
@@ -56,25 +56,25 @@ func collectWithWatchdog(ctx context.Context, name string, interval time.Duratio
 // without waiting for the interval-derived minimum.
 func runCollectWithWatchdog(ctx context.Context, name string, threshold time.Duration, collect func()) {
 	start := time.Now()
-	done := make(chan struct{})
 
 	logger.Debug("%s: collect cycle starting", name)
 
-	go func() {
-		select {
-		case <-done:
-		case <-ctx.Done():
+	// A runtime timer rather than a goroutine parked in select: every cycle of
+	// every collector arms one, and in the common case it is stopped before it
+	// fires, so no goroutine or channel is created at all.
+	watchdog := time.AfterFunc(threshold, func() {
+		if ctx.Err() != nil {
 			// Daemon shutting down — not a stall; exit without dumping.
-		case <-time.After(threshold):
-			logger.Warning("%s: collect cycle still running after %v — likely stalled; dumping goroutine stacks", name, threshold)
-			logger.Warning("%s: goroutine dump follows:\n%s", name, logger.AllGoroutineStacks())
+			return
 		}
-	}()
+		logger.Warning("%s: collect cycle still running after %v — likely stalled; dumping goroutine stacks", name, threshold)
+		logger.Warning("%s: goroutine dump follows:\n%s", name, logger.AllGoroutineStacks())
+	})
 
 	// Deferred so the watchdog is always stopped and the duration always logged,
 	// even if collect panics (the caller's recover handles the panic itself).
 	defer func() {
-		close(done)
+		watchdog.Stop()
 		elapsed := time.Since(start)
 		if elapsed >= threshold {
 			logger.Warning("%s: collect cycle finished after %v (was stalled)", name, elapsed)
@@ -28,37 +28,11 @@ func NewZFSCollector(ctx *domain.Context) *ZFSCollector {
 
 // Start begins the ZFS collection loop
 func (c *ZFSCollector) Start(ctx context.Context, interval time.Duration) {
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
 	logger.Info("ZFS collector started (interval: %v)", interval)
 
-	// Collect immediately on start with panic recovery
-	func() {
-		defer func() {
-			if r := recover(); r != nil {
-				logger.LogPanicWithStack("ZFS collector", r)
-			}
-		}()
-		collectWithWatchdog(ctx, "ZFS", interval, c.collect)
-	}()
-
-	for {
-		select {
-		case <-ctx.Done():
-			logger.Info("ZFS collector stopped")
-			return
-		case <-ticker.C:
-			func() {
-				defer func() {
-					if r := recover(); r != nil {
-						logger.LogPanicWithStack("ZFS collector", r)
-					}
-				}()
-				collectWithWatchdog(ctx, "ZFS", interval, c.collect)
-			}()
-		}
-	}
+	collect := func() { collectWithWatchdog(ctx, "ZFS", interval, c.collect) }
+	collectSafely("ZFS", collect)
+	tickCollect(ctx, "ZFS", interval, collect)
 }
 
 // collect gathers all ZFS data and publishes events
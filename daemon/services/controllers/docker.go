@@ -40,18 +40,45 @@ func NewDockerController() *DockerController {
 	return &DockerController{}
 }
 
+// sharedDockerClient is the Docker SDK client used by every DockerController.
+// Controllers are created per API request, MQTT command and MCP tool call;
+// giving each its own SDK client meant a fresh HTTP transport (no pooled
+// connections to the Docker socket) and a fresh API version negotiation
+// round trip every time. The client is safe for concurrent use.
+var (
+	sharedDockerMu     sync.Mutex
+	sharedDockerClient *client.Client
+)
+
+// dockerClient returns the shared Docker client, creating it on first use.
+// A failed creation is not cached, so a later call can retry.
+func dockerClient() (*client.Client, error) {
+	sharedDockerMu.Lock()
+	defer sharedDockerMu.Unlock()
+
+	if sharedDockerClient != nil {
+		return sharedDockerClient, nil
+	}
+	c, err := client.NewClientWithOpts(client.FromEnv, client.WithAPIVersionNegotiation()) //nolint:staticcheck,govet // SA1019: Updating to new API in future version
+	if err != nil {
+		return nil, fmt.Errorf("failed to create Docker client: %w", err)
+	}
+	sharedDockerClient = c
+	return c, nil
+}
+
 // initClient initializes the Docker client if not already done
 func (dc *DockerController) initClient() error {
 	if dc.client != nil {
 		return nil
 	}
 
-	dockerClient, err := client.NewClientWithOpts(client.FromEnv, client.WithAPIVersionNegotiation()) //nolint:staticcheck,govet // SA1019: Updating to new API in future version
+	c, err := dockerClient()
 	if err != nil {
-		return fmt.Errorf("failed to create Docker client: %w", err)
+		return err
 	}
 
-	dc.client = dockerClient
+	dc.client = c
 	return nil
 }
 
@@ -324,11 +351,10 @@ func modifyAutostartFile(path, containerName string, enabled bool) error {
 	return nil
 }
 
-// Close closes the Docker client connection.
+// Close releases the controller. The Docker client it used is shared with
+// other controllers and stays open.
 func (dc *DockerController) Close() error {
-	if dc.client != nil {
-		return dc.client.Close()
-	}
+	dc.client = nil
 	return nil
 }
 
@@ -390,12 +416,7 @@ func (dc *DockerController) ContainerLogs(containerRef string, tail int, since s
 	// Each frame: [stream_type(1)][0][0][0][size(4)][payload(size)]
 	logContent := stripDockerStreamHeaders(rawBytes)
 
-	lineCount := 0
-	for _, b := range logContent {
-		if b == '\n' {
-			lineCount++
-		}
-	}
+	lineCount := strings.Count(logContent, "\n")
 
 	result := &dto.ContainerLogs{
 		ContainerID:   containerInfo.ID[:12],
@@ -414,6 +435,9 @@ func (dc *DockerController) ContainerLogs(containerRef string, tail int, since s
 // Docker stream format: [type(1)][0(3)][size(4 big-endian)][payload(size)]
 func stripDockerStreamHeaders(raw []byte) string {
 	var result strings.Builder
+	// Payload is never longer than the input; one allocation up front avoids
+	// regrowing the builder frame by frame on multi-megabyte tails.
+	result.Grow(len(raw))
 	i := 0
 	for i < len(raw) {
 		// Need at least 8 bytes for header
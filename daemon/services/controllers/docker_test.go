@@ -125,6 +125,28 @@ func TestDockerControllerClose(t *testing.T) {
 	}
 }
 
+func TestDockerControllersShareClient(t *testing.T) {
+	a, b := NewDockerController(), NewDockerController()
+	if err := a.initClient(); err != nil {
+		t.Skipf("Docker client unavailable: %v", err)
+	}
+	if err := b.initClient(); err != nil {
+		t.Fatalf("second initClient() failed: %v", err)
+	}
+	if a.client != b.client {
+		t.Error("controllers created separate Docker clients, want one shared client")
+	}
+
+	_ = a.Close()
+	c := NewDockerController()
+	if err := c.initClient(); err != nil {
+		t.Fatalf("initClient() after Close failed: %v", err)
+	}
+	if c.client != b.client {
+		t.Error("Close() discarded the shared Docker client")
+	}
+}
+
 func TestStripDockerStreamHeaders(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -5,9 +5,11 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/domain"
@@ -32,20 +34,28 @@ func NewBundleService(ctx *domain.Context) *BundleService {
 }
 
 // CollectDiagnostics gathers all diagnostic information into a bundle.
+//
+// The sections are independent, and several shell out (docker, virsh) or read
+// large log files, so they are collected concurrently: the bundle takes as
+// long as the slowest section rather than the sum of all of them. Each
+// goroutine writes only its own field.
 func (s *BundleService) CollectDiagnostics(ctx context.Context) (*dto.DiagnosticBundle, error) {
 	hostname, _ := os.Hostname()
 
 	bundle := &dto.DiagnosticBundle{
 		Metadata:      s.collectMetadata(hostname),
-		SystemState:   s.collectSystemState(),
-		ArrayStatus:   s.collectArrayStatus(),
-		Containers:    s.collectContainers(),
-		VMs:           s.collectVMs(),
-		Network:       s.collectNetwork(),
-		Logs:          s.collectLogs(ctx),
 		Configuration: s.collectConfiguration(),
 	}
 
+	var wg sync.WaitGroup
+	wg.Go(func() { bundle.SystemState = s.collectSystemState() })
+	wg.Go(func() { bundle.ArrayStatus = s.collectArrayStatus() })
+	wg.Go(func() { bundle.Containers = s.collectContainers() })
+	wg.Go(func() { bundle.VMs = s.collectVMs() })
+	wg.Go(func() { bundle.Network = s.collectNetwork() })
+	wg.Go(func() { bundle.Logs = s.collectLogs(ctx) })
+	wg.Wait()
+
 	return bundle, nil
 }
 
@@ -228,24 +238,7 @@ func (s *BundleService) collectLogs(ctx context.Context) dto.BundleLogs {
 	logs := dto.BundleLogs{}
 
 	// Collect diagnostic log entries (structured JSON)
-	diagPath := filepath.Join(s.ctx.LogsDir, "diagnostic.jsonl")
-	// #nosec G304 -- path built from trusted LogsDir config
-	if data, err := os.ReadFile(diagPath); err == nil {
-		for _, line := range strings.Split(strings.TrimSpace(string(data)), "\n") {
-			if line == "" {
-				continue
-			}
-			var entry dto.DiagnosticLogEntry
-			if err := json.Unmarshal([]byte(line), &entry); err == nil {
-				// Redact sensitive data in log messages
-				entry.Message = lib.Redact(entry.Message)
-				if entry.Context != nil {
-					entry.Context = lib.RedactMap(entry.Context)
-				}
-				logs.DiagnosticEntries = append(logs.DiagnosticEntries, entry)
-			}
-		}
-	}
+	logs.DiagnosticEntries = readDiagnosticEntries(filepath.Join(s.ctx.LogsDir, "diagnostic.jsonl"))
 
 	// Collect agent log (last N lines, redacted)
 	agentLogPath := filepath.Join(s.ctx.LogsDir, "unraid-management-agent.log")
@@ -257,8 +250,84 @@ func (s *BundleService) collectLogs(ctx context.Context) dto.BundleLogs {
 	return logs
 }
 
+// maxDiagnosticLineBytes bounds a single diagnostic.jsonl entry; longer lines
+// are malformed or truncated and are skipped.
+const maxDiagnosticLineBytes = 1 << 20
+
+// readDiagnosticEntries decodes a JSON-lines diagnostic log, skipping lines
+// that fail to parse or exceed maxDiagnosticLineBytes. Lines are decoded
+// straight from the reader's buffer rather than materialising the whole file
+// and a string per line; only lines longer than that buffer are assembled.
+func readDiagnosticEntries(path string) []dto.DiagnosticLogEntry {
+	file, err := os.Open(path) // #nosec G304 -- path built from trusted LogsDir config
+	if err != nil {
+		return nil
+	}
+	defer func() {
+		if err := file.Close(); err != nil {
+			logger.Debug("failed to close file %s: %v", path, err)
+		}
+	}()
+
+	var (
+		entries  []dto.DiagnosticLogEntry
+		long     []byte // fragments of a line longer than the reader's buffer
+		partial  bool   // long holds the start of the current line
+		skipping bool   // the current line exceeds maxDiagnosticLineBytes
+	)
+	reader := bufio.NewReader(file)
+	for {
+		line, more, err := reader.ReadLine()
+		if err != nil {
+			if err != io.EOF {
+				logger.Debug("stopped reading %s: %v", path, err)
+			}
+			break
+		}
+		if more || partial {
+			partial = more
+			if !skipping {
+				if len(long)+len(line) > maxDiagnosticLineBytes {
+					skipping = true
+					long = long[:0]
+				} else {
+					long = append(long, line...)
+				}
+			}
+			if more {
+				continue
+			}
+			line, long = long, long[:0]
+			if skipping {
+				skipping = false
+				logger.Debug("skipped a diagnostic entry over %d bytes in %s", maxDiagnosticLineBytes, path)
+				continue
+			}
+		}
+		if len(line) == 0 {
+			continue
+		}
+		var entry dto.DiagnosticLogEntry
+		if err := json.Unmarshal(line, &entry); err != nil {
+			continue
+		}
+		// Redact sensitive data in log messages
+		entry.Message = lib.Redact(entry.Message)
+		if entry.Context != nil {
+			entry.Context = lib.RedactMap(entry.Context)
+		}
+		entries = append(entries, entry)
+	}
+	return entries
+}
+
 // readLastNLines reads the last n lines from a file and redacts sensitive data.
+// Only the retained lines are redacted: the scan keeps a ring of the last n raw
+// lines, so a large syslog costs one pass instead of a regex pass per line.
 func readLastNLines(path string, n int) []string {
+	if n <= 0 {
+		return nil
+	}
 	file, err := os.Open(path) // #nosec G304 -- path is always a hardcoded known log path
 	if err != nil {
 		return nil
@@ -269,14 +338,24 @@ func readLastNLines(path string, n int) []string {
 		}
 	}()
 
-	var lines []string
+	ring := make([]string, 0, n)
+	next := 0
 	scanner := bufio.NewScanner(file)
 	for scanner.Scan() {
-		lines = append(lines, lib.Redact(scanner.Text()))
+		if len(ring) < n {
+			ring = append(ring, scanner.Text())
+			continue
+		}
+		ring[next] = scanner.Text()
+		next = (next + 1) % n
 	}
 
-	if len(lines) > n {
-		lines = lines[len(lines)-n:]
+	if len(ring) == 0 {
+		return nil
+	}
+	lines := make([]string, 0, len(ring))
+	for i := range ring {
+		lines = append(lines, lib.Redact(ring[(next+i)%len(ring)]))
 	}
 	return lines
 }
@@ -2,6 +2,10 @@ package diagnostics
 
 import (
 	"context"
+	"os"
+	"path/filepath"
+	"slices"
+	"strings"
 	"testing"
 
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/domain"
@@ -95,3 +99,53 @@ func TestCollectDiagnostics_RedactsMQTTConfig(t *testing.T) {
 		t.Errorf("MQTT broker = %v, want %v", broker, "mqtt.example.com")
 	}
 }
+
+func TestReadLastNLines(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "test.log")
+	if err := os.WriteFile(path, []byte("one\ntwo\nthree\nfour\nfive\n"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	tests := []struct {
+		n    int
+		want []string
+	}{
+		{n: 2, want: []string{"four", "five"}},
+		{n: 5, want: []string{"one", "two", "three", "four", "five"}},
+		{n: 10, want: []string{"one", "two", "three", "four", "five"}},
+		{n: 0, want: nil},
+	}
+	for _, tt := range tests {
+		if got := readLastNLines(path, tt.n); !slices.Equal(got, tt.want) {
+			t.Errorf("readLastNLines(n=%d) = %q, want %q", tt.n, got, tt.want)
+		}
+	}
+}
+
+func TestReadDiagnosticEntries_SkipsMalformedLines(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "diagnostic.jsonl")
+	data := `{"level":"info","message":"first"}` + "\n\nnot json\n" + `{"level":"error","message":"second"}` + "\n"
+	if err := os.WriteFile(path, []byte(data), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	got := readDiagnosticEntries(path)
+	if len(got) != 2 || got[0].Message != "first" || got[1].Message != "second" {
+		t.Errorf("readDiagnosticEntries() = %+v, want first and second entries", got)
+	}
+}
+
+func TestReadDiagnosticEntries_SkipsOversizedLines(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "diagnostic.jsonl")
+	long := `{"level":"info","message":"` + strings.Repeat("x", 70_000) + `"}`
+	huge := `{"message":"` + strings.Repeat("y", maxDiagnosticLineBytes) + `"}`
+	data := `{"message":"first"}` + "\n" + huge + "\n" + long + "\n" + `{"message":"last"}` + "\n"
+	if err := os.WriteFile(path, []byte(data), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	got := readDiagnosticEntries(path)
+	if len(got) != 3 || got[0].Message != "first" || len(got[1].Message) != 70_000 || got[2].Message != "last" {
+		t.Errorf("readDiagnosticEntries() returned %d entries, want first, the 70 KB entry and last", len(got))
+	}
+}
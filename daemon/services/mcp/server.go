@@ -77,6 +77,79 @@ type CacheProvider interface {
 	GetHealthStatus() map[string]any
 }
 
+// containerLookup and vmLookup are implemented by providers that index
+// containers and VMs by ID and name (the API cache store), letting the
+// single-item tools skip the list scan.
+type containerLookup interface {
+	GetDockerContainer(idOrName string) (dto.ContainerInfo, bool)
+}
+
+type vmLookup interface {
+	GetVM(idOrName string) (dto.VMInfo, bool)
+}
+
+// findContainer returns the container whose ID or name matches idOrName,
+// using the provider's index when it has one and scanning containers otherwise.
+func findContainer(provider CacheProvider, containers []dto.ContainerInfo, idOrName string) (dto.ContainerInfo, bool) {
+	if lookup, ok := provider.(containerLookup); ok {
+		return lookup.GetDockerContainer(idOrName)
+	}
+	for _, c := range containers {
+		if c.ID == idOrName || c.Name == idOrName {
+			return c, true
+		}
+	}
+	return dto.ContainerInfo{}, false
+}
+
+// findVM returns the VM whose name or ID matches nameOrID, using the
+// provider's index when it has one and scanning vms otherwise.
+func findVM(provider CacheProvider, vms []dto.VMInfo, nameOrID string) (dto.VMInfo, bool) {
+	if lookup, ok := provider.(vmLookup); ok {
+		return lookup.GetVM(nameOrID)
+	}
+	for _, vm := range vms {
+		if vm.Name == nameOrID || vm.ID == nameOrID {
+			return vm, true
+		}
+	}
+	return dto.VMInfo{}, false
+}
+
+// dockerStatsProvider is implemented by providers that keep Docker aggregate
+// statistics precomputed per snapshot (the API cache store).
+type dockerStatsProvider interface {
+	GetDockerStats() (dto.DockerAggregateStats, bool)
+}
+
+// dockerStats returns aggregate Docker statistics, taking the provider's
+// precomputed totals when it has them and summing the container list
+// otherwise. ok is false when no container list is cached.
+func dockerStats(provider CacheProvider) (stats dto.DockerAggregateStats, ok bool) {
+	if p, isAgg := provider.(dockerStatsProvider); isAgg {
+		return p.GetDockerStats()
+	}
+	containers := provider.GetDockerCache()
+	if containers == nil {
+		return stats, false
+	}
+	for i := range containers {
+		c := &containers[i]
+		stats.TotalContainers++
+		if c.State == "running" {
+			stats.RunningContainers++
+			stats.TotalCPUPercent += c.CPUPercent
+			stats.TotalMemoryUsage += c.MemoryUsage
+			stats.TotalMemoryUsageMB += c.MemoryUsageMB
+			stats.TotalMemoryLimit += c.MemoryLimit
+		}
+	}
+	if stats.TotalMemoryLimit > 0 {
+		stats.MemoryUsagePercent = float64(stats.TotalMemoryUsage) / float64(stats.TotalMemoryLimit) * 100
+	}
+	return stats, true
+}
+
 // ptr returns a pointer to the given value. Used for optional ToolAnnotations fields.
 func ptr[T any](v T) *T { return &v }
 
@@ -327,10 +400,8 @@ func (s *Server) registerMonitoringTools() {
 		if containers == nil {
 			return textResult("Container information not available yet"), nil, nil
 		}
-		for _, c := range containers {
-			if c.ID == args.ContainerID || c.Name == args.ContainerID {
-				return jsonResult(c)
-			}
+		if c, ok := findContainer(s.cacheProvider, containers, args.ContainerID); ok {
+			return jsonResult(c)
 		}
 		return textResult(fmt.Sprintf("Container '%s' not found", args.ContainerID)), nil, nil
 	})
@@ -384,10 +455,8 @@ func (s *Server) registerMonitoringTools() {
 		if vms == nil {
 			return textResult("VM information not available yet"), nil, nil
 		}
-		for _, vm := range vms {
-			if vm.Name == args.VMName || vm.ID == args.VMName {
-				return jsonResult(vm)
-			}
+		if vm, ok := findVM(s.cacheProvider, vms, args.VMName); ok {
+			return jsonResult(vm)
 		}
 		return textResult(fmt.Sprintf("VM '%s' not found", args.VMName)), nil, nil
 	})
@@ -909,15 +978,23 @@ func (s *Server) registerMonitoringTools() {
 		}
 
 		// Disk issues
+		// A typed row instead of a map per disk; fields are kept in key order
+		// so the encoded output is unchanged.
+		type diskIssue struct {
+			ID          string  `json:"id"`
+			Name        string  `json:"name"`
+			Status      string  `json:"status"`
+			Temperature float64 `json:"temperature"`
+		}
 		disks := s.cacheProvider.GetDisksCache()
-		var diskIssues []map[string]any
+		var diskIssues []diskIssue
 		for _, disk := range disks {
 			if disk.Temperature > 50 || disk.Status != "PASSED" {
-				diskIssues = append(diskIssues, map[string]any{
-					"id":          disk.ID,
-					"name":        disk.Name,
-					"temperature": disk.Temperature,
-					"status":      disk.Status,
+				diskIssues = append(diskIssues, diskIssue{
+					ID:          disk.ID,
+					Name:        disk.Name,
+					Status:      disk.Status,
+					Temperature: disk.Temperature,
 				})
 			}
 		}
@@ -1125,13 +1202,14 @@ func (s *Server) registerNewMonitoringTools() {
 		logger.Info("MCP: Listing all services")
 		serviceCtrl := controllers.NewServiceController()
 		serviceNames := controllers.ValidServiceNames()
-		services := make([]map[string]any, 0)
+		type serviceStatus struct {
+			Name    string `json:"name"`
+			Running bool   `json:"running"`
+		}
+		services := make([]serviceStatus, 0, len(serviceNames))
 		for _, name := range serviceNames {
 			running, _ := serviceCtrl.GetServiceStatus(name)
-			services = append(services, map[string]any{
-				"name":    name,
-				"running": running,
-			})
+			services = append(services, serviceStatus{Name: name, Running: running})
 		}
 		return jsonResult(map[string]any{
 			"services": services,
@@ -3020,7 +3098,7 @@ func textResult(text string) *mcp.CallToolResult {
 
 // jsonResult creates a tool result with JSON-formatted text content.
 func jsonResult(data any) (*mcp.CallToolResult, any, error) {
-	jsonData, err := json.MarshalIndent(data, "", "  ")
+	text, err := indentedJSON(data)
 	if err != nil {
 		return &mcp.CallToolResult{
 			Content: []mcp.Content{&mcp.TextContent{Text: fmt.Sprintf("Error formatting response: %v", err)}},
@@ -3028,10 +3106,25 @@ func jsonResult(data any) (*mcp.CallToolResult, any, error) {
 		}, nil, nil
 	}
 	return &mcp.CallToolResult{
-		Content: []mcp.Content{&mcp.TextContent{Text: string(jsonData)}},
+		Content: []mcp.Content{&mcp.TextContent{Text: text}},
 	}, nil, nil
 }
 
+// indentedJSON returns the same text as json.MarshalIndent(v, "", "  ").
+// Tool results can carry every container, disk or VM, and MarshalIndent
+// holds three copies of the output on the way to a string (compact, indented,
+// string conversion); an indenting encoder writing into a strings.Builder
+// holds two.
+func indentedJSON(v any) (string, error) {
+	var sb strings.Builder
+	enc := json.NewEncoder(&sb)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(v); err != nil {
+		return "", err
+	}
+	return strings.TrimSuffix(sb.String(), "\n"), nil
+}
+
 // resourceResult creates a resource read result with text content.
 func resourceResult(uri, text string) (*mcp.ReadResourceResult, error) {
 	return &mcp.ReadResourceResult{
@@ -3222,26 +3315,10 @@ func (s *Server) registerCPUControlTools() {
 		Description: "Get aggregate CPU and memory statistics across all running Docker containers, including total CPU%, total memory usage (bytes and MB), and per-container breakdown",
 		Annotations: &mcp.ToolAnnotations{ReadOnlyHint: true},
 	}, func(_ context.Context, _ *mcp.CallToolRequest, _ dto.MCPEmptyArgs) (*mcp.CallToolResult, any, error) {
-		containers := s.cacheProvider.GetDockerCache()
-		if containers == nil {
+		stats, ok := dockerStats(s.cacheProvider)
+		if !ok {
 			return textResult("Docker information not available yet"), nil, nil
 		}
-
-		var stats dto.DockerAggregateStats
-		for i := range containers {
-			c := &containers[i]
-			stats.TotalContainers++
-			if c.State == "running" {
-				stats.RunningContainers++
-				stats.TotalCPUPercent += c.CPUPercent
-				stats.TotalMemoryUsage += c.MemoryUsage
-				stats.TotalMemoryUsageMB += c.MemoryUsageMB
-				stats.TotalMemoryLimit += c.MemoryLimit
-			}
-		}
-		if stats.TotalMemoryLimit > 0 {
-			stats.MemoryUsagePercent = float64(stats.TotalMemoryUsage) / float64(stats.TotalMemoryLimit) * 100
-		}
 		stats.Timestamp = time.Now()
 		return jsonResult(stats)
 	})
@@ -2,6 +2,7 @@ package mcp
 
 import (
 	"context"
+	"encoding/json"
 	"fmt"
 	"net/http"
 	"net/http/httptest"
@@ -826,3 +827,79 @@ func TestRefreshContainerUpdatesToolRegistered(t *testing.T) {
 	}
 	t.Error("expected tool \"refresh_container_updates\" to be registered")
 }
+
+// indexedCacheProvider adds the API cache store's indexed lookups to the mock.
+type indexedCacheProvider struct {
+	*MockCacheProvider
+	lookups int
+}
+
+func (p *indexedCacheProvider) GetDockerContainer(idOrName string) (dto.ContainerInfo, bool) {
+	p.lookups++
+	return dto.ContainerInfo{ID: "indexed", Name: idOrName}, true
+}
+
+func (p *indexedCacheProvider) GetVM(idOrName string) (dto.VMInfo, bool) {
+	p.lookups++
+	return dto.VMInfo{ID: "indexed", Name: idOrName}, true
+}
+
+func TestFindContainerAndVMPreferProviderIndex(t *testing.T) {
+	mock := newMockCacheProvider()
+	if c, ok := findContainer(mock, mock.containers, mock.containers[0].Name); !ok || c.ID != mock.containers[0].ID {
+		t.Errorf("scan findContainer = (%+v, %v), want %s", c, ok, mock.containers[0].ID)
+	}
+	if _, ok := findVM(mock, mock.vms, "nonexistent"); ok {
+		t.Error("scan findVM should miss an unknown VM")
+	}
+
+	indexed := &indexedCacheProvider{MockCacheProvider: mock}
+	if c, _ := findContainer(indexed, mock.containers, "plex"); c.ID != "indexed" {
+		t.Errorf("findContainer did not use the provider index, got %+v", c)
+	}
+	if vm, _ := findVM(indexed, mock.vms, "Windows10"); vm.ID != "indexed" {
+		t.Errorf("findVM did not use the provider index, got %+v", vm)
+	}
+	if indexed.lookups != 2 {
+		t.Errorf("index lookups = %d, want 2", indexed.lookups)
+	}
+}
+
+func (p *indexedCacheProvider) GetDockerStats() (dto.DockerAggregateStats, bool) {
+	p.lookups++
+	return dto.DockerAggregateStats{TotalContainers: 42}, true
+}
+
+func TestDockerStatsPrefersProviderAggregate(t *testing.T) {
+	mock := newMockCacheProvider()
+	stats, ok := dockerStats(mock)
+	if !ok || stats.TotalContainers != len(mock.containers) {
+		t.Errorf("summed dockerStats = (%+v, %v), want %d containers", stats, ok, len(mock.containers))
+	}
+
+	indexed := &indexedCacheProvider{MockCacheProvider: mock}
+	if stats, _ := dockerStats(indexed); stats.TotalContainers != 42 || indexed.lookups != 1 {
+		t.Errorf("dockerStats did not use the provider aggregate, got %+v", stats)
+	}
+}
+
+func TestIndentedJSONMatchesMarshalIndent(t *testing.T) {
+	for _, v := range []any{
+		nil,
+		[]string{"a", "<b>", "c"},
+		map[string]any{"nested": map[string]int{"x": 1}, "empty": []int{}},
+		dto.SystemInfo{Hostname: "tower"},
+	} {
+		want, err := json.MarshalIndent(v, "", "  ")
+		if err != nil {
+			t.Fatalf("MarshalIndent(%v): %v", v, err)
+		}
+		got, err := indentedJSON(v)
+		if err != nil || got != string(want) {
+			t.Errorf("indentedJSON(%v) = %q, %v; want %q", v, got, err, want)
+		}
+	}
+	if _, err := indentedJSON(make(chan int)); err == nil {
+		t.Error("indentedJSON should fail for a value JSON cannot encode")
+	}
+}
@@ -712,6 +712,15 @@ func TestToolGetDiagnosticSummary(t *testing.T) {
 	} else if len(stoppedList) != 1 || stoppedList[0] != "backup" {
 		t.Errorf("expected [backup], got %v", stoppedList)
 	}
+	// Mock disks carry no SMART status, so every one is reported.
+	issues, ok := summary["disk_issues"].([]any)
+	if !ok || len(issues) != 3 {
+		t.Fatalf("disk_issues = %v, want 3 entries", summary["disk_issues"])
+	}
+	first, _ := issues[0].(map[string]any)
+	if first["id"] != "disk1" || first["name"] != "disk1" || first["temperature"] != 35.0 || first["status"] != "" {
+		t.Errorf("disk_issues[0] = %v", first)
+	}
 }
 
 // ===== Monitoring tools with nil caches =====
@@ -7,6 +7,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"math/rand/v2"
 	"strings"
 	"sync"
 	"sync/atomic"
@@ -32,11 +33,24 @@ type Client struct {
 	msgSent      atomic.Int64
 	msgErrors    atomic.Int64
 	deviceInfo   *dto.HADeviceInfo
+	deviceJSON   json.RawMessage // deviceInfo, pre-encoded for discovery configs
 	hostname     string
 	agentVersion string
 	tracker      *discoveryTracker
 	domainCtx    *domain.Context // domain context for controllers (array, system)
 
+	// Topic fragments derived once from the immutable config and hostname so
+	// the per-message and per-entity paths only concatenate.
+	hostID            string // hostname with spaces replaced, used in HA IDs
+	uniqueIDPrefix    string // "unraid_<hostID>_", prepended to every entity ID
+	topicBase         string // "<TopicPrefix>/" or "" when unprefixed
+	availabilityTopic string
+	fanControlTopic   string
+	servicesTopic     string
+	commandPrefix     string         // "<topicBase>cmd/", stripped from command topics
+	topics            dto.MQTTTopics // fixed state topics; see buildTopics
+	qos               byte           // normalized config.QoS
+
 	// Notification event tracking. seenNotifications holds IDs already
 	// emitted as HA events; notifSeeded guards against replaying the
 	// existing backlog as events on the first collection cycle.
@@ -54,6 +68,57 @@ type Client struct {
 	// unassigned discovery publish.
 	remoteShareMu      sync.RWMutex
 	remoteShareSources map[string]string
+
+	// discoveryPayloads records a digest of the last HA discovery config
+	// payload published per topic. Per-item discovery runs on every
+	// collection cycle, and an unchanged retained config is a no-op for Home
+	// Assistant, so identical payloads are skipped. Reset on every
+	// (re)connect so a fresh session always republishes the full set.
+	discoveryMu       sync.Mutex
+	discoveryPayloads map[string]uint64 // topic -> digest of last config
+
+	// itemStates records the digest and time of the last per-item state
+	// payload published per topic; see publishItemState. Guarded by
+	// discoveryMu and reset together with discoveryPayloads.
+	itemStates map[string]itemStateMark
+
+	// serviceStates is the last published service running-state snapshot, so
+	// a switch command only needs to re-query the service it toggled.
+	serviceStatesMu sync.Mutex
+	serviceStates   map[string]bool
+
+	// itemTopics memoizes per-item entity IDs and state topics; see itemTopic.
+	itemTopicsMu sync.RWMutex
+	itemTopics   map[itemTopicKey]itemTopicNames
+
+	// serviceRefreshPending lists services toggled since the last coalesced
+	// state refresh, and serviceRefreshScheduled records whether that refresh
+	// is already waiting to run; see scheduleServiceStateRefresh.
+	serviceRefreshMu        sync.Mutex
+	serviceRefreshPending   []string
+	serviceRefreshScheduled bool
+
+	// discoveryFailures counts failed discovery config and per-item state
+	// publishes; see beginDiscoveryRefresh.
+	discoveryFailures atomic.Uint64
+
+	// discoverySlots bounds how many background per-item discovery passes
+	// publish at once; see goDiscovery.
+	discoverySlots chan struct{}
+
+	// discoveryQueues holds, per discovery category, the latest pass waiting
+	// to run and whether a worker goroutine is serving the category.
+	discoveryQueueMu sync.Mutex
+	discoveryQueues  map[string]*discoveryQueue
+
+	// background tracks goroutines started via goBackground so Disconnect
+	// can let them finish before the connection is torn down. stopping is set
+	// under backgroundMu by Disconnect; once set, goBackground starts nothing
+	// new (so background.Add never races background.Wait) and publish refuses
+	// further messages so the offline status stays last.
+	backgroundMu sync.Mutex
+	stopping     atomic.Bool
+	background   sync.WaitGroup
 }
 
 // setRemoteShareSources atomically replaces the remote-share ID→source map.
@@ -82,20 +147,40 @@ func normalizeQoS(qos int) byte {
 
 // NewClient creates a new MQTT client with the given configuration.
 func NewClient(config *dto.MQTTConfig, hostname, agentVersion string, domainCtx *domain.Context) *Client {
-	return &Client{
-		config:       config,
-		hostname:     hostname,
-		agentVersion: agentVersion,
-		tracker:      newDiscoveryTracker(),
-		domainCtx:    domainCtx,
+	hostID := strings.ReplaceAll(hostname, " ", "_")
+	topicBase := ""
+	if config.TopicPrefix != "" {
+		topicBase = config.TopicPrefix + "/"
+	}
+	c := &Client{
+		config:            config,
+		hostname:          hostname,
+		agentVersion:      agentVersion,
+		hostID:            hostID,
+		uniqueIDPrefix:    "unraid_" + hostID + "_",
+		topicBase:         topicBase,
+		availabilityTopic: topicBase + "availability",
+		fanControlTopic:   topicBase + "fancontrol",
+		servicesTopic:     topicBase + "services",
+		commandPrefix:     topicBase + "cmd/",
+		qos:               normalizeQoS(config.QoS),
+		tracker:           newDiscoveryTracker(),
+		domainCtx:         domainCtx,
+		discoverySlots:    make(chan struct{}, maxConcurrentDiscoveryPasses),
+		discoveryQueues:   make(map[string]*discoveryQueue),
 		deviceInfo: &dto.HADeviceInfo{
-			Identifiers:  []string{fmt.Sprintf("unraid_%s", strings.ReplaceAll(hostname, " ", "_"))},
+			Identifiers:  []string{"unraid_" + hostID},
 			Name:         hostname,
 			Manufacturer: "Lime Technology",
 			Model:        "Unraid Server",
 			SWVersion:    agentVersion,
 		},
 	}
+	// The device block is identical in every discovery config, so encode it
+	// once. Marshalling a struct of strings cannot fail.
+	c.deviceJSON, _ = json.Marshal(c.deviceInfo)
+	c.topics = c.buildTopics()
+	return c
 }
 
 // Connect establishes a connection to the MQTT broker.
@@ -105,7 +190,6 @@ func (c *Client) Connect(ctx context.Context) error {
 	}
 
 	c.mu.Lock()
-	defer c.mu.Unlock()
 
 	opts := pahomqtt.NewClientOptions()
 	opts.AddBroker(c.config.Broker)
@@ -123,8 +207,7 @@ func (c *Client) Connect(ctx context.Context) error {
 	}
 
 	// Set will message for availability
-	availabilityTopic := c.buildTopic("availability")
-	opts.SetWill(availabilityTopic, "offline", normalizeQoS(c.config.QoS), true)
+	opts.SetWill(c.availabilityTopic, "offline", c.qos, true)
 
 	// Connection handlers
 	opts.SetOnConnectHandler(func(_ pahomqtt.Client) {
@@ -139,26 +222,33 @@ func (c *Client) Connect(ctx context.Context) error {
 		logger.Debug("MQTT: Attempting to reconnect...")
 	})
 
-	c.client = pahomqtt.NewClient(opts)
+	client := pahomqtt.NewClient(opts)
+	// Route command messages once per paho client rather than on every
+	// (re)connect. With a persistent session the broker redelivers queued
+	// commands as soon as the connection is up, before subscribeCommandTopics
+	// runs after discovery; without a standing route paho would drop them.
+	client.AddRoute(c.buildTopic("cmd/#"), c.onCommandMessage)
+	c.client = client
 	c.startTime = time.Now()
+	// Release the lock before waiting on the broker so GetStatus and friends
+	// are not blocked for up to ConnectTimeout while RetryConnect is running.
+	c.mu.Unlock()
 
 	logger.Info("MQTT: Connecting to broker %s...", c.config.Broker)
 
-	token := c.client.Connect()
-
-	// Wait with context for connection
-	done := make(chan bool)
-	go func() {
-		token.Wait()
-		done <- true
-	}()
+	token := client.Connect()
 
+	// Wait with context for connection. Selecting on the token's Done channel
+	// (rather than a helper goroutine blocked in token.Wait) leaves nothing
+	// behind when ctx is cancelled first.
 	select {
 	case <-ctx.Done():
 		return fmt.Errorf("connection cancelled: %w", ctx.Err())
-	case <-done:
+	case <-token.Done():
 		if token.Error() != nil {
+			c.mu.Lock()
 			c.lastError = token.Error().Error()
+			c.mu.Unlock()
 			return fmt.Errorf("failed to connect: %w", token.Error())
 		}
 	}
@@ -166,6 +256,167 @@ func (c *Client) Connect(ctx context.Context) error {
 	return nil
 }
 
+// publishTimeout bounds how long a single publish waits for the broker to
+// acknowledge it. Without a bound, a half-open connection would park the
+// publishing goroutine (and Disconnect during shutdown) indefinitely.
+const publishTimeout = 10 * time.Second
+
+// maxConcurrentDiscoveryPasses bounds how many per-item discovery passes
+// (containers, disks, VMs, ...) publish to the broker at the same time. Every
+// collection event starts a pass in the background, so a burst of collectors
+// finishing together would otherwise put dozens of publishers on the single
+// broker connection at once and slow all of them down.
+const maxConcurrentDiscoveryPasses = 3
+
+// backgroundDrainTimeout bounds how long Disconnect waits for background
+// publish goroutines, so a stalled broker cannot hold up shutdown.
+const backgroundDrainTimeout = 2 * time.Second
+
+// goBackground runs fn in a goroutine that is tracked by c.background and
+// recovers panics under label, so background work is never lost silently.
+func (c *Client) goBackground(label string, fn func()) {
+	c.backgroundMu.Lock()
+	if c.stopping.Load() {
+		c.backgroundMu.Unlock()
+		return
+	}
+	c.background.Add(1)
+	c.backgroundMu.Unlock()
+	go func() {
+		defer c.background.Done()
+		defer func() {
+			if r := recover(); r != nil {
+				logger.LogPanicWithStack(label, r)
+			}
+		}()
+		fn()
+	}()
+}
+
+// waitBackground waits up to timeout for tracked background goroutines and
+// reports whether they all finished. On a timeout the helper goroutine keeps
+// waiting; after Disconnect that is short-lived, because every publish the
+// stragglers attempt fails immediately.
+func (c *Client) waitBackground(timeout time.Duration) bool {
+	done := make(chan struct{})
+	go func() {
+		c.background.Wait()
+		close(done)
+	}()
+	select {
+	case <-done:
+		return true
+	case <-time.After(timeout):
+		return false
+	}
+}
+
+// discoveryQueue is the per-category state behind goDiscovery.
+type discoveryQueue struct {
+	next    func() // latest pass not yet started; nil when none is waiting
+	running bool   // a worker goroutine owns the category
+}
+
+// goDiscovery runs the named discovery pass in the background once a slot in
+// discoverySlots is free, so callers on the event path never block. Each
+// category keeps at most one waiting pass and a newer snapshot replaces it:
+// with a slow broker, collector events no longer pile up goroutines holding
+// stale snapshots, and a category's passes never run out of order.
+func (c *Client) goDiscovery(name string, pass func()) {
+	if c.stopping.Load() {
+		return
+	}
+	c.discoveryQueueMu.Lock()
+	q := c.discoveryQueues[name]
+	if q == nil {
+		q = &discoveryQueue{}
+		c.discoveryQueues[name] = q
+	}
+	q.next = pass
+	if q.running {
+		c.discoveryQueueMu.Unlock()
+		return
+	}
+	q.running = true
+	c.discoveryQueueMu.Unlock()
+
+	label := "MQTT " + name + " discovery"
+	c.goBackground(label, func() {
+		for {
+			c.discoverySlots <- struct{}{}
+			c.discoveryQueueMu.Lock()
+			next := q.next
+			q.next = nil
+			if next == nil {
+				q.running = false
+			}
+			c.discoveryQueueMu.Unlock()
+			if next == nil {
+				<-c.discoverySlots
+				return
+			}
+			c.runDiscoveryPass(label, next)
+			<-c.discoverySlots
+		}
+	})
+}
+
+// runDiscoveryPass runs one pass, recovering a panic so the category's worker
+// keeps serving later snapshots.
+func (c *Client) runDiscoveryPass(label string, pass func()) {
+	defer func() {
+		if r := recover(); r != nil {
+			logger.LogPanicWithStack(label, r)
+		}
+	}()
+	pass()
+}
+
+// Startup reconnect backoff. The delay doubles per failed attempt up to
+// connectRetryMaxDelay and is spread by ±connectRetryJitter so agents that
+// lost the broker together (e.g. a broker host reboot) do not retry in lockstep.
+const (
+	connectRetryBaseDelay = 1 * time.Second
+	connectRetryMaxDelay  = 60 * time.Second
+	connectRetryJitter    = 0.25
+)
+
+// connectRetryDelay returns the delay before retry number attempt (0-based).
+// jitter is a fraction in [-connectRetryJitter, connectRetryJitter].
+func connectRetryDelay(attempt int, jitter float64) time.Duration {
+	delay := min(connectRetryBaseDelay<<min(attempt, 6), connectRetryMaxDelay)
+	return time.Duration(float64(delay) * (1 + jitter))
+}
+
+// RetryConnect keeps retrying Connect with exponential backoff and jitter until
+// it succeeds or ctx is cancelled. It is meant to run in the background after an
+// initial Connect failure: paho's auto-reconnect only covers connections lost
+// after a successful connect, so a broker that is unreachable at agent startup
+// would otherwise never be connected.
+func (c *Client) RetryConnect(ctx context.Context) error {
+	for attempt := 0; ; attempt++ {
+		delay := connectRetryDelay(attempt, (rand.Float64()*2-1)*connectRetryJitter)
+		logger.Info("MQTT: Retrying broker connection in %s", delay.Round(100*time.Millisecond))
+
+		timer := time.NewTimer(delay)
+		select {
+		case <-ctx.Done():
+			timer.Stop()
+			return ctx.Err()
+		case <-timer.C:
+		}
+
+		err := c.Connect(ctx)
+		if err == nil {
+			return nil
+		}
+		if ctx.Err() != nil {
+			return ctx.Err()
+		}
+		logger.Warning("MQTT: Connection attempt %d failed: %v", attempt+1, err)
+	}
+}
+
 // handleConnect is called when connection is established.
 func (c *Client) handleConnect() {
 	c.mu.Lock()
@@ -175,27 +426,23 @@ func (c *Client) handleConnect() {
 	}
 	ctx, cancel := context.WithCancel(context.Background())
 	c.connectCancel = cancel
-	c.mu.Unlock()
-
-	c.connected.Store(true)
 	now := time.Now()
 	c.lastConnect = &now
 	c.lastError = ""
+	c.mu.Unlock()
+
+	c.resetDiscoveryPayloads()
+
+	c.connected.Store(true)
 
 	logger.Success("MQTT: Connected to broker %s", c.config.Broker)
 
 	// Publish availability
-	availabilityTopic := c.buildTopic("availability")
-	_ = c.publish(availabilityTopic, "online", true)
+	_ = c.publish(c.availabilityTopic, availabilityOnline, true)
 
 	// Publish Home Assistant discovery if enabled
 	if c.config.HomeAssistantMode {
-		go func() {
-			defer func() {
-				if r := recover(); r != nil {
-					logger.LogPanicWithStack("MQTT HA discovery goroutine", r)
-				}
-			}()
+		c.goBackground("MQTT HA discovery goroutine", func() {
 			// Run discovery, initial states, then subscribe — sequentially —
 			// so command subscriptions exist only after discovery completes.
 			if ctx.Err() != nil {
@@ -210,7 +457,7 @@ func (c *Client) handleConnect() {
 				return
 			}
 			c.subscribeCommandTopics()
-		}()
+		})
 	}
 }
 
@@ -218,10 +465,14 @@ func (c *Client) handleConnect() {
 func (c *Client) handleDisconnect(err error) {
 	c.connected.Store(false)
 	now := time.Now()
-	c.lastDisconn = &now
 
-	// Cancel any in-flight connect goroutines.
+	// Cancel any in-flight connect goroutines. The status fields are read by
+	// GetStatus under the same lock.
 	c.mu.Lock()
+	c.lastDisconn = &now
+	if err != nil {
+		c.lastError = err.Error()
+	}
 	if c.connectCancel != nil {
 		c.connectCancel()
 		c.connectCancel = nil
@@ -229,7 +480,6 @@ func (c *Client) handleDisconnect(err error) {
 	c.mu.Unlock()
 
 	if err != nil {
-		c.lastError = err.Error()
 		logger.Warning("MQTT: Connection lost: %v", err)
 	} else {
 		logger.Info("MQTT: Disconnected from broker")
@@ -238,19 +488,30 @@ func (c *Client) handleDisconnect(err error) {
 
 // Disconnect closes the MQTT connection gracefully.
 func (c *Client) Disconnect() {
-	c.mu.Lock()
-	defer c.mu.Unlock()
-
 	// Cancel any in-flight connect goroutines.
+	c.mu.Lock()
 	if c.connectCancel != nil {
 		c.connectCancel()
 		c.connectCancel = nil
 	}
+	c.mu.Unlock()
+
+	// Stop accepting background work, then let what is running finish so the
+	// offline status is the last message published on this connection.
+	c.backgroundMu.Lock()
+	c.stopping.Store(true)
+	c.backgroundMu.Unlock()
+	if !c.waitBackground(backgroundDrainTimeout) {
+		logger.Warning("MQTT: Background publishes still running after %s, disconnecting anyway", backgroundDrainTimeout)
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
 
 	if c.client != nil && c.client.IsConnected() {
-		// Publish offline status
-		availabilityTopic := c.buildTopic("availability")
-		_ = c.publish(availabilityTopic, "offline", true)
+		// Publish offline status. publish refuses messages once stopping is
+		// set, so this one goes to paho directly.
+		_ = c.awaitPublish(c.availabilityTopic, c.client.Publish(c.availabilityTopic, c.qos, true, availabilityOffline))
 
 		c.client.Disconnect(250)
 		c.connected.Store(false)
@@ -334,7 +595,15 @@ func (c *Client) GetConfig() *dto.MQTTConfig {
 
 // GetTopics returns the MQTT topics used by the client.
 func (c *Client) GetTopics() *dto.MQTTTopics {
-	return &dto.MQTTTopics{
+	topics := c.topics
+	return &topics
+}
+
+// buildTopics derives the fixed state topics from the topic prefix. They are
+// built once in NewClient so that every publish reads a field instead of
+// concatenating the prefix again.
+func (c *Client) buildTopics() dto.MQTTTopics {
+	return dto.MQTTTopics{
 		Status:            c.buildTopic("status"),
 		System:            c.buildTopic("system"),
 		Array:             c.buildTopic("array"),
@@ -348,7 +617,7 @@ func (c *Client) GetTopics() *dto.MQTTTopics {
 		Notification:      c.buildTopic("notifications"),
 		NotificationEvent: c.buildTopic("notifications/event"),
 		ZFSPools:          c.buildTopic("zfs/pools"),
-		Availability:      c.buildTopic("availability"),
+		Availability:      c.availabilityTopic,
 		NUT:               c.buildTopic("nut/status"),
 		Hardware:          c.buildTopic("hardware"),
 		Registration:      c.buildTopic("registration"),
@@ -364,13 +633,13 @@ func (c *Client) PublishSystemInfo(info *dto.SystemInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	if err := c.publishJSON(c.buildTopic("system"), info); err != nil {
+	if err := c.publishJSON(c.topics.System, info); err != nil {
 		return err
 	}
 	if info == nil {
 		return nil
 	}
-	go c.publishFanDiscovery(info.Fans)
+	c.goDiscovery("fan", func() { c.publishFanDiscovery(info.Fans) })
 	return nil
 }
 
@@ -379,7 +648,7 @@ func (c *Client) PublishArrayStatus(status *dto.ArrayStatus) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("array"), status)
+	return c.publishJSON(c.topics.Array, status)
 }
 
 // PublishDisks publishes disk information to MQTT.
@@ -387,9 +656,9 @@ func (c *Client) PublishDisks(disks []dto.DiskInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("disks"), disks)
+	err := c.publishJSON(c.topics.Disks, disks)
 	// Publish per-disk topics and HA discovery
-	go c.publishDiskDiscovery(disks)
+	c.goDiscovery("disk", func() { c.publishDiskDiscovery(disks) })
 	return err
 }
 
@@ -398,9 +667,9 @@ func (c *Client) PublishContainers(containers []dto.ContainerInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("docker/containers"), containers)
+	err := c.publishJSON(c.topics.Containers, containers)
 	// Publish per-container topics and HA discovery
-	go c.publishContainerDiscovery(containers)
+	c.goDiscovery("container", func() { c.publishContainerDiscovery(containers) })
 	return err
 }
 
@@ -409,9 +678,9 @@ func (c *Client) PublishVMs(vms []dto.VMInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("vm/list"), vms)
+	err := c.publishJSON(c.topics.VMs, vms)
 	// Publish per-VM topics and HA discovery
-	go c.publishVMDiscovery(vms)
+	c.goDiscovery("VM", func() { c.publishVMDiscovery(vms) })
 	return err
 }
 
@@ -420,7 +689,7 @@ func (c *Client) PublishUPSStatus(ups *dto.UPSStatus) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("ups"), ups)
+	return c.publishJSON(c.topics.UPS, ups)
 }
 
 // PublishGPUMetrics publishes GPU metrics to MQTT.
@@ -428,9 +697,9 @@ func (c *Client) PublishGPUMetrics(gpus []*dto.GPUMetrics) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("gpu"), gpus)
+	err := c.publishJSON(c.topics.GPU, gpus)
 	// Publish per-GPU topics and HA discovery
-	go c.publishGPUDiscovery(gpus)
+	c.goDiscovery("GPU", func() { c.publishGPUDiscovery(gpus) })
 	return err
 }
 
@@ -439,9 +708,9 @@ func (c *Client) PublishNetworkInfo(network []dto.NetworkInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("network"), network)
+	err := c.publishJSON(c.topics.Network, network)
 	// Publish per-interface topics and HA discovery
-	go c.publishNetworkDiscovery(network)
+	c.goDiscovery("network", func() { c.publishNetworkDiscovery(network) })
 	return err
 }
 
@@ -450,9 +719,9 @@ func (c *Client) PublishShares(shares []dto.ShareInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("shares"), shares)
+	err := c.publishJSON(c.topics.Shares, shares)
 	// Publish per-share topics and HA discovery
-	go c.publishShareDiscovery(shares)
+	c.goDiscovery("share", func() { c.publishShareDiscovery(shares) })
 	return err
 }
 
@@ -461,7 +730,7 @@ func (c *Client) PublishNotifications(notifications *dto.NotificationList) error
 	if !c.shouldPublish() {
 		return nil
 	}
-	if err := c.publishJSON(c.buildTopic("notifications"), notifications); err != nil {
+	if err := c.publishJSON(c.topics.Notification, notifications); err != nil {
 		return err
 	}
 	if notifications != nil {
@@ -470,6 +739,27 @@ func (c *Client) PublishNotifications(notifications *dto.NotificationList) error
 	return nil
 }
 
+// notificationEvent is the HA event payload for a new Unraid notification.
+// Like haDiscoveryConfig it is a fixed struct rather than a map[string]any, so
+// each event avoids a per-event map, boxed values and the key sort
+// encoding/json applies to maps.
+type notificationEvent struct {
+	EventType          string `json:"event_type"`
+	ID                 string `json:"id"`
+	Title              string `json:"title"`
+	Subject            string `json:"subject"`
+	Description        string `json:"description"`
+	Importance         string `json:"importance"`
+	Type               string `json:"type"`
+	Link               string `json:"link"`
+	Timestamp          string `json:"timestamp"`
+	FormattedTimestamp string `json:"formatted_timestamp"`
+}
+
+// seenNotificationsSlack is how many departed notification IDs the seen-set
+// may hold beyond twice the live count before it is rebuilt.
+const seenNotificationsSlack = 64
+
 // publishNewNotificationEvents emits an HA event payload for each notification
 // not previously seen. On the first cycle it seeds the seen-set without firing,
 // so an agent restart does not replay the existing notification backlog as events.
@@ -479,17 +769,23 @@ func (c *Client) publishNewNotificationEvents(notifications []dto.Notification)
 		c.seenNotifications = make(map[string]bool)
 	}
 
-	var toFire []map[string]any
+	var toFire []notificationEvent
 
-	for _, n := range notifications {
+	live := 0
+	for i := range notifications {
+		n := &notifications[i]
 		// Only fire on active (unread) notifications with a stable ID.
 		if n.ID == "" || n.Type == "archive" {
 			continue
 		}
-		if c.seenNotifications[n.ID] {
+		live++
+		// One map write both records the ID and, through the size change,
+		// tells whether it was new.
+		seen := len(c.seenNotifications)
+		c.seenNotifications[n.ID] = true
+		if len(c.seenNotifications) == seen {
 			continue
 		}
-		c.seenNotifications[n.ID] = true
 
 		if !c.notifSeeded {
 			continue // seeding pass — record but don't fire
@@ -501,32 +797,43 @@ func (c *Client) publishNewNotificationEvents(notifications []dto.Notification)
 		}
 		// event_type selects the HA event class; all notification details are
 		// carried as event attributes so automations have the full context.
-		payload := map[string]any{
-			"event_type":          importance,
-			"id":                  n.ID,
-			"title":               n.Title,
-			"subject":             n.Subject,
-			"description":         n.Description,
-			"importance":          n.Importance,
-			"type":                n.Type,
-			"link":                n.Link,
-			"timestamp":           n.Timestamp.Format(time.RFC3339),
-			"formatted_timestamp": n.FormattedTimestamp,
-		}
-		toFire = append(toFire, payload)
+		toFire = append(toFire, notificationEvent{
+			EventType:          importance,
+			ID:                 n.ID,
+			Title:              n.Title,
+			Subject:            n.Subject,
+			Description:        n.Description,
+			Importance:         n.Importance,
+			Type:               n.Type,
+			Link:               n.Link,
+			Timestamp:          n.Timestamp.Format(time.RFC3339),
+			FormattedTimestamp: n.FormattedTimestamp,
+		})
 	}
 	c.notifSeeded = true
+	// IDs of notifications that were archived or deleted are never looked up
+	// again. Once they outnumber the live ones, keep only the live IDs so the
+	// set stays bounded by the unread backlog rather than by uptime.
+	if len(c.seenNotifications) > 2*live+seenNotificationsSlack {
+		next := make(map[string]bool, live)
+		for i := range notifications {
+			if n := &notifications[i]; n.ID != "" && n.Type != "archive" {
+				next[n.ID] = true
+			}
+		}
+		c.seenNotifications = next
+	}
 	c.notifMu.Unlock()
 
-	topic := c.buildTopic("notifications/event")
-	for _, p := range toFire {
-		data, err := json.Marshal(p)
+	topic := c.topics.NotificationEvent
+	for i := range toFire {
+		data, err := json.Marshal(&toFire[i])
 		if err != nil {
 			logger.Warning("MQTT: Failed to marshal notification event: %v", err)
 			continue
 		}
 		// Never retain event payloads — HA must not replay the last event on reconnect.
-		if err := c.publish(topic, string(data), false); err != nil {
+		if err := c.publish(topic, data, false); err != nil {
 			logger.Warning("MQTT: Failed to publish notification event: %v", err)
 		}
 	}
@@ -537,9 +844,9 @@ func (c *Client) PublishZFSPools(pools []dto.ZFSPool) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("zfs/pools"), pools)
+	err := c.publishJSON(c.topics.ZFSPools, pools)
 	// Publish per-pool topics and HA discovery
-	go c.publishZFSDiscovery(pools)
+	c.goDiscovery("ZFS", func() { c.publishZFSDiscovery(pools) })
 	return err
 }
 
@@ -548,7 +855,7 @@ func (c *Client) PublishNUTStatus(data *dto.NUTResponse) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("nut/status"), data)
+	return c.publishJSON(c.topics.NUT, data)
 }
 
 // PublishHardwareInfo publishes hardware information to MQTT.
@@ -556,7 +863,7 @@ func (c *Client) PublishHardwareInfo(info *dto.HardwareInfo) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("hardware"), info)
+	return c.publishJSON(c.topics.Hardware, info)
 }
 
 // PublishRegistration publishes registration/license information to MQTT.
@@ -564,7 +871,7 @@ func (c *Client) PublishRegistration(reg *dto.Registration) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("registration"), reg)
+	return c.publishJSON(c.topics.Registration, reg)
 }
 
 // PublishUnassignedDevices publishes unassigned device information to MQTT.
@@ -572,8 +879,8 @@ func (c *Client) PublishUnassignedDevices(list *dto.UnassignedDeviceList) error
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("unassigned/devices"), list)
-	go c.publishUnassignedDiscovery(list)
+	err := c.publishJSON(c.topics.Unassigned, list)
+	c.goDiscovery("unassigned", func() { c.publishUnassignedDiscovery(list) })
 	return err
 }
 
@@ -582,8 +889,8 @@ func (c *Client) PublishZFSDatasets(datasets []dto.ZFSDataset) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("zfs/datasets"), datasets)
-	go c.publishZFSDatasetDiscovery(datasets)
+	err := c.publishJSON(c.topics.ZFSDatasets, datasets)
+	c.goDiscovery("ZFS dataset", func() { c.publishZFSDatasetDiscovery(datasets) })
 	return err
 }
 
@@ -592,7 +899,7 @@ func (c *Client) PublishZFSSnapshots(snapshots []dto.ZFSSnapshot) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("zfs/snapshots"), snapshots)
+	return c.publishJSON(c.topics.ZFSSnapshots, snapshots)
 }
 
 // PublishZFSARCStats publishes ZFS ARC statistics to MQTT.
@@ -600,7 +907,7 @@ func (c *Client) PublishZFSARCStats(stats dto.ZFSARCStats) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	return c.publishJSON(c.buildTopic("zfs/arc"), stats)
+	return c.publishJSON(c.topics.ZFSARC, stats)
 }
 
 // PublishFanControlStatus publishes fan control status to MQTT.
@@ -608,9 +915,9 @@ func (c *Client) PublishFanControlStatus(status *dto.FanControlStatus) error {
 	if !c.shouldPublish() {
 		return nil
 	}
-	err := c.publishJSON(c.buildTopic("fancontrol"), status)
+	err := c.publishJSON(c.fanControlTopic, status)
 	if status != nil {
-		go c.publishFanControlDiscovery(status)
+		c.goDiscovery("fan control", func() { c.publishFanControlDiscovery(status) })
 	}
 	return err
 }
@@ -629,23 +936,45 @@ func (c *Client) shouldPublish() bool {
 	return c.config.Enabled && c.connected.Load() && c.client != nil
 }
 
-// publish publishes a string payload to the specified topic.
-func (c *Client) publish(topic, payload string, retained bool) error {
+// Availability payloads, shared by every publish. paho only reads payloads.
+var (
+	availabilityOnline  = []byte("online")
+	availabilityOffline = []byte("offline")
+)
+
+// publish publishes a payload to the specified topic. Payloads are passed to
+// paho as []byte, which it sends as-is; a string would be copied into a new
+// byte slice on every publish, on top of the copy made converting the
+// marshalled JSON to a string.
+func (c *Client) publish(topic string, payload []byte, retained bool) error {
 	if c.client == nil {
 		return fmt.Errorf("MQTT client not initialized")
 	}
+	if c.stopping.Load() {
+		return fmt.Errorf("MQTT client is disconnecting")
+	}
 
-	token := c.client.Publish(topic, normalizeQoS(c.config.QoS), retained, payload)
-	token.Wait()
+	return c.awaitPublish(topic, c.client.Publish(topic, c.qos, retained, payload))
+}
 
-	if token.Error() != nil {
+// awaitPublish waits for a publish token and records the outcome in the
+// message counters. Failures are returned, not logged: every caller that cares
+// already logs the error, and the message carries the topic.
+func (c *Client) awaitPublish(topic string, token pahomqtt.Token) error {
+	if !token.WaitTimeout(publishTimeout) {
+		c.msgErrors.Add(1)
+		return fmt.Errorf("publish to %s timed out after %s", topic, publishTimeout)
+	}
+
+	if err := token.Error(); err != nil {
 		c.msgErrors.Add(1)
-		logger.Debug("MQTT: Failed to publish to %s: %v", topic, token.Error())
-		return token.Error()
+		return fmt.Errorf("publish to %s: %w", topic, err)
 	}
 
 	c.msgSent.Add(1)
-	logger.Debug("MQTT: Published to %s", topic)
+	if logger.DebugEnabled() {
+		logger.Debug("MQTT: Published to %s", topic)
+	}
 	return nil
 }
 
@@ -657,15 +986,12 @@ func (c *Client) publishJSON(topic string, payload any) error {
 		return fmt.Errorf("failed to marshal JSON: %w", err)
 	}
 
-	return c.publish(topic, string(data), c.config.RetainMessages)
+	return c.publish(topic, data, c.config.RetainMessages)
 }
 
 // buildTopic constructs a full topic path with the configured prefix.
 func (c *Client) buildTopic(suffix string) string {
-	if c.config.TopicPrefix == "" {
-		return suffix
-	}
-	return fmt.Sprintf("%s/%s", c.config.TopicPrefix, suffix)
+	return c.topicBase + suffix
 }
 
 // NOTE: publishHADiscovery, publishHAEntity, and all per-item discovery
@@ -2,6 +2,7 @@ package mqtt
 
 import (
 	"context"
+	"strings"
 	"testing"
 	"time"
 
@@ -104,7 +105,7 @@ func TestPublish_NilClient(t *testing.T) {
 	client := NewClient(config, "test-server", "1.0.0", nil)
 	// client.client is nil
 
-	err := client.publish("test/topic", "payload", false)
+	err := client.publish("test/topic", []byte("payload"), false)
 	if err == nil {
 		t.Error("publish() should return error when MQTT client is nil")
 	}
@@ -115,6 +116,23 @@ func TestPublish_NilClient(t *testing.T) {
 	}
 }
 
+func TestPublish_TimesOutWhenBrokerStalls(t *testing.T) {
+	config := DefaultConfig()
+	client := NewClient(config, "test-server", "1.0.0", nil)
+	client.client = stalledPaho{}
+
+	err := client.publish("test/topic", []byte("payload"), false)
+	if err == nil || !strings.Contains(err.Error(), "timed out") {
+		t.Fatalf("publish() error = %v, want timeout", err)
+	}
+	if client.msgErrors.Load() != 1 {
+		t.Errorf("msgErrors = %d, want 1 after timeout", client.msgErrors.Load())
+	}
+	if client.msgSent.Load() != 0 {
+		t.Errorf("msgSent = %d, want 0 after timeout", client.msgSent.Load())
+	}
+}
+
 func TestPublishJSON_MarshalError(t *testing.T) {
 	config := DefaultConfig()
 	config.Enabled = true
@@ -246,6 +264,7 @@ func TestSanitizeID(t *testing.T) {
 		{"eth0.1", "eth0_1"},
 		{"path/to/thing", "path_to_thing"},
 		{"already_clean", "already_clean"},
+		{"Ärger-Böse.VM", "ärger_böse_vm"},
 	}
 
 	for _, tt := range tests {
@@ -329,6 +348,42 @@ func TestConnect_WithCredentials(t *testing.T) {
 	t.Logf("Connect with credentials returned expected error: %v", err)
 }
 
+func TestConnect_FailureRecordedWhileStatusPolled(t *testing.T) {
+	config := DefaultConfig()
+	config.Enabled = true
+	config.Broker = "tcp://127.0.0.1:1" // refused immediately
+	config.ConnectTimeout = 1
+	config.AutoReconnect = false
+	client := NewClient(config, "test-server", "1.0.0", nil)
+
+	// Run with -race: GetStatus reads lastError while Connect records it.
+	stop := make(chan struct{})
+	polled := make(chan struct{})
+	go func() {
+		defer close(polled)
+		for {
+			select {
+			case <-stop:
+				return
+			default:
+				_ = client.GetStatus()
+			}
+		}
+	}()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 3*time.Second)
+	defer cancel()
+	err := client.Connect(ctx)
+	close(stop)
+	<-polled
+	if err == nil {
+		t.Skip("connect to a closed port unexpectedly succeeded")
+	}
+	if ctx.Err() == nil && client.GetStatus().LastError == "" {
+		t.Error("failed connect did not record LastError")
+	}
+}
+
 func TestPublishMethodsWithEnabledButNotConnected(t *testing.T) {
 	config := DefaultConfig()
 	config.Enabled = true
@@ -1,6 +1,12 @@
 package mqtt
 
 import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"slices"
+	"sync"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -66,6 +72,59 @@ func TestPublishNewNotificationEventsSeeding(t *testing.T) {
 	}
 }
 
+func TestPublishNewNotificationEventsBoundsSeenSet(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test-server", "1.0.0", nil)
+	client.publishNewNotificationEvents(nil) // seed
+
+	// Each cycle a new notification arrives and the previous one is
+	// archived, so only one ID is ever live.
+	for i := range 200 {
+		client.publishNewNotificationEvents([]dto.Notification{
+			{ID: fmt.Sprintf("old%d", i), Type: "archive"},
+			{ID: fmt.Sprintf("n%d", i), Importance: "info", Type: "unread"},
+		})
+	}
+	if got, limit := len(client.seenNotifications), 2+seenNotificationsSlack+1; got > limit {
+		t.Errorf("seen-set holds %d IDs with one live notification, want at most %d", got, limit)
+	}
+	if !client.seenNotifications["n199"] {
+		t.Error("the live notification must stay in the seen-set")
+	}
+}
+
+func TestPublishNewNotificationEventsPayload(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	client.publishNewNotificationEvents(nil) // seed
+
+	client.publishNewNotificationEvents([]dto.Notification{
+		{ID: "n1", Title: "Parity", Importance: "bogus", Type: "unread", Timestamp: time.Unix(0, 0).UTC()},
+	})
+
+	fake.mu.Lock()
+	payloads := fake.published[client.topics.NotificationEvent]
+	fake.mu.Unlock()
+	if len(payloads) != 1 {
+		t.Fatalf("published %d events, want 1", len(payloads))
+	}
+	var got map[string]any
+	if err := json.Unmarshal([]byte(payloads[0]), &got); err != nil {
+		t.Fatalf("event payload is not JSON: %v", err)
+	}
+	want := map[string]any{
+		"event_type": "info", "id": "n1", "title": "Parity", "subject": "",
+		"description": "", "importance": "bogus", "type": "unread", "link": "",
+		"timestamp": "1970-01-01T00:00:00Z", "formatted_timestamp": "",
+	}
+	if len(got) != len(want) {
+		t.Errorf("payload has %d keys, want %d: %v", len(got), len(want), got)
+	}
+	for k, v := range want {
+		if got[k] != v {
+			t.Errorf("payload[%q] = %v, want %v", k, got[k], v)
+		}
+	}
+}
+
 func TestNewClient(t *testing.T) {
 	config := DefaultConfig()
 	client := NewClient(config, "test-server", "1.0.0", nil)
@@ -307,6 +366,27 @@ func TestClientGetTopicsWithCustomPrefix(t *testing.T) {
 	}
 }
 
+func TestClientPrecomputedTopicsMatchBuildTopic(t *testing.T) {
+	for _, prefix := range []string{"", "unraid", "homelab/server1"} {
+		config := DefaultConfig()
+		config.TopicPrefix = prefix
+		client := NewClient(config, "test-server", "1.0.0", nil)
+
+		for _, tt := range []struct{ got, suffix string }{
+			{client.fanControlTopic, "fancontrol"},
+			{client.servicesTopic, "services"},
+			{client.commandPrefix, "cmd/"},
+		} {
+			if want := client.buildTopic(tt.suffix); tt.got != want {
+				t.Errorf("prefix %q: precomputed %q topic = %q, want %q", prefix, tt.suffix, tt.got, want)
+			}
+		}
+		if got, want := client.buildCommandTopic("docker", "plex", "set"), client.buildTopic("cmd/docker/plex/set"); got != want {
+			t.Errorf("prefix %q: buildCommandTopic = %q, want %q", prefix, got, want)
+		}
+	}
+}
+
 func TestBuildTopic(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -714,3 +794,149 @@ func TestPublishSystemInfoNilSafe(t *testing.T) {
 		t.Errorf("PublishSystemInfo(nil) = %v, want nil", err)
 	}
 }
+
+func TestConnectRetryDelay(t *testing.T) {
+	tests := []struct {
+		attempt int
+		jitter  float64
+		want    time.Duration
+	}{
+		{0, 0, 1 * time.Second},
+		{1, 0, 2 * time.Second},
+		{3, 0, 8 * time.Second},
+		{5, 0, 32 * time.Second},
+		{6, 0, 60 * time.Second},
+		{50, 0, 60 * time.Second},
+		{0, 0.25, 1250 * time.Millisecond},
+		{6, -0.25, 45 * time.Second},
+	}
+
+	for _, tt := range tests {
+		if got := connectRetryDelay(tt.attempt, tt.jitter); got != tt.want {
+			t.Errorf("connectRetryDelay(%d, %v) = %s, want %s", tt.attempt, tt.jitter, got, tt.want)
+		}
+	}
+}
+
+func TestRetryConnect_CancelledContext(t *testing.T) {
+	config := DefaultConfig()
+	config.Enabled = true
+	config.Broker = "tcp://192.0.2.1:1883"
+	client := NewClient(config, "test-server", "1.0.0", nil)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	if err := client.RetryConnect(ctx); err == nil {
+		t.Error("RetryConnect() should return an error when the context is cancelled")
+	}
+	if client.IsConnected() {
+		t.Error("client should not be connected")
+	}
+}
+
+func TestGoDiscovery_BoundsConcurrentPasses(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test", "1.0.0", nil)
+
+	var running, peak atomic.Int32
+	release := make(chan struct{})
+	var done sync.WaitGroup
+	const passes = maxConcurrentDiscoveryPasses * 3
+	done.Add(passes)
+	for i := range passes {
+		client.goDiscovery(fmt.Sprintf("test%d", i), func() {
+			defer done.Done()
+			n := running.Add(1)
+			for {
+				p := peak.Load()
+				if n <= p || peak.CompareAndSwap(p, n) {
+					break
+				}
+			}
+			<-release
+			running.Add(-1)
+		})
+	}
+
+	time.Sleep(50 * time.Millisecond)
+	close(release)
+	done.Wait()
+
+	if got := peak.Load(); got > maxConcurrentDiscoveryPasses {
+		t.Errorf("peak concurrent passes = %d, want <= %d", got, maxConcurrentDiscoveryPasses)
+	}
+}
+
+func TestGoDiscovery_LatestSnapshotReplacesWaitingPass(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test", "1.0.0", nil)
+
+	var mu sync.Mutex
+	var ran []string
+	record := func(name string) func() {
+		return func() {
+			mu.Lock()
+			ran = append(ran, name)
+			mu.Unlock()
+		}
+	}
+	started := make(chan struct{})
+	release := make(chan struct{})
+	client.goDiscovery("disk", func() {
+		close(started)
+		<-release
+		record("first")()
+	})
+	<-started
+	client.goDiscovery("disk", record("stale"))
+	client.goDiscovery("disk", record("latest"))
+	close(release)
+	if !client.waitBackground(time.Second) {
+		t.Fatal("discovery passes did not finish")
+	}
+
+	mu.Lock()
+	defer mu.Unlock()
+	if !slices.Equal(ran, []string{"first", "latest"}) {
+		t.Errorf("passes ran %v, want [first latest]", ran)
+	}
+}
+
+func TestGoBackground_RecoversPanicsAndDrains(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test", "1.0.0", nil)
+
+	client.goDiscovery("test", func() { panic("boom") })
+	if !client.waitBackground(time.Second) {
+		t.Fatal("panicking pass was not recovered and released")
+	}
+
+	release := make(chan struct{})
+	client.goBackground("blocked", func() { <-release })
+	if client.waitBackground(20 * time.Millisecond) {
+		t.Error("waitBackground reported done while a goroutine was still running")
+	}
+	close(release)
+	if !client.waitBackground(time.Second) {
+		t.Error("waitBackground did not observe the goroutine finishing")
+	}
+}
+
+func TestDisconnect_StopsBackgroundWork(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test", "1.0.0", nil)
+	client.Disconnect()
+
+	var ran atomic.Bool
+	client.goBackground("late", func() { ran.Store(true) })
+	client.goDiscovery("late", func() { ran.Store(true) })
+	if !client.waitBackground(time.Second) || ran.Load() {
+		t.Error("background work started after Disconnect")
+	}
+
+	fake := newRecordingPaho()
+	client.client = fake
+	if err := client.publish("unraid/late", []byte("x"), false); err == nil {
+		t.Error("publish after Disconnect succeeded, want an error")
+	}
+	if len(fake.published) != 0 {
+		t.Errorf("publish after Disconnect reached the broker: %v", fake.published)
+	}
+}
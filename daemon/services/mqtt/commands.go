@@ -15,6 +15,10 @@ import (
 // subscribeCommandTopics subscribes to all command topics for switches and buttons.
 // Uses a combination of wildcard subscriptions for per-entity commands and
 // direct subscriptions for fixed-path commands.
+//
+// The message handler is registered once per paho client in Connect (see
+// onCommandMessage), so this only (re)establishes the broker-side
+// subscription after each connect.
 func (c *Client) subscribeCommandTopics() {
 	if c.client == nil || !c.client.IsConnected() {
 		return
@@ -22,9 +26,7 @@ func (c *Client) subscribeCommandTopics() {
 
 	// Subscribe to all commands under cmd/# using the wildcard router
 	cmdTopic := c.buildTopic("cmd/#")
-	token := c.client.Subscribe(cmdTopic, normalizeQoS(c.config.QoS), func(_ pahomqtt.Client, msg pahomqtt.Message) {
-		c.handleCommand(msg)
-	})
+	token := c.client.Subscribe(cmdTopic, c.qos, nil)
 	token.Wait()
 	if token.Error() != nil {
 		logger.Error("MQTT: Failed to subscribe to command topics: %v", token.Error())
@@ -34,10 +36,107 @@ func (c *Client) subscribeCommandTopics() {
 	logger.Success("MQTT: Subscribed to command topic %s", cmdTopic)
 }
 
+// onCommandMessage is the paho route handler for cmd/# messages.
+func (c *Client) onCommandMessage(_ pahomqtt.Client, msg pahomqtt.Message) {
+	c.handleCommand(msg)
+}
+
 // buildCommandTopic constructs a command topic for a specific entity.
 func (c *Client) buildCommandTopic(parts ...string) string {
-	suffix := "cmd/" + strings.Join(parts, "/")
-	return c.buildTopic(suffix)
+	return c.commandPrefix + strings.Join(parts, "/")
+}
+
+// commandRoute describes one command topic shape and its handler. Routes are
+// grouped by their first path segment in commandRoutes so each message costs a
+// single map lookup plus a scan of at most a couple of candidates.
+type commandRoute struct {
+	name   string // short label for logging
+	parts  int    // exact number of path segments
+	second string // required parts[1] ("" = any)
+	last   string // required final segment ("" = any)
+	exec   func(c *Client, parts []string, payload string) error
+}
+
+// commandRoutes maps the first segment of a relative command path to the
+// routes sharing it, in match order (most specific first).
+var commandRoutes = map[string][]commandRoute{
+	// Docker: docker/{name}/set (switch), docker/{name}/{action} (button)
+	"docker": {
+		{name: "docker_switch", parts: 3, last: "set", exec: func(c *Client, p []string, payload string) error {
+			return c.execDockerSwitch(p[1], payload)
+		}},
+		{name: "docker_button", parts: 3, exec: func(c *Client, p []string, _ string) error {
+			return c.execDockerButton(p[1], p[2])
+		}},
+	},
+	// VM: vm/{name}/set (switch), vm/{name}/{action} (button)
+	"vm": {
+		{name: "vm_switch", parts: 3, last: "set", exec: func(c *Client, p []string, payload string) error {
+			return c.execVMSwitch(p[1], payload)
+		}},
+		{name: "vm_button", parts: 3, exec: func(c *Client, p []string, _ string) error {
+			return c.execVMButton(p[1], p[2])
+		}},
+	},
+	// Array: array/set (switch); Parity: array/parity/{action} (buttons)
+	"array": {
+		{name: "array_switch", parts: 2, last: "set", exec: func(c *Client, _ []string, payload string) error {
+			return c.execArraySwitch(payload)
+		}},
+		{name: "parity_button", parts: 3, second: "parity", exec: func(c *Client, p []string, _ string) error {
+			return c.execParityButton(p[2])
+		}},
+	},
+	// Disk: disk/{name}/spin_up, disk/{name}/spin_down (buttons)
+	"disk": {
+		{name: "disk_spin_up", parts: 3, last: "spin_up", exec: func(c *Client, p []string, _ string) error {
+			return c.execDiskSpin(p[1], "up")
+		}},
+		{name: "disk_spin_down", parts: 3, last: "spin_down", exec: func(c *Client, p []string, _ string) error {
+			return c.execDiskSpin(p[1], "down")
+		}},
+	},
+	// Service: service/{name}/set (switch)
+	"service": {
+		{name: "service_switch", parts: 3, last: "set", exec: func(c *Client, p []string, payload string) error {
+			return c.execServiceSwitch(p[1], payload)
+		}},
+	},
+	// Remote share: unassigned/remote/{id}/set (switch → mount/unmount)
+	"unassigned": {
+		{name: "remote_share_switch", parts: 4, second: "remote", last: "set", exec: func(c *Client, p []string, payload string) error {
+			return c.execRemoteShareSwitch(p[2], payload)
+		}},
+	},
+	// System: system/reboot, system/shutdown (buttons)
+	"system": {
+		{name: "system_button", parts: 2, exec: func(c *Client, p []string, _ string) error {
+			return c.execSystemButton(p[1])
+		}},
+	},
+	// Notifications: notifications/archive_all (button)
+	"notifications": {
+		{name: "archive_all_notifications", parts: 2, last: "archive_all", exec: func(c *Client, _ []string, _ string) error {
+			return c.execArchiveAllNotifications()
+		}},
+	},
+}
+
+// matchCommandRoute returns the route handling the given relative path segments.
+func matchCommandRoute(parts []string) (commandRoute, bool) {
+	for _, r := range commandRoutes[parts[0]] {
+		if len(parts) != r.parts {
+			continue
+		}
+		if r.second != "" && parts[1] != r.second {
+			continue
+		}
+		if r.last != "" && parts[len(parts)-1] != r.last {
+			continue
+		}
+		return r, true
+	}
+	return commandRoute{}, false
 }
 
 // handleCommand routes incoming MQTT command messages to the appropriate handler.
@@ -50,7 +149,7 @@ func (c *Client) handleCommand(msg pahomqtt.Message) {
 
 	topic := msg.Topic()
 	payload := strings.TrimSpace(string(msg.Payload()))
-	prefix := c.buildTopic("cmd/")
+	prefix := c.commandPrefix
 
 	if !strings.HasPrefix(topic, prefix) {
 		return
@@ -62,55 +161,12 @@ func (c *Client) handleCommand(msg pahomqtt.Message) {
 
 	logger.Info("MQTT: Command received: %s → %s", relative, payload)
 
-	var err error
-
-	switch {
-	// Docker: docker/{name}/set (switch), docker/{name}/{action} (button)
-	case len(parts) == 3 && parts[0] == "docker" && parts[2] == "set":
-		err = c.execDockerSwitch(parts[1], payload)
-	case len(parts) == 3 && parts[0] == "docker":
-		err = c.execDockerButton(parts[1], parts[2])
-
-	// VM: vm/{name}/set (switch), vm/{name}/{action} (button)
-	case len(parts) == 3 && parts[0] == "vm" && parts[2] == "set":
-		err = c.execVMSwitch(parts[1], payload)
-	case len(parts) == 3 && parts[0] == "vm":
-		err = c.execVMButton(parts[1], parts[2])
-
-	// Array: array/set (switch)
-	case len(parts) == 2 && parts[0] == "array" && parts[1] == "set":
-		err = c.execArraySwitch(payload)
-
-	// Parity: array/parity/{action} (buttons)
-	case len(parts) == 3 && parts[0] == "array" && parts[1] == "parity":
-		err = c.execParityButton(parts[2])
-
-	// Disk: disk/{name}/spin_up, disk/{name}/spin_down (buttons)
-	case len(parts) == 3 && parts[0] == "disk" && parts[2] == "spin_up":
-		err = c.execDiskSpin(parts[1], "up")
-	case len(parts) == 3 && parts[0] == "disk" && parts[2] == "spin_down":
-		err = c.execDiskSpin(parts[1], "down")
-
-	// Service: service/{name}/set (switch)
-	case len(parts) == 3 && parts[0] == "service" && parts[2] == "set":
-		err = c.execServiceSwitch(parts[1], payload)
-
-	// Remote share: unassigned/remote/{id}/set (switch → mount/unmount)
-	case len(parts) == 4 && parts[0] == "unassigned" && parts[1] == "remote" && parts[3] == "set":
-		err = c.execRemoteShareSwitch(parts[2], payload)
-
-	// System: system/reboot, system/shutdown (buttons)
-	case len(parts) == 2 && parts[0] == "system":
-		err = c.execSystemButton(parts[1])
-
-	// Notifications: notifications/archive_all (button)
-	case len(parts) == 2 && parts[0] == "notifications" && parts[1] == "archive_all":
-		err = c.execArchiveAllNotifications()
-
-	default:
+	route, ok := matchCommandRoute(parts)
+	if !ok {
 		logger.Debug("MQTT: Unhandled command topic: %s", relative)
 		return
 	}
+	err := route.exec(c, parts, payload)
 
 	// Publish result
 	c.publishCommandResult(topic, err)
@@ -127,177 +183,184 @@ func (c *Client) publishCommandResult(topic string, err error) {
 	if jsonErr != nil {
 		return
 	}
-	_ = c.publish(topic+"/result", string(data), false)
+	_ = c.publish(topic+"/result", data, false)
+}
+
+// controllerOp is one command-triggered controller operation: the log message
+// emitted before it runs and the method that performs it. Each exec* handler
+// validates the action against a static table of ops before constructing its
+// controller, so invalid payloads never open a Docker/libvirt client.
+type controllerOp[C any] struct {
+	verb string // e.g. "Starting container"; the target is appended when non-empty
+	run  func(ctrl C, target string) error
+}
+
+// do logs and runs the operation against ctrl.
+func (op controllerOp[C]) do(ctrl C, target string) error {
+	if target == "" {
+		logger.Info("MQTT: %s", op.verb)
+	} else {
+		logger.Info("MQTT: %s %s", op.verb, target)
+	}
+	return op.run(ctrl, target)
+}
+
+// onOff normalizes a switch payload to the ON/OFF keys used by switch op tables.
+func onOff(payload string) string {
+	return strings.ToUpper(payload)
 }
 
 // --- Docker ---
 
-func (c *Client) execDockerSwitch(nameID, payload string) error {
-	ctrl := controllers.NewDockerController()
-	defer func() {
-		if err := ctrl.Close(); err != nil {
-			logger.Debug("MQTT: Failed to close Docker controller: %v", err)
-		}
-	}()
+type dockerOp = controllerOp[*controllers.DockerController]
+
+var dockerSwitchOps = map[string]dockerOp{
+	"ON":  {"Starting container", (*controllers.DockerController).Start},
+	"OFF": {"Stopping container", (*controllers.DockerController).Stop},
+}
+
+var dockerButtonOps = map[string]dockerOp{
+	"restart": {"Restarting container", (*controllers.DockerController).Restart},
+	"pause":   {"Pausing container", (*controllers.DockerController).Pause},
+	"unpause": {"Unpausing container", (*controllers.DockerController).Unpause},
+}
 
-	switch strings.ToUpper(payload) {
-	case "ON":
-		logger.Info("MQTT: Starting container %s", nameID)
-		return ctrl.Start(nameID)
-	case "OFF":
-		logger.Info("MQTT: Stopping container %s", nameID)
-		return ctrl.Stop(nameID)
-	default:
+func (c *Client) execDockerSwitch(nameID, payload string) error {
+	defer c.forgetItemState("docker", nameID)
+	op, ok := dockerSwitchOps[onOff(payload)]
+	if !ok {
 		return fmt.Errorf("invalid docker switch payload: %s (expected ON/OFF)", payload)
 	}
+	return runDockerOp(op, nameID)
 }
 
 func (c *Client) execDockerButton(nameID, action string) error {
+	defer c.forgetItemState("docker", nameID)
+	op, ok := dockerButtonOps[action]
+	if !ok {
+		return fmt.Errorf("unknown docker button action: %s", action)
+	}
+	return runDockerOp(op, nameID)
+}
+
+// runDockerOp runs op on a short-lived Docker controller, closing it afterwards.
+func runDockerOp(op dockerOp, nameID string) error {
 	ctrl := controllers.NewDockerController()
 	defer func() {
 		if err := ctrl.Close(); err != nil {
 			logger.Debug("MQTT: Failed to close Docker controller: %v", err)
 		}
 	}()
-
-	switch action {
-	case "restart":
-		logger.Info("MQTT: Restarting container %s", nameID)
-		return ctrl.Restart(nameID)
-	case "pause":
-		logger.Info("MQTT: Pausing container %s", nameID)
-		return ctrl.Pause(nameID)
-	case "unpause":
-		logger.Info("MQTT: Unpausing container %s", nameID)
-		return ctrl.Unpause(nameID)
-	default:
-		return fmt.Errorf("unknown docker button action: %s", action)
-	}
+	return op.do(ctrl, nameID)
 }
 
 // --- VM ---
 
+type vmOp = controllerOp[*controllers.VMController]
+
+var vmSwitchOps = map[string]vmOp{
+	"ON":  {"Starting VM", (*controllers.VMController).Start},
+	"OFF": {"Stopping VM", (*controllers.VMController).Stop},
+}
+
+var vmButtonOps = map[string]vmOp{
+	"restart":    {"Restarting VM", (*controllers.VMController).Restart},
+	"pause":      {"Pausing VM", (*controllers.VMController).Pause},
+	"resume":     {"Resuming VM", (*controllers.VMController).Resume},
+	"hibernate":  {"Hibernating VM", (*controllers.VMController).Hibernate},
+	"force_stop": {"Force-stopping VM", (*controllers.VMController).ForceStop},
+}
+
 func (c *Client) execVMSwitch(nameID, payload string) error {
-	ctrl := controllers.NewVMController()
-
-	switch strings.ToUpper(payload) {
-	case "ON":
-		logger.Info("MQTT: Starting VM %s", nameID)
-		return ctrl.Start(nameID)
-	case "OFF":
-		logger.Info("MQTT: Stopping VM %s", nameID)
-		return ctrl.Stop(nameID)
-	default:
+	defer c.forgetItemState("vm", nameID)
+	op, ok := vmSwitchOps[onOff(payload)]
+	if !ok {
 		return fmt.Errorf("invalid VM switch payload: %s (expected ON/OFF)", payload)
 	}
+	return op.do(controllers.NewVMController(), nameID)
 }
 
 func (c *Client) execVMButton(nameID, action string) error {
-	ctrl := controllers.NewVMController()
-
-	switch action {
-	case "restart":
-		logger.Info("MQTT: Restarting VM %s", nameID)
-		return ctrl.Restart(nameID)
-	case "pause":
-		logger.Info("MQTT: Pausing VM %s", nameID)
-		return ctrl.Pause(nameID)
-	case "resume":
-		logger.Info("MQTT: Resuming VM %s", nameID)
-		return ctrl.Resume(nameID)
-	case "hibernate":
-		logger.Info("MQTT: Hibernating VM %s", nameID)
-		return ctrl.Hibernate(nameID)
-	case "force_stop":
-		logger.Info("MQTT: Force-stopping VM %s", nameID)
-		return ctrl.ForceStop(nameID)
-	default:
+	defer c.forgetItemState("vm", nameID)
+	op, ok := vmButtonOps[action]
+	if !ok {
 		return fmt.Errorf("unknown VM button action: %s", action)
 	}
+	return op.do(controllers.NewVMController(), nameID)
 }
 
 // --- Array ---
 
+type arrayOp = controllerOp[*controllers.ArrayController]
+
+var arraySwitchOps = map[string]arrayOp{
+	"ON":  {"Starting array", func(a *controllers.ArrayController, _ string) error { return a.StartArray() }},
+	"OFF": {"Stopping array", func(a *controllers.ArrayController, _ string) error { return a.StopArray() }},
+}
+
+var parityButtonOps = map[string]arrayOp{
+	"start":  {"Starting parity check", func(a *controllers.ArrayController, _ string) error { return a.StartParityCheck(false) }},
+	"stop":   {"Stopping parity check", func(a *controllers.ArrayController, _ string) error { return a.StopParityCheck() }},
+	"pause":  {"Pausing parity check", func(a *controllers.ArrayController, _ string) error { return a.PauseParityCheck() }},
+	"resume": {"Resuming parity check", func(a *controllers.ArrayController, _ string) error { return a.ResumeParityCheck() }},
+}
+
+var diskSpinOps = map[string]arrayOp{
+	"up":   {"Spinning up disk", (*controllers.ArrayController).SpinUpDisk},
+	"down": {"Spinning down disk", (*controllers.ArrayController).SpinDownDisk},
+}
+
 func (c *Client) execArraySwitch(payload string) error {
 	if c.domainCtx == nil {
 		return fmt.Errorf("domain context not available for array control")
 	}
-	ctrl := controllers.NewArrayController(c.domainCtx)
-
-	switch strings.ToUpper(payload) {
-	case "ON":
-		logger.Info("MQTT: Starting array")
-		return ctrl.StartArray()
-	case "OFF":
-		logger.Info("MQTT: Stopping array")
-		return ctrl.StopArray()
-	default:
+	op, ok := arraySwitchOps[onOff(payload)]
+	if !ok {
 		return fmt.Errorf("invalid array switch payload: %s (expected ON/OFF)", payload)
 	}
+	return op.do(controllers.NewArrayController(c.domainCtx), "")
 }
 
 func (c *Client) execParityButton(action string) error {
 	if c.domainCtx == nil {
 		return fmt.Errorf("domain context not available for parity control")
 	}
-	ctrl := controllers.NewArrayController(c.domainCtx)
-
-	switch action {
-	case "start":
-		logger.Info("MQTT: Starting parity check")
-		return ctrl.StartParityCheck(false)
-	case "stop":
-		logger.Info("MQTT: Stopping parity check")
-		return ctrl.StopParityCheck()
-	case "pause":
-		logger.Info("MQTT: Pausing parity check")
-		return ctrl.PauseParityCheck()
-	case "resume":
-		logger.Info("MQTT: Resuming parity check")
-		return ctrl.ResumeParityCheck()
-	default:
+	op, ok := parityButtonOps[action]
+	if !ok {
 		return fmt.Errorf("unknown parity action: %s", action)
 	}
+	return op.do(controllers.NewArrayController(c.domainCtx), "")
 }
 
 func (c *Client) execDiskSpin(nameID, direction string) error {
 	if c.domainCtx == nil {
 		return fmt.Errorf("domain context not available for disk control")
 	}
-	ctrl := controllers.NewArrayController(c.domainCtx)
-
-	switch direction {
-	case "up":
-		logger.Info("MQTT: Spinning up disk %s", nameID)
-		return ctrl.SpinUpDisk(nameID)
-	case "down":
-		logger.Info("MQTT: Spinning down disk %s", nameID)
-		return ctrl.SpinDownDisk(nameID)
-	default:
+	op, ok := diskSpinOps[direction]
+	if !ok {
 		return fmt.Errorf("unknown spin direction: %s", direction)
 	}
+	return op.do(controllers.NewArrayController(c.domainCtx), nameID)
 }
 
 // --- Services ---
 
+var serviceSwitchOps = map[string]controllerOp[*controllers.ServiceController]{
+	"ON":  {"Starting service", (*controllers.ServiceController).StartService},
+	"OFF": {"Stopping service", (*controllers.ServiceController).StopService},
+}
+
 func (c *Client) execServiceSwitch(nameID, payload string) error {
-	ctrl := controllers.NewServiceController()
-
-	var err error
-	switch strings.ToUpper(payload) {
-	case "ON":
-		logger.Info("MQTT: Starting service %s", nameID)
-		err = ctrl.StartService(nameID)
-	case "OFF":
-		logger.Info("MQTT: Stopping service %s", nameID)
-		err = ctrl.StopService(nameID)
-	default:
+	op, ok := serviceSwitchOps[onOff(payload)]
+	if !ok {
 		return fmt.Errorf("invalid service switch payload: %s (expected ON/OFF)", payload)
 	}
 
-	// Publish updated service states so HA switches reflect the change
+	err := op.do(controllers.NewServiceController(), nameID)
+
+	// Publish the toggled service's new state so HA switches reflect the change
 	if err == nil {
-		go c.publishServiceStates()
+		c.scheduleServiceStateRefresh(nameID)
 	}
 
 	return err
@@ -305,49 +368,50 @@ func (c *Client) execServiceSwitch(nameID, payload string) error {
 
 // --- Remote shares ---
 
-func (c *Client) execRemoteShareSwitch(shareID, payload string) error {
-	source := c.lookupRemoteShareSource(shareID)
-	if source == "" {
-		return fmt.Errorf("unknown remote share id: %s", shareID)
-	}
-
-	ctrl := controllers.NewRemoteShareController()
-	switch strings.ToUpper(payload) {
-	case "ON":
-		logger.Info("MQTT: Mounting remote share %s", source)
-		if err := ctrl.Mount(source); err != nil {
+var remoteShareSwitchOps = map[string]controllerOp[*controllers.RemoteShareController]{
+	"ON": {"Mounting remote share", func(rc *controllers.RemoteShareController, source string) error {
+		if err := rc.Mount(source); err != nil {
 			return fmt.Errorf("mounting remote share %s: %w", source, err)
 		}
 		return nil
-	case "OFF":
-		logger.Info("MQTT: Unmounting remote share %s", source)
-		if err := ctrl.Unmount(source); err != nil {
+	}},
+	"OFF": {"Unmounting remote share", func(rc *controllers.RemoteShareController, source string) error {
+		if err := rc.Unmount(source); err != nil {
 			return fmt.Errorf("unmounting remote share %s: %w", source, err)
 		}
 		return nil
-	default:
+	}},
+}
+
+func (c *Client) execRemoteShareSwitch(shareID, payload string) error {
+	source := c.lookupRemoteShareSource(shareID)
+	if source == "" {
+		return fmt.Errorf("unknown remote share id: %s", shareID)
+	}
+
+	op, ok := remoteShareSwitchOps[onOff(payload)]
+	if !ok {
 		return fmt.Errorf("invalid remote share switch payload: %s (expected ON/OFF)", payload)
 	}
+	return op.do(controllers.NewRemoteShareController(), source)
 }
 
 // --- System ---
 
+var systemButtonOps = map[string]controllerOp[*controllers.SystemController]{
+	"reboot":   {"Initiating system reboot", func(s *controllers.SystemController, _ string) error { return s.Reboot() }},
+	"shutdown": {"Initiating system shutdown", func(s *controllers.SystemController, _ string) error { return s.Shutdown() }},
+}
+
 func (c *Client) execSystemButton(action string) error {
 	if c.domainCtx == nil {
 		return fmt.Errorf("domain context not available for system control")
 	}
-	ctrl := controllers.NewSystemController(c.domainCtx)
-
-	switch action {
-	case "reboot":
-		logger.Info("MQTT: Initiating system reboot")
-		return ctrl.Reboot()
-	case "shutdown":
-		logger.Info("MQTT: Initiating system shutdown")
-		return ctrl.Shutdown()
-	default:
+	op, ok := systemButtonOps[action]
+	if !ok {
 		return fmt.Errorf("unknown system action: %s", action)
 	}
+	return op.do(controllers.NewSystemController(c.domainCtx), "")
 }
 
 // --- Notifications ---
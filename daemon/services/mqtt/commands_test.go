@@ -0,0 +1,157 @@
+package mqtt
+
+import (
+	"maps"
+	"slices"
+	"strings"
+	"testing"
+
+	pahomqtt "github.com/eclipse/paho.mqtt.golang"
+)
+
+func TestMatchCommandRoute(t *testing.T) {
+	tests := []struct {
+		path string
+		want string // "" = no route
+	}{
+		{"docker/plex/set", "docker_switch"},
+		{"docker/plex/restart", "docker_button"},
+		{"vm/windows/set", "vm_switch"},
+		{"vm/windows/force_stop", "vm_button"},
+		{"array/set", "array_switch"},
+		{"array/parity/start", "parity_button"},
+		{"disk/disk1/spin_up", "disk_spin_up"},
+		{"disk/disk1/spin_down", "disk_spin_down"},
+		{"service/docker/set", "service_switch"},
+		{"unassigned/remote/nas_share/set", "remote_share_switch"},
+		{"system/reboot", "system_button"},
+		{"notifications/archive_all", "archive_all_notifications"},
+
+		{"docker/plex", ""},
+		{"array/parity", ""},
+		{"array/other/start", ""},
+		{"disk/disk1/spin", ""},
+		{"service/docker/toggle", ""},
+		{"unassigned/local/dev/set", ""},
+		{"notifications/clear", ""},
+		{"unknown/thing", ""},
+		{"", ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.path, func(t *testing.T) {
+			route, ok := matchCommandRoute(strings.Split(tt.path, "/"))
+			if tt.want == "" {
+				if ok {
+					t.Errorf("matchCommandRoute(%q) = %s, want no route", tt.path, route.name)
+				}
+				return
+			}
+			if !ok {
+				t.Fatalf("matchCommandRoute(%q) found no route, want %s", tt.path, tt.want)
+			}
+			if route.name != tt.want {
+				t.Errorf("matchCommandRoute(%q) = %s, want %s", tt.path, route.name, tt.want)
+			}
+		})
+	}
+}
+
+func TestExecCommands_RejectInvalidActions(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test-server", "1.0.0", nil)
+
+	tests := []struct {
+		name    string
+		exec    func() error
+		wantErr string
+	}{
+		{"docker switch", func() error { return client.execDockerSwitch("plex", "toggle") }, "invalid docker switch payload"},
+		{"docker button", func() error { return client.execDockerButton("plex", "explode") }, "unknown docker button action"},
+		{"vm switch", func() error { return client.execVMSwitch("win", "maybe") }, "invalid VM switch payload"},
+		{"vm button", func() error { return client.execVMButton("win", "suspend") }, "unknown VM button action"},
+		{"service switch", func() error { return client.execServiceSwitch("docker", "") }, "invalid service switch payload"},
+		{"array without context", func() error { return client.execArraySwitch("ON") }, "domain context not available"},
+		{"parity without context", func() error { return client.execParityButton("start") }, "domain context not available"},
+		{"disk without context", func() error { return client.execDiskSpin("disk1", "up") }, "domain context not available"},
+		{"system without context", func() error { return client.execSystemButton("reboot") }, "domain context not available"},
+		{"unknown remote share", func() error { return client.execRemoteShareSwitch("nope", "ON") }, "unknown remote share id"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := tt.exec()
+			if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+				t.Errorf("error = %v, want containing %q", err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestExecPowerCommands_ForceStateRepublish(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test-server", "1.0.0", nil)
+	_, plexTopic := client.itemTopic("docker", "plex")
+	_, winTopic := client.itemTopic("vm", "win")
+	client.itemStates = map[string]itemStateMark{plexTopic: {}, winTopic: {}}
+
+	// Even a rejected command must let the next poll correct an optimistic
+	// switch in Home Assistant.
+	_ = client.execDockerSwitch("plex", "toggle")
+	_ = client.execVMSwitch("win", "maybe")
+
+	if len(client.itemStates) != 0 {
+		t.Errorf("itemStates = %v, want container and VM marks dropped", client.itemStates)
+	}
+}
+
+func TestSwitchOpTablesCoverOnOff(t *testing.T) {
+	tables := map[string][]string{
+		"docker":       slices.Collect(maps.Keys(dockerSwitchOps)),
+		"vm":           slices.Collect(maps.Keys(vmSwitchOps)),
+		"array":        slices.Collect(maps.Keys(arraySwitchOps)),
+		"service":      slices.Collect(maps.Keys(serviceSwitchOps)),
+		"remote_share": slices.Collect(maps.Keys(remoteShareSwitchOps)),
+	}
+	for name, got := range tables {
+		if len(got) != 2 || !slices.Contains(got, "ON") || !slices.Contains(got, "OFF") {
+			t.Errorf("%s switch ops = %v, want exactly ON and OFF", name, got)
+		}
+	}
+	if onOff("on") != "ON" || onOff("Off") != "OFF" {
+		t.Error("onOff should upper-case switch payloads")
+	}
+}
+
+// subscribingPaho records Subscribe calls on a connected fake client.
+type subscribingPaho struct {
+	pahomqtt.Client
+
+	topics    []string
+	callbacks []pahomqtt.MessageHandler
+}
+
+func (s *subscribingPaho) IsConnected() bool { return true }
+
+func (s *subscribingPaho) Subscribe(topic string, _ byte, cb pahomqtt.MessageHandler) pahomqtt.Token {
+	s.topics = append(s.topics, topic)
+	s.callbacks = append(s.callbacks, cb)
+	return completedToken{}
+}
+
+func TestSubscribeCommandTopics_ReusesStandingRoute(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test", "1.0.0", nil)
+	fake := &subscribingPaho{}
+	client.client = fake
+
+	// Two (re)connects must not register a handler per subscription.
+	client.subscribeCommandTopics()
+	client.subscribeCommandTopics()
+
+	if len(fake.topics) != 2 || fake.topics[0] != "unraid/cmd/#" {
+		t.Fatalf("subscribed to %v, want unraid/cmd/# twice", fake.topics)
+	}
+	for i, cb := range fake.callbacks {
+		if cb != nil {
+			t.Errorf("subscription %d registered its own handler; commands are routed by the standing AddRoute", i)
+		}
+	}
+}
@@ -2,10 +2,20 @@
 package mqtt
 
 import (
+	"bytes"
+	"cmp"
+	"encoding/json"
 	"fmt"
+	"hash/maphash"
+	"maps"
+	"slices"
+	"strconv"
 	"strings"
 	"sync"
+	"time"
+	"unicode"
 
+	pahomqtt "github.com/eclipse/paho.mqtt.golang"
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/dto"
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/logger"
 	"github.com/ruaan-deysel/unraid-management-agent/daemon/services/controllers"
@@ -33,19 +43,116 @@ type haEntityOpts struct {
 	eventTypes     []string // for event entity type
 }
 
+// haDiscoveryConfig is the JSON body of a Home Assistant MQTT discovery config.
+// A fixed struct instead of a map[string]any avoids boxing every value and the
+// key sort encoding/json performs for maps, on a path that runs for every
+// entity of every discovery pass. Optional keys are omitted when empty; the
+// keys HA always expects are always emitted.
+type haDiscoveryConfig struct {
+	Name                string          `json:"name"`
+	UniqueID            string          `json:"unique_id"`
+	AvailabilityTopic   string          `json:"availability_topic"`
+	PayloadAvailable    string          `json:"payload_available"`
+	PayloadNotAvailable string          `json:"payload_not_available"`
+	Icon                string          `json:"icon"`
+	Device              json.RawMessage `json:"device"`
+	StateTopic          string          `json:"state_topic,omitempty"`
+	ValueTemplate       string          `json:"value_template,omitempty"`
+	UnitOfMeasurement   string          `json:"unit_of_measurement,omitempty"`
+	DeviceClass         string          `json:"device_class,omitempty"`
+	StateClass          string          `json:"state_class,omitempty"`
+	EntityCategory      string          `json:"entity_category,omitempty"`
+	CommandTopic        string          `json:"command_topic,omitempty"`
+	PayloadOn           string          `json:"payload_on,omitempty"`
+	PayloadOff          string          `json:"payload_off,omitempty"`
+	StateOn             string          `json:"state_on,omitempty"`
+	StateOff            string          `json:"state_off,omitempty"`
+	Optimistic          bool            `json:"optimistic,omitempty"`
+	PayloadPress        string          `json:"payload_press,omitempty"`
+	EventTypes          []string        `json:"event_types,omitempty"`
+}
+
+// discoveryRefreshInterval bounds how long a per-item category may go without
+// rebuilding its HA discovery configs while its item set is unchanged. Entity
+// configs depend on item identity, not state, so rebuilding them on every
+// collection cycle only burns CPU; the periodic pass still picks up attribute
+// changes that do not alter the item set.
+const discoveryRefreshInterval = 5 * time.Minute
+
 // discoveryTracker tracks published per-item HA discovery entities
 // so that removed items can have their discovery configs cleaned up.
 type discoveryTracker struct {
-	mu       sync.Mutex
-	entities map[string]map[string]bool // category -> set of entity IDs
+	mu        sync.Mutex
+	entities  map[string]map[string]struct{} // category -> set of entity IDs
+	refreshed map[string]refreshMark         // category -> last discovery config pass
+}
+
+// refreshMark records the item set and time of a category's last discovery
+// config pass.
+type refreshMark struct {
+	keys string
+	at   time.Time
 }
 
 func newDiscoveryTracker() *discoveryTracker {
 	return &discoveryTracker{
-		entities: make(map[string]map[string]bool),
+		entities:  make(map[string]map[string]struct{}),
+		refreshed: make(map[string]refreshMark),
+	}
+}
+
+// refreshDue reports whether a category's discovery configs must be rebuilt:
+// on the first pass, when the set of item keys changed, or once
+// discoveryRefreshInterval has elapsed. The pass is only recorded by
+// markRefreshed, once it has published its configs.
+func (t *discoveryTracker) refreshDue(category string, keys []string, now time.Time) bool {
+	sig := strings.Join(keys, "\x00")
+
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	m, ok := t.refreshed[category]
+	return !ok || m.keys != sig || now.Sub(m.at) >= discoveryRefreshInterval
+}
+
+// markRefreshed records a completed discovery config pass for category.
+func (t *discoveryTracker) markRefreshed(category string, keys []string, now time.Time) {
+	sig := strings.Join(keys, "\x00")
+
+	t.mu.Lock()
+	t.refreshed[category] = refreshMark{keys: sig, at: now}
+	t.mu.Unlock()
+}
+
+// beginDiscoveryRefresh reports whether category's discovery configs must be
+// rebuilt. When they must, finish records the pass unless a config or item
+// state publish failed meanwhile, so a pass lost to a broker timeout is retried on the next
+// poll instead of after discoveryRefreshInterval; the per-topic digest skip
+// keeps that retry from resending configs that did get through. A failure in
+// a concurrent pass of another category also defers the mark, which costs
+// only that retry. finish is a no-op when no refresh is due. Passes keep an
+// item's entities when its state publish fails: the item is still present,
+// and leaving its IDs out would make tracker.update remove it from Home
+// Assistant.
+func (c *Client) beginDiscoveryRefresh(category string, keys []string, now time.Time) (refresh bool, finish func()) {
+	if !c.tracker.refreshDue(category, keys, now) {
+		return false, func() {}
+	}
+	failures := c.discoveryFailures.Load()
+	return true, func() {
+		if c.discoveryFailures.Load() == failures {
+			c.tracker.markRefreshed(category, keys, now)
+		}
 	}
 }
 
+// resetRefresh forces the next pass of every category to rebuild its configs.
+func (t *discoveryTracker) resetRefresh() {
+	t.mu.Lock()
+	t.refreshed = make(map[string]refreshMark)
+	t.mu.Unlock()
+}
+
 // update records the current set of entity IDs for a category and returns
 // any IDs that were previously registered but are no longer present.
 func (t *discoveryTracker) update(category string, currentIDs []string) []string {
@@ -53,165 +160,314 @@ func (t *discoveryTracker) update(category string, currentIDs []string) []string
 	defer t.mu.Unlock()
 
 	prev := t.entities[category]
-	next := make(map[string]bool, len(currentIDs))
+	// The sets hold every entity ID for the life of the connection, hundreds
+	// on a large install; empty-struct values take no space in the map.
+	next := make(map[string]struct{}, len(currentIDs))
 	for _, id := range currentIDs {
-		next[id] = true
+		next[id] = struct{}{}
 	}
 	t.entities[category] = next
 
 	var removed []string
 	for id := range prev {
-		if !next[id] {
+		if _, ok := next[id]; !ok {
 			removed = append(removed, id)
 		}
 	}
 	return removed
 }
 
-// publishHAEntity publishes a single Home Assistant discovery config.
-func (c *Client) publishHAEntity(opts haEntityOpts) {
-	hostID := strings.ReplaceAll(c.hostname, " ", "_")
+// discoveryTopic returns the HA discovery config topic for an entity:
+// <discovery prefix>/<entity type>/<host ID>/<entity ID>/config.
+func (c *Client) discoveryTopic(entityType, id string) string {
+	return c.config.HADiscoveryPrefix + "/" + entityType + "/" + c.hostID + "/" + id + "/config"
+}
 
-	discoveryTopic := fmt.Sprintf("%s/%s/%s/%s/config",
-		c.config.HADiscoveryPrefix,
-		opts.entityType,
-		hostID,
-		opts.id,
-	)
+// appendEntityIDs appends one item's entity IDs to acc. On the first item it
+// reserves room for every item in the pass (items of them, each with as many
+// IDs as this one), so a discovery pass grows its ID list once instead of
+// reallocating as it goes.
+func appendEntityIDs(acc, ids []string, items int) []string {
+	if cap(acc) == len(acc) {
+		acc = slices.Grow(acc, len(ids)*items)
+	}
+	return append(acc, ids...)
+}
 
-	config := map[string]any{
-		"name":                  opts.name,
-		"unique_id":             fmt.Sprintf("unraid_%s_%s", hostID, opts.id),
-		"availability_topic":    c.buildTopic("availability"),
-		"payload_available":     "online",
-		"payload_not_available": "offline",
-		"icon":                  opts.icon,
-		"device":                c.deviceInfo,
+// publishHAEntity publishes a single Home Assistant discovery config.
+func (c *Client) publishHAEntity(opts haEntityOpts) {
+	discoveryTopic := c.discoveryTopic(opts.entityType, opts.id)
+
+	config := haDiscoveryConfig{
+		Name:                opts.name,
+		UniqueID:            c.uniqueIDPrefix + opts.id,
+		AvailabilityTopic:   c.availabilityTopic,
+		PayloadAvailable:    "online",
+		PayloadNotAvailable: "offline",
+		Icon:                opts.icon,
+		Device:              c.deviceJSON,
+		UnitOfMeasurement:   opts.unit,
+		DeviceClass:         opts.deviceClass,
+		StateClass:          opts.stateClass,
+		EntityCategory:      opts.entityCategory,
 	}
 
 	// state_topic is used by sensor, binary_sensor, and switch (not button)
-	if opts.entityType != "button" && opts.stateTopic != "" {
-		config["state_topic"] = opts.stateTopic
+	if opts.entityType != "button" {
+		config.StateTopic = opts.stateTopic
 	}
 
-	// value_template for sensors and binary sensors
-	if opts.template != "" && (opts.entityType == "sensor" || opts.entityType == "binary_sensor") {
-		config["value_template"] = opts.template
+	switch opts.entityType {
+	case "sensor":
+		config.ValueTemplate = opts.template
+
+	case "binary_sensor":
+		config.ValueTemplate = opts.template
+		config.PayloadOn = cmp.Or(opts.payloadOn, "ON")
+		config.PayloadOff = cmp.Or(opts.payloadOff, "OFF")
+
+	case "switch":
+		config.CommandTopic = opts.commandTopic
+		config.PayloadOn = cmp.Or(opts.payloadOn, "ON")
+		config.PayloadOff = cmp.Or(opts.payloadOff, "OFF")
+		config.ValueTemplate = opts.template
+		config.StateOn = opts.stateOn
+		config.StateOff = opts.stateOff
+		config.Optimistic = opts.optimistic
+
+	case "button":
+		config.CommandTopic = opts.commandTopic
+		config.PayloadPress = cmp.Or(opts.payloadPress, "PRESS")
+
+	case "event":
+		// HA fires an event each time a JSON payload containing "event_type"
+		// (one of event_types) arrives on the state topic.
+		config.EventTypes = opts.eventTypes
 	}
 
-	if opts.unit != "" {
-		config["unit_of_measurement"] = opts.unit
+	if err := c.publishDiscoveryConfig(discoveryTopic, &config); err != nil {
+		c.discoveryFailures.Add(1)
+		logger.Warning("MQTT: Failed to publish HA discovery for %s: %v", opts.id, err)
 	}
-	if opts.deviceClass != "" {
-		config["device_class"] = opts.deviceClass
+}
+
+// discoveryHashSeed seeds the digests kept in Client.discoveryPayloads.
+var discoveryHashSeed = maphash.MakeSeed()
+
+// publishDiscoveryConfig publishes a discovery config unless the exact same
+// payload was already published to the topic during this connection. Only a
+// 64-bit digest of each payload is retained, not the payload itself: a large
+// install has hundreds of entities, each with a config of several hundred
+// bytes, and the cache would otherwise hold a full copy of every one.
+// Without retain the broker keeps nothing for a Home Assistant that restarts
+// later, so every config is sent in that mode, as in publishItemState.
+func (c *Client) publishDiscoveryConfig(topic string, config *haDiscoveryConfig) error {
+	data, err := json.Marshal(config)
+	if err != nil {
+		c.msgErrors.Add(1)
+		return fmt.Errorf("failed to marshal JSON: %w", err)
 	}
-	if opts.stateClass != "" {
-		config["state_class"] = opts.stateClass
+	if !c.config.RetainMessages {
+		return c.publish(topic, data, false)
 	}
-	if opts.entityCategory != "" {
-		config["entity_category"] = opts.entityCategory
+	sum := maphash.Bytes(discoveryHashSeed, data)
+
+	c.discoveryMu.Lock()
+	prev, seen := c.discoveryPayloads[topic]
+	c.discoveryMu.Unlock()
+	if seen && prev == sum {
+		return nil
 	}
 
-	// binary_sensor payloads
-	if opts.entityType == "binary_sensor" {
-		on := opts.payloadOn
-		if on == "" {
-			on = "ON"
-		}
-		off := opts.payloadOff
-		if off == "" {
-			off = "OFF"
-		}
-		config["payload_on"] = on
-		config["payload_off"] = off
+	if err := c.publish(topic, data, c.config.RetainMessages); err != nil {
+		return err
 	}
 
-	// switch-specific config
-	if opts.entityType == "switch" {
-		config["command_topic"] = opts.commandTopic
-		on := opts.payloadOn
-		if on == "" {
-			on = "ON"
-		}
-		off := opts.payloadOff
-		if off == "" {
-			off = "OFF"
-		}
-		config["payload_on"] = on
-		config["payload_off"] = off
+	c.discoveryMu.Lock()
+	if c.discoveryPayloads == nil {
+		c.discoveryPayloads = make(map[string]uint64)
+	}
+	c.discoveryPayloads[topic] = sum
+	c.discoveryMu.Unlock()
+	return nil
+}
 
-		if opts.template != "" {
-			config["value_template"] = opts.template
-		}
-		if opts.stateOn != "" {
-			config["state_on"] = opts.stateOn
-		}
-		if opts.stateOff != "" {
-			config["state_off"] = opts.stateOff
-		}
-		if opts.optimistic {
-			config["optimistic"] = true
-		}
+// itemStateRefreshInterval bounds how long an unchanged per-item state
+// payload may go without being republished, so consumers that track "last
+// seen" still observe the item periodically.
+const itemStateRefreshInterval = 5 * time.Minute
+
+// itemStateMark is the digest and publish time of a per-item state payload.
+type itemStateMark struct {
+	sum uint64
+	at  time.Time
+}
+
+// publishItemState publishes a per-item state payload (one disk, container,
+// VM, ...) unless the identical payload was retained on the topic less than
+// itemStateRefreshInterval ago. On a mostly idle server nearly every item is
+// unchanged between polls, and each redundant publish costs a broker round
+// trip plus a Home Assistant state write for every entity bound to the topic.
+// Without retain a subscriber that joins later would see nothing until the
+// next change, so every payload is sent in that mode. now is the time of the
+// publish pass, taken once by the caller for the whole item list.
+func (c *Client) publishItemState(topic string, payload any, now time.Time) error {
+	if !c.config.RetainMessages {
+		return c.publishJSON(topic, payload)
 	}
 
-	// button-specific config
-	if opts.entityType == "button" {
-		config["command_topic"] = opts.commandTopic
-		press := opts.payloadPress
-		if press == "" {
-			press = "PRESS"
-		}
-		config["payload_press"] = press
+	data, err := json.Marshal(payload)
+	if err != nil {
+		c.msgErrors.Add(1)
+		return fmt.Errorf("failed to marshal JSON: %w", err)
 	}
+	sum := itemStateDigest(data)
 
-	// event-specific config — HA fires an event each time a JSON payload
-	// containing "event_type" (one of event_types) arrives on the state topic.
-	if opts.entityType == "event" {
-		config["event_types"] = opts.eventTypes
+	c.discoveryMu.Lock()
+	prev, seen := c.itemStates[topic]
+	c.discoveryMu.Unlock()
+	if seen && prev.sum == sum && now.Sub(prev.at) < itemStateRefreshInterval {
+		return nil
 	}
 
-	if err := c.publishJSON(discoveryTopic, config); err != nil {
-		logger.Warning("MQTT: Failed to publish HA discovery for %s: %v", opts.id, err)
+	if err := c.publish(topic, data, true); err != nil {
+		return err
 	}
-}
 
-// removeHAEntity removes a Home Assistant discovery entity by publishing empty payload.
-func (c *Client) removeHAEntity(entityType, id string) {
-	hostID := strings.ReplaceAll(c.hostname, " ", "_")
-	discoveryTopic := fmt.Sprintf("%s/%s/%s/%s/config",
-		c.config.HADiscoveryPrefix,
-		entityType,
-		hostID,
-		id,
-	)
+	c.discoveryMu.Lock()
+	// Topics of removed items are never deleted individually; starting over
+	// when the map outgrows any plausible install keeps it bounded.
+	if c.itemStates == nil || len(c.itemStates) >= maxItemTopics {
+		c.itemStates = make(map[string]itemStateMark)
+	}
+	c.itemStates[topic] = itemStateMark{sum: sum, at: now}
+	c.discoveryMu.Unlock()
+	return nil
+}
 
-	if err := c.publish(discoveryTopic, "", true); err != nil {
-		logger.Debug("MQTT: Failed to remove HA entity %s: %v", id, err)
+// timestampField is the JSON key of the collection time every DTO carries.
+var timestampField = []byte(`"timestamp":"`)
+
+// itemStateDigest hashes a per-item state payload with the values of its
+// "timestamp" fields left out. Collectors stamp every item with the poll
+// time, so without this the digest would differ on every poll and
+// publishItemState would never see an unchanged payload. The retained
+// payload still carries the timestamp of its last publish.
+func itemStateDigest(data []byte) uint64 {
+	var h maphash.Hash
+	h.SetSeed(discoveryHashSeed)
+	for {
+		i := bytes.Index(data, timestampField)
+		if i < 0 {
+			break
+		}
+		i += len(timestampField)
+		_, _ = h.Write(data[:i])
+		end := bytes.IndexByte(data[i:], '"')
+		if end < 0 {
+			data = nil
+			break
+		}
+		data = data[i+end:]
 	}
+	_, _ = h.Write(data)
+	return h.Sum64()
+}
+
+// forgetDiscoveryPayload drops the cached payload for a topic so the next
+// publish to it is always sent.
+func (c *Client) forgetDiscoveryPayload(topic string) {
+	c.discoveryMu.Lock()
+	delete(c.discoveryPayloads, topic)
+	c.discoveryMu.Unlock()
+}
+
+// forgetItemState drops the published-state mark for the item's state topic
+// so the next poll republishes it even if the payload is unchanged. Container
+// and VM power switches are optimistic; when a command fails or is ignored
+// the unchanged state is what corrects the switch in Home Assistant.
+func (c *Client) forgetItemState(category, id string) {
+	topic := c.topicBase + category + "/" + id
+	c.discoveryMu.Lock()
+	delete(c.itemStates, topic)
+	c.discoveryMu.Unlock()
 }
 
-// removeHAEntities removes HA discovery entities across all possible entity types.
-func (c *Client) removeHAEntities(id string) {
-	for _, t := range []string{"sensor", "binary_sensor", "switch", "button"} {
-		c.removeHAEntity(t, id)
+// resetDiscoveryPayloads clears the discovery and item state payload caches.
+func (c *Client) resetDiscoveryPayloads() {
+	c.discoveryMu.Lock()
+	c.discoveryPayloads = nil
+	c.itemStates = nil
+	c.discoveryMu.Unlock()
+	c.tracker.resetRefresh()
+}
+
+// removableEntityTypes are the entity types removeHAEntities clears per ID.
+var removableEntityTypes = [...]string{"sensor", "binary_sensor", "switch", "button"}
+
+// removeHAEntities removes HA discovery entities across all possible entity
+// types for every id. All empty payloads are handed to paho before any
+// acknowledgement is awaited, so removing a departed container's or disk's
+// entities costs about one broker round-trip instead of one per topic.
+func (c *Client) removeHAEntities(ids ...string) {
+	if len(ids) == 0 || c.client == nil || c.stopping.Load() {
+		return
+	}
+
+	type pending struct {
+		id, topic string
+		token     pahomqtt.Token
+	}
+	sent := make([]pending, 0, len(ids)*len(removableEntityTypes))
+	for _, id := range ids {
+		for _, t := range removableEntityTypes {
+			topic := c.discoveryTopic(t, id)
+			c.forgetDiscoveryPayload(topic)
+			sent = append(sent, pending{id, topic, c.client.Publish(topic, c.qos, true, []byte{})})
+		}
+	}
+	for _, p := range sent {
+		if err := c.awaitPublish(p.topic, p.token); err != nil {
+			logger.Debug("MQTT: Failed to remove HA entity %s: %v", p.id, err)
+		}
 	}
 }
 
 // publishHADiscovery publishes all Home Assistant MQTT Discovery configurations.
+//
+// The static sections are independent of each other and each one blocks on a
+// broker round-trip per entity, so they are fanned out concurrently and joined
+// before returning. Callers (handleConnect) still observe discovery as a single
+// step that completes before command topics are subscribed.
 func (c *Client) publishHADiscovery() {
 	logger.Info("MQTT: Publishing Home Assistant discovery configurations...")
 
-	c.publishSystemDiscovery()
-	c.publishArrayDiscovery()
-	c.publishUPSDiscovery()
-	c.publishNotificationDiscovery()
-	c.publishServiceDiscovery()
-	c.publishSystemControlDiscovery()
-	c.publishNUTDiscovery()
-	c.publishHardwareDiscovery()
-	c.publishRegistrationDiscovery()
-	c.publishZFSSnapshotDiscovery()
-	c.publishZFSARCDiscovery()
+	sections := []func(){
+		c.publishSystemDiscovery,
+		c.publishArrayDiscovery,
+		c.publishUPSDiscovery,
+		c.publishNotificationDiscovery,
+		c.publishServiceDiscovery,
+		c.publishSystemControlDiscovery,
+		c.publishNUTDiscovery,
+		c.publishHardwareDiscovery,
+		c.publishRegistrationDiscovery,
+		c.publishZFSSnapshotDiscovery,
+		c.publishZFSARCDiscovery,
+	}
+
+	var wg sync.WaitGroup
+	for _, section := range sections {
+		wg.Go(func() {
+			defer func() {
+				if r := recover(); r != nil {
+					logger.LogPanicWithStack("MQTT HA discovery section", r)
+				}
+			}()
+			section()
+		})
+	}
+	wg.Wait()
 
 	logger.Success("MQTT: Home Assistant discovery published")
 }
@@ -222,7 +478,7 @@ func (c *Client) publishHADiscovery() {
 
 // publishSystemDiscovery publishes HA discovery for system metrics.
 func (c *Client) publishSystemDiscovery() {
-	topic := c.buildTopic("system")
+	topic := c.topics.System
 
 	// CPU sensors
 	c.publishHAEntity(haEntityOpts{
@@ -387,14 +643,24 @@ func (c *Client) publishFanDiscovery(fans []dto.FanInfo) {
 		return
 	}
 
-	topic := c.buildTopic("system")
+	keys := make([]string, len(fans))
+	for i := range fans {
+		keys[i] = fans[i].Name
+	}
+	refresh, finish := c.beginDiscoveryRefresh("fans", keys, time.Now())
+	if !refresh {
+		return
+	}
+	defer finish()
+
+	topic := c.topics.System
 	var currentIDs []string
 
 	for _, fan := range fans {
 		fanID := "fan_" + sanitizeID(fan.Name)
 		c.publishHAEntity(haEntityOpts{
 			entityType: "sensor", stateTopic: topic,
-			id: fanID, name: fmt.Sprintf("System: %s", fan.Name), unit: "RPM",
+			id: fanID, name: "System: " + fan.Name, unit: "RPM",
 			icon:       "mdi:fan",
 			template:   fmt.Sprintf(`{{ (value_json.fans | selectattr('name', 'eq', '%s') | map(attribute='rpm') | first | default(0)) }}`, fan.Name),
 			stateClass: "measurement",
@@ -403,9 +669,7 @@ func (c *Client) publishFanDiscovery(fans []dto.FanInfo) {
 	}
 
 	removed := c.tracker.update("fans", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
-	}
+	c.removeHAEntities(removed...)
 }
 
 // ──────────────────────────────────────────────────────────────────────────────
@@ -414,7 +678,7 @@ func (c *Client) publishFanDiscovery(fans []dto.FanInfo) {
 
 // publishArrayDiscovery publishes HA discovery for array metrics.
 func (c *Client) publishArrayDiscovery() {
-	topic := c.buildTopic("array")
+	topic := c.topics.Array
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
@@ -513,7 +777,7 @@ func (c *Client) publishArrayDiscovery() {
 
 // publishUPSDiscovery publishes HA discovery for UPS metrics.
 func (c *Client) publishUPSDiscovery() {
-	topic := c.buildTopic("ups")
+	topic := c.topics.UPS
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
@@ -564,7 +828,7 @@ func (c *Client) publishUPSDiscovery() {
 
 // publishNotificationDiscovery publishes HA discovery for notification counts.
 func (c *Client) publishNotificationDiscovery() {
-	topic := c.buildTopic("notifications")
+	topic := c.topics.Notification
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
@@ -603,7 +867,7 @@ func (c *Client) publishNotificationDiscovery() {
 	// notification, carrying its title/subject/description/importance as
 	// event attributes so automations can react to individual notifications.
 	c.publishHAEntity(haEntityOpts{
-		entityType: "event", stateTopic: c.buildTopic("notifications/event"),
+		entityType: "event", stateTopic: c.topics.NotificationEvent,
 		id: "notif_event", name: "Notifications: Event",
 		icon:       "mdi:bell-ring",
 		eventTypes: []string{"alert", "warning", "info"},
@@ -617,7 +881,7 @@ func (c *Client) publishNotificationDiscovery() {
 // publishServiceDiscovery publishes HA discovery for service switches.
 func (c *Client) publishServiceDiscovery() {
 	services := controllers.ValidServiceNames()
-	servicesTopic := c.buildTopic("services")
+	servicesTopic := c.servicesTopic
 
 	for _, svc := range services {
 		svcID := sanitizeID(svc)
@@ -627,10 +891,10 @@ func (c *Client) publishServiceDiscovery() {
 			entityType:   "switch",
 			stateTopic:   servicesTopic,
 			commandTopic: c.buildCommandTopic("service", svcID, "set"),
-			id:           fmt.Sprintf("service_%s_switch", svcID),
-			name:         fmt.Sprintf("Service: %s", displayName),
+			id:           "service_" + svcID + "_switch",
+			name:         "Service: " + displayName,
 			icon:         serviceIcon(svc),
-			template:     fmt.Sprintf("{{ 'ON' if value_json.%s else 'OFF' }}", svc),
+			template:     "{{ 'ON' if value_json." + svc + " else 'OFF' }}",
 		})
 	}
 }
@@ -651,15 +915,99 @@ func (c *Client) publishServiceStates() {
 		states[svc] = running
 	}
 
-	topic := c.buildTopic("services")
+	c.serviceStatesMu.Lock()
+	c.serviceStates = states
+	c.serviceStatesMu.Unlock()
+
+	c.publishServiceStatesPayload(states)
+}
+
+// serviceStateRefreshDelay is how long a switch-triggered service state
+// refresh waits for further switch commands before publishing, so a burst of
+// toggles (a script or automation flipping several services) results in a
+// single services-topic publish.
+const serviceStateRefreshDelay = 50 * time.Millisecond
+
+// scheduleServiceStateRefresh queues svc for a state refresh after a switch
+// command. The first call in a window starts one background refresh; calls
+// until it runs only add their service to the pending set.
+func (c *Client) scheduleServiceStateRefresh(svc string) {
+	c.serviceRefreshMu.Lock()
+	defer c.serviceRefreshMu.Unlock()
+
+	if !slices.Contains(c.serviceRefreshPending, svc) {
+		c.serviceRefreshPending = append(c.serviceRefreshPending, svc)
+	}
+	if c.serviceRefreshScheduled {
+		return
+	}
+	c.serviceRefreshScheduled = true
+	c.goBackground("MQTT service state refresh", func() {
+		time.Sleep(serviceStateRefreshDelay)
+		c.serviceRefreshMu.Lock()
+		pending := c.serviceRefreshPending
+		c.serviceRefreshPending = nil
+		c.serviceRefreshScheduled = false
+		c.serviceRefreshMu.Unlock()
+		c.publishServiceState(pending...)
+	})
+}
+
+// publishServiceState refreshes the running state of the given services after
+// switch commands and republishes the services topic once. Only the toggled
+// services' rc scripts are queried; the other entries come from the last full
+// snapshot. Falls back to a full refresh when no snapshot exists yet or a name
+// is an alias rather than one of the canonical names published on the topic.
+func (c *Client) publishServiceState(svcs ...string) {
+	c.serviceStatesMu.Lock()
+	seeded := c.serviceStates != nil
+	c.serviceStatesMu.Unlock()
+	valid := controllers.ValidServiceNames()
+	if !seeded || slices.ContainsFunc(svcs, func(svc string) bool { return !slices.Contains(valid, svc) }) {
+		c.publishServiceStates()
+		return
+	}
+
+	ctrl := controllers.NewServiceController()
+	var states map[string]bool
+	for _, svc := range svcs {
+		running, err := ctrl.GetServiceStatus(svc)
+		if err != nil {
+			logger.Debug("MQTT: Failed to check service %s status: %v", svc, err)
+			continue
+		}
+		states = c.updateServiceState(svc, running)
+	}
+	if states != nil {
+		c.publishServiceStatesPayload(states)
+	}
+}
+
+// updateServiceState records one service's state and returns a fresh copy of
+// the full state map for publishing. The previous map is never mutated.
+func (c *Client) updateServiceState(svc string, running bool) map[string]bool {
+	c.serviceStatesMu.Lock()
+	defer c.serviceStatesMu.Unlock()
+
+	next := make(map[string]bool, len(c.serviceStates)+1)
+	maps.Copy(next, c.serviceStates)
+	next[svc] = running
+	c.serviceStates = next
+	return next
+}
+
+// publishServiceStatesPayload publishes a service state map to the services topic.
+func (c *Client) publishServiceStatesPayload(states map[string]bool) {
+	topic := c.servicesTopic
 	if err := c.publishJSON(topic, states); err != nil {
 		logger.Warning("MQTT: Failed to publish service states: %v", err)
 	}
 }
 
-// serviceDisplayName returns a human-friendly display name for a service.
-func serviceDisplayName(svc string) string {
-	names := map[string]string{
+// serviceDisplayNames and serviceIcons hold the HA display name and MDI icon
+// of each controllable service.
+var (
+	serviceDisplayNames = map[string]string{
 		"docker":    "Docker",
 		"libvirt":   "Libvirt",
 		"smb":       "Samba (SMB)",
@@ -672,15 +1020,8 @@ func serviceDisplayName(svc string) string {
 		"avahi":     "Avahi",
 		"wireguard": "WireGuard",
 	}
-	if name, ok := names[svc]; ok {
-		return name
-	}
-	return svc
-}
 
-// serviceIcon returns an MDI icon for a service.
-func serviceIcon(svc string) string {
-	icons := map[string]string{
+	serviceIcons = map[string]string{
 		"docker":    "mdi:docker",
 		"libvirt":   "mdi:desktop-classic",
 		"smb":       "mdi:folder-network",
@@ -693,7 +1034,19 @@ func serviceIcon(svc string) string {
 		"avahi":     "mdi:access-point",
 		"wireguard": "mdi:vpn",
 	}
-	if icon, ok := icons[svc]; ok {
+)
+
+// serviceDisplayName returns a human-friendly display name for a service.
+func serviceDisplayName(svc string) string {
+	if name, ok := serviceDisplayNames[svc]; ok {
+		return name
+	}
+	return svc
+}
+
+// serviceIcon returns an MDI icon for a service.
+func serviceIcon(svc string) string {
+	if icon, ok := serviceIcons[svc]; ok {
 		return icon
 	}
 	return "mdi:cog"
@@ -730,34 +1083,46 @@ func (c *Client) publishDiskDiscovery(disks []dto.DiskInfo) {
 		return
 	}
 
+	keys := make([]string, len(disks))
+	for i := range disks {
+		keys[i] = disks[i].ID + "=" + disks[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("disks", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
-	for _, disk := range disks {
+	for i := range disks {
+		disk := &disks[i]
 		if disk.ID == "" {
 			continue
 		}
-		diskID := sanitizeID(disk.ID)
-		diskTopic := c.buildTopic(fmt.Sprintf("disk/%s", diskID))
+		diskID, diskTopic := c.itemTopic("disk", disk.ID)
 
-		if err := c.publishJSON(diskTopic, disk); err != nil {
+		if err := c.publishItemState(diskTopic, disk, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish disk %s: %v", diskID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("disk_%s", diskID)
+		prefix := "disk_" + diskID
 		displayName := disk.Name
 		if displayName == "" {
 			displayName = disk.ID
 		}
 
 		ids := c.publishDiskEntities(diskTopic, prefix, displayName, diskID)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(disks))
 	}
 
-	removed := c.tracker.update("disks", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("disks", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishDiskEntities publishes HA discovery entities for a single disk.
@@ -779,59 +1144,59 @@ func (c *Client) publishDiskEntities(topic, prefix, displayName, diskID string)
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_temp", name: fmt.Sprintf("Disk: %s Temperature", displayName), unit: "°C",
+		id: prefix + "_temp", name: "Disk: " + displayName + " Temperature", unit: "°C",
 		icon: "mdi:thermometer", template: "{{ value_json.temperature_celsius }}",
 		deviceClass: "temperature", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_status", name: fmt.Sprintf("Disk: %s Status", displayName),
+		id: prefix + "_status", name: "Disk: " + displayName + " Status",
 		icon: "mdi:harddisk", template: "{{ value_json.status }}",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_smart_status", name: fmt.Sprintf("Disk: %s SMART Status", displayName),
+		id: prefix + "_smart_status", name: "Disk: " + displayName + " SMART Status",
 		icon: "mdi:harddisk", template: "{{ value_json.smart_status }}",
 		entityCategory: "diagnostic",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_usage", name: fmt.Sprintf("Disk: %s Usage", displayName), unit: "%",
+		id: prefix + "_usage", name: "Disk: " + displayName + " Usage", unit: "%",
 		icon: "mdi:chart-pie", template: "{{ value_json.usage_percent | default(0) | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_used", name: fmt.Sprintf("Disk: %s Used", displayName), unit: "B",
+		id: prefix + "_used", name: "Disk: " + displayName + " Used", unit: "B",
 		icon: "mdi:harddisk", template: "{{ value_json.used_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_free", name: fmt.Sprintf("Disk: %s Free", displayName), unit: "B",
+		id: prefix + "_free", name: "Disk: " + displayName + " Free", unit: "B",
 		icon: "mdi:harddisk", template: "{{ value_json.free_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_spin_state", name: fmt.Sprintf("Disk: %s Spin State", displayName),
+		id: prefix + "_spin_state", name: "Disk: " + displayName + " Spin State",
 		icon: "mdi:rotate-3d-variant", template: "{{ value_json.spin_state | default('unknown') }}",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_power_hours", name: fmt.Sprintf("Disk: %s Power On Hours", displayName), unit: "h",
+		id: prefix + "_power_hours", name: "Disk: " + displayName + " Power On Hours", unit: "h",
 		icon: "mdi:clock-outline", template: "{{ value_json.power_on_hours | default(0) }}",
 		deviceClass: "duration", stateClass: "total_increasing",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_io_util", name: fmt.Sprintf("Disk: %s I/O Utilization", displayName), unit: "%",
+		id: prefix + "_io_util", name: "Disk: " + displayName + " I/O Utilization", unit: "%",
 		icon: "mdi:speedometer", template: "{{ value_json.io_utilization_percent | default(0) | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_healthy", name: fmt.Sprintf("Disk: %s Healthy", displayName),
+		id: prefix + "_healthy", name: "Disk: " + displayName + " Healthy",
 		icon: "mdi:check-circle", template: "{{ 'ON' if value_json.smart_status == 'PASSED' else 'OFF' }}",
 		deviceClass: "safety",
 	})
@@ -840,13 +1205,13 @@ func (c *Client) publishDiskEntities(topic, prefix, displayName, diskID string)
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("disk", diskID, "spin_up"),
-		id:           prefix + "_spin_up", name: fmt.Sprintf("Disk: %s Spin Up", displayName),
+		id:           prefix + "_spin_up", name: "Disk: " + displayName + " Spin Up",
 		icon: "mdi:rotate-right",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("disk", diskID, "spin_down"),
-		id:           prefix + "_spin_down", name: fmt.Sprintf("Disk: %s Spin Down", displayName),
+		id:           prefix + "_spin_down", name: "Disk: " + displayName + " Spin Down",
 		icon: "mdi:stop-circle",
 	})
 
@@ -863,42 +1228,56 @@ func (c *Client) publishContainerDiscovery(containers []dto.ContainerInfo) {
 		return
 	}
 
+	keys := make([]string, len(containers))
+	for i := range containers {
+		keys[i] = containers[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("containers", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
-	containersTopic := c.buildTopic("docker/containers")
-	c.publishHAEntity(haEntityOpts{
-		entityType: "sensor", stateTopic: containersTopic,
-		id: "docker_total", name: "Docker: Total Containers",
-		icon: "mdi:docker", template: "{{ value_json | length }}",
-		stateClass: "measurement",
-	})
-	c.publishHAEntity(haEntityOpts{
-		entityType: "sensor", stateTopic: containersTopic,
-		id: "docker_running", name: "Docker: Running Containers",
-		icon: "mdi:docker", template: "{{ value_json | selectattr('state', 'eq', 'running') | list | length }}",
-		stateClass: "measurement",
-	})
-	currentIDs = append(currentIDs, "docker_total", "docker_running")
+	containersTopic := c.topics.Containers
+	if refresh {
+		c.publishHAEntity(haEntityOpts{
+			entityType: "sensor", stateTopic: containersTopic,
+			id: "docker_total", name: "Docker: Total Containers",
+			icon: "mdi:docker", template: "{{ value_json | length }}",
+			stateClass: "measurement",
+		})
+		c.publishHAEntity(haEntityOpts{
+			entityType: "sensor", stateTopic: containersTopic,
+			id: "docker_running", name: "Docker: Running Containers",
+			icon: "mdi:docker", template: "{{ value_json | selectattr('state', 'eq', 'running') | list | length }}",
+			stateClass: "measurement",
+		})
+		currentIDs = append(currentIDs, "docker_total", "docker_running")
+	}
 
-	for _, container := range containers {
-		nameID := sanitizeID(container.Name)
-		containerTopic := c.buildTopic(fmt.Sprintf("docker/%s", nameID))
+	for i := range containers {
+		container := &containers[i]
+		nameID, containerTopic := c.itemTopic("docker", container.Name)
 
-		if err := c.publishJSON(containerTopic, container); err != nil {
+		if err := c.publishItemState(containerTopic, container, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish container %s: %v", nameID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("container_%s", nameID)
+		prefix := "container_" + nameID
 
 		ids := c.publishContainerEntities(containerTopic, prefix, container.Name, nameID)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(containers))
 	}
 
-	removed := c.tracker.update("containers", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("containers", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishContainerEntities publishes HA discovery entities for a single container.
@@ -918,38 +1297,38 @@ func (c *Client) publishContainerEntities(topic, prefix, displayName, nameID str
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_state", name: fmt.Sprintf("Docker: %s Running", displayName),
+		id: prefix + "_state", name: "Docker: " + displayName + " Running",
 		icon: "mdi:docker", template: "{{ 'ON' if value_json.state == 'running' else 'OFF' }}",
 		deviceClass: "running",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_cpu", name: fmt.Sprintf("Docker: %s CPU", displayName), unit: "%",
+		id: prefix + "_cpu", name: "Docker: " + displayName + " CPU", unit: "%",
 		icon: "mdi:cpu-64-bit", template: "{{ value_json.cpu_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_memory", name: fmt.Sprintf("Docker: %s Memory", displayName), unit: "B",
+		id: prefix + "_memory", name: "Docker: " + displayName + " Memory", unit: "B",
 		icon: "mdi:memory", template: "{{ value_json.memory_usage_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_net_rx", name: fmt.Sprintf("Docker: %s Network RX", displayName), unit: "B",
+		id: prefix + "_net_rx", name: "Docker: " + displayName + " Network RX", unit: "B",
 		icon: "mdi:download", template: "{{ value_json.network_rx_bytes }}",
 		deviceClass: "data_size", stateClass: "total_increasing",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_net_tx", name: fmt.Sprintf("Docker: %s Network TX", displayName), unit: "B",
+		id: prefix + "_net_tx", name: "Docker: " + displayName + " Network TX", unit: "B",
 		icon: "mdi:upload", template: "{{ value_json.network_tx_bytes }}",
 		deviceClass: "data_size", stateClass: "total_increasing",
 	})
 	// MAC address (Docker 29 / Unraid 7.3 fixed-MAC support)
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_mac", name: fmt.Sprintf("Docker: %s MAC Address", displayName),
+		id: prefix + "_mac", name: "Docker: " + displayName + " MAC Address",
 		icon:           "mdi:ethernet",
 		template:       "{{ value_json.mac_address | default('') }}",
 		entityCategory: "diagnostic",
@@ -959,29 +1338,33 @@ func (c *Client) publishContainerEntities(topic, prefix, displayName, nameID str
 	c.publishHAEntity(haEntityOpts{
 		entityType: "switch", stateTopic: topic,
 		commandTopic: c.buildCommandTopic("docker", nameID, "set"),
-		id:           prefix + "_switch", name: fmt.Sprintf("Docker: %s Power", displayName),
+		id:           prefix + "_switch", name: "Docker: " + displayName + " Power",
 		icon: "mdi:docker", template: "{{ value_json.state }}",
 		stateOn: "running", stateOff: "exited",
+		// Flip the switch as soon as the command is sent; the next state
+		// publish confirms or corrects it, instead of the toggle appearing
+		// stuck until the following collection.
+		optimistic: true,
 	})
 
 	// Action buttons
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("docker", nameID, "restart"),
-		id:           prefix + "_restart", name: fmt.Sprintf("Docker: %s Restart", displayName),
+		id:           prefix + "_restart", name: "Docker: " + displayName + " Restart",
 		icon:        "mdi:restart",
 		deviceClass: "restart",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("docker", nameID, "pause"),
-		id:           prefix + "_pause", name: fmt.Sprintf("Docker: %s Pause", displayName),
+		id:           prefix + "_pause", name: "Docker: " + displayName + " Pause",
 		icon: "mdi:pause-circle",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("docker", nameID, "unpause"),
-		id:           prefix + "_unpause", name: fmt.Sprintf("Docker: %s Unpause", displayName),
+		id:           prefix + "_unpause", name: "Docker: " + displayName + " Unpause",
 		icon: "mdi:play-circle",
 	})
 
@@ -998,42 +1381,56 @@ func (c *Client) publishVMDiscovery(vms []dto.VMInfo) {
 		return
 	}
 
+	keys := make([]string, len(vms))
+	for i := range vms {
+		keys[i] = vms[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("vms", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
-	vmsTopic := c.buildTopic("vm/list")
-	c.publishHAEntity(haEntityOpts{
-		entityType: "sensor", stateTopic: vmsTopic,
-		id: "vm_total", name: "VM: Total",
-		icon: "mdi:desktop-classic", template: "{{ value_json | length }}",
-		stateClass: "measurement",
-	})
-	c.publishHAEntity(haEntityOpts{
-		entityType: "sensor", stateTopic: vmsTopic,
-		id: "vm_running", name: "VM: Running",
-		icon: "mdi:desktop-classic", template: "{{ value_json | selectattr('state', 'eq', 'running') | list | length }}",
-		stateClass: "measurement",
-	})
-	currentIDs = append(currentIDs, "vm_total", "vm_running")
+	vmsTopic := c.topics.VMs
+	if refresh {
+		c.publishHAEntity(haEntityOpts{
+			entityType: "sensor", stateTopic: vmsTopic,
+			id: "vm_total", name: "VM: Total",
+			icon: "mdi:desktop-classic", template: "{{ value_json | length }}",
+			stateClass: "measurement",
+		})
+		c.publishHAEntity(haEntityOpts{
+			entityType: "sensor", stateTopic: vmsTopic,
+			id: "vm_running", name: "VM: Running",
+			icon: "mdi:desktop-classic", template: "{{ value_json | selectattr('state', 'eq', 'running') | list | length }}",
+			stateClass: "measurement",
+		})
+		currentIDs = append(currentIDs, "vm_total", "vm_running")
+	}
 
-	for _, vm := range vms {
-		nameID := sanitizeID(vm.Name)
-		vmTopic := c.buildTopic(fmt.Sprintf("vm/%s", nameID))
+	for i := range vms {
+		vm := &vms[i]
+		nameID, vmTopic := c.itemTopic("vm", vm.Name)
 
-		if err := c.publishJSON(vmTopic, vm); err != nil {
+		if err := c.publishItemState(vmTopic, vm, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish VM %s: %v", nameID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("vm_%s", nameID)
+		prefix := "vm_" + nameID
 
 		ids := c.publishVMEntities(vmTopic, prefix, vm.Name, nameID)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(vms))
 	}
 
-	removed := c.tracker.update("vms", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("vms", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishVMEntities publishes HA discovery entities for a single VM.
@@ -1054,31 +1451,31 @@ func (c *Client) publishVMEntities(topic, prefix, displayName, nameID string) []
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_state", name: fmt.Sprintf("VM: %s Running", displayName),
+		id: prefix + "_state", name: "VM: " + displayName + " Running",
 		icon: "mdi:desktop-classic", template: "{{ 'ON' if value_json.state == 'running' else 'OFF' }}",
 		deviceClass: "running",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_guest_cpu", name: fmt.Sprintf("VM: %s Guest CPU", displayName), unit: "%",
+		id: prefix + "_guest_cpu", name: "VM: " + displayName + " Guest CPU", unit: "%",
 		icon: "mdi:cpu-64-bit", template: "{{ value_json.guest_cpu_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_host_cpu", name: fmt.Sprintf("VM: %s Host CPU", displayName), unit: "%",
+		id: prefix + "_host_cpu", name: "VM: " + displayName + " Host CPU", unit: "%",
 		icon: "mdi:cpu-64-bit", template: "{{ value_json.host_cpu_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_memory_used", name: fmt.Sprintf("VM: %s Memory Used", displayName), unit: "B",
+		id: prefix + "_memory_used", name: "VM: " + displayName + " Memory Used", unit: "B",
 		icon: "mdi:memory", template: "{{ value_json.memory_used_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_memory_allocated", name: fmt.Sprintf("VM: %s Memory Allocated", displayName), unit: "B",
+		id: prefix + "_memory_allocated", name: "VM: " + displayName + " Memory Allocated", unit: "B",
 		icon: "mdi:memory", template: "{{ value_json.memory_allocated_bytes }}",
 		deviceClass: "data_size", entityCategory: "diagnostic",
 	})
@@ -1087,41 +1484,45 @@ func (c *Client) publishVMEntities(topic, prefix, displayName, nameID string) []
 	c.publishHAEntity(haEntityOpts{
 		entityType: "switch", stateTopic: topic,
 		commandTopic: c.buildCommandTopic("vm", nameID, "set"),
-		id:           prefix + "_switch", name: fmt.Sprintf("VM: %s Power", displayName),
+		id:           prefix + "_switch", name: "VM: " + displayName + " Power",
 		icon: "mdi:desktop-classic", template: "{{ value_json.state }}",
 		stateOn: "running", stateOff: "shut off",
+		// Flip the switch as soon as the command is sent; the next state
+		// publish confirms or corrects it, instead of the toggle appearing
+		// stuck until the following collection.
+		optimistic: true,
 	})
 
 	// Action buttons
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("vm", nameID, "restart"),
-		id:           prefix + "_restart", name: fmt.Sprintf("VM: %s Restart", displayName),
+		id:           prefix + "_restart", name: "VM: " + displayName + " Restart",
 		icon:        "mdi:restart",
 		deviceClass: "restart",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("vm", nameID, "pause"),
-		id:           prefix + "_pause", name: fmt.Sprintf("VM: %s Pause", displayName),
+		id:           prefix + "_pause", name: "VM: " + displayName + " Pause",
 		icon: "mdi:pause-circle",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("vm", nameID, "resume"),
-		id:           prefix + "_resume", name: fmt.Sprintf("VM: %s Resume", displayName),
+		id:           prefix + "_resume", name: "VM: " + displayName + " Resume",
 		icon: "mdi:play-circle",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("vm", nameID, "hibernate"),
-		id:           prefix + "_hibernate", name: fmt.Sprintf("VM: %s Hibernate", displayName),
+		id:           prefix + "_hibernate", name: "VM: " + displayName + " Hibernate",
 		icon: "mdi:power-sleep",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType:   "button",
 		commandTopic: c.buildCommandTopic("vm", nameID, "force_stop"),
-		id:           prefix + "_force_stop", name: fmt.Sprintf("VM: %s Force Stop", displayName),
+		id:           prefix + "_force_stop", name: "VM: " + displayName + " Force Stop",
 		icon: "mdi:power-off",
 	})
 
@@ -1138,38 +1539,52 @@ func (c *Client) publishGPUDiscovery(gpus []*dto.GPUMetrics) {
 		return
 	}
 
+	keys := make([]string, 0, len(gpus))
+	for _, gpu := range gpus {
+		if gpu != nil && gpu.Available {
+			keys = append(keys, strconv.Itoa(gpu.Index)+"="+gpu.Name)
+		}
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("gpus", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
 	for _, gpu := range gpus {
 		if gpu == nil || !gpu.Available {
 			continue
 		}
-		gpuID := sanitizeID(fmt.Sprintf("%d", gpu.Index))
-		gpuTopic := c.buildTopic(fmt.Sprintf("gpu/%s", gpuID))
+		gpuID, gpuTopic := c.itemTopic("gpu", strconv.Itoa(gpu.Index))
 
-		if err := c.publishJSON(gpuTopic, gpu); err != nil {
+		if err := c.publishItemState(gpuTopic, gpu, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish GPU %s: %v", gpuID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("gpu_%s", gpuID)
+		prefix := "gpu_" + gpuID
 		displayName := gpu.Name
 		if displayName == "" {
 			displayName = fmt.Sprintf("GPU %d", gpu.Index)
 		}
 
 		ids := c.publishGPUEntities(gpuTopic, prefix, displayName)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(gpus))
 	}
 
-	removed := c.tracker.update("gpus", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("gpus", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishGPUEntities publishes HA discovery entities for a single GPU.
 func (c *Client) publishGPUEntities(topic, prefix, displayName string) []string {
+	// Build each entity ID once and reuse it for the discovery config.
 	ids := []string{
 		prefix + "_temp",
 		prefix + "_util",
@@ -1181,37 +1596,37 @@ func (c *Client) publishGPUEntities(topic, prefix, displayName string) []string
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_temp", name: fmt.Sprintf("GPU: %s Temperature", displayName), unit: "°C",
+		id: ids[0], name: "GPU: " + displayName + " Temperature", unit: "°C",
 		icon: "mdi:thermometer", template: "{{ value_json.temperature_celsius }}",
 		deviceClass: "temperature", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_util", name: fmt.Sprintf("GPU: %s Utilization", displayName), unit: "%",
+		id: ids[1], name: "GPU: " + displayName + " Utilization", unit: "%",
 		icon: "mdi:expansion-card", template: "{{ value_json.utilization_gpu_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_mem_util", name: fmt.Sprintf("GPU: %s Memory Utilization", displayName), unit: "%",
+		id: ids[2], name: "GPU: " + displayName + " Memory Utilization", unit: "%",
 		icon: "mdi:expansion-card", template: "{{ value_json.utilization_memory_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_mem_used", name: fmt.Sprintf("GPU: %s Memory Used", displayName), unit: "B",
+		id: ids[3], name: "GPU: " + displayName + " Memory Used", unit: "B",
 		icon: "mdi:memory", template: "{{ value_json.memory_used_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_power", name: fmt.Sprintf("GPU: %s Power Draw", displayName), unit: "W",
+		id: ids[4], name: "GPU: " + displayName + " Power Draw", unit: "W",
 		icon: "mdi:lightning-bolt", template: "{{ value_json.power_draw_watts | round(1) }}",
 		deviceClass: "power", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_fan", name: fmt.Sprintf("GPU: %s Fan Speed", displayName), unit: "%",
+		id: ids[5], name: "GPU: " + displayName + " Fan Speed", unit: "%",
 		icon: "mdi:fan", template: "{{ value_json.fan_speed_percent | default(0) | round(0) }}",
 		stateClass: "measurement",
 	})
@@ -1256,32 +1671,44 @@ func (c *Client) publishNetworkDiscovery(interfaces []dto.NetworkInfo) {
 		return
 	}
 
+	keys := make([]string, len(interfaces))
+	for i := range interfaces {
+		keys[i] = interfaces[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("network", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
-	for _, iface := range interfaces {
+	for i := range interfaces {
+		iface := &interfaces[i]
 		if !isPhysicalInterface(iface.Name) {
 			continue
 		}
 
-		ifaceID := sanitizeID(iface.Name)
-		ifaceTopic := c.buildTopic(fmt.Sprintf("network/%s", ifaceID))
+		ifaceID, ifaceTopic := c.itemTopic("network", iface.Name)
 
-		if err := c.publishJSON(ifaceTopic, iface); err != nil {
+		if err := c.publishItemState(ifaceTopic, iface, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish network %s: %v", ifaceID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("net_%s", ifaceID)
+		prefix := "net_" + ifaceID
 		displayName := iface.Name
 
 		ids := c.publishNetworkEntities(ifaceTopic, prefix, displayName)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(interfaces))
 	}
 
-	removed := c.tracker.update("network", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("network", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishNetworkEntities publishes HA discovery entities for a single network interface.
@@ -1297,37 +1724,37 @@ func (c *Client) publishNetworkEntities(topic, prefix, displayName string) []str
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_state", name: fmt.Sprintf("Network: %s Link", displayName),
+		id: prefix + "_state", name: "Network: " + displayName + " Link",
 		icon: "mdi:ethernet", template: "{{ 'ON' if value_json.state == 'up' else 'OFF' }}",
 		deviceClass: "connectivity",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_speed", name: fmt.Sprintf("Network: %s Speed", displayName), unit: "Mbit/s",
+		id: prefix + "_speed", name: "Network: " + displayName + " Speed", unit: "Mbit/s",
 		icon: "mdi:speedometer", template: "{{ value_json.speed_mbps }}",
 		entityCategory: "diagnostic",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_rx", name: fmt.Sprintf("Network: %s Throughput In", displayName), unit: "B/s",
+		id: prefix + "_rx", name: "Network: " + displayName + " Throughput In", unit: "B/s",
 		icon: "mdi:download", template: "{{ value_json.rx_bytes_per_sec | round(1) }}",
 		deviceClass: "data_rate", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_tx", name: fmt.Sprintf("Network: %s Throughput Out", displayName), unit: "B/s",
+		id: prefix + "_tx", name: "Network: " + displayName + " Throughput Out", unit: "B/s",
 		icon: "mdi:upload", template: "{{ value_json.tx_bytes_per_sec | round(1) }}",
 		deviceClass: "data_rate", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_errors_rx", name: fmt.Sprintf("Network: %s RX Errors", displayName),
+		id: prefix + "_errors_rx", name: "Network: " + displayName + " RX Errors",
 		icon: "mdi:alert-circle", template: "{{ value_json.errors_received }}",
 		stateClass: "total_increasing", entityCategory: "diagnostic",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_errors_tx", name: fmt.Sprintf("Network: %s TX Errors", displayName),
+		id: prefix + "_errors_tx", name: "Network: " + displayName + " TX Errors",
 		icon: "mdi:alert-circle", template: "{{ value_json.errors_sent }}",
 		stateClass: "total_increasing", entityCategory: "diagnostic",
 	})
@@ -1345,28 +1772,40 @@ func (c *Client) publishShareDiscovery(shares []dto.ShareInfo) {
 		return
 	}
 
+	keys := make([]string, len(shares))
+	for i := range shares {
+		keys[i] = shares[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("shares", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
-	for _, share := range shares {
-		shareID := sanitizeID(share.Name)
-		shareTopic := c.buildTopic(fmt.Sprintf("shares/%s", shareID))
+	for i := range shares {
+		share := &shares[i]
+		shareID, shareTopic := c.itemTopic("shares", share.Name)
 
-		if err := c.publishJSON(shareTopic, share); err != nil {
+		if err := c.publishItemState(shareTopic, share, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish share %s: %v", shareID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("share_%s", shareID)
+		prefix := "share_" + shareID
 		displayName := share.Name
 
 		ids := c.publishShareEntities(shareTopic, prefix, displayName)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(shares))
 	}
 
-	removed := c.tracker.update("shares", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("shares", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishShareEntities publishes HA discovery entities for a single share.
@@ -1379,19 +1818,19 @@ func (c *Client) publishShareEntities(topic, prefix, displayName string) []strin
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_usage", name: fmt.Sprintf("Share: %s Usage", displayName), unit: "%",
+		id: prefix + "_usage", name: "Share: " + displayName + " Usage", unit: "%",
 		icon: "mdi:folder", template: "{{ value_json.usage_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_used", name: fmt.Sprintf("Share: %s Used", displayName), unit: "B",
+		id: prefix + "_used", name: "Share: " + displayName + " Used", unit: "B",
 		icon: "mdi:folder", template: "{{ value_json.used_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_free", name: fmt.Sprintf("Share: %s Free", displayName), unit: "B",
+		id: prefix + "_free", name: "Share: " + displayName + " Free", unit: "B",
 		icon: "mdi:folder", template: "{{ value_json.free_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
@@ -1409,28 +1848,40 @@ func (c *Client) publishZFSDiscovery(pools []dto.ZFSPool) {
 		return
 	}
 
+	keys := make([]string, len(pools))
+	for i := range pools {
+		keys[i] = pools[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("zfs", keys, now)
+	defer finish()
+
 	var currentIDs []string
 
-	for _, pool := range pools {
-		poolID := sanitizeID(pool.Name)
-		poolTopic := c.buildTopic(fmt.Sprintf("zfs/%s", poolID))
+	for i := range pools {
+		pool := &pools[i]
+		poolID, poolTopic := c.itemTopic("zfs", pool.Name)
 
-		if err := c.publishJSON(poolTopic, pool); err != nil {
+		if err := c.publishItemState(poolTopic, pool, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish ZFS pool %s: %v", poolID, err)
+		}
+		if !refresh {
 			continue
 		}
 
-		prefix := fmt.Sprintf("zfs_%s", poolID)
+		prefix := "zfs_" + poolID
 		displayName := pool.Name
 
 		ids := c.publishZFSEntities(poolTopic, prefix, displayName)
-		currentIDs = append(currentIDs, ids...)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(pools))
 	}
 
-	removed := c.tracker.update("zfs", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("zfs", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishZFSEntities publishes HA discovery entities for a single ZFS pool.
@@ -1447,44 +1898,44 @@ func (c *Client) publishZFSEntities(topic, prefix, displayName string) []string
 
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_health", name: fmt.Sprintf("ZFS: %s Health", displayName),
+		id: prefix + "_health", name: "ZFS: " + displayName + " Health",
 		icon: "mdi:database", template: "{{ value_json.health }}",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_capacity", name: fmt.Sprintf("ZFS: %s Usage", displayName), unit: "%",
+		id: prefix + "_capacity", name: "ZFS: " + displayName + " Usage", unit: "%",
 		icon: "mdi:database", template: "{{ value_json.capacity_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_free", name: fmt.Sprintf("ZFS: %s Free", displayName), unit: "B",
+		id: prefix + "_free", name: "ZFS: " + displayName + " Free", unit: "B",
 		icon: "mdi:database", template: "{{ value_json.free_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_fragmentation", name: fmt.Sprintf("ZFS: %s Fragmentation", displayName), unit: "%",
+		id: prefix + "_fragmentation", name: "ZFS: " + displayName + " Fragmentation", unit: "%",
 		icon: "mdi:chart-scatter-plot", template: "{{ value_json.fragmentation_percent | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_errors", name: fmt.Sprintf("ZFS: %s Errors", displayName),
+		id: prefix + "_errors", name: "ZFS: " + displayName + " Errors",
 		icon:       "mdi:alert-circle",
 		template:   "{{ (value_json.read_errors | default(0)) + (value_json.write_errors | default(0)) + (value_json.checksum_errors | default(0)) }}",
 		stateClass: "total_increasing",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_healthy", name: fmt.Sprintf("ZFS: %s Healthy", displayName),
+		id: prefix + "_healthy", name: "ZFS: " + displayName + " Healthy",
 		icon: "mdi:check-circle", template: "{{ 'ON' if value_json.health == 'ONLINE' else 'OFF' }}",
 		deviceClass: "safety",
 	})
 	// Corrupted file count (Unraid 7.3 / ZFS 2.4.1 surfaces these without a scrub)
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_corrupted_files", name: fmt.Sprintf("ZFS: %s Corrupted Files", displayName),
+		id: prefix + "_corrupted_files", name: "ZFS: " + displayName + " Corrupted Files",
 		icon:       "mdi:file-alert",
 		template:   "{{ value_json.corrupted_files | default([]) | count }}",
 		stateClass: "measurement",
@@ -1500,7 +1951,7 @@ func (c *Client) publishZFSEntities(topic, prefix, displayName string) []string
 // publishNUTDiscovery publishes HA discovery for NUT UPS metrics.
 // NUTResponse.Status is a pointer — templates use | default() guards for nil safety.
 func (c *Client) publishNUTDiscovery() {
-	topic := c.buildTopic("nut/status")
+	topic := c.topics.NUT
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
 		id: "nut_connected", name: "NUT: UPS Connected",
@@ -1571,7 +2022,7 @@ func (c *Client) publishNUTDiscovery() {
 
 // publishHardwareDiscovery publishes HA discovery for hardware information.
 func (c *Client) publishHardwareDiscovery() {
-	topic := c.buildTopic("hardware")
+	topic := c.topics.Hardware
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
 		id: "bios_version", name: "Hardware: BIOS Version",
@@ -1646,7 +2097,7 @@ func (c *Client) publishHardwareDiscovery() {
 
 // publishRegistrationDiscovery publishes HA discovery for Unraid license/registration info.
 func (c *Client) publishRegistrationDiscovery() {
-	topic := c.buildTopic("registration")
+	topic := c.topics.Registration
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
 		id: "registration_state", name: "Registration: State",
@@ -1688,48 +2139,47 @@ func (c *Client) publishUnassignedDiscovery(list *dto.UnassignedDeviceList) {
 	if list == nil {
 		return
 	}
+	now := time.Now()
 	var currentIDs []string
-	for _, dev := range list.Devices {
+	for i := range list.Devices {
+		dev := &list.Devices[i]
 		if dev.Device == "" {
 			continue
 		}
-		devID := sanitizeID(dev.Device)
-		devTopic := c.buildTopic(fmt.Sprintf("unassigned/%s", devID))
-		if err := c.publishJSON(devTopic, dev); err != nil {
+		devID, devTopic := c.itemTopic("unassigned", dev.Device)
+		if err := c.publishItemState(devTopic, dev, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish unassigned device %s: %v", devID, err)
-			continue
 		}
 		displayName := dev.Model
 		if displayName == "" {
 			displayName = dev.Device
 		}
-		ids := c.publishUnassignedEntities(devTopic, fmt.Sprintf("unassigned_%s", devID), displayName, dev)
+		ids := c.publishUnassignedEntities(devTopic, "unassigned_"+devID, displayName, *dev)
 		currentIDs = append(currentIDs, ids...)
 	}
 	shareSources := make(map[string]string)
-	for _, share := range list.RemoteShares {
+	for i := range list.RemoteShares {
+		share := &list.RemoteShares[i]
 		if share.MountPoint == "" {
 			continue
 		}
-		shareID := sanitizeID(share.MountPoint)
+		shareID, shareTopic := c.itemTopic("unassigned/remote", share.MountPoint)
 		// Record the ID→source mapping so MQTT switch commands can be routed
 		// back to the controller. Skip ISO mounts, which cannot be toggled.
 		if share.Source != "" && share.Type != "iso" {
 			shareSources[shareID] = share.Source
 		}
-		shareTopic := c.buildTopic(fmt.Sprintf("unassigned/remote/%s", shareID))
-		if err := c.publishJSON(shareTopic, share); err != nil {
+		if err := c.publishItemState(shareTopic, share, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish remote share %s: %v", shareID, err)
-			continue
 		}
-		ids := c.publishRemoteShareEntities(shareTopic, fmt.Sprintf("remote_share_%s", shareID), remoteShareDisplayName(share), shareID, share.Type)
+		ids := c.publishRemoteShareEntities(shareTopic, "remote_share_"+shareID, remoteShareDisplayName(*share), shareID, share.Type)
 		currentIDs = append(currentIDs, ids...)
 	}
 	c.setRemoteShareSources(shareSources)
 	removed := c.tracker.update("unassigned", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
-	}
+	c.removeHAEntities(removed...)
 }
 
 // remoteShareDisplayName builds a human-friendly label for a remote share.
@@ -1747,7 +2197,7 @@ func (c *Client) publishRemoteShareEntities(topic, prefix, displayName, shareID,
 	ids := []string{prefix + "_mounted", prefix + "_usage", prefix + "_used", prefix + "_free"}
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_mounted", name: fmt.Sprintf("Remote Share: %s Mounted", displayName),
+		id: prefix + "_mounted", name: "Remote Share: " + displayName + " Mounted",
 		icon:        "mdi:nas",
 		template:    "{{ 'ON' if value_json.status == 'mounted' else 'OFF' }}",
 		deviceClass: "connectivity",
@@ -1758,7 +2208,7 @@ func (c *Client) publishRemoteShareEntities(topic, prefix, displayName, shareID,
 		c.publishHAEntity(haEntityOpts{
 			entityType: "switch", stateTopic: topic,
 			commandTopic: c.buildCommandTopic("unassigned", "remote", shareID, "set"),
-			id:           prefix + "_switch", name: fmt.Sprintf("Remote Share: %s Mount", displayName),
+			id:           prefix + "_switch", name: "Remote Share: " + displayName + " Mount",
 			icon:     "mdi:nas",
 			template: "{{ value_json.status }}",
 			stateOn:  "mounted", stateOff: "unmounted",
@@ -1766,21 +2216,21 @@ func (c *Client) publishRemoteShareEntities(topic, prefix, displayName, shareID,
 	}
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_usage", name: fmt.Sprintf("Remote Share: %s Usage", displayName), unit: "%",
+		id: prefix + "_usage", name: "Remote Share: " + displayName + " Usage", unit: "%",
 		icon:       "mdi:nas",
 		template:   "{{ value_json.usage_percent | default(0) | round(1) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_used", name: fmt.Sprintf("Remote Share: %s Used", displayName), unit: "B",
+		id: prefix + "_used", name: "Remote Share: " + displayName + " Used", unit: "B",
 		icon:        "mdi:nas",
 		template:    "{{ value_json.used_bytes | default(0) }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_free", name: fmt.Sprintf("Remote Share: %s Free", displayName), unit: "B",
+		id: prefix + "_free", name: "Remote Share: " + displayName + " Free", unit: "B",
 		icon:        "mdi:nas",
 		template:    "{{ value_json.free_bytes | default(0) }}",
 		deviceClass: "data_size", stateClass: "measurement",
@@ -1793,21 +2243,21 @@ func (c *Client) publishUnassignedEntities(topic, prefix, displayName string, de
 	ids := []string{prefix + "_connected", prefix + "_temp", prefix + "_spin_state"}
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_connected", name: fmt.Sprintf("Unassigned: %s Connected", displayName),
+		id: prefix + "_connected", name: "Unassigned: " + displayName + " Connected",
 		icon:        "mdi:harddisk",
 		template:    "{{ 'ON' if value_json.status != 'error' else 'OFF' }}",
 		deviceClass: "connectivity",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_temp", name: fmt.Sprintf("Unassigned: %s Temperature", displayName), unit: "°C",
+		id: prefix + "_temp", name: "Unassigned: " + displayName + " Temperature", unit: "°C",
 		icon:        "mdi:thermometer",
 		template:    "{{ value_json.temperature_celsius | default(0) }}",
 		deviceClass: "temperature", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_spin_state", name: fmt.Sprintf("Unassigned: %s Spin State", displayName),
+		id: prefix + "_spin_state", name: "Unassigned: " + displayName + " Spin State",
 		icon:     "mdi:rotate-3d-variant",
 		template: "{{ value_json.spin_state | default('unknown') }}",
 	})
@@ -1855,24 +2305,35 @@ func (c *Client) publishZFSDatasetDiscovery(datasets []dto.ZFSDataset) {
 	if !c.config.HomeAssistantMode {
 		return
 	}
+	keys := make([]string, len(datasets))
+	for i := range datasets {
+		keys[i] = datasets[i].Name
+	}
+	now := time.Now()
+	refresh, finish := c.beginDiscoveryRefresh("zfs_datasets", keys, now)
+	defer finish()
 	var currentIDs []string
-	for _, ds := range datasets {
+	for i := range datasets {
+		ds := &datasets[i]
 		if ds.Name == "" {
 			continue
 		}
-		dsID := sanitizeID(ds.Name)
-		dsTopic := c.buildTopic(fmt.Sprintf("zfs/datasets/%s", dsID))
-		if err := c.publishJSON(dsTopic, ds); err != nil {
+		dsID, dsTopic := c.itemTopic("zfs/datasets", ds.Name)
+		if err := c.publishItemState(dsTopic, ds, now); err != nil {
+			c.discoveryFailures.Add(1)
 			logger.Debug("MQTT: Failed to publish ZFS dataset %s: %v", dsID, err)
+		}
+		if !refresh {
 			continue
 		}
-		ids := c.publishZFSDatasetEntities(dsTopic, fmt.Sprintf("zfs_ds_%s", dsID), ds.Name)
-		currentIDs = append(currentIDs, ids...)
+		ids := c.publishZFSDatasetEntities(dsTopic, "zfs_ds_"+dsID, ds.Name)
+		currentIDs = appendEntityIDs(currentIDs, ids, len(datasets))
 	}
-	removed := c.tracker.update("zfs_datasets", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
+	if !refresh {
+		return
 	}
+	removed := c.tracker.update("zfs_datasets", currentIDs)
+	c.removeHAEntities(removed...)
 }
 
 // publishZFSDatasetEntities publishes HA entity discovery for a single ZFS dataset.
@@ -1880,28 +2341,28 @@ func (c *Client) publishZFSDatasetEntities(topic, prefix, displayName string) []
 	ids := []string{prefix + "_used", prefix + "_available", prefix + "_compress_ratio", prefix + "_readonly"}
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_used", name: fmt.Sprintf("ZFS Dataset: %s Used", displayName), unit: "B",
+		id: prefix + "_used", name: "ZFS Dataset: " + displayName + " Used", unit: "B",
 		icon:        "mdi:database",
 		template:    "{{ value_json.used_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_available", name: fmt.Sprintf("ZFS Dataset: %s Available", displayName), unit: "B",
+		id: prefix + "_available", name: "ZFS Dataset: " + displayName + " Available", unit: "B",
 		icon:        "mdi:database",
 		template:    "{{ value_json.available_bytes }}",
 		deviceClass: "data_size", stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
-		id: prefix + "_compress_ratio", name: fmt.Sprintf("ZFS Dataset: %s Compression Ratio", displayName),
+		id: prefix + "_compress_ratio", name: "ZFS Dataset: " + displayName + " Compression Ratio",
 		icon:       "mdi:zip-box",
 		template:   "{{ value_json.compress_ratio | round(2) }}",
 		stateClass: "measurement",
 	})
 	c.publishHAEntity(haEntityOpts{
 		entityType: "binary_sensor", stateTopic: topic,
-		id: prefix + "_readonly", name: fmt.Sprintf("ZFS Dataset: %s Read-Only", displayName),
+		id: prefix + "_readonly", name: "ZFS Dataset: " + displayName + " Read-Only",
 		icon:     "mdi:lock",
 		template: "{{ 'ON' if value_json.readonly else 'OFF' }}",
 	})
@@ -1914,7 +2375,7 @@ func (c *Client) publishZFSDatasetEntities(topic, prefix, displayName string) []
 
 // publishZFSSnapshotDiscovery publishes aggregate HA discovery for ZFS snapshots.
 func (c *Client) publishZFSSnapshotDiscovery() {
-	topic := c.buildTopic("zfs/snapshots")
+	topic := c.topics.ZFSSnapshots
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
 		id: "zfs_snapshot_count", name: "ZFS: Snapshot Count",
@@ -1937,7 +2398,7 @@ func (c *Client) publishZFSSnapshotDiscovery() {
 
 // publishZFSARCDiscovery publishes HA discovery for ZFS ARC cache statistics.
 func (c *Client) publishZFSARCDiscovery() {
-	topic := c.buildTopic("zfs/arc")
+	topic := c.topics.ZFSARC
 	c.publishHAEntity(haEntityOpts{
 		entityType: "sensor", stateTopic: topic,
 		id: "arc_size", name: "ZFS ARC: Size", unit: "B",
@@ -1997,7 +2458,20 @@ func (c *Client) publishFanControlDiscovery(status *dto.FanControlStatus) {
 		return
 	}
 
-	topic := c.buildTopic("fancontrol")
+	// Entity IDs, names and templates derive only from each fan's ID and
+	// name, so they are rebuilt only when that set changes or the periodic
+	// refresh is due rather than on every fan control poll.
+	keys := make([]string, len(status.Fans))
+	for i := range status.Fans {
+		keys[i] = status.Fans[i].ID + "=" + status.Fans[i].Name
+	}
+	refresh, finish := c.beginDiscoveryRefresh("fancontrol", keys, time.Now())
+	if !refresh {
+		return
+	}
+	defer finish()
+
+	topic := c.fanControlTopic
 	var currentIDs []string
 
 	for _, fan := range status.Fans {
@@ -2007,7 +2481,7 @@ func (c *Client) publishFanControlDiscovery(status *dto.FanControlStatus) {
 		rpmID := fanID + "_rpm"
 		c.publishHAEntity(haEntityOpts{
 			entityType: "sensor", stateTopic: topic,
-			id: rpmID, name: fmt.Sprintf("Fan Control: %s RPM", fan.Name), unit: "RPM",
+			id: rpmID, name: "Fan Control: " + fan.Name + " RPM", unit: "RPM",
 			icon:       "mdi:fan",
 			template:   fmt.Sprintf(`{{ (value_json.fans | selectattr('id', 'eq', '%s') | map(attribute='rpm') | first | default(0)) }}`, fan.ID),
 			stateClass: "measurement",
@@ -2018,7 +2492,7 @@ func (c *Client) publishFanControlDiscovery(status *dto.FanControlStatus) {
 		pwmID := fanID + "_pwm"
 		c.publishHAEntity(haEntityOpts{
 			entityType: "sensor", stateTopic: topic,
-			id: pwmID, name: fmt.Sprintf("Fan Control: %s PWM", fan.Name), unit: "%",
+			id: pwmID, name: "Fan Control: " + fan.Name + " PWM", unit: "%",
 			icon:       "mdi:fan",
 			template:   fmt.Sprintf(`{{ (value_json.fans | selectattr('id', 'eq', '%s') | map(attribute='pwm_percent') | first | default(0)) }}`, fan.ID),
 			stateClass: "measurement",
@@ -2029,7 +2503,7 @@ func (c *Client) publishFanControlDiscovery(status *dto.FanControlStatus) {
 		modeID := fanID + "_mode"
 		c.publishHAEntity(haEntityOpts{
 			entityType: "sensor", stateTopic: topic,
-			id: modeID, name: fmt.Sprintf("Fan Control: %s Mode", fan.Name),
+			id: modeID, name: "Fan Control: " + fan.Name + " Mode",
 			icon:     "mdi:fan-clock",
 			template: fmt.Sprintf(`{{ (value_json.fans | selectattr('id', 'eq', '%s') | map(attribute='mode') | first | default('unknown')) }}`, fan.ID),
 		})
@@ -2049,21 +2523,60 @@ func (c *Client) publishFanControlDiscovery(status *dto.FanControlStatus) {
 	currentIDs = append(currentIDs, enabledID)
 
 	removed := c.tracker.update("fancontrol", currentIDs)
-	for _, id := range removed {
-		c.removeHAEntities(id)
-	}
+	c.removeHAEntities(removed...)
 }
 
 // ──────────────────────────────────────────────────────────────────────────────
 // Helpers
 // ──────────────────────────────────────────────────────────────────────────────
 
-// sanitizeID converts a string into a safe MQTT/HA entity ID.
+// maxItemTopics bounds the itemTopic memo; it is cleared when full so item
+// churn (renamed containers, replaced disks) cannot grow it without limit.
+const maxItemTopics = 2048
+
+// itemTopicKey identifies a per-item state topic by category and raw name.
+type itemTopicKey struct{ category, raw string }
+
+// itemTopicNames is the memoized sanitized ID and state topic for one item.
+type itemTopicNames struct{ id, topic string }
+
+// itemTopic returns the sanitized entity ID for raw and its state topic under
+// category (e.g. "docker" -> "<prefix>/docker/<id>"). Per-item state is
+// published on every collection cycle for the same, rarely changing set of
+// names, so both strings are built once per item and then looked up.
+func (c *Client) itemTopic(category, raw string) (id, topic string) {
+	key := itemTopicKey{category, raw}
+	c.itemTopicsMu.RLock()
+	names, ok := c.itemTopics[key]
+	c.itemTopicsMu.RUnlock()
+	if ok {
+		return names.id, names.topic
+	}
+
+	id = sanitizeID(raw)
+	topic = c.topicBase + category + "/" + id
+	c.itemTopicsMu.Lock()
+	if c.itemTopics == nil || len(c.itemTopics) >= maxItemTopics {
+		c.itemTopics = make(map[itemTopicKey]itemTopicNames)
+	}
+	c.itemTopics[key] = itemTopicNames{id: id, topic: topic}
+	c.itemTopicsMu.Unlock()
+	return id, topic
+}
+
+// sanitizeID converts a string into a safe MQTT/HA entity ID: lowercased,
+// with spaces, slashes, dots and hyphens replaced by underscores. It runs for
+// every per-item entity on every discovery pass, so the lowering and all
+// replacements happen in a single pass, and an already-clean ID is returned
+// without allocating.
 func sanitizeID(s string) string {
-	s = strings.ToLower(s)
-	s = strings.ReplaceAll(s, " ", "_")
-	s = strings.ReplaceAll(s, "/", "_")
-	s = strings.ReplaceAll(s, ".", "_")
-	s = strings.ReplaceAll(s, "-", "_")
-	return s
+	return strings.Map(sanitizeIDRune, s)
+}
+
+func sanitizeIDRune(r rune) rune {
+	switch r {
+	case ' ', '/', '.', '-':
+		return '_'
+	}
+	return unicode.ToLower(r)
 }
@@ -0,0 +1,726 @@
+package mqtt
+
+import (
+	"bytes"
+	"encoding/json"
+	"errors"
+	"slices"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	pahomqtt "github.com/eclipse/paho.mqtt.golang"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/dto"
+)
+
+// completedToken is a paho token that has already finished successfully.
+type completedToken struct {
+	pahomqtt.Token
+}
+
+var closedDone = func() chan struct{} {
+	ch := make(chan struct{})
+	close(ch)
+	return ch
+}()
+
+func (completedToken) Wait() bool                     { return true }
+func (completedToken) WaitTimeout(time.Duration) bool { return true }
+func (completedToken) Done() <-chan struct{}          { return closedDone }
+func (completedToken) Error() error                   { return nil }
+
+// pendingToken is a paho token that never completes.
+type pendingToken struct {
+	pahomqtt.Token
+}
+
+func (pendingToken) WaitTimeout(time.Duration) bool { return false }
+func (pendingToken) Error() error                   { return nil }
+
+// failedToken is a paho token that completed with an error.
+type failedToken struct {
+	pahomqtt.Token
+	err error
+}
+
+func (failedToken) Wait() bool                     { return true }
+func (failedToken) WaitTimeout(time.Duration) bool { return true }
+func (failedToken) Done() <-chan struct{}          { return closedDone }
+func (t failedToken) Error() error                 { return t.err }
+
+// recordingPaho is a minimal paho client that records every publish.
+// Only Publish is implemented; the embedded interface panics on anything else.
+type recordingPaho struct {
+	pahomqtt.Client
+
+	mu        sync.Mutex
+	published map[string][]string // topic -> payloads in publish order
+	fail      map[string]bool     // topics whose publishes fail
+}
+
+func newRecordingPaho() *recordingPaho {
+	return &recordingPaho{published: make(map[string][]string)}
+}
+
+func (r *recordingPaho) Publish(topic string, _ byte, _ bool, payload any) pahomqtt.Token {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if r.fail[topic] {
+		return failedToken{err: errors.New("broker unavailable")}
+	}
+	var s string
+	switch p := payload.(type) {
+	case string:
+		s = p
+	case []byte:
+		s = string(p)
+	case bytes.Buffer:
+		s = p.String()
+	default:
+		// paho rejects any other payload type, including an untyped nil.
+		return failedToken{err: errors.New("unknown payload type")}
+	}
+	r.published[topic] = append(r.published[topic], s)
+	return completedToken{}
+}
+
+// stalledPaho is a paho client whose publishes are never acknowledged.
+type stalledPaho struct {
+	pahomqtt.Client
+}
+
+func (stalledPaho) Publish(string, byte, bool, any) pahomqtt.Token { return pendingToken{} }
+
+func (r *recordingPaho) topics(prefix string) []string {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	var out []string
+	for t := range r.published {
+		if strings.HasPrefix(t, prefix) {
+			out = append(out, t)
+		}
+	}
+	return out
+}
+
+func newRecordingClient(t *testing.T) (*Client, *recordingPaho) {
+	t.Helper()
+	config := DefaultConfig()
+	config.Enabled = true
+	config.HomeAssistantMode = true
+	config.HADiscoveryPrefix = "homeassistant"
+	client := NewClient(config, "test server", "1.0.0", nil)
+	fake := newRecordingPaho()
+	client.client = fake
+	client.connected.Store(true)
+	return client, fake
+}
+
+func TestPublishHADiscovery_PublishesAllSections(t *testing.T) {
+	client, fake := newRecordingClient(t)
+
+	client.publishHADiscovery()
+
+	wantTopics := []string{
+		"homeassistant/sensor/test_server/cpu_usage/config",
+		"homeassistant/sensor/test_server/ups_status/config",
+		"homeassistant/button/test_server/system_reboot/config",
+	}
+	for _, want := range wantTopics {
+		fake.mu.Lock()
+		payloads := fake.published[want]
+		fake.mu.Unlock()
+		if len(payloads) != 1 {
+			t.Errorf("topic %s published %d times, want 1", want, len(payloads))
+		}
+	}
+
+	configs := fake.topics("homeassistant/")
+	if int64(len(configs)) != client.msgSent.Load() {
+		t.Errorf("distinct config topics = %d, msgSent = %d; every config should be published exactly once",
+			len(configs), client.msgSent.Load())
+	}
+}
+
+func TestPublishHAEntity_SkipsUnchangedConfig(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const topic = "homeassistant/sensor/test_server/cpu_usage/config"
+	opts := haEntityOpts{
+		entityType: "sensor", stateTopic: "unraid/system",
+		id: "cpu_usage", name: "System: CPU Usage", unit: "%",
+	}
+	count := func() int {
+		fake.mu.Lock()
+		defer fake.mu.Unlock()
+		return len(fake.published[topic])
+	}
+
+	client.publishHAEntity(opts)
+	client.publishHAEntity(opts)
+	if got := count(); got != 1 {
+		t.Fatalf("identical config published %d times, want 1", got)
+	}
+
+	opts.unit = "percent"
+	client.publishHAEntity(opts)
+	if got := count(); got != 2 {
+		t.Fatalf("changed config published %d times in total, want 2", got)
+	}
+
+	// A reconnect must republish everything.
+	client.resetDiscoveryPayloads()
+	client.publishHAEntity(opts)
+	if got := count(); got != 3 {
+		t.Fatalf("config after reset published %d times in total, want 3", got)
+	}
+
+	// Removal publishes an empty payload and re-arms the topic.
+	client.removeHAEntities("cpu_usage")
+	client.publishHAEntity(opts)
+	if got := count(); got != 5 {
+		t.Fatalf("config after removal published %d times in total, want 5", got)
+	}
+}
+
+func TestPublishHAEntity_RepublishesConfigWithoutRetain(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	client.config.RetainMessages = false
+	opts := haEntityOpts{
+		entityType: "sensor", stateTopic: "unraid/system",
+		id: "cpu_usage", name: "System: CPU Usage", unit: "%",
+	}
+
+	client.publishHAEntity(opts)
+	client.publishHAEntity(opts)
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	if got := len(fake.published[client.discoveryTopic("sensor", "cpu_usage")]); got != 2 {
+		t.Errorf("non-retained config published %d times, want 2", got)
+	}
+}
+
+func TestRemoveHAEntities_ClearsEveryTypeForEachID(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	opts := haEntityOpts{entityType: "sensor", stateTopic: "unraid/docker/plex", id: "container_plex_cpu", name: "CPU"}
+	client.publishHAEntity(opts)
+	sent := client.msgSent.Load()
+
+	client.removeHAEntities("container_plex_cpu", "container_sonarr_cpu")
+
+	if got := client.msgSent.Load() - sent; got != 2*int64(len(removableEntityTypes)) {
+		t.Errorf("removal sent %d messages, want %d", got, 2*len(removableEntityTypes))
+	}
+	for _, id := range []string{"container_plex_cpu", "container_sonarr_cpu"} {
+		for _, et := range removableEntityTypes {
+			topic := client.discoveryTopic(et, id)
+			fake.mu.Lock()
+			payloads := fake.published[topic]
+			fake.mu.Unlock()
+			if len(payloads) == 0 || payloads[len(payloads)-1] != "" {
+				t.Errorf("%s: last payload = %q, want empty removal", topic, payloads)
+			}
+		}
+	}
+
+	// The removed config must be republished if the entity comes back.
+	client.publishHAEntity(opts)
+	fake.mu.Lock()
+	got := len(fake.published[client.discoveryTopic("sensor", opts.id)])
+	fake.mu.Unlock()
+	if got != 3 {
+		t.Errorf("config topic published %d times, want 3 (config, removal, config)", got)
+	}
+}
+
+func TestUpdateServiceState_CopiesSnapshot(t *testing.T) {
+	client, _ := newRecordingClient(t)
+	prev := map[string]bool{"docker": true, "smb": true}
+	client.serviceStates = prev
+
+	next := client.updateServiceState("docker", false)
+
+	if next["docker"] || !next["smb"] {
+		t.Errorf("next = %v, want docker=false smb=true", next)
+	}
+	if !prev["docker"] {
+		t.Error("previous snapshot was mutated")
+	}
+	if client.serviceStates["docker"] {
+		t.Error("stored snapshot should reflect the update")
+	}
+}
+
+func TestScheduleServiceStateRefresh_CoalescesBurst(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	client.serviceStates = map[string]bool{"docker": true, "smb": true}
+
+	for _, svc := range []string{"docker", "smb", "docker"} {
+		client.scheduleServiceStateRefresh(svc)
+	}
+	if !client.waitBackground(time.Second) {
+		t.Fatal("service state refresh did not finish")
+	}
+
+	fake.mu.Lock()
+	payloads := fake.published["unraid/services"]
+	fake.mu.Unlock()
+	if len(payloads) != 1 {
+		t.Fatalf("services topic published %d times, want 1 for a burst of toggles", len(payloads))
+	}
+	var states map[string]bool
+	if err := json.Unmarshal([]byte(payloads[0]), &states); err != nil {
+		t.Fatalf("invalid services payload: %v", err)
+	}
+	if len(states) != 2 {
+		t.Errorf("states = %v, want both toggled services", states)
+	}
+}
+
+func TestScheduleServiceStateRefresh_SameServiceTwiceRefreshesOnce(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	client.serviceStates = map[string]bool{"docker": true}
+
+	client.scheduleServiceStateRefresh("docker")
+	client.scheduleServiceStateRefresh("docker")
+	if !client.waitBackground(time.Second) {
+		t.Fatal("service state refresh did not finish")
+	}
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	if got := len(fake.published["unraid/services"]); got != 1 {
+		t.Errorf("services topic published %d times, want 1", got)
+	}
+}
+
+func TestItemTopic(t *testing.T) {
+	client, _ := newRecordingClient(t)
+
+	tests := []struct {
+		category, raw, wantID, wantTopic string
+	}{
+		{"docker", "Plex-Server", "plex_server", "unraid/docker/plex_server"},
+		{"vm", "Plex-Server", "plex_server", "unraid/vm/plex_server"},
+		{"unassigned/remote", "/mnt/remotes/nas", "_mnt_remotes_nas", "unraid/unassigned/remote/_mnt_remotes_nas"},
+	}
+	for range 2 { // the second round is served from the memo
+		for _, tt := range tests {
+			id, topic := client.itemTopic(tt.category, tt.raw)
+			if id != tt.wantID || topic != tt.wantTopic {
+				t.Errorf("itemTopic(%q, %q) = (%q, %q), want (%q, %q)",
+					tt.category, tt.raw, id, topic, tt.wantID, tt.wantTopic)
+			}
+		}
+	}
+	if got := len(client.itemTopics); got != len(tests) {
+		t.Errorf("memo holds %d entries, want %d", got, len(tests))
+	}
+}
+
+func TestPublishContainerDiscovery_KeepsEntitiesWhenStateFails(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	containers := []dto.ContainerInfo{{Name: "plex", State: "running"}}
+	switchTopic := client.discoveryTopic("switch", "container_plex_switch")
+
+	client.publishContainerDiscovery(containers)
+
+	fake.mu.Lock()
+	fake.fail = map[string]bool{"unraid/docker/plex": true}
+	fake.mu.Unlock()
+	client.tracker.resetRefresh()
+	client.publishContainerDiscovery(containers)
+
+	fake.mu.Lock()
+	payloads := fake.published[switchTopic]
+	fake.mu.Unlock()
+	if len(payloads) == 0 || payloads[len(payloads)-1] == "" {
+		t.Errorf("switch config payloads = %q, want the entity kept after a failed state publish", payloads)
+	}
+	if !client.tracker.refreshDue("containers", []string{"plex"}, time.Now()) {
+		t.Error("a pass with a failed state publish should stay due")
+	}
+}
+
+func TestDiscoveryTracker_RefreshDue(t *testing.T) {
+	tracker := newDiscoveryTracker()
+	now := time.Now()
+	due := func(category string, keys []string, at time.Time) bool {
+		if !tracker.refreshDue(category, keys, at) {
+			return false
+		}
+		tracker.markRefreshed(category, keys, at)
+		return true
+	}
+
+	if !due("containers", []string{"plex"}, now) {
+		t.Fatal("first pass should be due")
+	}
+	if due("containers", []string{"plex"}, now.Add(time.Minute)) {
+		t.Error("unchanged item set within the interval should not be due")
+	}
+	if !due("vms", []string{"plex"}, now.Add(time.Minute)) {
+		t.Error("categories are tracked independently")
+	}
+	if !due("containers", []string{"plex", "sonarr"}, now.Add(2*time.Minute)) {
+		t.Error("changed item set should be due")
+	}
+	if !due("containers", []string{"plex", "sonarr"}, now.Add(2*time.Minute+discoveryRefreshInterval)) {
+		t.Error("pass after the refresh interval should be due")
+	}
+
+	tracker.resetRefresh()
+	if !due("containers", []string{"plex", "sonarr"}, now.Add(3*time.Minute+discoveryRefreshInterval)) {
+		t.Error("pass after reset should be due")
+	}
+
+	if !tracker.refreshDue("shares", []string{"media"}, now) || !tracker.refreshDue("shares", []string{"media"}, now) {
+		t.Error("an unrecorded pass should stay due")
+	}
+}
+
+func TestBeginDiscoveryRefresh_RetriesAfterFailedPublish(t *testing.T) {
+	client := NewClient(DefaultConfig(), "test", "1.0.0", nil)
+	now := time.Now()
+	keys := []string{"plex"}
+
+	refresh, finish := client.beginDiscoveryRefresh("containers", keys, now)
+	if !refresh {
+		t.Fatal("first pass should be due")
+	}
+	client.discoveryFailures.Add(1) // a config publish timed out
+	finish()
+
+	refresh, finish = client.beginDiscoveryRefresh("containers", keys, now.Add(time.Second))
+	if !refresh {
+		t.Fatal("a pass with a failed publish should be retried on the next poll")
+	}
+	finish()
+
+	if refresh, _ := client.beginDiscoveryRefresh("containers", keys, now.Add(2*time.Second)); refresh {
+		t.Error("a successful pass should be recorded")
+	}
+}
+
+func TestPublishContainerDiscovery_SkipsConfigsForUnchangedSet(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const (
+		stateTopic  = "unraid/docker/plex"
+		configTopic = "homeassistant/binary_sensor/test_server/container_plex_state/config"
+	)
+	count := func(topic string) int {
+		fake.mu.Lock()
+		defer fake.mu.Unlock()
+		return len(fake.published[topic])
+	}
+	containers := []dto.ContainerInfo{{Name: "plex", State: "running"}}
+
+	client.publishContainerDiscovery(containers)
+	sent := client.msgSent.Load()
+	// Drop the payload cache so only the refresh gate can suppress configs.
+	client.discoveryMu.Lock()
+	client.discoveryPayloads = nil
+	client.discoveryMu.Unlock()
+
+	client.publishContainerDiscovery(containers)
+	if got := count(stateTopic); got != 2 {
+		t.Errorf("state topic published %d times, want 2", got)
+	}
+	if got := count(configTopic); got != 1 {
+		t.Errorf("config topic published %d times, want 1 (unchanged set must skip configs)", got)
+	}
+	if got := client.msgSent.Load() - sent; got != 1 {
+		t.Errorf("second pass sent %d messages, want only the state update", got)
+	}
+}
+
+func TestPublishShareDiscovery_SkipsConfigsForUnchangedSet(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const configTopic = "homeassistant/sensor/test_server/share_media_usage/config"
+	count := func(topic string) int {
+		fake.mu.Lock()
+		defer fake.mu.Unlock()
+		return len(fake.published[topic])
+	}
+	dropPayloadCache := func() {
+		client.discoveryMu.Lock()
+		client.discoveryPayloads = nil
+		client.discoveryMu.Unlock()
+	}
+
+	client.publishShareDiscovery([]dto.ShareInfo{{Name: "media", UsagePercent: 10}})
+	dropPayloadCache()
+	client.publishShareDiscovery([]dto.ShareInfo{{Name: "media", UsagePercent: 20}})
+	if got := count(configTopic); got != 1 {
+		t.Fatalf("config topic published %d times, want 1 (unchanged set must skip configs)", got)
+	}
+
+	dropPayloadCache()
+	client.publishShareDiscovery([]dto.ShareInfo{{Name: "media"}, {Name: "backups"}})
+	if got := count(configTopic); got != 2 {
+		t.Errorf("config topic published %d times after set change, want 2", got)
+	}
+}
+
+func TestPublishFanControlDiscovery_SkipsUnchangedFans(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const configTopic = "homeassistant/sensor/test_server/fanctrl_hwmon0_fan1_rpm/config"
+	count := func() int {
+		fake.mu.Lock()
+		defer fake.mu.Unlock()
+		return len(fake.published[configTopic])
+	}
+	pass := func(name string, rpm int) {
+		// Drop the payload cache so only the refresh gate can suppress configs.
+		client.discoveryMu.Lock()
+		client.discoveryPayloads = nil
+		client.discoveryMu.Unlock()
+		client.publishFanControlDiscovery(&dto.FanControlStatus{
+			Fans: []dto.FanDevice{{ID: "hwmon0_fan1", Name: name, RPM: rpm}},
+		})
+	}
+
+	pass("CPU Fan", 1200)
+	pass("CPU Fan", 1350) // readings change every poll; configs do not
+	if got := count(); got != 1 {
+		t.Fatalf("config published %d times for an unchanged fan set, want 1", got)
+	}
+
+	pass("CPU Fan (front)", 1350)
+	if got := count(); got != 2 {
+		t.Errorf("config published %d times after a rename, want 2", got)
+	}
+}
+
+func TestPublishHAEntity_ConfigPayload(t *testing.T) {
+	tests := []struct {
+		name    string
+		opts    haEntityOpts
+		want    map[string]any
+		absent  []string
+		topicID string
+	}{
+		{
+			name: "sensor",
+			opts: haEntityOpts{
+				entityType: "sensor", stateTopic: "unraid/system", id: "cpu_usage",
+				name: "CPU", unit: "%", template: "{{ value_json.cpu }}", stateClass: "measurement",
+			},
+			want: map[string]any{
+				"unique_id": "unraid_test_server_cpu_usage", "state_topic": "unraid/system",
+				"value_template": "{{ value_json.cpu }}", "unit_of_measurement": "%",
+				"state_class": "measurement", "icon": "", "payload_available": "online",
+			},
+			absent:  []string{"command_topic", "payload_on", "device_class"},
+			topicID: "homeassistant/sensor/test_server/cpu_usage/config",
+		},
+		{
+			name:    "binary sensor defaults payloads",
+			opts:    haEntityOpts{entityType: "binary_sensor", stateTopic: "unraid/array", id: "array_started", name: "Array"},
+			want:    map[string]any{"payload_on": "ON", "payload_off": "OFF"},
+			absent:  []string{"value_template"},
+			topicID: "homeassistant/binary_sensor/test_server/array_started/config",
+		},
+		{
+			name: "button drops state topic",
+			opts: haEntityOpts{
+				entityType: "button", stateTopic: "unraid/system", commandTopic: "unraid/cmd/reboot",
+				id: "reboot", name: "Reboot", template: "ignored",
+			},
+			want:    map[string]any{"command_topic": "unraid/cmd/reboot", "payload_press": "PRESS"},
+			absent:  []string{"state_topic", "value_template"},
+			topicID: "homeassistant/button/test_server/reboot/config",
+		},
+		{
+			name: "switch",
+			opts: haEntityOpts{
+				entityType: "switch", stateTopic: "unraid/docker/plex", commandTopic: "unraid/cmd/plex",
+				id: "plex_switch", name: "Plex", template: "{{ value_json.state }}",
+				stateOn: "running", stateOff: "exited", payloadOn: "start",
+			},
+			want: map[string]any{
+				"command_topic": "unraid/cmd/plex", "payload_on": "start", "payload_off": "OFF",
+				"state_on": "running", "state_off": "exited", "value_template": "{{ value_json.state }}",
+			},
+			absent:  []string{"optimistic", "payload_press"},
+			topicID: "homeassistant/switch/test_server/plex_switch/config",
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			client, fake := newRecordingClient(t)
+			client.publishHAEntity(tt.opts)
+
+			payloads := fake.published[tt.topicID]
+			if len(payloads) != 1 {
+				t.Fatalf("published %d payloads to %s, want 1", len(payloads), tt.topicID)
+			}
+			var got map[string]any
+			if err := json.Unmarshal([]byte(payloads[0]), &got); err != nil {
+				t.Fatalf("invalid JSON payload: %v", err)
+			}
+			for k, v := range tt.want {
+				if got[k] != v {
+					t.Errorf("%s = %v, want %v", k, got[k], v)
+				}
+			}
+			for _, k := range tt.absent {
+				if _, ok := got[k]; ok {
+					t.Errorf("unexpected key %s in payload", k)
+				}
+			}
+			if _, ok := got["device"].(map[string]any); !ok {
+				t.Errorf("device = %v, want object", got["device"])
+			}
+		})
+	}
+}
+
+func TestPublishItemState_SkipsUnchangedRetainedPayloads(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const topic = "unraid/docker/plex"
+	count := func() int {
+		fake.mu.Lock()
+		defer fake.mu.Unlock()
+		return len(fake.published[topic])
+	}
+	// Every poll restamps the container, as the Docker collector does.
+	container := dto.ContainerInfo{ID: "abc123", Name: "plex", State: "running", Timestamp: time.Now()}
+	poll := func() error {
+		container.Timestamp = container.Timestamp.Add(15 * time.Second)
+		return client.publishItemState(topic, &container, time.Now())
+	}
+
+	for range 3 {
+		if err := poll(); err != nil {
+			t.Fatalf("publishItemState: %v", err)
+		}
+	}
+	if got := count(); got != 1 {
+		t.Fatalf("unchanged payload published %d times, want 1", got)
+	}
+
+	container.State = "exited"
+	if err := poll(); err != nil {
+		t.Fatalf("publishItemState: %v", err)
+	}
+	if got := count(); got != 2 {
+		t.Fatalf("changed payload not published, got %d publishes", got)
+	}
+
+	client.resetDiscoveryPayloads()
+	if err := poll(); err != nil {
+		t.Fatalf("publishItemState: %v", err)
+	}
+	if got := count(); got != 3 {
+		t.Errorf("payload not republished after reset, got %d publishes", got)
+	}
+
+	client.config.RetainMessages = false
+	for range 2 {
+		_ = poll()
+	}
+	if got := count(); got != 5 {
+		t.Errorf("non-retained payloads published %d times in total, want 5", got)
+	}
+}
+
+func TestPublishItemState_IgnoresPollTimestamp(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const topic = "unraid/docker/plex"
+
+	container := dto.ContainerInfo{Name: "plex", State: "running", Timestamp: time.Now()}
+	for range 3 {
+		container.Timestamp = container.Timestamp.Add(15 * time.Second)
+		if err := client.publishItemState(topic, &container, time.Now()); err != nil {
+			t.Fatalf("publishItemState: %v", err)
+		}
+	}
+	container.State = "exited"
+	if err := client.publishItemState(topic, &container, time.Now()); err != nil {
+		t.Fatalf("publishItemState: %v", err)
+	}
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	if got := len(fake.published[topic]); got != 2 {
+		t.Errorf("published %d times, want 2 (initial state and the state change)", got)
+	}
+}
+
+func TestPublishItemState_RefreshesAfterInterval(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	const topic = "unraid/vm/win11"
+	vm := dto.VMInfo{Name: "win11", State: "running"}
+
+	start := time.Now()
+	for _, at := range []time.Time{start, start.Add(itemStateRefreshInterval - time.Second), start.Add(itemStateRefreshInterval)} {
+		vm.Timestamp = at
+		if err := client.publishItemState(topic, &vm, at); err != nil {
+			t.Fatalf("publishItemState: %v", err)
+		}
+	}
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	if got := len(fake.published[topic]); got != 2 {
+		t.Errorf("published %d times, want 2 (initial state and the interval refresh)", got)
+	}
+}
+
+func TestItemStateDigest(t *testing.T) {
+	a := []byte(`{"name":"plex","timestamp":"2026-01-01T00:00:00Z","x":1}`)
+	b := []byte(`{"name":"plex","timestamp":"2026-01-01T00:00:15.5Z","x":1}`)
+	c := []byte(`{"name":"plex","timestamp":"2026-01-01T00:00:00Z","x":2}`)
+	if itemStateDigest(a) != itemStateDigest(b) {
+		t.Error("digest changed when only the timestamp changed")
+	}
+	if itemStateDigest(a) == itemStateDigest(c) {
+		t.Error("digest ignored a non-timestamp change")
+	}
+}
+
+func TestAppendEntityIDs_ReservesForWholePass(t *testing.T) {
+	acc := appendEntityIDs([]string{"docker_total"}[:1:1], []string{"a_1", "a_2"}, 3)
+	if cap(acc) < 7 {
+		t.Fatalf("cap after first item = %d, want room for all 3 items", cap(acc))
+	}
+	first := &acc[0]
+	acc = appendEntityIDs(acc, []string{"b_1", "b_2"}, 3)
+	acc = appendEntityIDs(acc, []string{"c_1", "c_2"}, 3)
+	if &acc[0] != first {
+		t.Error("acc was reallocated after the first item")
+	}
+	want := []string{"docker_total", "a_1", "a_2", "b_1", "b_2", "c_1", "c_2"}
+	if !slices.Equal(acc, want) {
+		t.Errorf("acc = %v, want %v", acc, want)
+	}
+}
+
+func TestContainerAndVMSwitchesAreOptimistic(t *testing.T) {
+	client, fake := newRecordingClient(t)
+	client.publishContainerDiscovery([]dto.ContainerInfo{{ID: "abc", Name: "plex", State: "running"}})
+	client.publishVMDiscovery([]dto.VMInfo{{ID: "vm1", Name: "win", State: "running"}})
+
+	fake.mu.Lock()
+	defer fake.mu.Unlock()
+	switches := 0
+	for topic, payloads := range fake.published {
+		if !strings.HasPrefix(topic, "homeassistant/switch/") {
+			continue
+		}
+		switches++
+		var cfg map[string]any
+		if err := json.Unmarshal([]byte(payloads[len(payloads)-1]), &cfg); err != nil {
+			t.Fatalf("%s: %v", topic, err)
+		}
+		if cfg["optimistic"] != true {
+			t.Errorf("%s: optimistic = %v, want true", topic, cfg["optimistic"])
+		}
+	}
+	if switches != 2 {
+		t.Errorf("published %d switch configs, want 2", switches)
+	}
+}
@@ -489,17 +489,19 @@ func (o *Orchestrator) initializeMQTT(ctx context.Context, wg *sync.WaitGroup, a
 	// Create MQTT client
 	o.mqttClient = mqtt.NewClient(mqttConfig, hostname, o.ctx.Version, o.ctx)
 
-	// Connect to broker
-	if err := o.mqttClient.Connect(ctx); err != nil {
-		logger.Error("Failed to connect to MQTT broker: %v", err)
-		return
-	}
-
-	logger.Success("MQTT client connected to %s", o.ctx.MQTTConfig.Broker)
-
-	// Set MQTT client on API server for REST endpoints
+	// Set MQTT client on API server for REST endpoints. Done before connecting
+	// so status endpoints report a broker that is still being retried.
 	apiServer.SetMQTTClient(o.mqttClient)
 
+	// Connect to broker. On failure keep retrying in the background with
+	// backoff instead of leaving MQTT dead until the agent restarts.
+	connectErr := o.mqttClient.Connect(ctx)
+	if connectErr == nil {
+		logger.Success("MQTT client connected to %s", o.ctx.MQTTConfig.Broker)
+	} else {
+		logger.Error("Failed to connect to MQTT broker: %v (retrying in background)", connectErr)
+	}
+
 	// Start MQTT event subscriber
 	wg.Go(func() {
 		defer func() {
@@ -507,6 +509,12 @@ func (o *Orchestrator) initializeMQTT(ctx context.Context, wg *sync.WaitGroup, a
 				logger.LogPanicWithStack("MQTT subscriber goroutine", r)
 			}
 		}()
+		if connectErr != nil {
+			if err := o.mqttClient.RetryConnect(ctx); err != nil {
+				return
+			}
+			logger.Success("MQTT client connected to %s", o.ctx.MQTTConfig.Broker)
+		}
 		o.subscribeMQTTEvents(ctx, apiServer)
 	})
 }
@@ -531,6 +539,58 @@ func mqttBind[T any](topic domain.Topic[T], fn func(T) error) mqttBinding {
 	}
 }
 
+// mqttFanControlMinInterval is the shortest gap between fan control
+// publishes. Fan status is collected every few seconds (IntervalFanControl)
+// for the local fan logic, but each publish updates every fan's RPM and PWM
+// entities in Home Assistant; forwarding it at the system collector's pace
+// keeps those entities from dominating the broker and HA state writes.
+const mqttFanControlMinInterval = constants.IntervalSystem * time.Second
+
+// throttled returns b forwarding at most one update per minInterval. The
+// first update is forwarded at once; updates arriving inside the window are
+// coalesced, and the newest one is forwarded when the window ends, so the
+// final state always reaches MQTT. That trailing publish runs on a timer
+// goroutine, hence the lock.
+func (b mqttBinding) throttled(minInterval time.Duration) mqttBinding {
+	handle := b.handle
+	var (
+		mu      sync.Mutex
+		last    time.Time
+		pending any // newest update held back inside the window
+		timer   *time.Timer
+	)
+	flush := func() {
+		mu.Lock()
+		v := pending
+		pending, timer = nil, nil
+		if v != nil {
+			last = time.Now()
+		}
+		mu.Unlock()
+		if v != nil {
+			handle(v)
+		}
+	}
+	b.handle = func(v any) {
+		mu.Lock()
+		now := time.Now()
+		if wait := minInterval - now.Sub(last); !last.IsZero() && wait > 0 {
+			pending = v
+			if timer == nil {
+				timer = time.AfterFunc(wait, flush)
+			}
+			mu.Unlock()
+			return
+		}
+		// A timer that fired late may still be queued; it finds nothing to
+		// publish, since v supersedes whatever it held.
+		last, pending = now, nil
+		mu.Unlock()
+		handle(v)
+	}
+	return b
+}
+
 // subscribeMQTTEvents subscribes to collector events and publishes them via MQTT.
 func (o *Orchestrator) subscribeMQTTEvents(ctx context.Context, _ *api.Server) {
 	if o.mqttClient == nil {
@@ -571,7 +631,8 @@ func (o *Orchestrator) subscribeMQTTEvents(ctx context.Context, _ *api.Server) {
 		mqttBind(constants.TopicZFSDatasetsUpdate, o.mqttClient.PublishZFSDatasets),
 		mqttBind(constants.TopicZFSSnapshotsUpdate, o.mqttClient.PublishZFSSnapshots),
 		mqttBind(constants.TopicZFSARCStatsUpdate, o.mqttClient.PublishZFSARCStats),
-		mqttBind(constants.TopicFanControlUpdate, o.mqttClient.PublishFanControlStatus),
+		mqttBind(constants.TopicFanControlUpdate, o.mqttClient.PublishFanControlStatus).
+			throttled(mqttFanControlMinInterval),
 	}
 
 	topics := make([]string, len(bindings))
@@ -590,12 +651,48 @@ func (o *Orchestrator) subscribeMQTTEvents(ctx context.Context, _ *api.Server) {
 			logger.Info("MQTT: Event subscription stopping")
 			return
 		case msg := <-ch:
-			if o.mqttClient == nil || !o.mqttClient.IsConnected() {
+			// mqttClient is set once before this loop starts and checked above.
+			if !o.mqttClient.IsConnected() {
 				continue
 			}
-			if handler, ok := dispatch[reflect.TypeOf(msg)]; ok {
-				handler(msg)
+			for _, m := range coalesceQueued(msg, ch) {
+				if handler, ok := dispatch[reflect.TypeOf(m)]; ok {
+					handler(m)
+				}
 			}
 		}
 	}
 }
+
+// coalesceQueued returns first plus the messages already queued on ch, keeping
+// only the newest message of each type, in order of each type's first arrival.
+// A publish can block on the broker and on discovery passes, so several
+// snapshots of one topic may queue up behind it (e.g. after a reconnect or
+// a slow broker). Every message is a full snapshot, so only the newest of each
+// needs publishing. Only messages queued at call time are taken, so a steady
+// stream of events cannot keep the loop draining forever.
+func coalesceQueued(first any, ch <-chan any) []any {
+	n := len(ch)
+	if n == 0 {
+		return []any{first}
+	}
+	batch := make([]any, 1, n+1)
+	batch[0] = first
+	index := map[reflect.Type]int{reflect.TypeOf(first): 0}
+	for range n {
+		var msg any
+		select {
+		case msg = <-ch:
+		default:
+			return batch
+		}
+		t := reflect.TypeOf(msg)
+		if i, ok := index[t]; ok {
+			batch[i] = msg
+			continue
+		}
+		index[t] = len(batch)
+		batch = append(batch, msg)
+	}
+	return batch
+}
@@ -2,6 +2,8 @@ package services
 
 import (
 	"context"
+	"slices"
+	"sync"
 	"testing"
 	"time"
 
@@ -84,3 +86,54 @@ func TestSubscribeMQTTEvents_NotConnected(t *testing.T) {
 		t.Error("subscribeMQTTEvents did not return for disconnected client")
 	}
 }
+
+func TestMQTTBindingThrottled(t *testing.T) {
+	var mu sync.Mutex
+	var got []int
+	forwarded := func() []int {
+		mu.Lock()
+		defer mu.Unlock()
+		return slices.Clone(got)
+	}
+	b := mqttBind(domain.NewTopic[int]("test_throttle"), func(v int) error {
+		mu.Lock()
+		got = append(got, v)
+		mu.Unlock()
+		return nil
+	}).throttled(50 * time.Millisecond)
+
+	b.handle(1)
+	b.handle(2)
+	b.handle(3)
+	if g := forwarded(); !slices.Equal(g, []int{1}) {
+		t.Fatalf("forwarded %v inside the window, want [1]", g)
+	}
+
+	// The newest update held back by the window is published when it ends.
+	deadline := time.Now().Add(time.Second)
+	for !slices.Equal(forwarded(), []int{1, 3}) && time.Now().Before(deadline) {
+		time.Sleep(5 * time.Millisecond)
+	}
+	if g := forwarded(); !slices.Equal(g, []int{1, 3}) {
+		t.Errorf("forwarded %v, want [1 3]", g)
+	}
+}
+
+func TestCoalesceQueued(t *testing.T) {
+	ch := make(chan any, 8)
+	if got := coalesceQueued(1, ch); len(got) != 1 || got[0] != 1 {
+		t.Fatalf("coalesceQueued with empty queue = %v, want [1]", got)
+	}
+
+	ch <- "a"
+	ch <- 2
+	ch <- "b"
+	ch <- 3
+	got := coalesceQueued(1, ch)
+	if len(got) != 2 || got[0] != 3 || got[1] != "b" {
+		t.Errorf("coalesceQueued = %v, want [3 b]", got)
+	}
+	if len(ch) != 0 {
+		t.Errorf("%d messages left queued, want 0", len(ch))
+	}
+}
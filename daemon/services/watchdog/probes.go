@@ -3,6 +3,7 @@ package watchdog
 import (
 	"context"
 	"fmt"
+	"io"
 	"net"
 	"net/http"
 	"time"
@@ -15,6 +16,10 @@ import (
 // ProbeResult holds the outcome of a single probe execution.
 type ProbeResult struct {
 	Healthy bool
+	// Unknown is set when the probe could not observe the target's current
+	// state, e.g. because the data it reads is stale. Healthy is meaningless
+	// then and the runner keeps the check's previous verdict.
+	Unknown bool
 	Error   string
 }
 
@@ -36,24 +41,45 @@ func RunProbe(ctx context.Context, check dto.HealthCheck) ProbeResult {
 	}
 }
 
+// httpClient is shared by HTTP probes and webhook calls. Health checks hit the
+// same targets on every interval, so a single client lets them reuse pooled
+// keep-alive connections instead of paying a TCP (and TLS) handshake per probe.
+// Per-call deadlines come from the request context.
+var httpClient = &http.Client{}
+
+// maxDrainBytes caps how much of an unread response body is discarded to make
+// its connection reusable; larger bodies are cheaper to drop with the socket.
+const maxDrainBytes = 64 << 10
+
+// drainAndClose discards the rest of body and closes it. net/http only returns
+// a connection to the idle pool once its body has been read to EOF.
+func drainAndClose(body io.ReadCloser) {
+	_, _ = io.Copy(io.Discard, io.LimitReader(body, maxDrainBytes))
+	_ = body.Close()
+}
+
 // probeHTTP performs an HTTP GET and checks the response status code.
 func probeHTTP(ctx context.Context, url string, expectedCode int, timeout time.Duration) ProbeResult {
 	if expectedCode == 0 {
 		expectedCode = DefaultSuccessCode
 	}
 
-	client := &http.Client{Timeout: timeout}
+	if timeout > 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, timeout)
+		defer cancel()
+	}
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
 	if err != nil {
 		return ProbeResult{Healthy: false, Error: fmt.Sprintf("creating request: %s", err)}
 	}
 
 	// #nosec G704 -- Target URL is a user-configured health check endpoint.
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return ProbeResult{Healthy: false, Error: fmt.Sprintf("HTTP request failed: %s", err)}
 	}
-	defer func() { _ = resp.Body.Close() }()
+	defer drainAndClose(resp.Body)
 
 	if resp.StatusCode != expectedCode {
 		return ProbeResult{
@@ -101,19 +127,45 @@ func probeContainer(ctx context.Context, containerID string) ProbeResult {
 		return ProbeResult{Healthy: false, Error: "Docker cache not available"}
 	}
 
-	for _, c := range containers {
-		if c.ID == containerID || c.Name == containerID {
-			if c.State == "running" {
-				return ProbeResult{Healthy: true}
-			}
-			return ProbeResult{
-				Healthy: false,
-				Error:   fmt.Sprintf("container %s is %s (expected running)", containerID, c.State),
-			}
+	c, found := findContainer(dockerProvider, containers, containerID)
+	if !found {
+		return ProbeResult{Healthy: false, Error: fmt.Sprintf("container %s not found", containerID)}
+	}
+	if c.SourceStatus.Stale() {
+		// The cache is a last-known-good copy republished while Docker is
+		// unreachable, so c.State may no longer be true.
+		return ProbeResult{
+			Unknown: true,
+			Error:   fmt.Sprintf("container %s state unknown: %s", containerID, c.SourceStatus.Reason),
 		}
 	}
+	if c.State == "running" {
+		return ProbeResult{Healthy: true}
+	}
+	return ProbeResult{
+		Healthy: false,
+		Error:   fmt.Sprintf("container %s is %s (expected running)", containerID, c.State),
+	}
+}
+
+// containerLookup is implemented by providers that index containers by ID and
+// name (the API cache store), letting probes skip the list scan.
+type containerLookup interface {
+	GetDockerContainer(idOrName string) (dto.ContainerInfo, bool)
+}
 
-	return ProbeResult{Healthy: false, Error: fmt.Sprintf("container %s not found", containerID)}
+// findContainer returns the container matching idOrName, using the provider's
+// index when it has one and scanning containers otherwise.
+func findContainer(provider DockerCacheProvider, containers []dto.ContainerInfo, idOrName string) (dto.ContainerInfo, bool) {
+	if lookup, ok := provider.(containerLookup); ok {
+		return lookup.GetDockerContainer(idOrName)
+	}
+	for _, c := range containers {
+		if c.ID == idOrName || c.Name == idOrName {
+			return c, true
+		}
+	}
+	return dto.ContainerInfo{}, false
 }
 
 // DockerCacheProvider provides access to the Docker container cache.
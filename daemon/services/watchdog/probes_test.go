@@ -6,6 +6,7 @@ import (
 	"net"
 	"net/http"
 	"net/http/httptest"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -199,6 +200,30 @@ func TestProbeContainer_NotFound(t *testing.T) {
 	}
 }
 
+func TestProbeContainer_StaleCacheIsUnknown(t *testing.T) {
+	old := dockerProviderInst
+	defer func() { dockerProviderInst = old }()
+
+	stale := &dto.SourceStatus{Subsystem: "docker", State: dto.SourceUnavailable, Reason: "Docker daemon unreachable"}
+	dockerProviderInst = &mockDockerProvider{
+		containers: []dto.ContainerInfo{
+			{ID: "abc123", Name: "plex", State: "running", SourceStatus: stale},
+		},
+	}
+
+	check := dto.HealthCheck{
+		ID:             "container-stale",
+		Type:           dto.HealthCheckContainer,
+		Target:         "plex",
+		TimeoutSeconds: 5,
+	}
+
+	result := RunProbe(context.Background(), check)
+	if !result.Unknown || result.Healthy {
+		t.Errorf("expected unknown result for a stale container, got %+v", result)
+	}
+}
+
 func TestProbeContainer_NoProvider(t *testing.T) {
 	old := dockerProviderInst
 	defer func() { dockerProviderInst = old }()
@@ -248,6 +273,31 @@ func TestProbeHTTP_CustomSuccessCode(t *testing.T) {
 	}
 }
 
+func TestProbeHTTP_ReusesConnection(t *testing.T) {
+	srv := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		_, _ = w.Write([]byte("ok: response body left unread by the probe"))
+	}))
+	var conns atomic.Int32
+	srv.Config.ConnState = func(_ net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			conns.Add(1)
+		}
+	}
+	srv.Start()
+	defer srv.Close()
+
+	check := dto.HealthCheck{Type: dto.HealthCheckHTTP, Target: srv.URL, TimeoutSeconds: 5}
+	for range 3 {
+		if result := RunProbe(context.Background(), check); !result.Healthy {
+			t.Fatalf("expected healthy, got error: %s", result.Error)
+		}
+	}
+
+	if got := conns.Load(); got != 1 {
+		t.Errorf("probes opened %d connections, want 1 reused keep-alive connection", got)
+	}
+}
+
 func TestProbeContainer_MatchByID(t *testing.T) {
 	old := dockerProviderInst
 	defer func() { dockerProviderInst = old }()
@@ -29,18 +29,24 @@ func (r *Remediator) Execute(ctx context.Context, check dto.HealthCheck, result
 		return nil
 	}
 
-	switch {
-	case action == "notify":
-		return r.notifyUnraid(check, result)
-	case strings.HasPrefix(action, "restart_container:"):
-		containerID := strings.TrimPrefix(action, "restart_container:")
-		return r.restartContainer(ctx, containerID)
-	case strings.HasPrefix(action, "webhook:"):
-		url := strings.TrimPrefix(action, "webhook:")
-		return r.callWebhook(ctx, check, result, url)
-	default:
-		return fmt.Errorf("unknown remediation action: %s", action)
+	// Split once on the first ':' and switch on the action kind instead of
+	// testing each prefix in turn and trimming it again.
+	kind, arg, hasArg := strings.Cut(action, ":")
+	switch kind {
+	case "notify":
+		if !hasArg {
+			return r.notifyUnraid(check, result)
+		}
+	case "restart_container":
+		if hasArg {
+			return r.restartContainer(ctx, arg)
+		}
+	case "webhook":
+		if hasArg {
+			return r.callWebhook(ctx, check, result, arg)
+		}
 	}
+	return fmt.Errorf("unknown remediation action: %s", action)
 }
 
 // notifyUnraid creates an Unraid system notification about the health check failure.
@@ -79,19 +85,20 @@ func (r *Remediator) callWebhook(ctx context.Context, check dto.HealthCheck, res
 		check.ID, check.Name, check.Target, result.Error, time.Now().UTC().Format(time.RFC3339),
 	)
 
+	ctx, cancel := context.WithTimeout(ctx, 10*time.Second)
+	defer cancel()
 	req, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewBufferString(payload))
 	if err != nil {
 		return fmt.Errorf("creating webhook request: %w", err)
 	}
 	req.Header.Set("Content-Type", "application/json")
 
-	client := &http.Client{Timeout: 10 * time.Second}
 	// #nosec G704 -- Webhook URL is user-configured and requested directly without shell execution.
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return fmt.Errorf("webhook request failed: %w", err)
 	}
-	defer func() { _ = resp.Body.Close() }()
+	defer drainAndClose(resp.Body)
 
 	if resp.StatusCode >= 400 {
 		return fmt.Errorf("webhook returned status %d", resp.StatusCode)
@@ -0,0 +1,25 @@
+package watchdog
+
+import (
+	"context"
+	"testing"
+
+	"github.com/ruaan-deysel/unraid-management-agent/daemon/dto"
+)
+
+func TestRemediatorExecute_RejectsMalformedActions(t *testing.T) {
+	r := NewRemediator()
+
+	if err := r.Execute(context.Background(), dto.HealthCheck{}, ProbeResult{}); err != nil {
+		t.Errorf("empty action: got %v, want nil", err)
+	}
+
+	for _, action := range []string{"bogus", "notify:extra", "restart_container", "webhook", "reboot:now"} {
+		t.Run(action, func(t *testing.T) {
+			err := r.Execute(context.Background(), dto.HealthCheck{OnFail: action}, ProbeResult{})
+			if err == nil {
+				t.Errorf("Execute(%q) = nil, want unknown action error", action)
+			}
+		})
+	}
+}
@@ -132,13 +132,27 @@ func (r *Runner) runCheck(ctx context.Context, check dto.HealthCheck, now time.T
 		r.statuses[check.ID] = status
 	}
 
-	wasHealthy := status.Healthy || !exists
-	status.Healthy = result.Healthy
 	status.LastCheck = now
 	status.CheckName = check.Name
 	status.Target = check.Target
 	status.RemediationAction = check.OnFail
 
+	if result.Unknown {
+		// The target could not be observed, so keep the previous verdict and
+		// fail count: an outage of the data source must neither trigger
+		// remediation nor clear a real failure. A check without a verdict yet
+		// stays presumed healthy, as it is before its first run.
+		if !exists {
+			status.Healthy = true
+		}
+		status.LastError = result.Error
+		r.mu.Unlock()
+		return
+	}
+
+	wasHealthy := status.Healthy || !exists
+	status.Healthy = result.Healthy
+
 	if result.Healthy {
 		status.LastError = ""
 		status.ConsecutiveFails = 0
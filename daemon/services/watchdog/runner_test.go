@@ -381,6 +381,49 @@ func TestRunnerConsecutiveFails(t *testing.T) {
 	}
 }
 
+func TestRunnerUnknownKeepsVerdict(t *testing.T) {
+	old := dockerProviderInst
+	defer func() { dockerProviderInst = old }()
+
+	provider := &mockDockerProvider{
+		containers: []dto.ContainerInfo{{ID: "abc123", Name: "plex", State: "exited"}},
+	}
+	dockerProviderInst = provider
+
+	dir := t.TempDir()
+	store := NewStore(dir)
+	store.CreateCheck(dto.HealthCheck{
+		ID:      "stale-container",
+		Name:    "Stale",
+		Type:    dto.HealthCheckContainer,
+		Target:  "plex",
+		Enabled: true,
+	})
+
+	runner := NewRunner(store)
+	runner.RunSingleCheck(context.Background(), "stale-container")
+
+	// Docker becomes unreachable: the cache now holds a stale copy that
+	// still claims the container is running.
+	stale := &dto.SourceStatus{Subsystem: "docker", State: dto.SourceUnavailable}
+	provider.containers = []dto.ContainerInfo{{ID: "abc123", Name: "plex", State: "running", SourceStatus: stale}}
+	runner.RunSingleCheck(context.Background(), "stale-container")
+
+	status, err := runner.GetStatus("stale-container")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if status.Healthy {
+		t.Error("stale cache must not mark the check healthy")
+	}
+	if status.ConsecutiveFails != 1 {
+		t.Errorf("expected fail count to stay at 1, got %d", status.ConsecutiveFails)
+	}
+	if len(runner.GetHistory()) != 1 {
+		t.Errorf("expected only the initial failure in history, got %d events", len(runner.GetHistory()))
+	}
+}
+
 func TestRunnerRecovery(t *testing.T) {
 	callCount := 0
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {